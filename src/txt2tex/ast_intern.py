@@ -0,0 +1,135 @@
+"""Structural shapes of AST subtrees, for per-subtree caches.
+
+A specification repeats the same subexpressions throughout: type names
+such as ``N``, ``dom f``, schema references, whole predicates.  The
+parser builds each occurrence as its own node, because every node
+carries the source position that warnings and error messages report.
+:class:`NodeInterner` does not merge them: every node stays in its tree.
+It records, in a slot on each node, the first node interned with the
+same structure, the node's *shape*.
+
+The structure of a node is its class and its fields other than ``line``
+and ``column``, with each child replaced by the id of the child's shape.
+Children are interned before their parents, so a node's key has one
+entry per field rather than one per node below it.  After that, two
+subtrees interned by the same interner are structurally equal exactly
+when :func:`shape_of` returns the same object for both, and per-subtree
+caches keyed by ``id(shape_of(node))`` compute each distinct subtree
+once.
+
+Interning is not free: it visits every node and builds and hashes one
+key tuple per node, about a fifth of the time it took to parse the tree
+(``tests/benchmarks/test_ast_intern.py``), and the table keeps every
+shape alive until the interner is dropped.  The parser therefore does
+not intern.  The generator's caches (:mod:`txt2tex.codegen.annotations`,
+:class:`txt2tex.free_vars.FreeVariables`) intern the trees they are
+asked about and drop their tables between documents.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import TYPE_CHECKING, TypeVar
+
+from txt2tex.ast_nodes import ASTNode
+from txt2tex.ast_walk import children
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_NodeT = TypeVar("_NodeT", bound=ASTNode)
+
+_POSITION_FIELDS = frozenset({"line", "column"})
+
+# Reads the shape slot of an interned node (AttributeError if unset).
+_shape: Callable[[ASTNode], ASTNode] = attrgetter("_shape")
+
+# Per node class, the names of the fields that make up its structure.
+_STRUCTURE_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _structure_fields(cls: type[ASTNode]) -> tuple[str, ...]:
+    names = _STRUCTURE_FIELDS.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.name not in _POSITION_FIELDS)
+        _STRUCTURE_FIELDS[cls] = names
+    return names
+
+
+def _shape_key(value: object) -> object:
+    """A field value with every (interned) node replaced by its shape's id."""
+    if isinstance(value, ASTNode):
+        return id(_shape(value))
+    if type(value) is tuple:
+        return tuple(map(_shape_key, value))
+    return value
+
+
+def is_interned(node: ASTNode) -> bool:
+    """True if ``node`` has been through a :class:`NodeInterner`."""
+    return hasattr(node, "_shape")
+
+
+def shape_of(node: ASTNode) -> ASTNode:
+    """The shared instance for ``node``'s structure.
+
+    Structurally equal subtrees interned by the same :class:`NodeInterner`
+    have the same shape.  A node that was never interned is its own shape.
+    """
+    shape: ASTNode = getattr(node, "_shape", node)
+    return shape
+
+
+class NodeInterner:
+    """Table of subtree shapes, shared by every tree interned through it."""
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        # Structural key -> the first node interned with that structure.
+        # The table keeps every shape alive, so the ids in its keys cannot
+        # be reused by other objects.
+        self._shapes: dict[tuple[object, ...], ASTNode] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct shapes interned so far."""
+        return len(self._shapes)
+
+    def intern(self, root: _NodeT) -> _NodeT:
+        """Intern every node of ``root`` not interned yet; return ``root``.
+
+        Subtrees already interned (by this or another interner) are not
+        visited again.
+        """
+        if hasattr(root, "_shape"):
+            return root
+        # Collect the new nodes parents first, from an explicit stack (trees
+        # can be deeper than the recursion limit), then intern them in
+        # reverse, so every node's children have their shapes before it.
+        # The key loop is inlined: it runs once per node of every item.
+        order: list[ASTNode] = []
+        pending: list[ASTNode] = [root]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            pending.extend(
+                child for child in children(node) if not hasattr(child, "_shape")
+            )
+
+        shapes = self._shapes
+        set_shape = object.__setattr__
+        for node in reversed(order):
+            if hasattr(node, "_shape"):
+                continue  # reached twice through a shared child
+            cls = type(node)
+            key: list[object] = [cls]
+            for name in _structure_fields(cls):
+                value = getattr(node, name)
+                if isinstance(value, ASTNode):
+                    key.append(id(_shape(value)))
+                elif type(value) is tuple:
+                    key.append(_shape_key(value))
+                else:
+                    key.append(value)
+            set_shape(node, "_shape", shapes.setdefault(tuple(key), node))
+        return root
@@ -1,22 +1,91 @@
 """AST node definitions for txt2tex parser.
 
-Nodes use ``@dataclass(frozen=True)``.  This protects against accidental
-attribute rebinding; it does *not* deep-freeze ``list``-valued fields.
-Calling ``hash()`` on a node that carries a mutable list raises
-``TypeError`` — the correct behaviour, since these nodes are never used
-as dict keys or set elements.  A future call site that needs hashability
-should switch the relevant field to a ``tuple``.
+Every node is a frozen, slotted dataclass declared with :func:`node`.
+Slots drop the per-instance ``__dict__``, and sequence-valued fields are
+stored as tuples, so a finished tree is immutable all the way down and
+hashable.  Constructors still accept lists (the parser builds children in
+lists): :func:`node` converts them once, when the node is created.
+Fields annotated ``Sequence[...]`` hold tuples at run time.
+
+Each node also has one slot outside its fields, in which
+:mod:`txt2tex.ast_intern` records the shared instance for its structure.
 """
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, TypeVar, dataclass_transform
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_NodeT = TypeVar("_NodeT", bound=type)
+
+
+def _sequence_fields(cls: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Names of ``cls``'s flat and nested ``Sequence[...]`` fields."""
+    annotations: dict[str, object] = {}
+    for klass in reversed(cls.__mro__):
+        annotations.update(inspect.get_annotations(klass))
+    flat: list[str] = []
+    nested: list[str] = []
+    for name, annotation in annotations.items():
+        if not isinstance(annotation, str):
+            continue
+        if annotation.startswith("Sequence[Sequence["):
+            nested.append(name)
+        elif annotation.startswith("Sequence["):
+            flat.append(name)
+    return tuple(flat), tuple(nested)
+
+
+def _tuple_fields(
+    flat: tuple[str, ...], nested: tuple[str, ...]
+) -> Callable[[ASTNode], None]:
+    """Build a ``__post_init__`` that stores list arguments as tuples."""
+
+    def __post_init__(self: ASTNode) -> None:  # noqa: N807 - dataclass hook
+        for name in flat:
+            value = getattr(self, name)
+            if type(value) is list:
+                object.__setattr__(self, name, tuple(value))
+        for name in nested:
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, tuple(tuple(v) for v in value))
+
+    return __post_init__
+
+
+@dataclass_transform(frozen_default=True)
+def node(cls: _NodeT) -> _NodeT:  # noqa: UP047 - TypeVar, as in parser_pkg
+    """Declare an AST node class: a frozen, slotted dataclass.
+
+    ``Sequence[...]`` fields given as lists (one level, or two for
+    ``Sequence[Sequence[...]]``) are converted to tuples on construction.
+    """
+    flat, nested = _sequence_fields(cls)
+    if flat or nested:
+        cls.__post_init__ = _tuple_fields(flat, nested)  # type: ignore[attr-defined]
+    return dataclass(frozen=True, slots=True)(cls)
+
+
+class _Interned:
+    """Slot for the shape :class:`~txt2tex.ast_intern.NodeInterner` assigns.
+
+    Not a dataclass field: it is unset until the node is interned, and is
+    not compared, printed or pickled.
+    """
+
+    __slots__ = ("_shape",)
+
+    _shape: ASTNode
 
 
-@dataclass(frozen=True)
-class ASTNode:
+@node
+class ASTNode(_Interned):
     """Base class for all AST nodes."""
 
     line: int
@@ -26,7 +95,7 @@ class ASTNode:
 # Expression nodes
 
 
-@dataclass(frozen=True)
+@node
 class BinaryOp(ASTNode):
     """Binary operation node (and, or, =>, <=>).
 
@@ -44,7 +113,7 @@ class BinaryOp(ASTNode):
     explicit_parens: bool = False  # True if expression was explicitly wrapped in ()
 
 
-@dataclass(frozen=True)
+@node
 class UnaryOp(ASTNode):
     """Unary operation node (not)."""
 
@@ -52,21 +121,21 @@ class UnaryOp(ASTNode):
     operand: Expr
 
 
-@dataclass(frozen=True)
+@node
 class Identifier(ASTNode):
     """Identifier node (variable name)."""
 
     name: str
 
 
-@dataclass(frozen=True)
+@node
 class Number(ASTNode):
     """Numeric literal node."""
 
     value: str
 
 
-@dataclass(frozen=True)
+@node
 class StringLit(ASTNode):
     """String literal node ('quoted value').
 
@@ -81,7 +150,7 @@ class StringLit(ASTNode):
 # Quantifier expression nodes
 
 
-@dataclass(frozen=True)
+@node
 class SchemaBinding(ASTNode):
     """Schema-text binding in a quantifier (Z RM §3.10).
 
@@ -106,7 +175,7 @@ class SchemaBinding(ASTNode):
     schema_name: str  # Raw identifier (e.g., "S", "S'", "BoxOffice")
 
 
-@dataclass(frozen=True)
+@node
 class Quantifier(ASTNode):
     """Quantifier node (forall, exists, exists1, mu).
 
@@ -148,7 +217,7 @@ class Quantifier(ASTNode):
     """
 
     quantifier: str  # "forall", "exists", "exists1", or "mu"
-    variables: list[str]  # One or more variables (e.g., ["x", "y"])
+    variables: Sequence[str]  # One or more variables (e.g., ["x", "y"])
     domain: Expr | None  # Optional domain shared by all variables (e.g., N, Z)
     body: Expr  # Constraint (before bullet) or full body (without bullet)
     expression: Expr | None = None  # Body after bullet (all quantifiers)
@@ -158,7 +227,7 @@ class Quantifier(ASTNode):
     schema_binding: SchemaBinding | None = None  # Schema-text binding (Z RM §3.10)
 
 
-@dataclass(frozen=True)
+@node
 class Subscript(ASTNode):
     """Subscript node (a_1, x_i)."""
 
@@ -166,7 +235,7 @@ class Subscript(ASTNode):
     index: Expr
 
 
-@dataclass(frozen=True)
+@node
 class Superscript(ASTNode):
     """Superscript node (x^2, 2^n)."""
 
@@ -174,7 +243,7 @@ class Superscript(ASTNode):
     exponent: Expr
 
 
-@dataclass(frozen=True)
+@node
 class SetComprehension(ASTNode):
     """Set comprehension node.
 
@@ -192,18 +261,18 @@ class SetComprehension(ASTNode):
                           expression=(x^2)
     """
 
-    variables: list[str]  # One or more variables (e.g., ["x"], ["x", "y"])
+    variables: Sequence[str]  # One or more variables (e.g., ["x"], ["x", "y"])
     domain: Expr | None  # Optional domain (e.g., N, Z, P X)
     predicate: Expr | None  # The condition/predicate (can be None)
     expression: Expr | None  # Optional expression (if present, set by expression)
     # Additional semicolon-separated declaration groups for multi-typed bindings:
     # { s : Ship; c : Class | ... } → extra_declarations=[("c", Class)]
-    extra_declarations: list[tuple[str, Expr]] | None = None
+    extra_declarations: Sequence[tuple[str, Expr]] | None = None
     line_break_after_pipe: bool = False
     line_break_after_bullet: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class SetLiteral(ASTNode):
     """Set literal node.
 
@@ -215,10 +284,10 @@ class SetLiteral(ASTNode):
     - {} -> elements=[]  (empty set)
     """
 
-    elements: list[Expr]  # List of elements in the set (can be empty)
+    elements: Sequence[Expr]  # List of elements in the set (can be empty)
 
 
-@dataclass(frozen=True)
+@node
 class FunctionApp(ASTNode):
     """Function application node.
 
@@ -237,10 +306,10 @@ class FunctionApp(ASTNode):
     """
 
     function: Expr  # Function expression (can be any expression)
-    args: list[Expr]  # Argument list (can be empty for f())
+    args: Sequence[Expr]  # Argument list (can be empty for f())
 
 
-@dataclass(frozen=True)
+@node
 class FunctionType(ASTNode):
     """Function type node.
 
@@ -266,7 +335,7 @@ class FunctionType(ASTNode):
     range: Expr  # Range type
 
 
-@dataclass(frozen=True)
+@node
 class Lambda(ASTNode):
     """Lambda expression node.
 
@@ -282,12 +351,12 @@ class Lambda(ASTNode):
     - lambda x, y : N . x + y -> variables=["x", "y"], domain=N, body=(x+y)
     """
 
-    variables: list[str]  # One or more variables (e.g., ["x"], ["x", "y"])
+    variables: Sequence[str]  # One or more variables (e.g., ["x"], ["x", "y"])
     domain: Expr  # Domain type expression
     body: Expr  # Lambda body expression
 
 
-@dataclass(frozen=True)
+@node
 class Tuple(ASTNode):
     """Tuple expression node.
 
@@ -307,10 +376,10 @@ class Tuple(ASTNode):
     not tuples. Tuples require at least 2 elements.
     """
 
-    elements: list[Expr]  # List of tuple elements (minimum 2)
+    elements: Sequence[Expr]  # List of tuple elements (minimum 2)
 
 
-@dataclass(frozen=True)
+@node
 class RelationalImage(ASTNode):
     r"""Relational image node.
 
@@ -332,7 +401,7 @@ class RelationalImage(ASTNode):
     set: Expr  # The set S
 
 
-@dataclass(frozen=True)
+@node
 class GenericInstantiation(ASTNode):
     """Generic type instantiation node.
 
@@ -352,10 +421,10 @@ class GenericInstantiation(ASTNode):
     """
 
     base: Expr  # The generic type being instantiated
-    type_params: list[Expr]  # Type parameters (at least one)
+    type_params: Sequence[Expr]  # Type parameters (at least one)
 
 
-@dataclass(frozen=True)
+@node
 class SchemaCompose(ASTNode):
     """Schema composition node (Z RM §3.11).
 
@@ -376,7 +445,7 @@ class SchemaCompose(ASTNode):
     right: Expr
 
 
-@dataclass(frozen=True)
+@node
 class SchemaPipe(ASTNode):
     """Schema piping node (Z RM §3.11).
 
@@ -396,7 +465,7 @@ class SchemaPipe(ASTNode):
     right: Expr
 
 
-@dataclass(frozen=True)
+@node
 class SchemaHide(ASTNode):
     """Schema hiding node (Z RM §3.11).
 
@@ -413,10 +482,10 @@ class SchemaHide(ASTNode):
     """
 
     schema: Expr
-    names: list[str]
+    names: Sequence[str]
 
 
-@dataclass(frozen=True)
+@node
 class SchemaProject(ASTNode):
     """Schema projection node (Z RM §3.11).
 
@@ -435,7 +504,7 @@ class SchemaProject(ASTNode):
     right: Expr
 
 
-@dataclass(frozen=True)
+@node
 class SchemaRename(ASTNode):
     """Schema renaming node (Z RM §3.11).
 
@@ -462,13 +531,13 @@ class SchemaRename(ASTNode):
     """
 
     schema: Expr  # Schema reference (typically a decorated Identifier)
-    pairs: list[tuple[str, str]]  # (new_name, old_name) per Z RM §3.11, at least one
+    pairs: Sequence[tuple[str, str]]  # (new, old) per Z RM §3.11, at least one
 
 
 # Range node
 
 
-@dataclass(frozen=True)
+@node
 class Range(ASTNode):
     """Range expression node.
 
@@ -491,7 +560,7 @@ class Range(ASTNode):
 # Sequence nodes
 
 
-@dataclass(frozen=True)
+@node
 class SequenceLiteral(ASTNode):
     """Sequence literal node.
 
@@ -508,10 +577,10 @@ class SequenceLiteral(ASTNode):
     LaTeX rendering: \\langle elements \\rangle
     """
 
-    elements: list[Expr]  # List of sequence elements (can be empty)
+    elements: Sequence[Expr]  # List of sequence elements (can be empty)
 
 
-@dataclass(frozen=True)
+@node
 class TupleProjection(ASTNode):
     """Tuple projection node.
 
@@ -537,7 +606,7 @@ class TupleProjection(ASTNode):
     index: int | str  # Component index (1-based: 1, 2, 3, ...) or field name
 
 
-@dataclass(frozen=True)
+@node
 class BagLiteral(ASTNode):
     """Bag literal node.
 
@@ -553,10 +622,10 @@ class BagLiteral(ASTNode):
     LaTeX rendering: \\lbag elements \\rbag
     """
 
-    elements: list[Expr]  # List of bag elements (can have duplicates)
+    elements: Sequence[Expr]  # List of bag elements (can have duplicates)
 
 
-@dataclass(frozen=True)
+@node
 class Conditional(ASTNode):
     """Conditional expression node.
 
@@ -584,7 +653,7 @@ class Conditional(ASTNode):
     line_break_after_then: bool = False  # Line break before 'else'
 
 
-@dataclass(frozen=True)
+@node
 class GuardedBranch(ASTNode):
     """A single branch in a guarded cases expression.
 
@@ -601,7 +670,7 @@ class GuardedBranch(ASTNode):
     guard: Expr  # The condition/guard for this branch
 
 
-@dataclass(frozen=True)
+@node
 class GuardedCases(ASTNode):
     """Guarded cases expression.
 
@@ -620,10 +689,10 @@ class GuardedCases(ASTNode):
     LaTeX rendering: Multiple lines with \text{if} guards
     """
 
-    branches: list[GuardedBranch]  # List of conditional branches
+    branches: Sequence[GuardedBranch]  # List of conditional branches
 
 
-@dataclass(frozen=True)
+@node
 class Theta(ASTNode):
     r"""θ-expression (Z RM §3.10).
 
@@ -643,7 +712,7 @@ class Theta(ASTNode):
     expr: Expr  # Schema reference (typically a decorated Identifier)
 
 
-@dataclass(frozen=True)
+@node
 class SchemaText(ASTNode):
     r"""Inline schema text in a horizontal definition (Z RM §3.8).
 
@@ -667,8 +736,8 @@ class SchemaText(ASTNode):
     the inline form, so no nested list structure is needed.
     """
 
-    declarations: list[Declaration | SchemaInclusion]
-    predicates: list[Expr]  # Flat list; ';' separated in source
+    declarations: Sequence[Declaration | SchemaInclusion]
+    predicates: Sequence[Expr]  # Flat list; ';' separated in source
 
 
 # Aggregator support (Phase 4.2 — GROUP aggregate form)
@@ -689,7 +758,7 @@ class Aggregator(Enum):
         return self.name.capitalize()
 
 
-@dataclass(frozen=True)
+@node
 class AggregatorClause(ASTNode):
     """Single aggregator application inside a GROUP or EXTEND expression.
 
@@ -709,7 +778,7 @@ class AggregatorClause(ASTNode):
 # Relational algebra nodes (Phase 2.2)
 
 
-@dataclass(frozen=True)
+@node
 class Restrict(ASTNode):
     """Relational restriction (sigma) node.
 
@@ -723,7 +792,7 @@ class Restrict(ASTNode):
     relation: Expr
 
 
-@dataclass(frozen=True)
+@node
 class Project(ASTNode):
     """Relational projection (pi) node.
 
@@ -733,11 +802,11 @@ class Project(ASTNode):
     - pi[class, country](Class) -> attrs=["class", "country"], relation=Class
     """
 
-    attrs: list[str]
+    attrs: Sequence[str]
     relation: Expr
 
 
-@dataclass(frozen=True)
+@node
 class RelationRename(ASTNode):
     """Relation renaming node (Z RM §3.11).
 
@@ -767,10 +836,10 @@ class RelationRename(ASTNode):
     """
 
     relation: Expr  # Any expression (compound operands allowed)
-    pairs: list[tuple[str, str]]  # (new_name, old_name) per Z RM §3.11, at least one
+    pairs: Sequence[tuple[str, str]]  # (new, old) per Z RM §3.11, at least one
 
 
-@dataclass(frozen=True)
+@node
 class NaturalJoin(ASTNode):
     """Natural join or theta-join (join) node.
 
@@ -787,7 +856,7 @@ class NaturalJoin(ASTNode):
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class Divide(ASTNode):
     """Relational division (div) node.
 
@@ -802,7 +871,7 @@ class Divide(ASTNode):
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class Group(ASTNode):
     """Date's GROUP operator — bundle attributes into a nested relation (Phase 4.1).
 
@@ -822,12 +891,12 @@ class Group(ASTNode):
     """
 
     relation: Expr
-    attrs: list[str]
+    attrs: Sequence[str]
     alias: str
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class Ungroup(ASTNode):
     """Date's UNGROUP operator — flatten a nested relation (Phase 4.1).
 
@@ -849,7 +918,7 @@ class Ungroup(ASTNode):
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class GroupAggregate(ASTNode):
     """Date's GROUP operator in aggregate form (Phase 4.2).
 
@@ -871,11 +940,11 @@ class GroupAggregate(ASTNode):
     """
 
     relation: Expr
-    clauses: list[AggregatorClause]
+    clauses: Sequence[AggregatorClause]
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class ExtendAggregate(ASTNode):
     """Date's EXTEND operator — add computed aggregate attributes (Phase 4.3).
 
@@ -900,11 +969,11 @@ class ExtendAggregate(ASTNode):
     """
 
     relation: Expr
-    clauses: list[AggregatorClause]
+    clauses: Sequence[AggregatorClause]
     line_break_after: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class Binding(ASTNode):
     r"""Z binding expression (Z RM §3.7).
 
@@ -926,7 +995,7 @@ class Binding(ASTNode):
       -> pairs=[]
     """
 
-    pairs: list[tuple[str, Expr]]
+    pairs: Sequence[tuple[str, Expr]]
 
 
 # Type alias for all expression types
@@ -977,7 +1046,7 @@ Expr = (
 # Document structure nodes
 
 
-@dataclass(frozen=True)
+@node
 class TitleMetadata(ASTNode):
     """Document title metadata (title, author, date, etc.)."""
 
@@ -988,7 +1057,7 @@ class TitleMetadata(ASTNode):
     institution: str | None = None
 
 
-@dataclass(frozen=True)
+@node
 class BibliographyMetadata(ASTNode):
     """Bibliography file and style metadata for document."""
 
@@ -996,42 +1065,42 @@ class BibliographyMetadata(ASTNode):
     style: str | None = None
 
 
-@dataclass(frozen=True)
+@node
 class Section(ASTNode):
     """Section with title and content."""
 
     title: str
-    items: list[DocumentItem]
+    items: Sequence[DocumentItem]
 
 
-@dataclass(frozen=True)
+@node
 class Solution(ASTNode):
     """Solution block with number and content."""
 
     number: str
-    items: list[DocumentItem]
+    items: Sequence[DocumentItem]
 
 
-@dataclass(frozen=True)
+@node
 class Part(ASTNode):
     """Part label with content."""
 
     label: str
-    items: list[DocumentItem]
+    items: Sequence[DocumentItem]
 
 
-@dataclass(frozen=True)
+@node
 class TruthTable(ASTNode):
     """Truth table with headers and rows."""
 
-    headers: list[str]
-    rows: list[list[str]]
+    headers: Sequence[str]
+    rows: Sequence[Sequence[str]]
 
 
 # Equivalence chain nodes
 
 
-@dataclass(frozen=True)
+@node
 class ArgueStep(ASTNode):
     """Single step in an argue chain (equational reasoning).
 
@@ -1042,7 +1111,7 @@ class ArgueStep(ASTNode):
     justification: str | None
 
 
-@dataclass(frozen=True)
+@node
 class ArgueChain(ASTNode):
     """Argue chain with multiple reasoning steps (equational reasoning).
 
@@ -1051,11 +1120,11 @@ class ArgueChain(ASTNode):
     connector="eq" joins steps with = (equality of expressions of the same Z type).
     """
 
-    steps: list[ArgueStep]
+    steps: Sequence[ArgueStep]
     connector: Literal["iff", "eq"] = "iff"
 
 
-@dataclass(frozen=True)
+@node
 class InfruleBlock(ASTNode):
     """Inference rule with premises, horizontal line, and conclusion.
 
@@ -1067,21 +1136,21 @@ class InfruleBlock(ASTNode):
       conclusion [label]
     """
 
-    premises: list[tuple[Expr, str | None]]  # (premise, label)
+    premises: Sequence[tuple[Expr, str | None]]  # (premise, label)
     conclusion: tuple[Expr, str | None]  # (conclusion, label)
 
 
 # Z notation nodes
 
 
-@dataclass(frozen=True)
+@node
 class GivenType(ASTNode):
     """Given type declaration (given A, B, C)."""
 
-    names: list[str]
+    names: Sequence[str]
 
 
-@dataclass(frozen=True)
+@node
 class FreeBranch(ASTNode):
     """A single branch in a free type definition.
 
@@ -1100,7 +1169,7 @@ class FreeBranch(ASTNode):
     )  # None for simple branches, Expr for parameterized constructors
 
 
-@dataclass(frozen=True)
+@node
 class FreeType(ASTNode):
     """Free type definition (Type ::= branch1 | branch2).
 
@@ -1114,10 +1183,10 @@ class FreeType(ASTNode):
     """
 
     name: str
-    branches: list[FreeBranch]  # List of constructor branches
+    branches: Sequence[FreeBranch]  # List of constructor branches
 
 
-@dataclass(frozen=True)
+@node
 class SyntaxDefinition(ASTNode):
     """Single free type definition within syntax environment.
 
@@ -1130,10 +1199,10 @@ class SyntaxDefinition(ASTNode):
     """
 
     name: str  # Type name (e.g., "EXP", "OP")
-    branches: list[FreeBranch]  # List of constructor branches
+    branches: Sequence[FreeBranch]  # List of constructor branches
 
 
-@dataclass(frozen=True)
+@node
 class SyntaxBlock(ASTNode):
     """Syntax environment for aligned free type definitions.
 
@@ -1157,10 +1226,10 @@ class SyntaxBlock(ASTNode):
       \\end{syntax}
     """
 
-    groups: list[list[SyntaxDefinition]]  # Groups separated by blank lines
+    groups: Sequence[Sequence[SyntaxDefinition]]  # Groups separated by blank lines
 
 
-@dataclass(frozen=True)
+@node
 class Abbreviation(ASTNode):
     """Abbreviation definition (name == expression).
 
@@ -1170,10 +1239,10 @@ class Abbreviation(ASTNode):
 
     name: str
     expression: Expr
-    generic_params: list[str] | None = None  # Optional generic parameters
+    generic_params: Sequence[str] | None = None  # Optional generic parameters
 
 
-@dataclass(frozen=True)
+@node
 class Declaration(ASTNode):
     """Declaration in axdef or schema (var : Type).
 
@@ -1186,7 +1255,7 @@ class Declaration(ASTNode):
     is_primary_key: bool = False
 
 
-@dataclass(frozen=True)
+@node
 class SchemaInclusion(ASTNode):
     """Schema inclusion in axdef, schema, or gendef declaration list.
 
@@ -1204,10 +1273,10 @@ class SchemaInclusion(ASTNode):
 
     name: str
     decoration: str | None  # None | "delta" | "xi"
-    generics: list[Expr] | None = None
+    generics: Sequence[Expr] | None = None
 
 
-@dataclass(frozen=True)
+@node
 class AxDef(ASTNode):
     """Axiomatic definition block.
 
@@ -1222,12 +1291,14 @@ class AxDef(ASTNode):
     end
     """
 
-    declarations: list[Declaration | SchemaInclusion]
-    predicates: list[list[Expr]]  # Groups of predicates (separated by blank lines)
-    generic_params: list[str] | None = None  # Optional generic parameters
+    declarations: Sequence[Declaration | SchemaInclusion]
+    predicates: Sequence[
+        Sequence[Expr]
+    ]  # Groups of predicates (separated by blank lines)
+    generic_params: Sequence[str] | None = None  # Optional generic parameters
 
 
-@dataclass(frozen=True)
+@node
 class GenDef(ASTNode):
     """Generic definition block.
 
@@ -1243,12 +1314,14 @@ class GenDef(ASTNode):
     end
     """
 
-    generic_params: list[str]  # Required generic parameters
-    declarations: list[Declaration | SchemaInclusion]
-    predicates: list[list[Expr]]  # Groups of predicates (separated by blank lines)
+    generic_params: Sequence[str]  # Required generic parameters
+    declarations: Sequence[Declaration | SchemaInclusion]
+    predicates: Sequence[
+        Sequence[Expr]
+    ]  # Groups of predicates (separated by blank lines)
 
 
-@dataclass(frozen=True)
+@node
 class Schema(ASTNode):
     """Schema definition block.
 
@@ -1262,12 +1335,14 @@ class Schema(ASTNode):
     """
 
     name: str | None  # Optional name (None for anonymous schemas)
-    declarations: list[Declaration | SchemaInclusion]
-    predicates: list[list[Expr]]  # Groups of predicates (separated by blank lines)
-    generic_params: list[str] | None = None  # Optional generic parameters
+    declarations: Sequence[Declaration | SchemaInclusion]
+    predicates: Sequence[
+        Sequence[Expr]
+    ]  # Groups of predicates (separated by blank lines)
+    generic_params: Sequence[str] | None = None  # Optional generic parameters
 
 
-@dataclass(frozen=True)
+@node
 class HorizDef(ASTNode):
     r"""Horizontal schema definition (Z RM §3.8).
 
@@ -1288,7 +1363,7 @@ class HorizDef(ASTNode):
     """
 
     name: str  # LHS schema name
-    generics: list[str] | None  # Optional generic parameter names
+    generics: Sequence[str] | None  # Optional generic parameter names
     # RHS: Identifier, GenericInstantiation, SchemaInclusion, or SchemaText.
     # SchemaInclusion covers Delta/Xi decorated references (Z RM §3.8 examples).
     body: Expr | SchemaInclusion
@@ -1297,15 +1372,15 @@ class HorizDef(ASTNode):
 # Proof tree nodes
 
 
-@dataclass(frozen=True)
+@node
 class CaseAnalysis(ASTNode):
     """Case analysis branch (case q: ... case r: ...)."""
 
     case_name: str  # "q", etc.
-    steps: list[ProofNode]  # Proof steps for this case
+    steps: Sequence[ProofNode]  # Proof steps for this case
 
 
-@dataclass(frozen=True)
+@node
 class ProofNode(ASTNode):
     """Node in a proof tree (Path C format)."""
 
@@ -1316,11 +1391,11 @@ class ProofNode(ASTNode):
     label: int | None  # For assumptions: [1], [2], etc.
     is_assumption: bool  # True if this is marked [assumption]
     is_sibling: bool  # True if marked with :: (sibling premise)
-    children: list[ProofNode | CaseAnalysis]  # Child proof nodes or case branches
+    children: Sequence[ProofNode | CaseAnalysis]  # Child proof nodes or case branches
     indent_level: int  # Indentation level (for parsing)
 
 
-@dataclass(frozen=True)
+@node
 class ProofTree(ASTNode):
     """Proof tree (Path C format) - conclusion with supporting proof."""
 
@@ -1330,7 +1405,7 @@ class ProofTree(ASTNode):
 # Text paragraph node
 
 
-@dataclass(frozen=True)
+@node
 class Paragraph(ASTNode):
     """Plain text paragraph with formula detection.
 
@@ -1340,7 +1415,7 @@ class Paragraph(ASTNode):
     text: str  # The paragraph content
 
 
-@dataclass(frozen=True)
+@node
 class PureParagraph(ASTNode):
     """Pure text paragraph with NO processing.
 
@@ -1351,7 +1426,7 @@ class PureParagraph(ASTNode):
     text: str  # The raw paragraph content
 
 
-@dataclass(frozen=True)
+@node
 class LatexBlock(ASTNode):
     """Raw LaTeX passthrough block.
 
@@ -1362,7 +1437,7 @@ class LatexBlock(ASTNode):
     latex: str  # The raw LaTeX content
 
 
-@dataclass(frozen=True)
+@node
 class BMachine(ASTNode):
     """B-machine verbatim block (B: ... END).
 
@@ -1373,7 +1448,7 @@ class BMachine(ASTNode):
     body: str  # Raw multi-line body including the final END line
 
 
-@dataclass(frozen=True)
+@node
 class RawLatexBlock(ASTNode):
     """Multi-line raw LaTeX passthrough block (LATEX:\\n...END).
 
@@ -1386,7 +1461,7 @@ class RawLatexBlock(ASTNode):
     body: str  # Raw multi-line body (excluding the final END line)
 
 
-@dataclass(frozen=True)
+@node
 class PageBreak(ASTNode):
     """Page break in document.
 
@@ -1394,7 +1469,7 @@ class PageBreak(ASTNode):
     """
 
 
-@dataclass(frozen=True)
+@node
 class LineBreak(ASTNode):
     """Vertical line break (\\medskip) in document.
 
@@ -1404,7 +1479,7 @@ class LineBreak(ASTNode):
     """
 
 
-@dataclass(frozen=True)
+@node
 class Contents(ASTNode):
     """Table of contents directive.
 
@@ -1415,7 +1490,7 @@ class Contents(ASTNode):
     depth: str = ""  # Empty = sections only, "full" or "2" = sections + subsections
 
 
-@dataclass(frozen=True)
+@node
 class PartsFormat(ASTNode):
     """Parts formatting style directive.
 
@@ -1425,7 +1500,7 @@ class PartsFormat(ASTNode):
     style: str = "subsection"  # "inline" or "subsection"
 
 
-@dataclass(frozen=True)
+@node
 class Zed(ASTNode):
     """Zed block for standalone predicates and declarations.
 
@@ -1475,11 +1550,11 @@ DocumentItem = (
 )
 
 
-@dataclass(frozen=True)
+@node
 class Document(ASTNode):
     """Document containing multiple expressions or blocks."""
 
-    items: list[DocumentItem]
+    items: Sequence[DocumentItem]
     title_metadata: TitleMetadata | None = None
     parts_format: str = "subsection"  # "inline" or "subsection"
     bibliography_metadata: BibliographyMetadata | None = None
@@ -0,0 +1,251 @@
+"""Traversal of AST nodes through per-class child-field tables.
+
+Which fields of a node class can hold child nodes is fixed by the class's
+annotations, so it is worked out once per class, on first use, instead of
+by inspecting every field of every node visited.  Each child field is
+classified by its annotation:
+
+* a *node* field holds one node (``Expr``, ``ProofNode | None``, ...);
+* a *sequence* field holds a tuple of nodes (``Sequence[Expr]``);
+* a *nested* field holds nodes inside tuples within the value
+  (``Sequence[Sequence[Expr]]``, ``Sequence[tuple[str, Expr]]``, ...).
+
+Fields that cannot hold a node (names, flags, positions) are never read.
+:func:`children` and :func:`iter_children` list the nodes directly under
+a node in field order; :func:`walk` visits a whole tree and
+:func:`transform` rebuilds one bottom-up.  Both run from explicit stacks,
+so trees deeper than Python's recursion limit are fine.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import types
+from collections.abc import Sequence
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from txt2tex.ast_nodes import ASTNode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_NODE, _SEQUENCE, _NESTED = range(3)
+_UNIONS = (Union, types.UnionType)
+
+# Per node class: a getter returning the values of its child fields (in
+# field order), the kind of each of those fields, and their names.
+_Table = tuple[
+    "Callable[[ASTNode], tuple[object, ...]]", tuple[int, ...], tuple[str, ...]
+]
+_TABLES: dict[type, _Table] = {}
+# Per node class: the function :func:`children` calls for its nodes.
+_CHILDREN: dict[type, Callable[[ASTNode], Sequence[ASTNode]]] = {}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ChildFields:
+    """The fields of a node class that can hold child nodes, by kind."""
+
+    nodes: tuple[str, ...]
+    sequences: tuple[str, ...]
+    nested: tuple[str, ...]
+    optional: tuple[str, ...]  # those of the above that may be None
+
+
+def _holds_nodes(hint: object) -> bool:
+    """True if a value of type ``hint`` can be or contain an AST node."""
+    origin = get_origin(hint)
+    if origin is Literal:
+        return False
+    if origin is not None:
+        return any(_holds_nodes(arg) for arg in get_args(hint))
+    return isinstance(hint, type) and issubclass(hint, ASTNode)
+
+
+def _is_node_type(hint: object) -> bool:
+    """True if every value of type ``hint`` is an AST node (or None)."""
+    if get_origin(hint) in _UNIONS:
+        return all(arg is type(None) or _is_node_type(arg) for arg in get_args(hint))
+    return isinstance(hint, type) and issubclass(hint, ASTNode)
+
+
+def _field_kind(hint: object) -> int | None:
+    """Kind of a field annotated ``hint``, or None if it never holds a node."""
+    if not _holds_nodes(hint):
+        return None
+    if _is_node_type(hint):
+        return _NODE
+    if get_origin(hint) in _UNIONS:  # Optional[...]: classify the rest
+        (hint,) = (arg for arg in get_args(hint) if arg is not type(None))
+    if get_origin(hint) is Sequence and _is_node_type(get_args(hint)[0]):
+        return _SEQUENCE
+    return _NESTED
+
+
+def child_fields(cls: type[ASTNode]) -> ChildFields:
+    """Classify the child-bearing fields of ``cls`` from its annotations."""
+    # Annotations are strings (postponed evaluation); ``Sequence`` is only
+    # imported by ast_nodes for type checking, so supply it here.
+    hints = get_type_hints(cls, localns={"Sequence": Sequence})
+    by_kind: tuple[list[str], list[str], list[str]] = ([], [], [])
+    optional: list[str] = []
+    for field in dataclasses.fields(cls):
+        hint = hints[field.name]
+        kind = _field_kind(hint)
+        if kind is not None:
+            by_kind[kind].append(field.name)
+            if get_origin(hint) in _UNIONS and type(None) in get_args(hint):
+                optional.append(field.name)
+    nodes, sequences, nested = by_kind
+    return ChildFields(tuple(nodes), tuple(sequences), tuple(nested), tuple(optional))
+
+
+def _table(cls: type[ASTNode]) -> _Table:
+    table = _TABLES.get(cls)
+    if table is None:
+        fields = child_fields(cls)
+        kind_of = dict.fromkeys(fields.nodes, _NODE)
+        kind_of.update(dict.fromkeys(fields.sequences, _SEQUENCE))
+        kind_of.update(dict.fromkeys(fields.nested, _NESTED))
+        names = tuple(f.name for f in dataclasses.fields(cls) if f.name in kind_of)
+        table = (_getter(names), tuple(kind_of[name] for name in names), names)
+        _TABLES[cls] = table
+    return table
+
+
+def _getter(names: tuple[str, ...]) -> Callable[[ASTNode], tuple[object, ...]]:
+    """A function returning the tuple of ``names`` attributes of a node."""
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        get = attrgetter(names[0])
+        return lambda node: (get(node),)
+    return lambda _node: ()
+
+
+def _add_nested(value: object, found: list[ASTNode]) -> None:
+    if isinstance(value, ASTNode):
+        found.append(value)
+    elif isinstance(value, tuple):
+        for item in value:
+            _add_nested(item, found)
+
+
+def _no_children(_node: ASTNode) -> Sequence[ASTNode]:
+    return ()
+
+
+def _children_function(cls: type[ASTNode]) -> Callable[[ASTNode], Sequence[ASTNode]]:
+    """Build (and remember) the function listing the children of ``cls`` nodes.
+
+    The common shapes get a getter that does no per-field work in Python:
+    a class whose child fields are all single required nodes returns them
+    straight from an ``attrgetter``, and one whose only child field is a
+    required sequence returns that tuple.
+    """
+    get, kinds, names = _table(cls)
+    optional = child_fields(cls).optional
+    function: Callable[[ASTNode], Sequence[ASTNode]]
+    if not names:
+        function = _no_children
+    elif not optional and all(kind == _NODE for kind in kinds):
+        function = cast("Callable[[ASTNode], Sequence[ASTNode]]", get)
+    elif not optional and kinds == (_SEQUENCE,):
+        function = attrgetter(names[0])
+    else:
+
+        def function(node: ASTNode) -> Sequence[ASTNode]:
+            found: list[ASTNode] = []
+            for kind, value in zip(kinds, get(node), strict=True):
+                if kind == _NODE:
+                    if value is not None:
+                        found.append(cast("ASTNode", value))
+                elif kind == _SEQUENCE:
+                    if value:
+                        found.extend(cast("tuple[ASTNode, ...]", value))
+                else:
+                    _add_nested(value, found)
+            return found
+
+    _CHILDREN[cls] = function
+    return function
+
+
+def children(node: ASTNode) -> Sequence[ASTNode]:
+    """The nodes directly under ``node``, in field order."""
+    return (_CHILDREN.get(type(node)) or _children_function(type(node)))(node)
+
+
+def iter_children(node: ASTNode) -> Iterator[ASTNode]:
+    """Iterate over the nodes directly under ``node``, in field order."""
+    return iter(children(node))
+
+
+def walk(root: ASTNode) -> Iterator[ASTNode]:
+    """Every node of ``root``'s tree, parents before children (pre-order)."""
+    functions = _CHILDREN
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        kids = (functions.get(type(node)) or _children_function(type(node)))(node)
+        if kids:
+            stack.extend(reversed(kids))
+
+
+def transform(root: ASTNode, fn: Callable[[ASTNode], ASTNode]) -> ASTNode:
+    """Rebuild ``root`` bottom-up, replacing every node ``n`` by ``fn(n)``.
+
+    ``fn`` sees each node with its children already transformed.  A node
+    none of whose children changed is passed to ``fn`` as it is, so an
+    ``fn`` that returns its argument leaves the tree (and any cached data
+    on it) untouched.
+    """
+    done: list[ASTNode] = []
+    stack: list[tuple[ASTNode, Sequence[ASTNode] | None]] = [(root, None)]
+    while stack:
+        node, kids = stack.pop()
+        if kids is None:
+            kids = children(node)
+            stack.append((node, kids))
+            stack.extend((child, None) for child in reversed(kids))
+            continue
+        if kids:
+            new = done[-len(kids) :]
+            del done[-len(kids) :]
+            if any(a is not b for a, b in zip(new, kids, strict=True)):
+                node = _replace_children(node, iter(new))
+        done.append(fn(node))
+    return done[0]
+
+
+def _replace_children(node: ASTNode, new: Iterator[ASTNode]) -> ASTNode:
+    """Copy of ``node`` with its children, in field order, taken from ``new``."""
+    get, kinds, names = _table(type(node))
+    changes: dict[str, object] = {}
+    for name, kind, value in zip(names, kinds, get(node), strict=True):
+        if kind == _NODE:
+            changes[name] = None if value is None else next(new)
+        elif kind == _SEQUENCE:
+            items = cast("tuple[ASTNode, ...] | None", value)
+            changes[name] = items and tuple(next(new) for _ in items)
+        else:
+            changes[name] = _replace_nested(value, new)
+    return dataclasses.replace(node, **changes)
+
+
+def _replace_nested(value: object, new: Iterator[ASTNode]) -> object:
+    if isinstance(value, ASTNode):
+        return next(new)
+    if isinstance(value, tuple):
+        return tuple(_replace_nested(item, new) for item in value)
+    return value
@@ -0,0 +1,237 @@
+"""Parallel multi-file batch conversion for the txt2tex CLI.
+
+``txt2tex a.txt b.txt dir/ --jobs N`` lands here.  Lex/parse/generate runs
+in a process pool (the pipeline is pure Python, so threads would serialise
+on the GIL); the follow-up tex-fmt, fuzz and latexmk subprocesses run from
+a thread pool of the same size, so at most N external tools run at once.
+Each file's subprocess stage is scheduled as soon as its .tex is written,
+overlapping PDF builds with generation of the remaining files.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from txt2tex.cache import GenerationCache
+from txt2tex.compile import build_dir_for, compile_pdf, format_tex, typecheck_fuzz
+from txt2tex.pipeline import ConversionOptions, convert_text
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Per-run settings shared by every file in a batch."""
+
+    conversion: ConversionOptions
+    tex_only: bool = False
+    keep_aux: bool = False
+    format_tex: bool = False
+    jobs: int = 1
+    cache: GenerationCache | None = None
+    precompiled_preamble: bool = False
+    persistent_build: bool = False
+
+
+@dataclass(frozen=True)
+class FileStatus:
+    """Final status of one source file in a batch.
+
+    ``stage`` names the step that failed (``read``, ``generate``, ``write``,
+    ``typecheck``, ``compile``, or ``build`` when a build worker raised)
+    or is ``done`` on success.
+    """
+
+    source: Path
+    ok: bool
+    stage: str
+    message: str = ""
+    warnings: tuple[str, ...] = field(default=())
+
+
+def collect_inputs(paths: list[Path]) -> list[Path]:
+    """Expand directories to their .txt files (recursively, sorted).
+
+    Plain file arguments are kept as given.  Duplicates are dropped while
+    preserving first-seen order.
+    """
+    sources: list[Path] = []
+    seen: set[Path] = set()
+    for path in paths:
+        candidates = sorted(path.rglob("*.txt")) if path.is_dir() else [path]
+        for candidate in candidates:
+            key = candidate.resolve()
+            if key not in seen:
+                seen.add(key)
+                sources.append(candidate)
+    return sources
+
+
+def _generate_file(
+    source: Path, options: ConversionOptions, cache: GenerationCache | None
+) -> FileStatus:
+    """Read, convert and write one file (process-pool worker)."""
+    try:
+        text = source.read_text()
+    except FileNotFoundError:
+        return FileStatus(source, ok=False, stage="read", message="file not found")
+    except PermissionError:
+        return FileStatus(source, ok=False, stage="read", message="permission denied")
+    except UnicodeDecodeError as e:
+        return FileStatus(
+            source, ok=False, stage="read", message=f"encoding issue: {e}"
+        )
+
+    result = convert_text(text, options, cache)
+    if result.error is not None:
+        return FileStatus(source, ok=False, stage="generate", message=result.error)
+
+    output_path = source.with_suffix(".tex")
+    try:
+        output_path.write_text(result.latex)
+    except OSError as e:
+        return FileStatus(
+            source,
+            ok=False,
+            stage="write",
+            message=f"cannot write {output_path}: {e}",
+            warnings=result.warnings,
+        )
+    return FileStatus(source, ok=True, stage="done", warnings=result.warnings)
+
+
+def _build_file(status: FileStatus, options: BatchOptions) -> FileStatus:
+    """Run the subprocess stages (format, fuzz, PDF) for one generated file."""
+    tex_path = status.source.with_suffix(".tex")
+    if options.format_tex:
+        format_tex(tex_path)
+    if options.conversion.use_fuzz and not typecheck_fuzz(
+        tex_path, use_cache=options.cache is not None
+    ):
+        return FileStatus(
+            status.source,
+            ok=False,
+            stage="typecheck",
+            message="fuzz type checking failed",
+            warnings=status.warnings,
+        )
+    if not options.tex_only and not compile_pdf(
+        tex_path,
+        keep_aux=options.keep_aux,
+        precompiled=options.precompiled_preamble,
+        build_dir=build_dir_for(tex_path) if options.persistent_build else None,
+    ):
+        return FileStatus(
+            status.source,
+            ok=False,
+            stage="compile",
+            message="PDF compilation failed",
+            warnings=status.warnings,
+        )
+    return status
+
+
+def _report_generated(status: FileStatus) -> None:
+    """Print the immediate per-file outcome of the generation stage."""
+    for warning in status.warnings:
+        print(f"{status.source}: {warning}", file=sys.stderr)
+    if status.ok:
+        print(f"Generated: {status.source.with_suffix('.tex')}")
+    elif status.stage == "generate":
+        print(f"{status.source}:\n{status.message}", file=sys.stderr)
+    else:
+        print(f"Error: {status.source}: {status.message}", file=sys.stderr)
+
+
+def _print_summary(statuses: list[FileStatus]) -> None:
+    """Print the aggregated per-file status table."""
+    failed = [s for s in statuses if not s.ok]
+    print(
+        f"\nBatch summary: {len(statuses)} files, "
+        f"{len(statuses) - len(failed)} succeeded, {len(failed)} failed"
+    )
+    for status in statuses:
+        if status.ok:
+            print(f"  ok      {status.source}")
+        else:
+            print(f"  FAILED  {status.source} ({status.stage})")
+
+
+def _outcome(future: Future[FileStatus], source: Path, stage: str) -> FileStatus:
+    """Return a worker's status, or a failed one if the worker raised.
+
+    An unexpected exception (an OSError, a crashed pool process) fails only
+    the file it was working on; the rest of the batch carries on.
+    """
+    try:
+        return future.result()
+    except Exception as e:  # noqa: BLE001
+        return FileStatus(source, ok=False, stage=stage, message=f"{e!r}")
+
+
+def run_batch(sources: list[Path], options: BatchOptions) -> int:
+    """Convert many files concurrently and report per-file status.
+
+    Args:
+        sources: Source files (directories already expanded).
+        options: Batch settings; ``options.jobs`` bounds both pools.
+
+    Returns:
+        0 if every file succeeded, 1 otherwise.
+    """
+    if not sources:
+        print("Error: no .txt input files found", file=sys.stderr)
+        return 1
+
+    if options.conversion.use_fuzz and shutil.which("fuzz") is None:
+        print(
+            "Note: fuzz typechecker not found. Skipping type checking.",
+            file=sys.stderr,
+        )
+
+    needs_build = (
+        options.format_tex or options.conversion.use_fuzz or not options.tex_only
+    )
+    jobs = max(1, min(options.jobs, len(sources)))
+    results: dict[Path, FileStatus] = {}
+
+    with (
+        ProcessPoolExecutor(max_workers=jobs) as generators,
+        ThreadPoolExecutor(max_workers=jobs) as builders,
+    ):
+        pending = {
+            generators.submit(
+                _generate_file, source, options.conversion, options.cache
+            ): source
+            for source in sources
+        }
+        builds: dict[Future[FileStatus], Path] = {}
+        for future in as_completed(pending):
+            status = _outcome(future, pending[future], "generate")
+            _report_generated(status)
+            if status.ok and needs_build:
+                builds[builders.submit(_build_file, status, options)] = status.source
+            else:
+                results[status.source] = status
+        for build in as_completed(builds):
+            status = _outcome(build, builds[build], "build")
+            if not status.ok and status.stage == "build":
+                print(f"Error: {status.source}: {status.message}", file=sys.stderr)
+            results[status.source] = status
+
+    statuses = [results[source] for source in sources]
+    _print_summary(statuses)
+    return 0 if all(s.ok for s in statuses) else 1
+
+
+def default_jobs() -> int:
+    """Return the default batch concurrency (one job per CPU)."""
+    return os.cpu_count() or 1
@@ -0,0 +1,234 @@
+"""On-disk content-addressed cache for generated LaTeX.
+
+A cache entry maps a key derived from the source text, the generator
+options and the installed txt2tex code to the generated document and its
+overflow warnings.  On a hit the CLI skips lexing, parsing and generation
+entirely.
+
+Entries are small JSON files under ``<root>/<key[:2]>/<key>.json``.  Writes
+go through a temporary file and ``os.replace`` so concurrent batch workers
+never observe a partial entry.  Reads touch the entry's mtime.
+
+The same root also holds persistent PDF build directories (``build/``),
+precompiled formats (``formats/``) and fuzz verdict markers (``fuzz/``).
+``max_bytes`` bounds all of it together: :meth:`GenerationCache.evict`
+removes the least recently used generation entries, formats, verdict
+markers and whole build directories until the root fits.  Eviction scans
+the whole root, so stores never run it; the CLI calls
+:meth:`GenerationCache.evict_if_due`, which runs it at most once per
+``EVICT_INTERVAL`` (a stamp file in the root records the last run) and
+otherwise costs one ``stat``.
+
+The cache is strictly best-effort: any I/O problem degrades to a miss (or a
+skipped store) and never fails a conversion.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from functools import cache
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from txt2tex.__version__ import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from txt2tex.pipeline import ConversionOptions
+
+CACHE_DIR_ENV = "TXT2TEX_CACHE_DIR"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Sizes are counted in whole filesystem blocks, as ``du`` does, so small
+# files are not treated as free.
+_BLOCK_BYTES = 4096
+# Seconds between evictions started by evict_if_due
+EVICT_INTERVAL = 3600
+_EVICT_STAMP = "last-evict"
+
+
+@cache
+def _code_fingerprint() -> str:
+    """Fingerprint the installed package sources (path, size, mtime).
+
+    ``__version__`` only changes on release; folding in the module stats
+    keeps an editable checkout from serving output of older code.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        stat = path.stat()
+        digest.update(
+            f"{path.relative_to(package_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Return the cache root: ``$TXT2TEX_CACHE_DIR`` or the XDG cache dir."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "txt2tex"
+
+
+def _footprint(stat: os.stat_result) -> int:
+    """Bytes a file occupies, rounded up to whole blocks (at least one)."""
+    return max(1, -(-stat.st_size // _BLOCK_BYTES)) * _BLOCK_BYTES
+
+
+def _evictable_items(root: Path) -> Iterator[tuple[int, int, Path]]:
+    """Yield ``(last use, bytes, path)`` for everything eviction may remove.
+
+    Generation entries, formats and fuzz verdict markers are single files;
+    a build directory is removed as a whole, last used when its newest
+    file was written.
+    """
+    files = chain(
+        root.glob("*/*.json"), root.glob("formats/*.fmt"), root.glob("fuzz/*/*")
+    )
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        yield stat.st_mtime_ns, _footprint(stat), path
+    build_root = root / "build"
+    if not build_root.is_dir():
+        return
+    for build_dir in build_root.iterdir():
+        last_use = size = 0
+        for path in build_dir.rglob("*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                last_use = max(last_use, stat.st_mtime_ns)
+                size += _footprint(stat)
+        yield last_use, size, build_dir
+
+
+@dataclass(frozen=True)
+class CachedGeneration:
+    """A cached conversion: the generated document and its warnings."""
+
+    latex: str
+    warnings: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class GenerationCache:
+    """Size-bounded LRU cache of generated documents.
+
+    Instances are plain values (a directory and a size bound) so they can be
+    handed to process-pool workers.
+    """
+
+    root: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    @classmethod
+    def default(cls) -> GenerationCache:
+        """Return a cache rooted at :func:`default_cache_dir`."""
+        return cls(default_cache_dir())
+
+    def key(self, text: str, options: ConversionOptions) -> str:
+        """Return the content address for ``text`` under ``options``."""
+        digest = hashlib.sha256()
+        digest.update(f"txt2tex {__version__}\n".encode())
+        digest.update(f"code {_code_fingerprint()}\n".encode())
+        digest.update(json.dumps(asdict(options), sort_keys=True).encode())
+        digest.update(b"\n")
+        digest.update(text.encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, text: str, options: ConversionOptions) -> CachedGeneration | None:
+        """Return the cached conversion for ``text``, or None on a miss."""
+        path = self._entry_path(self.key(text, options))
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CachedGeneration(
+                latex=data["latex"], warnings=tuple(data["warnings"])
+            )
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def put(
+        self, text: str, options: ConversionOptions, entry: CachedGeneration
+    ) -> None:
+        """Store ``entry`` for ``text`` (eviction is left to :meth:`evict`)."""
+        path = self._entry_path(self.key(text, options))
+        payload = json.dumps({"latex": entry.latex, "warnings": list(entry.warnings)})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    tmp.write(payload)
+                Path(tmp_name).replace(path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+
+    def evict(self) -> None:
+        """Remove least recently used items until the root is within budget.
+
+        Scans the whole cache root, so call it once per run, not per store.
+        """
+        try:
+            items = list(_evictable_items(self.root))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in items)
+        for _, size, path in sorted(items):
+            if total <= self.max_bytes:
+                break
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def evict_if_due(self, interval: float = EVICT_INTERVAL) -> bool:
+        """Run :meth:`evict` unless it last ran under ``interval`` seconds ago.
+
+        Returns True when eviction ran.  Does nothing before the root
+        exists: there is nothing to evict.
+        """
+        stamp = self.root / _EVICT_STAMP
+        try:
+            if time.time() - stamp.stat().st_mtime < interval:
+                return False
+        except OSError:
+            pass
+        try:
+            stamp.touch()
+        except OSError:
+            return False
+        self.evict()
+        return True
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path in self.root.glob("*/*.json"):
+            path.unlink(missing_ok=True)
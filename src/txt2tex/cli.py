@@ -1,165 +1,185 @@
-"""Command-line interface for txt2tex."""
+"""Command-line interface for txt2tex.
+
+Imports are deferred to the mode that needs them: ``--version`` and
+``--help`` load nothing beyond argparse, and the lexer, parser and code
+generator are imported only when a conversion actually runs (not at all
+on a generation-cache hit or in ``--client`` mode with a live daemon).
+"""
 
 from __future__ import annotations
 
 import argparse
 import shutil
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from txt2tex.__version__ import __version__
-from txt2tex.compile import compile_pdf, copy_latex_files, format_tex, get_latex_dir
-from txt2tex.errors import ErrorFormatter
-from txt2tex.latex_gen import LaTeXGenerator
-from txt2tex.lexer import Lexer, LexerError
-from txt2tex.parser import Parser, ParserError
-from txt2tex.repl import repl_main
-
-# Re-export for backward compatibility
-__all__ = ["compile_pdf", "copy_latex_files", "format_tex", "get_latex_dir", "main"]
-
 
-def typecheck_fuzz(tex_path: Path) -> bool:
-    """Run fuzz typechecker on a .tex file.
-
-    Args:
-        tex_path: Path to the .tex file
-
-    Returns:
-        True if typechecking passed, False otherwise
-    """
-    fuzz = shutil.which("fuzz")
-    if fuzz is None:
-        return True  # Skip if not available
-
-    work_dir = tex_path.parent
+if TYPE_CHECKING:
+    from txt2tex.cache import GenerationCache
+    from txt2tex.compile import (
+        compile_pdf,
+        copy_latex_files,
+        format_tex,
+        get_latex_dir,
+        typecheck_fuzz,
+    )
+    from txt2tex.pipeline import ConversionOptions, ConversionResult
 
-    # Copy .sty files for fuzz
-    copied_files = copy_latex_files(work_dir)
+# Re-export for backward compatibility
+__all__ = [
+    "compile_pdf",
+    "copy_latex_files",
+    "format_tex",
+    "get_latex_dir",
+    "main",
+    "typecheck_fuzz",
+]
+
+_COMPILE_EXPORTS = frozenset(
+    {"compile_pdf", "copy_latex_files", "format_tex", "get_latex_dir", "typecheck_fuzz"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the backward-compatible compile re-exports on first use."""
+    if name in _COMPILE_EXPORTS:
+        from txt2tex import compile as compile_module  # noqa: PLC0415
+
+        return getattr(compile_module, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def _convert_via_client(
+    text: str,
+    options: ConversionOptions,
+    cache: GenerationCache | None,
+    socket_path: Path | None,
+) -> ConversionResult:
+    """Convert through the daemon, falling back to in-process conversion."""
+    from txt2tex.pipeline import convert_text  # noqa: PLC0415
+    from txt2tex.server import (  # noqa: PLC0415
+        ProtocolError,
+        default_socket_path,
+        request_conversion,
+    )
 
     try:
-        result = subprocess.run(  # noqa: S603
-            [fuzz, tex_path.name],
-            cwd=work_dir,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            print("Type checking failed:", file=sys.stderr)
-            # Show fuzz output (it contains the errors)
-            if result.stdout:
-                print(result.stdout, file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            return False
-
-        print("Type checking: passed")
-        return True
-
-    finally:
-        # Clean up copied files
-        for copied in copied_files:
-            copied.unlink(missing_ok=True)
-
-
-def _check_latex_package(pdflatex: str, package: str) -> bool:
-    """Check if a LaTeX package is available."""
-    test_doc = (
-        f"\\documentclass{{article}}\n"
-        f"\\usepackage{{{package}}}\n"
-        f"\\begin{{document}}\ntest\n\\end{{document}}\n"
+        result = request_conversion(text, options, socket_path or default_socket_path())
+    except ProtocolError as e:
+        print(f"Note: {e}; converting in-process", file=sys.stderr)
+        result = None
+    if result is None:
+        result = convert_text(text, options, cache)
+    return result
+
+
+def _build_outputs(
+    args: argparse.Namespace, output_path: Path, *, persistent_build: bool
+) -> int:
+    """Format, typecheck and compile a written .tex file.
+
+    The fuzz typecheck and the PDF build only read the .tex, so they run
+    concurrently; a PDF built from a document fuzz rejects is discarded
+    unless --keep-pdf-on-type-error is given.
+    """
+    from txt2tex.compile import (  # noqa: PLC0415
+        build_dir_for,
+        compile_pdf,
+        format_tex,
+        typecheck_and_compile_pdf,
+        typecheck_fuzz,
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_file = Path(tmpdir) / "test.tex"
-        tex_file.write_text(test_doc)
+    # Format with tex-fmt (if requested)
+    if args.format:
+        format_tex(output_path)
 
-        result = subprocess.run(  # noqa: S603
-            [pdflatex, "-interaction=batchmode", "-halt-on-error", "test.tex"],
-            cwd=tmpdir,
-            capture_output=True,
-            check=False,
+    # Type check with fuzz (if available and using fuzz package)
+    use_fuzz = not args.zed
+    if use_fuzz and shutil.which("fuzz") is None:
+        use_fuzz = False
+        print(
+            "Note: fuzz typechecker not found. Skipping type checking.",
+            file=sys.stderr,
+        )
+        print(
+            "      Install from: https://github.com/jmf-pobox/fuzz",
+            file=sys.stderr,
         )
-        return result.returncode == 0
-
-
-def check_environment() -> int:
-    """Check for required and optional dependencies."""
-    print("txt2tex environment check")
-    print("=" * 40)
-
-    all_ok = True
-
-    # Check pdflatex (required for PDF)
-    pdflatex = shutil.which("pdflatex")
-    if pdflatex:
-        print(f"✓ pdflatex: {pdflatex}")
-    else:
-        print("✗ pdflatex: NOT FOUND (required for PDF generation)")
-        all_ok = False
-
-    # Check required LaTeX packages (only if pdflatex found)
-    if pdflatex:
-        required_packages = ["adjustbox", "natbib", "geometry", "amsfonts", "hyperref"]
-        print("\nLaTeX packages:")
-        for pkg in required_packages:
-            if _check_latex_package(pdflatex, pkg):
-                print(f"  ✓ {pkg}")
-            else:
-                print(f"  ✗ {pkg}: NOT FOUND")
-                all_ok = False
-
-    # Check latexmk (optional, but recommended)
-    print("\nOptional tools:")
-    latexmk = shutil.which("latexmk")
-    if latexmk:
-        print(f"  ✓ latexmk: {latexmk}")
-    else:
-        print("  ○ latexmk: not found (recommended for bibliography)")
-
-    # Check bibtex (optional)
-    bibtex = shutil.which("bibtex")
-    if bibtex:
-        print(f"  ✓ bibtex: {bibtex}")
-    else:
-        print("  ○ bibtex: not found (for bibliography)")
-
-    # Check fuzz (optional)
-    fuzz = shutil.which("fuzz")
-    if fuzz:
-        print(f"  ✓ fuzz: {fuzz}")
-    else:
-        print("  ○ fuzz: not found (for Z notation type checking)")
 
-    print("\n" + "=" * 40)
-    if all_ok:
-        print("Environment OK - ready for PDF generation")
+    if args.tex_only:
+        if use_fuzz and not typecheck_fuzz(output_path, use_cache=not args.no_cache):
+            return 1
         return 0
 
-    print("Missing required dependencies - use --tex-only or install LaTeX")
-    print("On Ubuntu/Debian: sudo apt install texlive-latex-extra")
-    print("On macOS: Install MacTeX from https://www.tug.org/mactex/")
-    return 1
+    pdf_path = output_path.with_suffix(".pdf")
+    build_dir = build_dir_for(output_path) if persistent_build else None
+    print(f"Compiling: {pdf_path}")
+    if use_fuzz:
+        typecheck_ok, compiled = typecheck_and_compile_pdf(
+            output_path,
+            keep_pdf_on_type_error=args.keep_pdf_on_type_error,
+            fuzz_cache=not args.no_cache,
+            keep_aux=args.keep_aux,
+            precompiled=args.precompile_preamble,
+            build_dir=build_dir,
+        )
+        if not typecheck_ok:
+            if compiled:
+                print(f"Kept (despite type errors): {pdf_path}")
+            return 1
+    else:
+        compiled = compile_pdf(
+            output_path,
+            keep_aux=args.keep_aux,
+            precompiled=args.precompile_preamble,
+            build_dir=build_dir,
+        )
+    if not compiled:
+        return 1
+    print(f"Generated: {pdf_path}")
+    return 0
 
 
 _EPILOG = """\
 modes:
   txt2tex FILE.txt      read FILE.txt, write FILE.tex, compile FILE.pdf (default)
+  txt2tex A.txt B.txt DIR/ [--jobs N]
+                        batch mode: convert every file (DIR/ expands to its
+                        .txt files) in parallel and print a per-file summary
   txt2tex --tex-only FILE.txt
                         write FILE.tex only; skip PDF compilation
+  txt2tex --watch FILE.txt
+                        rebuild FILE.tex/FILE.pdf whenever FILE.txt changes
+  txt2tex serve [--socket PATH]
+                        run a conversion daemon on a Unix socket
+  txt2tex --client FILE.txt
+                        convert via the daemon (in-process if none is running)
   txt2tex -i            interactive REPL; no input file required
   txt2tex --check-env   report LaTeX/fuzz dependencies and exit
 
-The default mode runs fuzz type-checking (if fuzz is installed) before
-compiling. Use --zed to switch from fuzz to the zed-* package family."""
+The default mode runs fuzz type-checking (if fuzz is installed) alongside
+the PDF build and discards the PDF if type-checking fails. Use --zed to
+switch from fuzz to the zed-* package family.
+
+Generated LaTeX is cached in $TXT2TEX_CACHE_DIR (default
+~/.cache/txt2tex); unchanged sources skip regeneration. PDFs are built
+in a persistent per-document directory under the same cache, so
+unchanged documents need a single pdflatex pass and the source tree
+stays free of .aux/.log/.bbl files. Use --no-cache to bypass both, or
+--keep-aux to build next to the .tex and keep its auxiliary files."""
 
 
 def main() -> int:
     """Main entry point for txt2tex CLI."""
+    if sys.argv[1:2] == ["serve"]:
+        from txt2tex.server import serve_main  # noqa: PLC0415
+
+        return serve_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="Convert whiteboard notation to LaTeX",
         prog="txt2tex",
@@ -175,8 +195,8 @@ def main() -> int:
     parser.add_argument(
         "input",
         type=Path,
-        nargs="?",
-        help="Input text file with whiteboard notation",
+        nargs="*",
+        help="Input text file(s) or directories with whiteboard notation",
     )
     parser.add_argument(
         "-o",
@@ -184,6 +204,14 @@ def main() -> int:
         type=Path,
         help="Output LaTeX file (default: input with .tex extension)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Parallel jobs in batch mode (default: number of CPUs)",
+    )
     parser.add_argument(
         "--zed",
         action="store_true",
@@ -214,13 +242,49 @@ def main() -> int:
     parser.add_argument(
         "--keep-aux",
         action="store_true",
-        help="Keep auxiliary files (.aux, .log, etc.) after PDF compilation",
+        help="Build next to the .tex and keep its auxiliary files (.aux, .log, etc.)",
+    )
+    parser.add_argument(
+        "--keep-pdf-on-type-error",
+        action="store_true",
+        help="Keep the PDF when fuzz type checking fails (it runs concurrently)",
     )
     parser.add_argument(
         "--format",
         action="store_true",
         help="Format generated .tex file with tex-fmt (if available)",
     )
+    parser.add_argument(
+        "--precompile-preamble",
+        action="store_true",
+        help="Compile against a cached .fmt dump of the fixed preamble (faster)",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Rebuild whenever the input changes (incremental PDF builds)",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Convert via a running 'txt2tex serve' daemon if available",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Daemon socket for --client (default: $TXT2TEX_SOCKET)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Bypass the on-disk caches (generated LaTeX, fuzz verdicts, "
+            "build directory, --check-env results)"
+        ),
+    )
     parser.add_argument(
         "--check-env",
         action="store_true",
@@ -236,17 +300,33 @@ def main() -> int:
 
     # Handle --check-env
     if args.check_env:
-        return check_environment()
+        from txt2tex.environment import check_environment  # noqa: PLC0415
+
+        return check_environment(use_cache=not args.no_cache)
 
     # Handle --interactive
     if args.interactive:
-        return repl_main(use_fuzz=not args.zed)
+        from txt2tex.repl import repl_main  # noqa: PLC0415
+
+        return repl_main(
+            use_fuzz=not args.zed, precompiled_preamble=args.precompile_preamble
+        )
 
     # Require input file for normal operation
-    if args.input is None:
+    if not args.input:
         parser.error(
             "input file required (use -i for REPL, --check-env to verify deps)"
         )
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    batch_mode = len(args.input) > 1 or any(path.is_dir() for path in args.input)
+    if batch_mode and args.output is not None:
+        parser.error("-o/--output cannot be used with multiple inputs")
+    if batch_mode and args.watch:
+        parser.error("--watch takes a single input file")
+    if args.client and (batch_mode or args.watch):
+        parser.error("--client takes a single input file and no --watch")
 
     # Check for pdflatex early unless --tex-only
     if not args.tex_only and shutil.which("pdflatex") is None:
@@ -257,53 +337,99 @@ def main() -> int:
         )
         return 1
 
+    from txt2tex.cache import GenerationCache  # noqa: PLC0415
+    from txt2tex.pipeline import ConversionOptions  # noqa: PLC0415
+
+    options = ConversionOptions(
+        use_fuzz=not args.zed,
+        toc_parts=args.toc_parts,
+        warn_overflow=not args.no_warn_overflow,
+        overflow_threshold=args.overflow_threshold,
+    )
+    cache = None if args.no_cache else GenerationCache.default()
+    if cache is not None:
+        # Stores do not evict; bound the cache root at most once an interval.
+        cache.evict_if_due()
+    persistent_build = not (args.keep_aux or args.no_cache)
+
+    if batch_mode:
+        from txt2tex.batch import (  # noqa: PLC0415
+            BatchOptions,
+            collect_inputs,
+            default_jobs,
+            run_batch,
+        )
+
+        return run_batch(
+            collect_inputs(args.input),
+            BatchOptions(
+                conversion=options,
+                tex_only=args.tex_only,
+                keep_aux=args.keep_aux,
+                format_tex=args.format,
+                jobs=args.jobs if args.jobs is not None else default_jobs(),
+                cache=cache,
+                precompiled_preamble=args.precompile_preamble,
+                persistent_build=persistent_build,
+            ),
+        )
+
+    input_path: Path = args.input[0]
+
+    if args.watch:
+        from txt2tex.watch import Watcher, WatchOptions  # noqa: PLC0415
+
+        if not input_path.is_file():
+            print(f"Error: Input file not found: {input_path}", file=sys.stderr)
+            return 1
+        watcher = Watcher(
+            input_path,
+            args.output or input_path.with_suffix(".tex"),
+            WatchOptions(
+                conversion=options,
+                tex_only=args.tex_only,
+                format_tex=args.format,
+                cache=cache,
+                precompiled_preamble=args.precompile_preamble,
+                persistent_build=persistent_build,
+            ),
+        )
+        return watcher.run()
+
     # Read input
     try:
-        text = args.input.read_text()
+        text = input_path.read_text()
     except FileNotFoundError:
-        print(f"Error: Input file not found: {args.input}", file=sys.stderr)
+        print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         return 1
     except PermissionError:
-        print(f"Error: Permission denied reading: {args.input}", file=sys.stderr)
+        print(f"Error: Permission denied reading: {input_path}", file=sys.stderr)
         return 1
     except IsADirectoryError:
-        print(f"Error: Expected a file, got a directory: {args.input}", file=sys.stderr)
+        print(f"Error: Expected a file, got a directory: {input_path}", file=sys.stderr)
         return 1
     except UnicodeDecodeError as e:
         print(f"Error: File encoding issue: {e}", file=sys.stderr)
         return 1
 
-    # Process
-    formatter = ErrorFormatter(text)
-    try:
-        lexer = Lexer(text)
-        tokens = lexer.tokenize()
-
-        parser_obj = Parser(tokens)
-        ast = parser_obj.parse()
-    except LexerError as e:
-        formatted = formatter.format_error(e.message, e.line, e.column)
-        print(formatted, file=sys.stderr)
-        return 1
-    except ParserError as e:
-        formatted = formatter.format_error(e.message, e.token.line, e.token.column)
-        print(formatted, file=sys.stderr)
-        return 1
+    # Lex, parse and generate (via the daemon, or reusing a cached generation)
+    if args.client:
+        result = _convert_via_client(text, options, cache, args.socket)
+    else:
+        from txt2tex.pipeline import convert_text  # noqa: PLC0415
 
-    # LaTeX generation
-    generator = LaTeXGenerator(
-        use_fuzz=not args.zed,
-        toc_parts=args.toc_parts,
-        warn_overflow=not args.no_warn_overflow,
-        overflow_threshold=args.overflow_threshold,
-    )
-    latex = generator.generate_document(ast)
+        result = convert_text(text, options, cache)
+    if result.error is not None:
+        print(result.error, file=sys.stderr)
+        return 1
+    latex = result.latex
 
     # Emit any overflow warnings
-    generator.emit_warnings()
+    for warning in result.warnings:
+        print(warning, file=sys.stderr)
 
     # Write output
-    output_path = args.output or args.input.with_suffix(".tex")
+    output_path = args.output or input_path.with_suffix(".tex")
     try:
         output_path.write_text(latex)
         print(f"Generated: {output_path}")
@@ -317,33 +443,7 @@ def main() -> int:
         print(f"Error writing output file: {e}", file=sys.stderr)
         return 1
 
-    # Format with tex-fmt (if requested)
-    if args.format:
-        format_tex(output_path)
-
-    # Type check with fuzz (if available and using fuzz package)
-    if not args.zed:
-        if shutil.which("fuzz") is not None:
-            if not typecheck_fuzz(output_path):
-                return 1
-        else:
-            print(
-                "Note: fuzz typechecker not found. Skipping type checking.",
-                file=sys.stderr,
-            )
-            print(
-                "      Install from: https://github.com/jmf-pobox/fuzz",
-                file=sys.stderr,
-            )
-
-    # Compile to PDF unless --tex-only
-    if not args.tex_only:
-        print(f"Compiling: {output_path.with_suffix('.pdf')}")
-        if not compile_pdf(output_path, keep_aux=args.keep_aux):
-            return 1
-        print(f"Generated: {output_path.with_suffix('.pdf')}")
-
-    return 0
+    return _build_outputs(args, output_path, persistent_build=persistent_build)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
-"""Dispatch base for LaTeXGenerator — defines the two singledispatch entry points.
+"""Dispatch base for LaTeXGenerator — defines the singledispatch entry points.
 
-The two module-level names ``expr_register`` and ``item_register`` expose the
-``singledispatchmethod`` descriptors in a form that both mypy and pyright
-understand.  Mixin files import these names and apply them as decorators:
+The module-level names ``expr_register``, ``item_register`` and
+``steps_register`` expose the ``singledispatchmethod`` descriptors in a form
+that both mypy and pyright understand.  Mixin files import these names and
+apply them as decorators:
 
     @expr_register.register(SomeNode)
     def _generate_some_node(self, node: SomeNode, parent: Expr | None = None) -> str:
         ...
 
+Handlers of node types that expressions nest through are written as
+*steps* and registered with ``steps_register``: generators that yield each
+operand with its parent (or the steps of a sub-generation) and are sent
+the operand's LaTeX back.  :meth:`CodegenDispatch._drive_steps` runs them
+from an explicit stack, so nesting depth is bounded by memory rather than
+the recursion limit; their ``generate_expr`` handlers drive their steps.
+
 The final ``LaTeXGenerator`` class inherits from ``CodegenDispatch`` plus all
 the mixin classes so every registered handler is reachable through the MRO.
 """
@@ -21,12 +29,22 @@ from typing import TYPE_CHECKING, ClassVar, TypeVar, cast
 from txt2tex.ast_nodes import Binding, DocumentItem, Expr, SetComprehension
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from txt2tex.ast_nodes import (
         BinaryOp,
+        FunctionType,
         Identifier,
         Quantifier,
         SchemaInclusion,
     )
+    from txt2tex.codegen.annotations import NodeAnnotations
+    from txt2tex.free_vars import FreeVariables
+    from txt2tex.source import SourceFile
+
+    # A handler's steps: yields an operand and its parent, or the steps of a
+    # sub-generation, and is sent the generated LaTeX; returns its own.
+    ExprSteps = Generator["tuple[Expr, Expr | None] | ExprSteps", str, str]
 
 F = TypeVar("F", bound=Callable[..., object])
 
@@ -64,13 +82,17 @@ class CodegenDispatch:
         _in_z_paragraph: bool
         _in_inline_part: bool
         _quantifier_depth: int
+        _proof_tree_depths: dict[int, int]
         _warn_overflow: bool
         _overflow_warnings: list[str]
         _overflow_threshold: int
+        _source: SourceFile | None
         _first_part_in_solution: bool
         _in_argue_block: bool
         _dollar_sanitise_registry: dict[str, str]
         _synth_abbrev_counter: int
+        _annotations: NodeAnnotations
+        _free_vars: FreeVariables
         _in_hidden_fuzz_block: bool
         _toc_depth: int
         parts_format: str
@@ -82,6 +104,14 @@ class CodegenDispatch:
         _FUZZ_FUNCTION_LIKE_UNARY: ClassVar[frozenset[str]]
 
         def _has_line_breaks(self, expr: Expr) -> bool: ...
+        def _format_function_type(
+            self,
+            node: FunctionType,
+            arrow_latex: str,
+            domain_latex: str,
+            range_latex: str,
+        ) -> str: ...
+        def _function_arrow_latex(self, node: FunctionType) -> str: ...
         def _generate_identifier(
             self, node: Identifier, parent: Expr | None = None
         ) -> str: ...
@@ -200,6 +230,48 @@ class CodegenDispatch:
         """
         raise TypeError(f"Unknown expression type: {type(expr).__name__}")
 
+    @singledispatchmethod
+    def _expr_steps(self, expr: Expr, parent: Expr | None = None) -> ExprSteps | None:
+        """Return the steps generating ``expr``, or None if its handler has none.
+
+        Handlers registered here yield their operands instead of calling
+        ``generate_expr``; see :meth:`_drive_steps`.
+        """
+        return None
+
+    def _drive_steps(self, steps: ExprSteps) -> str:
+        """Run a handler's steps, and those of every operand that has steps.
+
+        A waiting handler sits on ``stack`` while its operand is generated,
+        and is sent the operand's LaTeX.  Operands without steps go through
+        ``generate_expr``.
+        """
+        # Bound once: each access to a singledispatchmethod builds a wrapper.
+        steps_for = self._expr_steps
+        generate_expr = self.generate_expr
+        stack = [steps]
+        latex: str | None = None
+        while True:
+            try:
+                request = stack[-1].send(latex)  # type: ignore[arg-type]
+            except StopIteration as done:
+                stack.pop()
+                if not stack:
+                    result: str = done.value
+                    return result
+                latex = done.value
+                continue
+            if isinstance(request, tuple):
+                operand, parent = request
+                nested = steps_for(operand, parent)
+                if nested is None:
+                    latex = generate_expr(operand, parent=parent)
+                    continue
+            else:
+                nested = request
+            stack.append(nested)
+            latex = None
+
 
 # Expose the singledispatchmethod descriptors with a typed interface so that
 # mypy and pyright understand @_expr_register.register(SomeNode) as a typed
@@ -208,3 +280,4 @@ class CodegenDispatch:
 # _RegisterHelper annotation makes the .register call fully typed.
 expr_register: RegisterHelper = CodegenDispatch.__dict__["generate_expr"]
 item_register: RegisterHelper = CodegenDispatch.__dict__["generate_document_item"]
+steps_register: RegisterHelper = CodegenDispatch.__dict__["_expr_steps"]
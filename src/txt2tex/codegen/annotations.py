@@ -0,0 +1,219 @@
+"""Per-subtree facts the generator asks about, computed in one pass.
+
+Whether an expression contains a line break decides how an expression
+item or a part is laid out; whether it contains a relational construct
+decides if an abbreviation may sit in a Z environment.  Both used to be
+answered by walking the subtree on every question, and the generator
+asks at several levels of the same tree.  :class:`NodeAnnotations`
+instead annotates the whole document bottom-up once, before generation,
+and answers each question with a table lookup.
+
+Facts depend only on a subtree's structure, so the table is keyed by
+its interned shape (:mod:`txt2tex.ast_intern`): each distinct subtree is
+annotated once however often it occurs.  A node the table has not seen,
+such as one the generator builds while rewriting, is annotated on first
+query (only its new part is visited).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from txt2tex.ast_intern import NodeInterner, is_interned, shape_of
+from txt2tex.ast_nodes import (
+    ASTNode,
+    BinaryOp,
+    Conditional,
+    Divide,
+    FunctionApp,
+    GenericInstantiation,
+    Group,
+    GroupAggregate,
+    Lambda,
+    NaturalJoin,
+    Project,
+    Quantifier,
+    RelationalImage,
+    RelationRename,
+    Restrict,
+    SequenceLiteral,
+    SetComprehension,
+    SetLiteral,
+    Subscript,
+    Superscript,
+    Tuple,
+    UnaryOp,
+    Ungroup,
+)
+from txt2tex.ast_walk import iter_children
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Bits of a packed annotation; the rest of the int is the subtree depth.
+_LINE_BREAKS = 1
+_DAT_CONSTRUCT = 2
+_CONNECTIVE = 4
+_DEPTH_SHIFT = 3
+
+
+# Nodes every child of which carries a line break up to them.
+_BREAKS_FROM_ALL_CHILDREN: tuple[type, ...] = (
+    BinaryOp,
+    Divide,
+    NaturalJoin,
+    Group,
+    Ungroup,
+    Restrict,
+    Project,
+    RelationRename,
+    UnaryOp,
+    Subscript,
+    Superscript,
+    SetLiteral,
+    SequenceLiteral,
+    Tuple,
+    FunctionApp,
+    RelationalImage,
+    GenericInstantiation,
+    Conditional,
+)
+# Nodes with a line_break_after flag of their own.
+_FLAGGED: tuple[type, ...] = (
+    BinaryOp,
+    NaturalJoin,
+    Divide,
+    Group,
+    Ungroup,
+    GroupAggregate,
+)
+
+
+def _line_breaks(expr: ASTNode) -> tuple[bool, Sequence[ASTNode] | None]:
+    """Return expr's own line-break flag and the children that carry one.
+
+    None stands for all of expr's children.  Anything else (Identifier,
+    Number, declarations, ...) neither breaks nor carries a line break.
+    """
+    if isinstance(expr, _FLAGGED):
+        own: bool = expr.line_break_after  # type: ignore[attr-defined]
+        if isinstance(expr, GroupAggregate):  # the clauses do not count
+            return own, (expr.relation,)
+        return own, None
+    if isinstance(expr, _BREAKS_FROM_ALL_CHILDREN):
+        return False, None
+    # Binders: only the domain and body (quantifiers have their own flag)
+    if isinstance(expr, Quantifier):
+        if expr.domain:
+            return expr.line_break_after_pipe, (expr.domain, expr.body)
+        return expr.line_break_after_pipe, (expr.body,)
+    if isinstance(expr, Lambda):
+        return False, (expr.body,)
+    if isinstance(expr, SetComprehension):
+        return False, [
+            child for child in (expr.domain, expr.predicate, expr.expression) if child
+        ]
+    return False, ()
+
+
+class NodeAnnotations:
+    """Side table of per-subtree flags and depths, keyed by shape.
+
+    For every annotated subtree it records whether the subtree has a line
+    break (by the layout rules of :func:`_line_breaks`), contains one of
+    ``dat_types`` or a ``BinaryOp`` whose operator is in
+    ``connective_ops``, and its depth in nodes.
+    """
+
+    def __init__(
+        self, *, dat_types: tuple[type, ...], connective_ops: frozenset[str]
+    ) -> None:
+        """Create an empty table for the given construct types and operators."""
+        self._dat_types = dat_types
+        self._connective_ops = connective_ops
+        # id(shape) -> packed flags and depth.  ``_shapes`` keeps every
+        # annotated shape alive, so the ids cannot be reused while in use.
+        self._facts: dict[int, int] = {}
+        self._shapes: list[ASTNode] = []
+        # Interns the trees annotated (the parser does not intern).
+        self._interner = NodeInterner()
+
+    def __len__(self) -> int:
+        """Number of distinct subtrees annotated so far."""
+        return len(self._facts)
+
+    def clear(self) -> None:
+        """Forget every annotation (and the shapes they keep alive)."""
+        self._facts.clear()
+        self._shapes.clear()
+        self._interner = NodeInterner()
+
+    def annotate(self, root: ASTNode) -> None:
+        """Annotate every subtree of ``root`` not annotated yet."""
+        self._annotate(root)
+
+    def has_line_breaks(self, node: ASTNode) -> bool:
+        """True if ``node`` or a sub-expression breaks the line."""
+        return bool(self._lookup(node) & _LINE_BREAKS)
+
+    def contains_dat_construct(self, node: ASTNode) -> bool:
+        """True if ``node``'s subtree has a relational construct."""
+        return bool(self._lookup(node) & _DAT_CONSTRUCT)
+
+    def contains_connective(self, node: ASTNode) -> bool:
+        """True if ``node``'s subtree has a propositional connective."""
+        return bool(self._lookup(node) & _CONNECTIVE)
+
+    def max_depth(self, node: ASTNode) -> int:
+        """Number of nodes on the longest path down from ``node``."""
+        return self._lookup(node) >> _DEPTH_SHIFT
+
+    def _lookup(self, node: ASTNode) -> int:
+        facts = self._facts.get(id(shape_of(node)))
+        if facts is None:
+            facts = self._annotate(node)
+        return facts
+
+    def _annotate(self, root: ASTNode) -> int:
+        """Annotate ``root``'s new subtrees; return ``root``'s packed facts."""
+        if not is_interned(root):
+            self._interner.intern(root)
+        facts = self._facts
+        # Depth-first from an explicit stack: a shape is pushed once to
+        # collect its children's shapes and again, with them, to be
+        # annotated after they are.  Shapes form a DAG (equal siblings are
+        # one shape), and one annotated already is never expanded again.
+        pending: list[tuple[ASTNode, list[ASTNode] | None]] = [(shape_of(root), None)]
+        while pending:
+            shape, children = pending.pop()
+            if id(shape) in facts:
+                continue
+            if children is None:
+                children = list(map(shape_of, iter_children(shape)))
+                pending.append((shape, children))
+                pending.extend((child, None) for child in children)
+            else:
+                facts[id(shape)] = self._facts_of(shape, children)
+                self._shapes.append(shape)
+        return facts[id(shape_of(root))]
+
+    def _facts_of(self, shape: ASTNode, children: list[ASTNode]) -> int:
+        """Packed facts of ``shape``, whose children's shapes are annotated."""
+        facts = self._facts
+        flags = 0
+        depth = 0
+        for child in children:
+            child_facts = facts[id(child)]
+            flags |= child_facts
+            depth = max(depth, child_facts >> _DEPTH_SHIFT)
+        flags &= _DAT_CONSTRUCT | _CONNECTIVE
+        if isinstance(shape, self._dat_types):
+            flags |= _DAT_CONSTRUCT
+        if isinstance(shape, BinaryOp) and shape.operator in self._connective_ops:
+            flags |= _CONNECTIVE
+        own, carriers = _line_breaks(shape)
+        if carriers is not None:
+            children = list(map(shape_of, carriers))
+        if own or any(facts[id(child)] & _LINE_BREAKS for child in children):
+            flags |= _LINE_BREAKS
+        return flags | (depth + 1) << _DEPTH_SHIFT
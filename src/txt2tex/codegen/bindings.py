@@ -5,15 +5,23 @@ The multi-typed comprehension that uses bindings ships with the
 expressions mixin as part of ``_generate_set_comprehension``.
 
 This mixin is composed into :class:`LaTeXGenerator` via multiple
-inheritance.  Methods are byte-identical to their counterparts in the
-pre-refactor monolithic ``latex_gen.py``; only their file location has
-changed.
+inheritance.  Binding is generated through steps (see
+:mod:`txt2tex.codegen._dispatch`), so binding literals nest to any depth.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from txt2tex.ast_nodes import Binding, Expr, Theta
-from txt2tex.codegen._dispatch import CodegenDispatch, expr_register
+from txt2tex.codegen._dispatch import (
+    CodegenDispatch,
+    expr_register,
+    steps_register,
+)
+
+if TYPE_CHECKING:
+    from txt2tex.codegen._dispatch import ExprSteps
 
 
 class _BindingsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
@@ -37,12 +45,17 @@ class _BindingsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         Component values are emitted with the full expression generator.
         Empty binding ``{| |}`` → ``\lblot \rblot``.
         """
+        return self._drive_steps(self._binding_steps(node, parent))
+
+    @steps_register.register(Binding)
+    def _binding_steps(self, node: Binding, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_binding``."""
         if not node.pairs:
             return r"\lblot~\rblot"
         components: list[str] = []
         for label, value_expr in node.pairs:
             label_latex = self._emit_attr_name(label)
-            value_latex = self.generate_expr(value_expr)
+            value_latex = yield value_expr, None
             components.append(f"{label_latex} == {value_latex}")
         inner = ", ".join(components)
         return rf"\lblot~{inner}~\rblot"
@@ -7,13 +7,15 @@ lambda chain helpers and the schema-binding emitter that are only
 called from this family.
 
 This mixin is composed into :class:`LaTeXGenerator` via multiple
-inheritance.  Methods are byte-identical to their counterparts in the
-pre-refactor monolithic ``latex_gen.py``; only their file location has
-changed.
+inheritance.  Handlers of nodes that expressions nest through are written
+as steps (see :mod:`txt2tex.codegen._dispatch`); their ``_generate_*``
+entry points drive them.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from txt2tex.ast_nodes import (
     BagLiteral,
     BinaryOp,
@@ -40,8 +42,16 @@ from txt2tex.ast_nodes import (
     TupleProjection,
     UnaryOp,
 )
-from txt2tex.codegen._dispatch import CodegenDispatch, expr_register
-from txt2tex.free_vars import expr_free_vars
+from txt2tex.codegen._dispatch import (
+    CodegenDispatch,
+    expr_register,
+    steps_register,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from txt2tex.codegen._dispatch import ExprSteps
 
 
 def _is_atomic_predicate(node: Expr) -> bool:
@@ -67,6 +77,16 @@ def _is_atomic_predicate(node: Expr) -> bool:
 class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
     """Mixin: handlers for general expression constructs."""
 
+    def _operands_steps(
+        self, operands: list[Expr], parent: Expr | None = None
+    ) -> Generator[tuple[Expr, Expr | None], str, list[str]]:
+        """Generate each of ``operands`` in order, returning their LaTeX."""
+        operands_latex: list[str] = []
+        for operand in operands:
+            operand_latex = yield operand, parent
+            operands_latex.append(operand_latex)
+        return operands_latex
+
     @expr_register.register(Identifier)
     def _generate_identifier(
         self,
@@ -189,12 +209,24 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         Postfix operators (~, +, *) are rendered as superscripts on the
         operand, not as prefix operators.
         """
+        return self._drive_steps(self._unary_op_steps(node, parent))
+
+    @steps_register.register(UnaryOp)
+    def _unary_op_steps(self, node: UnaryOp, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_unary_op``."""
+        op_latex = self._unary_op_latex(node)
+        operand = yield node.operand, None
+        return self._format_unary_op(node, op_latex, operand)
+
+    def _unary_op_latex(self, node: UnaryOp) -> str:
+        """Return the LaTeX for a unary operator symbol."""
         op_latex = self.UNARY_OPS.get(node.operator)
         if op_latex is None:
             raise ValueError(f"Unknown unary operator: {node.operator}")
+        return op_latex
 
-        operand = self.generate_expr(node.operand)
-
+    def _format_unary_op(self, node: UnaryOp, op_latex: str, operand: str) -> str:
+        """Combine a unary operator with its generated operand."""
         # UNARY_PRECEDENCE-driven rule: unary always binds tighter than binary.
         # Wrap the operand when it is a BinaryOp whose precedence is below the
         # unary level (which is every binary operator in the table).
@@ -269,6 +301,19 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         Supports line breaks with \\\\ for long expressions.
         """
+        return self._drive_steps(self._binary_op_steps(node, parent))
+
+    @steps_register.register(BinaryOp)
+    def _binary_op_steps(self, node: BinaryOp, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_binary_op``."""
+        op_latex = self._binary_op_latex(node)
+        # Pass this node as parent to children
+        left = yield node.left, node
+        right = yield node.right, node
+        return self._format_binary_op(node, op_latex, left, right)
+
+    def _binary_op_latex(self, node: BinaryOp) -> str:
+        """Return the LaTeX for a binary operator symbol in the current context."""
         op_latex = self.BINARY_OPS.get(node.operator)
         if op_latex is None:
             raise ValueError(f"Unknown binary operator: {node.operator}")
@@ -282,12 +327,12 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             op_latex = r"\comp"
 
         # Apply fuzz-specific operator mappings
-        op_latex = self._map_binary_operator(node.operator, op_latex)
-
-        # Pass this node as parent to children
-        left = self.generate_expr(node.left, parent=node)
-        right = self.generate_expr(node.right, parent=node)
+        return self._map_binary_operator(node.operator, op_latex)
 
+    def _format_binary_op(
+        self, node: BinaryOp, op_latex: str, left: str, right: str
+    ) -> str:
+        """Combine a binary operator with its generated operands."""
         # Add parentheses if needed for precedence and associativity
         if self._needs_parens(node.left, node, is_left_child=True):
             left = f"({left})"
@@ -318,13 +363,13 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
     def _collect_lambda_chain(
         self, node: Quantifier
-    ) -> tuple[list[tuple[list[str], Expr | None, str]], Expr, Expr | None]:
+    ) -> tuple[list[Quantifier], Expr, Expr | None]:
         """Walk a nested lambda Quantifier chain and collect all bindings.
 
         Returns:
-            A triple (bindings, predicate, expression) where:
-            - bindings: list of (variables, raw_domain, domain_latex) triples,
-              one per collected level
+            A triple (levels, predicate, expression) where:
+            - levels: the Quantifier nodes of the chain, outermost first, one
+              per collected declaration (its variables and domain)
             - predicate: the innermost body (predicate before @ separator), or
               the un-collapsed inner Quantifier when a dependency stops early
             - expression: the expression after @, or None if absent/stopped
@@ -336,33 +381,40 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         in the chain, collection stops early: the returned predicate is the
         inner Quantifier node and expression is None (dependency-stop sentinel).
         """
-        bindings: list[tuple[list[str], Expr | None, str]] = []
-        accumulated_names: frozenset[str] = frozenset()
+        levels: list[Quantifier] = []
+        accumulated_names: set[str] = set()
         current: Quantifier = node
         while True:
-            domain_latex = (
-                self.generate_expr(current.domain, parent=current)
-                if current.domain is not None
-                else ""
-            )
-            bindings.append((list(current.variables), current.domain, domain_latex))
-            accumulated_names = accumulated_names | frozenset(current.variables)
+            levels.append(current)
+            accumulated_names.update(current.variables)
             inner = current.body
             if isinstance(inner, Quantifier) and inner.quantifier == "lambda":
                 # Check whether the next level's domain references a bound name.
                 if inner.domain is not None:
-                    inner_domain_free = expr_free_vars(inner.domain)
-                    if inner_domain_free & accumulated_names:
+                    inner_domain_free = self._free_vars(inner.domain)
+                    if not inner_domain_free.isdisjoint(accumulated_names):
                         # Dependency detected: stop here.
-                        return bindings, inner, None
+                        return levels, inner, None
                 current = inner
             else:
                 # Base case: body is the predicate, expression is after @
-                return bindings, current.body, current.expression
+                return levels, current.body, current.expression
 
-    def _generate_lambda_quantifier(
+    def _declarations_steps(self, levels: list[Quantifier]) -> ExprSteps:
+        """Generate the schema text ``v0 : D0; v1 : D1; ...`` of a chain."""
+        colon = self._get_colon_separator()
+        decl_parts: list[str] = []
+        for level in levels:
+            domain_latex = (
+                (yield level.domain, level) if level.domain is not None else ""
+            )
+            vars_str = ", ".join(level.variables)
+            decl_parts.append(f"{vars_str} {colon} {domain_latex}")
+        return "; ".join(decl_parts)
+
+    def _lambda_quantifier_steps(
         self, node: Quantifier, parent: Expr | None = None
-    ) -> str:
+    ) -> ExprSteps:
         """Emit Spivey-canonical LaTeX for multi-decl lambda Quantifier nodes.
 
         Collects the full binding chain into a single SchemaText and emits:
@@ -374,9 +426,8 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         Wrapped in parentheses in fuzz mode when appearing inside an expression.
         """
-        bindings, predicate, expression = self._collect_lambda_chain(node)
-
-        colon = self._get_colon_separator()
+        levels, predicate, expression = self._collect_lambda_chain(node)
+        schema_text = yield from self._declarations_steps(levels)
 
         # Dependency-stop case: predicate is the un-collapsed inner Quantifier.
         if (
@@ -384,38 +435,26 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             and predicate.quantifier == "lambda"
             and expression is None
         ):
-            decl_parts: list[str] = []
-            for variables, _raw_domain, domain_latex in bindings:
-                vars_str = ", ".join(variables)
-                decl_parts.append(f"{vars_str} {colon} {domain_latex}")
-            schema_text = "; ".join(decl_parts)
-
             pipe_sep = self._get_mid_separator()
             # Recurse: the inner lambda will attempt its own collapse from scratch.
-            inner_latex = self._generate_lambda_quantifier(predicate, parent=node)
+            inner_latex = yield self._lambda_quantifier_steps(predicate, parent=node)
             result = rf"\lambda {schema_text} {pipe_sep} {inner_latex}"
             if self.use_fuzz:
                 result = f"({result})"
             return result
 
         # Normal full-collapse path.
-        decl_parts = []
-        for variables, _raw_domain, domain_latex in bindings:
-            vars_str = ", ".join(variables)
-            decl_parts.append(f"{vars_str} {colon} {domain_latex}")
-        schema_text = "; ".join(decl_parts)
-
         parts = [r"\lambda", schema_text]
 
         # Predicate (before @) — always present in the multi-decl form
         pipe_sep = self._get_mid_separator()
-        pred_latex = self.generate_expr(predicate, parent=node)
+        pred_latex = yield predicate, node
         parts.append(f"{pipe_sep} {pred_latex}")
 
         # Expression (after @)
         if expression is not None:
             bullet_sep = self._get_bullet_separator()
-            expr_latex = self.generate_expr(expression, parent=node)
+            expr_latex = yield expression, node
             parts.append(f"{bullet_sep} {expr_latex}")
 
         result = " ".join(parts)
@@ -428,16 +467,16 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
     def _collect_quantifier_chain(
         self, node: Quantifier
-    ) -> tuple[list[tuple[list[str], Expr | None, str]], Expr, Expr | None, Quantifier]:
+    ) -> tuple[list[Quantifier], Expr, Expr | None, Quantifier]:
         """Walk a nested same-quantifier chain and collect all bindings.
 
         Mirrors _collect_lambda_chain but works for forall/exists/exists1/mu.
         Stops when the body is not a Quantifier with the same quantifier attribute.
 
         Returns:
-            A 4-tuple (bindings, predicate, expression, innermost) where:
-            - bindings: list of (variables, raw_domain, domain_latex) triples,
-              one per collected level
+            A 4-tuple (levels, predicate, expression, innermost) where:
+            - levels: the Quantifier nodes of the chain, outermost first, one
+              per collected declaration (its variables and domain)
             - predicate: the innermost body (predicate before @ or | separator),
               or the un-collapsed inner Quantifier when dependency stops early
             - expression: the expression after @, or None if absent/stopped
@@ -449,32 +488,28 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         in the chain, collection stops early: the returned predicate is the
         inner Quantifier node and expression is None (dependency-stop sentinel).
         """
-        bindings: list[tuple[list[str], Expr | None, str]] = []
-        accumulated_names: frozenset[str] = frozenset()
+        levels: list[Quantifier] = []
+        # Extended in place: rebuilding it per level is quadratic in depth.
+        accumulated_names: set[str] = set()
         current: Quantifier = node
         while True:
-            domain_latex = (
-                self.generate_expr(current.domain, parent=current)
-                if current.domain is not None
-                else ""
-            )
-            bindings.append((list(current.variables), current.domain, domain_latex))
-            accumulated_names = accumulated_names | frozenset(current.variables)
+            levels.append(current)
+            accumulated_names.update(current.variables)
             inner = current.body
             if isinstance(inner, Quantifier) and inner.quantifier == node.quantifier:
                 # Check whether the next level's domain references a bound name.
                 if inner.domain is not None:
-                    inner_domain_free = expr_free_vars(inner.domain)
-                    if inner_domain_free & accumulated_names:
+                    inner_domain_free = self._free_vars(inner.domain)
+                    if not inner_domain_free.isdisjoint(accumulated_names):
                         # Dependency detected: stop here.
-                        return bindings, inner, None, current
+                        return levels, inner, None, current
                 current = inner
             else:
-                return bindings, current.body, current.expression, current
+                return levels, current.body, current.expression, current
 
-    def _generate_logical_quantifier(
+    def _logical_quantifier_steps(
         self, node: Quantifier, parent: Expr | None = None
-    ) -> str:
+    ) -> ExprSteps:
         """Emit Spivey-canonical LaTeX for multi-decl logical Quantifier nodes.
 
         Collects the full binding chain into a single SchemaText and emits one
@@ -493,11 +528,9 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         existing _generate_quantifier body unchanged.
         """
         quant_latex = self.QUANTIFIERS[node.quantifier]
-        bindings, predicate, expression, innermost = self._collect_quantifier_chain(
-            node
-        )
+        levels, predicate, expression, innermost = self._collect_quantifier_chain(node)
+        schema_text = yield from self._declarations_steps(levels)
 
-        colon = self._get_colon_separator()
         bullet_sep = self._get_bullet_separator()
 
         # Dependency-stop case: predicate is the un-collapsed inner Quantifier.
@@ -506,14 +539,8 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             and predicate.quantifier == node.quantifier
             and expression is None
         ):
-            decl_parts: list[str] = []
-            for variables, _raw_domain, domain_latex in bindings:
-                vars_str = ", ".join(variables)
-                decl_parts.append(f"{vars_str} {colon} {domain_latex}")
-            schema_text = "; ".join(decl_parts)
-
             # Recursively generate the inner quantifier (fresh collapse attempt).
-            inner_latex = self._generate_logical_quantifier(predicate, parent=node)
+            inner_latex = yield self._logical_quantifier_steps(predicate, parent=node)
             result = f"{quant_latex} {schema_text} {bullet_sep} {inner_latex}"
 
             if node.quantifier == "mu" and self.use_fuzz:
@@ -523,17 +550,11 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             return result
 
         # Normal full-collapse path.
-        decl_parts = []
-        for variables, _raw_domain, domain_latex in bindings:
-            vars_str = ", ".join(variables)
-            decl_parts.append(f"{vars_str} {colon} {domain_latex}")
-        schema_text = "; ".join(decl_parts)
-
         parts = [quant_latex, schema_text]
 
         self._quantifier_depth += 1
         indent = self._get_indentation()
-        pred_latex = self.generate_expr(predicate, parent=node)
+        pred_latex = yield predicate, node
         self._quantifier_depth -= 1
 
         # Honour line_break_after_pipe / line_break_after_bullet from the
@@ -550,7 +571,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             else:
                 parts.append(f"{pipe_sep} {pred_latex}")
             if expression is not None:
-                expr_latex = self.generate_expr(expression, parent=node)
+                expr_latex = yield expression, node
                 if bullet_break:
                     parts.append(f"{bullet_sep} \\\\\n{indent} {expr_latex}")
                 else:
@@ -562,7 +583,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                 parts.append(f"{pipe_sep} \\\\\n{indent} {pred_latex}")
             else:
                 parts.append(f"{pipe_sep} {pred_latex}")
-            expr_latex = self.generate_expr(expression, parent=node)
+            expr_latex = yield expression, node
             if bullet_break:
                 parts.append(f"{bullet_sep} \\\\\n{indent} {expr_latex}")
             else:
@@ -638,14 +659,21 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             exists S | P       -> \\exists S \\spot P
             exists S' | P      -> \\exists S^{\\prime} \\spot P
         """
+        return self._drive_steps(self._quantifier_steps(node, parent))
+
+    @steps_register.register(Quantifier)
+    def _quantifier_steps(
+        self, node: Quantifier, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_quantifier``."""
         # Schema-text quantification path (Z RM §3.10).
         if node.schema_binding is not None:
-            return self._generate_schema_quantifier(node, parent)
+            return (yield from self._schema_quantifier_steps(node, parent))
 
         # Multi-decl lambda: specialize to emit Spivey-canonical single-token form.
         # Single-decl lambda uses Lambda AST node and routes through _generate_lambda.
         if node.quantifier == "lambda":
-            return self._generate_lambda_quantifier(node, parent)
+            return (yield from self._lambda_quantifier_steps(node, parent))
 
         # Multi-decl chain: route to Spivey-canonical single-quantifier form.
         # A chain exists when the body is a Quantifier with the same operator.
@@ -653,7 +681,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             isinstance(node.body, Quantifier)
             and node.body.quantifier == node.quantifier
         ):
-            return self._generate_logical_quantifier(node, parent)
+            return (yield from self._logical_quantifier_steps(node, parent))
 
         quant_latex = self.QUANTIFIERS.get(node.quantifier)
         if quant_latex is None:
@@ -662,14 +690,14 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         # Generate variables (tuple pattern or comma-separated list)
         if node.tuple_pattern:
             # Tuple pattern: forall (x, y) : T | P
-            variables_str = self.generate_expr(node.tuple_pattern, parent=node)
+            variables_str = yield node.tuple_pattern, node
         else:
             # Simple variables: forall x, y : T | P
             variables_str = ", ".join(node.variables)
         parts = [quant_latex, variables_str]
 
         if node.domain:
-            domain_latex = self.generate_expr(node.domain, parent=node)
+            domain_latex = yield node.domain, node
             parts.append(self._get_colon_separator())
             parts.append(domain_latex)
 
@@ -678,7 +706,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         if node.quantifier == "mu" and self.use_fuzz:
             mu_parts = [quant_latex, variables_str]
             if node.domain:
-                domain_latex = self.generate_expr(node.domain, parent=node)
+                domain_latex = yield node.domain, node
                 mu_parts.append(f": {domain_latex}")
             # Always use | for predicate separator in mu
 
@@ -686,7 +714,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             self._quantifier_depth += 1
             # Get indentation at this depth (for line breaks)
             indent = self._get_indentation()
-            body_latex = self.generate_expr(node.body, parent=node)
+            body_latex = yield node.body, node
             self._quantifier_depth -= 1
 
             # Check for line break after pipe (|)
@@ -701,7 +729,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             # If there's an expression part, add @ separator and expression
             if node.expression:
                 mu_parts.append("@")
-                expr_latex = self.generate_expr(node.expression, parent=node)
+                expr_latex = yield node.expression, node
                 mu_parts.append(expr_latex)
 
             # Wrap ENTIRE mu expression in parentheses
@@ -716,7 +744,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             self._quantifier_depth += 1
             # Get indentation at this depth (for line breaks)
             indent = self._get_indentation()
-            body_latex = self.generate_expr(node.body, parent=node)
+            body_latex = yield node.body, node
             self._quantifier_depth -= 1
 
             # Check for line break after pipe (|)
@@ -729,7 +757,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
             # Add @ or bullet separator and expression
             bullet_sep = self._get_bullet_separator()
-            expr_latex = self.generate_expr(node.expression, parent=node)
+            expr_latex = yield node.expression, node
 
             # Check for line break after bullet (.)
             if node.line_break_after_bullet:
@@ -747,7 +775,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             self._quantifier_depth += 1
             # Get indentation at this depth (for line breaks)
             indent = self._get_indentation()
-            body_latex = self.generate_expr(node.body, parent=node)
+            body_latex = yield node.body, node
             self._quantifier_depth -= 1
 
             # Check for line break after pipe (|)
@@ -771,9 +799,9 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         return result
 
-    def _generate_schema_quantifier(
+    def _schema_quantifier_steps(
         self, node: Quantifier, parent: Expr | None = None
-    ) -> str:
+    ) -> ExprSteps:
         r"""Emit LaTeX for a schema-text quantifier (Z RM §3.10).
 
         The binding is emitted literally; fuzz expands the schema invariant.
@@ -788,7 +816,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             \exists_1 \Delta S \spot P
         """
         if node.schema_binding is None:
-            raise ValueError("_generate_schema_quantifier: schema_binding is None")
+            raise ValueError("_schema_quantifier_steps: schema_binding is None")
 
         quant_latex = self.QUANTIFIERS.get(node.quantifier)
         if quant_latex is None:
@@ -799,7 +827,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         self._quantifier_depth += 1
         indent = self._get_indentation()
-        body_latex = self.generate_expr(node.body, parent=node)
+        body_latex = yield node.body, node
         self._quantifier_depth -= 1
 
         if node.line_break_after_pipe:
@@ -825,17 +853,22 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         Note: Uses : (colon) for lambda binding, not \\colon.
         Fuzz requires @ separator and parentheses around lambdas in expressions.
         """
+        return self._drive_steps(self._lambda_steps(node, parent))
+
+    @steps_register.register(Lambda)
+    def _lambda_steps(self, node: Lambda, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_lambda``."""
         # Generate variables (comma-separated for multi-variable)
         variables_str = ", ".join(node.variables)
         parts = [r"\lambda", variables_str, ":"]
 
         # Generate domain (required for lambda)
-        domain_latex = self.generate_expr(node.domain)
+        domain_latex = yield node.domain, None
         parts.append(domain_latex)
 
         # Add bullet/@ separator
         parts.append(self._get_bullet_separator())
-        body_latex = self.generate_expr(node.body)
+        body_latex = yield node.body, None
         parts.append(body_latex)
 
         result = " ".join(parts)
@@ -868,6 +901,13 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         - { x : N . x^2 }
           -> \\{ x \\colon \\mathbb{N} \\bullet x^{2} \\}
         """
+        return self._drive_steps(self._set_comprehension_steps(node, parent))
+
+    @steps_register.register(SetComprehension)
+    def _set_comprehension_steps(
+        self, node: SetComprehension, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_set_comprehension``."""
         # Generate variables (comma-separated for multi-variable)
         variables_str = ", ".join(node.variables)
         # Both fuzz and LaTeX use \{ \} for set braces
@@ -875,7 +915,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         parts = [r"\{~", variables_str]
 
         if node.domain:
-            domain_latex = self.generate_expr(node.domain)
+            domain_latex = yield node.domain, None
             parts.append(self._get_colon_separator())
             parts.append(domain_latex)
 
@@ -886,7 +926,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             primary_bound = frozenset(node.variables)
             accumulated_bound = primary_bound
             for extra_var, extra_domain in node.extra_declarations:
-                domain_free = expr_free_vars(extra_domain)
+                domain_free = self._free_vars(extra_domain)
                 if domain_free & accumulated_bound:
                     offending = sorted(domain_free & accumulated_bound)
                     prior = offending[0]
@@ -900,7 +940,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                     )
                     raise ValueError(msg)
                 accumulated_bound = accumulated_bound | {extra_var}
-                extra_domain_latex = self.generate_expr(extra_domain)
+                extra_domain_latex = yield extra_domain, None
                 parts.append(";")
                 parts.append(extra_var)
                 parts.append(self._get_colon_separator())
@@ -913,7 +953,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                 parts.append(self._get_bullet_separator())
                 if node.line_break_after_bullet:
                     parts.append(r"\\")
-                expression_latex = self.generate_expr(node.expression)
+                expression_latex = yield node.expression, None
                 parts.append(expression_latex)
             # else: {x : T} with no predicate or expression - just the binding
         else:
@@ -926,7 +966,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             # Generate predicate, passing this node as parent so that nested
             # quantifiers receive the SetComprehension context and the
             # always-paren rule (ADR §4 context #2) fires correctly.
-            predicate_latex = self.generate_expr(node.predicate, parent=node)
+            predicate_latex = yield node.predicate, node
             parts.append(predicate_latex)
 
             # If expression is present, add bullet/@ and expression
@@ -934,7 +974,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                 parts.append(self._get_bullet_separator())
                 if node.line_break_after_bullet:
                     parts.append(r"\\")
-                expression_latex = self.generate_expr(node.expression)
+                expression_latex = yield node.expression, None
                 parts.append(expression_latex)
 
         # Close set
@@ -976,6 +1016,13 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         - ⟨a, b, c⟩(2) → \\langle a, b, c \\rangle(2)
         - (f ++ g)(x) → (f \\oplus g)(x)
         """
+        return self._drive_steps(self._function_app_steps(node, parent))
+
+    @steps_register.register(FunctionApp)
+    def _function_app_steps(
+        self, node: FunctionApp, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_function_app``."""
         # Special Z notation functions with LaTeX commands
         special_functions = {
             "seq": r"\seq",
@@ -995,7 +1042,7 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                 # LaTeX inserts thin space automatically
                 func_latex = special_functions[func_name]
                 arg = node.args[0]
-                arg_latex = self.generate_expr(arg)
+                arg_latex = yield arg, None
                 # Add parentheses for nested applications
                 # Critical for fuzz: P (P Z) → \power (\power Z) not \power \power Z
                 # FunctionApp: P (P Z), seq (seq X)
@@ -1011,7 +1058,8 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
             # Standard function application with identifier: f(x, y, z)
             # Process identifier through _generate_identifier for underscore handling
             func_latex = self._generate_identifier(node.function)
-            args_latex = ", ".join(self.generate_expr(arg) for arg in node.args)
+            args = yield from self._operands_steps(node.args)
+            args_latex = ", ".join(args)
             return f"{func_latex}({args_latex})"
 
         # Check for nested special functions: seq seq X or seq1 seq X
@@ -1031,18 +1079,20 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
                 # Generate: special_fn1~(special_fn2~args) with parens and tildes
                 outer_latex = special_functions[inner_func.name]
                 inner_latex = special_functions[node.function.args[0].name]
-                args_latex = " ".join(self.generate_expr(arg) for arg in node.args)
+                args = yield from self._operands_steps(node.args)
+                args_latex = " ".join(args)
                 # Add ~ spacing hints
                 return f"{outer_latex}~({inner_latex}~{args_latex})"
 
         # General function application: expr(args)
-        func_latex = self.generate_expr(node.function)
+        func_latex = yield node.function, None
 
         # Add parentheses around function if it's a binary operator
         if isinstance(node.function, BinaryOp):
             func_latex = f"({func_latex})"
 
-        args_latex = ", ".join(self.generate_expr(arg) for arg in node.args)
+        args = yield from self._operands_steps(node.args)
+        args_latex = ", ".join(args)
         return f"{func_latex}({args_latex})"
 
     @expr_register.register(Range)
@@ -1058,8 +1108,13 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         LaTeX rendering uses \\upto command.
         """
-        start_latex = self.generate_expr(node.start)
-        end_latex = self.generate_expr(node.end)
+        return self._drive_steps(self._range_steps(node, parent))
+
+    @steps_register.register(Range)
+    def _range_steps(self, node: Range, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_range``."""
+        start_latex = yield node.start, None
+        end_latex = yield node.end, None
         return f"{start_latex} \\upto {end_latex}"
 
     @expr_register.register(Conditional)
@@ -1080,9 +1135,16 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         Fuzz mode: \\IF condition \\THEN expr1 \\ELSE expr2
         Standard LaTeX: (\\mbox{if } ... \\mbox{ then } ... \\mbox{ else } ...)
         """
-        condition_latex = self.generate_expr(node.condition)
-        then_latex = self.generate_expr(node.then_expr)
-        else_latex = self.generate_expr(node.else_expr)
+        return self._drive_steps(self._conditional_steps(node, parent))
+
+    @steps_register.register(Conditional)
+    def _conditional_steps(
+        self, node: Conditional, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_conditional``."""
+        condition_latex = yield node.condition, None
+        then_latex = yield node.then_expr, None
+        else_latex = yield node.else_expr, None
 
         # Build line break markers
         break_after_cond = " \\\\\n\\t1 " if node.line_break_after_condition else " "
@@ -1120,10 +1182,17 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
           premium_plays~s \\\\
           \\mbox{if } user_status(x.2) = standard
         """
+        return self._drive_steps(self._guarded_cases_steps(node, parent))
+
+    @steps_register.register(GuardedCases)
+    def _guarded_cases_steps(
+        self, node: GuardedCases, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_guarded_cases``."""
         lines: list[str] = []
         for branch in node.branches:
-            expr_latex = self.generate_expr(branch.expression)
-            guard_latex = self.generate_expr(branch.guard)
+            expr_latex = yield branch.expression, None
+            guard_latex = yield branch.guard, None
             lines.append(f"{expr_latex} \\\\")
             lines.append(f"\\mbox{{if }} {guard_latex}")
             if branch != node.branches[-1]:  # Add line break between branches
@@ -1139,8 +1208,15 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         This is typically not called directly; GuardedCases handles the rendering.
         """
-        expr_latex = self.generate_expr(node.expression)
-        guard_latex = self.generate_expr(node.guard)
+        return self._drive_steps(self._guarded_branch_steps(node, parent))
+
+    @steps_register.register(GuardedBranch)
+    def _guarded_branch_steps(
+        self, node: GuardedBranch, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_guarded_branch``."""
+        expr_latex = yield node.expression, None
+        guard_latex = yield node.guard, None
         return f"{expr_latex} \\mbox{{if }} {guard_latex}"
 
     @expr_register.register(StringLit)
@@ -1172,21 +1248,34 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         - {a, b} -> \\{a, b\\}
         - {} -> \\{\\} (empty set)
         """
+        return self._drive_steps(self._set_literal_steps(node, parent))
+
+    @steps_register.register(SetLiteral)
+    def _set_literal_steps(
+        self, node: SetLiteral, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_set_literal``."""
         if not node.elements:
             # Empty set - render as \{\}
             return r"\{\}"
 
         # Generate comma-separated elements
-        elements_latex = ", ".join(
-            self.generate_expr(elem, parent=node) for elem in node.elements
-        )
+        elements = yield from self._operands_steps(node.elements, node)
+        elements_latex = ", ".join(elements)
         return f"\\{{{elements_latex}\\}}"
 
     @expr_register.register(Subscript)
     def _generate_subscript(self, node: Subscript, parent: Expr | None = None) -> str:
         """Generate LaTeX for subscript (a_1, x_i)."""
-        base = self.generate_expr(node.base)
-        index = self.generate_expr(node.index)
+        return self._drive_steps(self._subscript_steps(node, parent))
+
+    @steps_register.register(Subscript)
+    def _subscript_steps(
+        self, node: Subscript, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_subscript``."""
+        base = yield node.base, None
+        index = yield node.index, None
 
         # Wrap index in braces if it's more than one character
         if len(index) > 1:
@@ -1198,8 +1287,15 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         self, node: Superscript, parent: Expr | None = None
     ) -> str:
         """Generate LaTeX for superscript using \\bsup...\\esup (fuzz-compatible)."""
-        base = self.generate_expr(node.base)
-        exponent = self.generate_expr(node.exponent)
+        return self._drive_steps(self._superscript_steps(node, parent))
+
+    @steps_register.register(Superscript)
+    def _superscript_steps(
+        self, node: Superscript, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_superscript``."""
+        base = yield node.base, None
+        exponent = yield node.exponent, None
 
         # Use \bsup...\esup for fuzz compatibility
         # Standard ^{n} doesn't work in fuzz mode
@@ -1222,7 +1318,13 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         Tuples are rendered as comma-separated expressions in parentheses.
         """
-        elements_latex = ", ".join(self.generate_expr(elem) for elem in node.elements)
+        return self._drive_steps(self._tuple_steps(node, parent))
+
+    @steps_register.register(Tuple)
+    def _tuple_steps(self, node: Tuple, parent: Expr | None = None) -> ExprSteps:
+        """Steps of ``_generate_tuple``."""
+        elements = yield from self._operands_steps(node.elements)
+        elements_latex = ", ".join(elements)
         return f"({elements_latex})"
 
     @expr_register.register(RelationalImage)
@@ -1242,8 +1344,15 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         Note: fuzz requires the entire expression wrapped in parentheses with
         spaces around \\limg/\\rimg, not function application syntax.
         """
-        relation_latex = self.generate_expr(node.relation)
-        set_latex = self.generate_expr(node.set)
+        return self._drive_steps(self._relational_image_steps(node, parent))
+
+    @steps_register.register(RelationalImage)
+    def _relational_image_steps(
+        self, node: RelationalImage, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_relational_image``."""
+        relation_latex = yield node.relation, None
+        set_latex = yield node.set, None
         return f"({relation_latex} \\limg {set_latex} \\rimg)"
 
     @expr_register.register(SequenceLiteral)
@@ -1257,12 +1366,20 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         - ⟨a⟩ -> \\langle a \\rangle
         - ⟨1, 2, 3⟩ -> \\langle 1, 2, 3 \\rangle
         """
+        return self._drive_steps(self._sequence_literal_steps(node, parent))
+
+    @steps_register.register(SequenceLiteral)
+    def _sequence_literal_steps(
+        self, node: SequenceLiteral, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_sequence_literal``."""
         if not node.elements:
             # Empty sequence
             return r"\langle \rangle"
 
         # Generate comma-separated elements
-        elements_latex = ", ".join(self.generate_expr(elem) for elem in node.elements)
+        elements = yield from self._operands_steps(node.elements)
+        elements_latex = ", ".join(elements)
         return f"\\langle {elements_latex} \\rangle"
 
     @expr_register.register(TupleProjection)
@@ -1287,7 +1404,14 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
         Numeric projections (.1, .2) violate fuzz grammar
         (requires Var-Name, not Number).
         """
-        base_latex = self.generate_expr(node.base)
+        return self._drive_steps(self._tuple_projection_steps(node, parent))
+
+    @steps_register.register(TupleProjection)
+    def _tuple_projection_steps(
+        self, node: TupleProjection, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_tuple_projection``."""
+        base_latex = yield node.base, None
 
         # Add parentheses if base is a binary operator
         if isinstance(node.base, BinaryOp):
@@ -1308,6 +1432,14 @@ class _ExpressionsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         Bags are multisets where elements can appear multiple times.
         """
+        return self._drive_steps(self._bag_literal_steps(node, parent))
+
+    @steps_register.register(BagLiteral)
+    def _bag_literal_steps(
+        self, node: BagLiteral, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_bag_literal``."""
         # Generate comma-separated elements
-        elements_latex = ", ".join(self.generate_expr(elem) for elem in node.elements)
+        elements = yield from self._operands_steps(node.elements)
+        elements_latex = ", ".join(elements)
         return f"\\lbag {elements_latex} \\rbag"
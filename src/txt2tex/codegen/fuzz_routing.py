@@ -13,9 +13,10 @@ to their counterparts in the pre-refactor monolithic ``latex_gen.py``.
 
 from __future__ import annotations
 
-from typing import ClassVar, cast
+from typing import ClassVar
 
 from txt2tex.ast_nodes import (
+    ASTNode,
     Binding,
     Divide,
     Expr,
@@ -55,23 +56,14 @@ class _FuzzRoutingCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass
 
         Relational constructs (algebra, bindings, GROUP/UNGROUP) cannot sit
         inside a Z environment without fuzz rejecting their syntax.
-        This recursive walk lets abbreviation emission switch between an
-        in-zed form (pure Z RHS) and a noindent-math form (relational RHS).
+        This test lets abbreviation emission switch between an in-zed form
+        (pure Z RHS) and a noindent-math form (relational RHS).  It is a
+        lookup in the annotation table ``generate_document`` fills, so
+        asking again about the same subtree does not walk it again.
         """
-        if isinstance(expr, self._DAT_EXPRESSION_TYPES):
-            return True
-        fields = getattr(expr, "__dataclass_fields__", None)
-        if fields is None:
-            return False
-        for field_name in fields:
-            value: object = getattr(expr, field_name)
-            if isinstance(value, list):
-                items = cast("list[object]", value)
-                if any(self._expression_contains_dat_construct(v) for v in items):
-                    return True
-            elif self._expression_contains_dat_construct(value):
-                return True
-        return False
+        return isinstance(expr, ASTNode) and self._annotations.contains_dat_construct(
+            expr
+        )
 
     def _binding_to_tuple_expr(self, binding: Binding) -> Expr:
         """Convert a binding to the equivalent tuple expression for fuzz.
@@ -65,6 +65,13 @@ class _OverflowCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         if max_line_len <= self._overflow_threshold:
             return
 
+        if content_preview is None and self._source is not None:
+            source_text = self._source.line(source_line).strip()
+            if source_text:
+                content_preview = (
+                    source_text[:50] + "..." if len(source_text) > 50 else source_text
+                )
+
         # Build warning message.  Parenthesise to avoid the `or` binding
         # tighter than the conditional expression, which would discard a
         # caller-supplied `content_preview` whenever `len(latex) <= 50`.
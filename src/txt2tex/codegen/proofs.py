@@ -6,14 +6,15 @@ analysis, assumption scoping) and justification-label/text formatting
 helpers.
 
 This mixin is composed into :class:`LaTeXGenerator` via multiple
-inheritance.  Methods are byte-identical to their counterparts in the
-pre-refactor monolithic ``latex_gen.py``; only their file location has
-changed.
+inheritance.  The proof-tree internals are written as steps (see
+:mod:`txt2tex.codegen._dispatch`): a sub-proof is yielded rather than
+generated by a recursive call, so proofs nest to any depth.
 """
 
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING
 
 from txt2tex.ast_nodes import (
     ArgueChain,
@@ -27,6 +28,9 @@ from txt2tex.ast_nodes import (
 )
 from txt2tex.codegen._dispatch import CodegenDispatch, item_register
 
+if TYPE_CHECKING:
+    from txt2tex.codegen._dispatch import ExprSteps
+
 
 class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
     """Mixin: handlers for proof constructs."""
@@ -247,7 +251,12 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         lines.append(r"\adjustbox{max width=" + max_width + r"}{%")
 
         # Generate proof tree in display math
-        proof_latex = self._generate_proof_node_infer(node.conclusion)
+        try:
+            proof_latex = self._drive_steps(
+                self._proof_node_infer_steps(node.conclusion)
+            )
+        finally:
+            self._proof_tree_depths.clear()
         lines.append(r"$\displaystyle")
         lines.append(proof_latex)
         lines.append(r"$%")
@@ -271,17 +280,38 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         return f"\\ulcorner {expr_latex} \\urcorner"
 
     def _calculate_tree_depth(self, node: ProofNode | CaseAnalysis) -> int:
-        """Calculate the depth of a proof tree (number of inference levels)."""
-        if isinstance(node, CaseAnalysis):
-            if not node.steps:
-                return 0
+        """Calculate the depth of a proof tree (number of inference levels).
+
+        Walked from an explicit stack: a node's depth is computed once the
+        depths of all of its children are known.  Depths are kept until the
+        proof tree is generated, so nested case analyses are walked once.
+        """
+        depths = self._proof_tree_depths
+        stack: list[ProofNode | CaseAnalysis] = [node]
+        while stack:
+            current = stack[-1]
+            children = (
+                current.steps if isinstance(current, CaseAnalysis) else current.children
+            )
+            pending = [child for child in children if id(child) not in depths]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if not children:
+                depths[id(current)] = 0
+                continue
+            max_child_depth = max(depths[id(child)] for child in children)
+            if not isinstance(current, CaseAnalysis):
+                depths[id(current)] = 1 + max_child_depth
+                continue
 
             # For case analysis, count sequential steps (not just nested depth)
             # Sequential steps stack vertically, increasing height
             sibling_count = 0
             sequential_count = 0
 
-            for step in node.steps:
+            for step in current.steps:
                 if step.is_sibling:
                     if sequential_count == 0:
                         sibling_count += 1
@@ -294,24 +324,18 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             # Height is based on sequential steps + 1 for sibling layer (if any)
             # Plus the depth of any nested children
             sibling_layer = 1 if sibling_count > 0 else 0
-            max_child_depth = max(
-                (self._calculate_tree_depth(step) for step in node.steps), default=0
-            )
-
-            return sibling_layer + sequential_count + max_child_depth
-
-        if not node.children:
-            return 0
-
-        return 1 + max(self._calculate_tree_depth(child) for child in node.children)
+            depths[id(current)] = sibling_layer + sequential_count + max_child_depth
+        return depths[id(node)]
 
-    def _generate_proof_node_infer(self, node: ProofNode) -> str:
+    def _proof_node_infer_steps(self, node: ProofNode) -> ExprSteps:
         """
         Generate \\infer macro for a proof node (bottom-up natural deduction).
 
         Returns LaTeX string for this node and its supporting premises.
 
-        Handles synthetic top-level case analysis nodes.
+        Handles synthetic top-level case analysis nodes.  Written as steps
+        (see ``_drive_steps``) so that deep proofs need no Python frame per
+        level: sub-proofs are yielded rather than generated recursively.
         """
         # Check for synthetic top-level case analysis node
         # These are created when proof starts with CASE statements
@@ -325,10 +349,10 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             for child in node.children:
                 if isinstance(child, CaseAnalysis):
                     # Use existing case analysis generation method
-                    case_latexes.append(self._generate_case_analysis(child))
+                    case_latexes.append((yield self._case_analysis_steps(child)))
                 else:
                     # Must be ProofNode
-                    case_latexes.append(self._generate_proof_node_infer(child))
+                    case_latexes.append((yield self._proof_node_infer_steps(child)))
 
             # Join cases side-by-side with &
             return " & ".join(case_latexes) if case_latexes else ""
@@ -351,15 +375,19 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             if len(node.children) == 1 and isinstance(node.children[0], ProofNode):
                 single_child = node.children[0]
                 # Generate child with assumption as its premise
-                return self._generate_inference_from_assumption(
-                    single_child, assumption_latex, node.label
+                return (
+                    yield from self._inference_from_assumption_steps(
+                        single_child, assumption_latex, node.label
+                    )
                 )
 
             # Multiple children or case analysis - need special handling
-            return self._generate_complex_assumption_scope(node, assumption_latex)
+            return (
+                yield from self._complex_assumption_scope_steps(node, assumption_latex)
+            )
 
         # Generate expression for conclusion
-        expr_latex = self.generate_expr(node.expression)
+        expr_latex = yield node.expression, None
 
         # Check for assumption reference FIRST (before checking children)
         # Pattern: "from N" where N is a digit
@@ -374,11 +402,11 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
                 # If this node has children, they should be rendered below
                 if node.children:
                     # Generate children as premises
-                    child_latexes = [
-                        self._generate_proof_node_infer(child)
-                        for child in node.children
-                        if isinstance(child, ProofNode)
-                    ]
+                    child_latexes: list[str] = []
+                    for child in node.children:
+                        if isinstance(child, ProofNode):
+                            child_latex = yield self._proof_node_infer_steps(child)
+                            child_latexes.append(child_latex)
                     premises = "\n  ".join(child_latexes)
                     boxed = f"\\ulcorner {expr_latex} \\urcorner^{{[{ref_label}]}}"
                     return f"\\infer{{{boxed}}}{{\n  {premises}\n}}"
@@ -416,7 +444,7 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
                     current_group = []
             else:
                 # child is ProofNode (only other type in union)
-                child_latex = self._generate_proof_node_infer(child)
+                child_latex = yield self._proof_node_infer_steps(child)
 
                 if child.is_sibling and current_group:
                     # Add to current sibling group
@@ -452,7 +480,7 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             # Generate raised cases with staggered heights
             raised_cases: list[str] = []
             for case_position, (_idx, case) in enumerate(case_children):
-                case_latex = self._generate_case_analysis(case)
+                case_latex = yield self._case_analysis_steps(case)
                 depth = self._calculate_tree_depth(case)
 
                 # STAGGERED HEIGHT FORMULA:
@@ -492,11 +520,11 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         # No justification - use plain \infer
         return f"\\infer{{{expr_latex}}}{{\n  {premises}\n}}"
 
-    def _generate_inference_from_assumption(
+    def _inference_from_assumption_steps(
         self, node: ProofNode, assumption_latex: str, assumption_label: int | None
-    ) -> str:
+    ) -> ExprSteps:
         """Generate an inference that derives from a boxed assumption."""
-        expr_latex = self.generate_expr(node.expression)
+        expr_latex = yield node.expression, None
 
         # If this node has no children, it directly derives from the assumption
         if not node.children:
@@ -507,15 +535,17 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
 
         # Node has children - generate them recursively
         # Children should ultimately reference the assumption as their premise
-        return self._generate_proof_node_infer_with_assumption(
-            node, assumption_latex, assumption_label
+        return (
+            yield from self._proof_node_infer_with_assumption_steps(
+                node, assumption_latex, assumption_label
+            )
         )
 
-    def _generate_proof_node_infer_with_assumption(
+    def _proof_node_infer_with_assumption_steps(
         self, node: ProofNode, assumption_latex: str, assumption_label: int | None
-    ) -> str:
+    ) -> ExprSteps:
         """Generate inference node with leaves referencing the given assumption."""
-        expr_latex = self.generate_expr(node.expression)
+        expr_latex = yield node.expression, None
 
         # Base case: no children means this should derive from the assumption
         if not node.children:
@@ -540,13 +570,13 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         premises: list[str] = []
         for child in node.children:
             if isinstance(child, CaseAnalysis):
-                premises.append(self._generate_case_analysis(child))
+                premises.append((yield self._case_analysis_steps(child)))
             elif child.is_assumption:
                 # Child is its own assumption - process independently
-                child_latex = self._generate_proof_node_infer(child)
+                child_latex = yield self._proof_node_infer_steps(child)
                 premises.append(child_latex)
             else:
-                child_latex = self._generate_proof_node_infer_with_assumption(
+                child_latex = yield self._proof_node_infer_with_assumption_steps(
                     child, assumption_latex, assumption_label
                 )
                 premises.append(child_latex)
@@ -560,9 +590,9 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             return f"\\infer[{just}]{{{expr_latex}}}{{{premises_str}}}"
         return f"\\infer{{{expr_latex}}}{{{premises_str}}}"
 
-    def _generate_complex_assumption_scope(
+    def _complex_assumption_scope_steps(
         self, assumption_node: ProofNode, assumption_latex: str
-    ) -> str:
+    ) -> ExprSteps:
         """Handle complex assumption scopes with multiple children or case analysis."""
         # Group children into sibling groups and sequential derivations
         # Siblings (marked with ::) are horizontal, non-siblings nest vertically
@@ -597,9 +627,9 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         sibling_latex_parts: list[str] = []
         for child in sibling_group:
             if isinstance(child, CaseAnalysis):
-                sibling_latex_parts.append(self._generate_case_analysis(child))
+                sibling_latex_parts.append((yield self._case_analysis_steps(child)))
             else:
-                child_latex = self._generate_proof_node_infer_with_assumption(
+                child_latex = yield self._proof_node_infer_with_assumption_steps(
                     child, assumption_latex, assumption_node.label
                 )
                 sibling_latex_parts.append(child_latex)
@@ -614,13 +644,13 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         # Each sequential step uses the previous result as its premise
         for child in sequential:
             if isinstance(child, CaseAnalysis):
-                child_latex = self._generate_case_analysis(child)
+                child_latex = yield self._case_analysis_steps(child)
             # Generate the child
             # If it has children, we need to process them recursively
             elif child.children:
                 # This node has children - need to generate a full subtree
                 # The subtree should use current_premises as its base
-                expr_latex = self.generate_expr(child.expression)
+                expr_latex = yield child.expression, None
 
                 # Generate children
                 child_premises_parts: list[str] = []
@@ -628,12 +658,14 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
                 for grandchild in child.children:
                     if isinstance(grandchild, CaseAnalysis):
                         child_premises_parts.append(
-                            self._generate_case_analysis(grandchild)
+                            (yield self._case_analysis_steps(grandchild))
                         )
                         has_case_analysis = True
                     else:
                         # Recurse to handle nested structure
-                        grandchild_latex = self._generate_proof_node_infer(grandchild)
+                        grandchild_latex = yield self._proof_node_infer_steps(
+                            grandchild
+                        )
                         child_premises_parts.append(grandchild_latex)
 
                 # Include siblings from parent scope as additional premises.
@@ -712,7 +744,7 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
                     child_latex = f"\\infer{{{expr_latex}}}{{{child_premises}}}"
             else:
                 # No children - derive directly from current_premises
-                expr_latex = self.generate_expr(child.expression)
+                expr_latex = yield child.expression, None
 
                 if child.justification:
                     just = self._format_justification_label(child.justification)
@@ -727,7 +759,7 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
 
         return current_premises
 
-    def _generate_case_analysis(self, case: CaseAnalysis) -> str:
+    def _case_analysis_steps(self, case: CaseAnalysis) -> ExprSteps:
         """Generate LaTeX for case analysis branch."""
         # For each case, generate the proof steps
         # Cases are typically rendered as separate inference branches
@@ -737,7 +769,7 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         # Generate the first step (usually the conclusion of this case)
         # In many cases, there's just one step per case
         if len(case.steps) == 1:
-            return self._generate_proof_node_infer(case.steps[0])
+            return (yield from self._proof_node_infer_steps(case.steps[0]))
 
         # Multiple steps - need to group siblings horizontally, rest vertically
         # Separate siblings from sequential steps
@@ -761,17 +793,18 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         if sibling_group:
             if len(sibling_group) == 1:
                 # Single step - straightforward
-                current_result = self._generate_proof_node_infer(sibling_group[0])
+                current_result = yield self._proof_node_infer_steps(sibling_group[0])
             else:
                 # Multiple sibling steps: last step wraps earlier ones as premises
                 # Generate earlier siblings as complete inference trees
-                earlier_parts = [
-                    self._generate_proof_node_infer(s) for s in sibling_group[:-1]
-                ]
+                earlier_parts: list[str] = []
+                for s in sibling_group[:-1]:
+                    earlier_latex = yield self._proof_node_infer_steps(s)
+                    earlier_parts.append(earlier_latex)
 
                 # Last step becomes the outer wrapper
                 last_step = sibling_group[-1]
-                expr_latex = self.generate_expr(last_step.expression)
+                expr_latex = yield last_step.expression, None
 
                 # Combine earlier siblings with last step's own premises
                 all_premises = earlier_parts.copy()
@@ -779,10 +812,14 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
                     # Last step has its own children/premises too
                     for child in last_step.children:
                         if isinstance(child, ProofNode):
-                            all_premises.append(self._generate_proof_node_infer(child))
+                            all_premises.append(
+                                (yield self._proof_node_infer_steps(child))
+                            )
                         else:
                             # child is CaseAnalysis (only other type in union)
-                            all_premises.append(self._generate_case_analysis(child))
+                            all_premises.append(
+                                (yield self._case_analysis_steps(child))
+                            )
 
                 premises_str = " & ".join(all_premises) if all_premises else ""
 
@@ -798,12 +835,12 @@ class _ProofsCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
             # No siblings, start with first sequential
             if not sequential:
                 return ""
-            current_result = self._generate_proof_node_infer(sequential[0])
+            current_result = yield self._proof_node_infer_steps(sequential[0])
             sequential = sequential[1:]
 
         # Build sequential steps vertically on top
         for step in sequential:
-            expr_latex = self.generate_expr(step.expression)
+            expr_latex = yield step.expression, None
 
             if step.justification:
                 just = self._format_justification_label(step.justification)
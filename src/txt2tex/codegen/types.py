@@ -5,13 +5,14 @@ emit Z type expressions that appear inside axdef/schema declaration
 slots and as the right-hand sides of abbreviations.
 
 This mixin is composed into :class:`LaTeXGenerator` via multiple
-inheritance.  Methods are byte-identical to their counterparts in the
-pre-refactor monolithic ``latex_gen.py``; only their file location has
-changed.
+inheritance.  FunctionType is generated through steps (see
+:mod:`txt2tex.codegen._dispatch`), so arrow chains nest to any depth.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from txt2tex.ast_nodes import (
     BinaryOp,
     Expr,
@@ -21,7 +22,14 @@ from txt2tex.ast_nodes import (
     Identifier,
     UnaryOp,
 )
-from txt2tex.codegen._dispatch import CodegenDispatch, expr_register
+from txt2tex.codegen._dispatch import (
+    CodegenDispatch,
+    expr_register,
+    steps_register,
+)
+
+if TYPE_CHECKING:
+    from txt2tex.codegen._dispatch import ExprSteps
 
 
 class _TypesCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
@@ -40,13 +48,29 @@ class _TypesCodegen(CodegenDispatch):  # pyright: ignore[reportUnusedClass]
         - N +-> N → N \\pfun N
         - A -> B -> C → A \\fun (B \\fun C) [right-associative]
         """
+        return self._drive_steps(self._function_type_steps(node, parent))
+
+    @steps_register.register(FunctionType)
+    def _function_type_steps(
+        self, node: FunctionType, parent: Expr | None = None
+    ) -> ExprSteps:
+        """Steps of ``_generate_function_type``."""
+        arrow_latex = self._function_arrow_latex(node)
+        domain_latex = yield node.domain, None
+        range_latex = yield node.range, None
+        return self._format_function_type(node, arrow_latex, domain_latex, range_latex)
+
+    def _function_arrow_latex(self, node: FunctionType) -> str:
+        """Return the LaTeX for a function arrow."""
         arrow_latex = self.BINARY_OPS.get(node.arrow)
         if arrow_latex is None:
             raise ValueError(f"Unknown function arrow: {node.arrow}")
+        return arrow_latex
 
-        domain_latex = self.generate_expr(node.domain)
-        range_latex = self.generate_expr(node.range)
-
+    def _format_function_type(
+        self, node: FunctionType, arrow_latex: str, domain_latex: str, range_latex: str
+    ) -> str:
+        """Combine a function arrow with its generated domain and range."""
         # Add parentheses to domain if it's a function type
         # (N1 +-> X) -> seq X should generate as (\nat_1 \pfun X) \fun \seq X
         if isinstance(node.domain, FunctionType):
@@ -2,17 +2,59 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+from txt2tex.cache import default_cache_dir
+from txt2tex.formats import ensure_format, format_family
+from txt2tex.fuzz_cache import (
+    Z_ENVIRONMENTS,
+    VerdictCache,
+    dependency_closures,
+    document_preamble,
+    paragraph_keys,
+    reduced_document,
+    split_paragraphs,
+)
+
+# Reference counts for bundled-file copies, keyed by resolved work directory.
+# Concurrent compile/typecheck jobs in one directory (batch mode) share a
+# single copy, removed when the last job leaves.
+_bundled_lock = threading.Lock()
+_bundled_users: dict[Path, int] = {}
+_bundled_copies: dict[Path, list[Path]] = {}
+
+# Auxiliary outputs compared between pdflatex passes in a build directory;
+# another pass is needed while any of them still changes.
+_PASS_STATE_SUFFIXES = (".aux", ".toc", ".out")
+_MAX_RERUNS = 3
+
 
 def get_latex_dir() -> Path:
     """Get the path to bundled LaTeX files."""
     return Path(__file__).parent / "latex"
 
 
+def build_dir_for(tex_path: Path) -> Path:
+    """Return the persistent build directory for a document.
+
+    The directory lives under the txt2tex cache directory, keyed by the
+    document's resolved path, so aux/toc/bbl files survive between builds
+    without cluttering the source tree.
+    """
+    key = hashlib.sha256(str(tex_path.resolve()).encode()).hexdigest()[:12]
+    return default_cache_dir() / "build" / f"{tex_path.stem}-{key}"
+
+
 def format_tex(tex_path: Path) -> bool:
     """Format a .tex file with tex-fmt if available.
 
@@ -60,7 +102,146 @@ def copy_latex_files(work_dir: Path) -> list[Path]:
     return copied_files
 
 
-def compile_pdf(tex_path: Path, *, keep_aux: bool = False) -> bool:
+@contextmanager
+def bundled_latex_files(work_dir: Path) -> Iterator[None]:
+    """Make the bundled .sty and .mf files available in work_dir.
+
+    Files are copied on first entry for a directory and removed when the
+    last concurrent user exits, so parallel jobs in the same directory
+    never delete files another job still needs.  Files that already
+    existed in work_dir are left untouched, as with ``copy_latex_files``.
+    """
+    key = work_dir.resolve()
+    with _bundled_lock:
+        users = _bundled_users.get(key, 0)
+        if users == 0:
+            _bundled_copies[key] = copy_latex_files(work_dir)
+        _bundled_users[key] = users + 1
+    try:
+        yield
+    finally:
+        with _bundled_lock:
+            _bundled_users[key] -= 1
+            if _bundled_users[key] == 0:
+                del _bundled_users[key]
+                for copied in _bundled_copies.pop(key):
+                    copied.unlink(missing_ok=True)
+
+
+def typecheck_fuzz(tex_path: Path, *, use_cache: bool = True) -> bool:
+    """Run fuzz typechecker on a .tex file.
+
+    With use_cache, Z paragraphs that already passed fuzz (with unchanged
+    dependencies) are skipped and fuzz checks a reduced document holding
+    only the rest; see ``txt2tex.fuzz_cache``.  Failures are always
+    reported from a run over the whole document.
+
+    Args:
+        tex_path: Path to the .tex file
+        use_cache: Reuse cached per-paragraph verdicts
+
+    Returns:
+        True if typechecking passed, False otherwise
+    """
+    fuzz = shutil.which("fuzz")
+    if fuzz is None:
+        return True  # Skip if not available
+
+    work_dir = tex_path.parent
+    cache = VerdictCache.default() if use_cache else None
+    keys: list[str] = []
+
+    # Bundled .sty files are needed by fuzz
+    with bundled_latex_files(work_dir):
+        if cache is not None:
+            tex_content = tex_path.read_text()
+            paragraphs = split_paragraphs(tex_content)
+            if len(paragraphs) == _count_z_environments(tex_content):
+                keys = paragraph_keys(paragraphs, fuzz, document_preamble(tex_content))
+                stale = [i for i, key in enumerate(keys) if not cache.passed(key)]
+                if not stale:
+                    print("Type checking: passed (cached)")
+                    return True
+                closures = dependency_closures(paragraphs)
+                needed = sorted({j for i in stale for j in closures[i]})
+                if len(needed) < len(paragraphs):
+                    reduced = reduced_document(
+                        tex_content, [paragraphs[j] for j in needed]
+                    )
+                    if _run_fuzz_on_text(fuzz, work_dir, tex_path.stem, reduced):
+                        cache.record([keys[j] for j in needed])
+                        print(
+                            f"Type checking: passed ({len(stale)} of "
+                            f"{len(paragraphs)} paragraphs rechecked)"
+                        )
+                        return True
+                    # Fall through: report errors from the full document
+
+        result = subprocess.run(  # noqa: S603
+            [fuzz, tex_path.name],
+            cwd=work_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    if result.returncode != 0:
+        print("Type checking failed:", file=sys.stderr)
+        # Show fuzz output (it contains the errors)
+        if result.stdout:
+            print(result.stdout, file=sys.stderr)
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+        return False
+
+    if cache is not None:
+        cache.record(keys)
+    print("Type checking: passed")
+    return True
+
+
+def _count_z_environments(tex_content: str) -> int:
+    """Count Z environments anywhere, to detect paragraphs the splitter missed."""
+    return sum(tex_content.count(f"\\begin{{{env}}}") for env in Z_ENVIRONMENTS)
+
+
+def _run_fuzz_on_text(fuzz: str, work_dir: Path, stem: str, text: str) -> bool:
+    """Run fuzz over generated text written next to the document."""
+    reduced_path = work_dir / f"{stem}-fuzz-reduced.tex"
+    reduced_path.write_text(text)
+    try:
+        result = subprocess.run(  # noqa: S603
+            [fuzz, reduced_path.name],
+            cwd=work_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    finally:
+        reduced_path.unlink(missing_ok=True)
+    return result.returncode == 0
+
+
+def _format_args(pdflatex: str | None, tex_content: str) -> list[str]:
+    """Return ``-fmt=...`` for a precompiled preamble, or [] if unusable."""
+    family = format_family(tex_content)
+    if pdflatex is None or family is None:
+        return []
+    fmt_path = ensure_format(family, pdflatex, get_latex_dir())
+    if fmt_path is None:
+        print("Note: could not build precompiled preamble; compiling normally.")
+        return []
+    return [f"-fmt={fmt_path}"]
+
+
+def compile_pdf(
+    tex_path: Path,
+    *,
+    keep_aux: bool = False,
+    incremental: bool = False,
+    precompiled: bool = False,
+    build_dir: Path | None = None,
+) -> bool:
     """Compile a .tex file to PDF using latexmk or pdflatex.
 
     Uses latexmk if available (handles bibliography and multiple passes).
@@ -69,20 +250,36 @@ def compile_pdf(tex_path: Path, *, keep_aux: bool = False) -> bool:
     Args:
         tex_path: Path to the .tex file
         keep_aux: If True, keep auxiliary files (.aux, .log, etc.)
+        incremental: If True, let latexmk reuse the previous run's state
+            instead of forcing a full rebuild (``-gg``).  Auxiliary files
+            are kept, since the next incremental build depends on them.
+        precompiled: If True, compile against a cached ``.fmt`` dump of
+            the fixed txt2tex preamble (built on first use; see
+            ``txt2tex.formats``).  Documents with a custom preamble are
+            compiled normally.
+        build_dir: Persistent output directory for the auxiliary files
+            (see ``build_dir_for``).  Builds are incremental: an unchanged
+            document needs a single pass and bibtex reruns only when the
+            citations or .bib files change.  The PDF is copied next to
+            the .tex; ``keep_aux`` and ``incremental`` are implied.
 
     Returns:
         True if compilation succeeded, False otherwise
     """
     work_dir = tex_path.parent
 
-    # Copy bundled .sty and .mf files to working directory
-    copied_files = copy_latex_files(work_dir)
-
     # Check for bibliography in the .tex file
     tex_content = tex_path.read_text()
     has_bibliography = "\\bibliography{" in tex_content
 
-    try:
+    pdflatex = shutil.which("pdflatex")
+    fmt_args = _format_args(pdflatex, tex_content) if precompiled else []
+    if build_dir is not None:
+        build_dir.mkdir(parents=True, exist_ok=True)
+        keep_aux = incremental = True
+
+    # Bundled .sty and .mf files are copied in for the duration of the build
+    with bundled_latex_files(work_dir):
         # Prefer latexmk if available (handles everything automatically)
         latexmk = shutil.which("latexmk")
         if latexmk is not None:
@@ -91,26 +288,70 @@ def compile_pdf(tex_path: Path, *, keep_aux: bool = False) -> bool:
                 tex_path,
                 work_dir,
                 has_bibliography=has_bibliography,
-                keep_aux=keep_aux,
+                keep_aux=keep_aux or incremental,
+                force_rebuild=not incremental,
+                pdflatex_command=(
+                    shlex.join([pdflatex, *fmt_args]) + " %O %S"
+                    if pdflatex is not None and fmt_args
+                    else None
+                ),
+                out_dir=build_dir,
             )
 
         # Fall back to pdflatex
-        pdflatex = shutil.which("pdflatex")
         if pdflatex is None:
             return False
 
+        if build_dir is not None:
+            return _compile_in_build_dir(
+                pdflatex,
+                tex_path,
+                work_dir,
+                build_dir,
+                has_bibliography=has_bibliography,
+                fmt_args=fmt_args,
+            )
+
         return _compile_with_pdflatex(
             pdflatex,
             tex_path,
             work_dir,
             has_bibliography=has_bibliography,
-            keep_aux=keep_aux,
+            keep_aux=keep_aux or incremental,
+            fmt_args=fmt_args,
         )
 
-    finally:
-        # Clean up copied .sty/.mf files
-        for copied in copied_files:
-            copied.unlink(missing_ok=True)
+
+def typecheck_and_compile_pdf(
+    tex_path: Path,
+    *,
+    keep_pdf_on_type_error: bool = False,
+    fuzz_cache: bool = True,
+    keep_aux: bool = False,
+    precompiled: bool = False,
+    build_dir: Path | None = None,
+) -> tuple[bool, bool]:
+    """Run the fuzz typecheck and the PDF build concurrently.
+
+    Both only read the .tex file, so the wall-clock time is the slower of
+    the two rather than their sum.  If fuzz rejects the document the new
+    PDF is deleted, unless keep_pdf_on_type_error is set.  fuzz_cache is
+    passed to ``typecheck_fuzz`` as use_cache.
+
+    Returns:
+        (typecheck passed, PDF compiled and kept)
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        typecheck = pool.submit(typecheck_fuzz, tex_path, use_cache=fuzz_cache)
+        compiled = compile_pdf(
+            tex_path, keep_aux=keep_aux, precompiled=precompiled, build_dir=build_dir
+        )
+        typecheck_ok = typecheck.result()
+
+    if compiled and not typecheck_ok and not keep_pdf_on_type_error:
+        tex_path.with_suffix(".pdf").unlink(missing_ok=True)
+        compiled = False
+    return typecheck_ok, compiled
 
 
 def _compile_with_latexmk(
@@ -120,16 +361,27 @@ def _compile_with_latexmk(
     *,
     has_bibliography: bool,
     keep_aux: bool,
+    force_rebuild: bool = True,
+    pdflatex_command: str | None = None,
+    out_dir: Path | None = None,
 ) -> bool:
     """Compile using latexmk (handles multiple passes automatically)."""
     # latexmk -pdf handles pdflatex + bibtex + multiple passes
     bibtex_flag = [] if has_bibliography else ["-bibtex-"]
+    # Force complete rebuild for consistent bibliography generation
+    rebuild_flag = ["-gg"] if force_rebuild else []
+    # Custom pdflatex invocation (e.g. against a precompiled format)
+    command_flag = [f"-pdflatex={pdflatex_command}"] if pdflatex_command else []
+    # Keep aux/log/bbl (and latexmk's own state) out of the source tree
+    out_flag = [f"-outdir={out_dir}"] if out_dir is not None else []
 
     result = subprocess.run(  # noqa: S603
         [
             latexmk,
             "-pdf",
-            "-gg",  # Force complete rebuild for consistent bibliography generation
+            *rebuild_flag,
+            *command_flag,
+            *out_flag,
             "-interaction=nonstopmode",
             *bibtex_flag,
             tex_path.name,
@@ -140,19 +392,24 @@ def _compile_with_latexmk(
         check=False,
     )
 
-    pdf_path = tex_path.with_suffix(".pdf")
+    output_dir = out_dir if out_dir is not None else work_dir
+    pdf_path = output_dir / f"{tex_path.stem}.pdf"
+    log_file = output_dir / f"{tex_path.stem}.log"
 
     # Check for actual LaTeX errors (not just "no pages" warning)
     if result.returncode != 0:
-        if _has_latex_error(tex_path):
-            _show_latex_error(tex_path)
+        if _has_latex_error(log_file):
+            _show_latex_error(log_file)
             return False
         # No real error - might be empty document with "No pages of output"
         # Check if PDF exists (even if empty)
         if not pdf_path.exists():
-            _show_latex_error(tex_path)
+            _show_latex_error(log_file)
             return False
 
+    if out_dir is not None:
+        _publish_pdf(pdf_path, tex_path)
+
     # Clean up with latexmk -c unless --keep-aux
     if not keep_aux:
         subprocess.run(  # noqa: S603
@@ -165,9 +422,8 @@ def _compile_with_latexmk(
     return True
 
 
-def _has_latex_error(tex_path: Path) -> bool:
+def _has_latex_error(log_file: Path) -> bool:
     """Check if the LaTeX log contains actual errors."""
-    log_file = tex_path.with_suffix(".log")
     if not log_file.exists():
         return False
     try:
@@ -184,6 +440,7 @@ def _compile_with_pdflatex(
     *,
     has_bibliography: bool,
     keep_aux: bool,
+    fmt_args: list[str] | None = None,
 ) -> bool:
     """Compile using pdflatex with multiple passes for TOC/bibliography."""
     tex_name = tex_path.name
@@ -191,7 +448,13 @@ def _compile_with_pdflatex(
 
     def run_pdflatex() -> subprocess.CompletedProcess[str]:
         return subprocess.run(  # noqa: S603
-            [pdflatex, "-interaction=nonstopmode", "-halt-on-error", tex_name],
+            [
+                pdflatex,
+                *(fmt_args or []),
+                "-interaction=nonstopmode",
+                "-halt-on-error",
+                tex_name,
+            ],
             cwd=work_dir,
             capture_output=True,
             text=True,
@@ -201,7 +464,7 @@ def _compile_with_pdflatex(
     # First pass
     result = run_pdflatex()
     if result.returncode != 0:
-        _show_latex_error(tex_path)
+        _show_latex_error(tex_path.with_suffix(".log"))
         return False
 
     # Run bibtex if bibliography present
@@ -230,9 +493,111 @@ def _compile_with_pdflatex(
     return True
 
 
-def _show_latex_error(tex_path: Path) -> None:
+def _compile_in_build_dir(
+    pdflatex: str,
+    tex_path: Path,
+    work_dir: Path,
+    build_dir: Path,
+    *,
+    has_bibliography: bool,
+    fmt_args: list[str],
+) -> bool:
+    """Compile incrementally with pdflatex, keeping outputs in build_dir.
+
+    One pass is always run; further passes only while the aux/toc/out
+    files keep changing.  bibtex runs only when the citations or the .bib
+    contents differ from the previous build (recorded in a stamp file).
+    """
+    stem = tex_path.stem
+    log_file = build_dir / f"{stem}.log"
+    state_files = [build_dir / f"{stem}{suffix}" for suffix in _PASS_STATE_SUFFIXES]
+
+    def pass_state() -> list[bytes]:
+        return [f.read_bytes() if f.exists() else b"" for f in state_files]
+
+    def run_pdflatex() -> bool:
+        result = subprocess.run(  # noqa: S603
+            [
+                pdflatex,
+                *fmt_args,
+                "-interaction=nonstopmode",
+                "-halt-on-error",
+                f"-output-directory={build_dir}",
+                tex_path.name,
+            ],
+            cwd=work_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            _show_latex_error(log_file)
+            # A half-written .aux would poison the next incremental build
+            (build_dir / f"{stem}.aux").unlink(missing_ok=True)
+            return False
+        return True
+
+    previous: list[bytes] | None = pass_state()
+    if not run_pdflatex():
+        return False
+
+    bibtex = shutil.which("bibtex")
+    if has_bibliography and bibtex is not None:
+        stamp_file = build_dir / f"{stem}.bibstamp"
+        stamp = _bibliography_stamp(build_dir / f"{stem}.aux", work_dir)
+        if not stamp_file.exists() or stamp_file.read_text() != stamp:
+            search_path = f"{work_dir}{os.pathsep}"
+            subprocess.run(  # noqa: S603
+                [bibtex, stem],
+                cwd=build_dir,
+                env={**os.environ, "BIBINPUTS": search_path, "BSTINPUTS": search_path},
+                capture_output=True,
+                check=False,
+            )
+            stamp_file.write_text(stamp)
+            previous = None  # new .bbl: at least one more pass
+
+    for _ in range(_MAX_RERUNS):
+        current = pass_state()
+        if current == previous:
+            break
+        previous = current
+        if not run_pdflatex():
+            return False
+
+    _publish_pdf(build_dir / f"{stem}.pdf", tex_path)
+    return True
+
+
+def _bibliography_stamp(aux_file: Path, work_dir: Path) -> str:
+    """Hash the citations, style and .bib contents a bibtex run depends on."""
+    digest = hashlib.sha256()
+    try:
+        aux = aux_file.read_text(errors="replace")
+    except OSError:
+        aux = ""
+    for line in aux.splitlines():
+        if not line.startswith(("\\citation{", "\\bibdata{", "\\bibstyle{")):
+            continue
+        digest.update(line.encode() + b"\n")
+        if line.startswith("\\bibdata{"):
+            for name in line[len("\\bibdata{") :].rstrip("}").split(","):
+                bib_file = work_dir / (name if name.endswith(".bib") else f"{name}.bib")
+                try:
+                    digest.update(bib_file.read_bytes())
+                except OSError:
+                    continue
+    return digest.hexdigest()
+
+
+def _publish_pdf(built_pdf: Path, tex_path: Path) -> None:
+    """Copy a PDF built in a separate output directory next to the .tex."""
+    if built_pdf.exists():
+        shutil.copyfile(built_pdf, tex_path.with_suffix(".pdf"))
+
+
+def _show_latex_error(log_file: Path) -> None:
     """Show relevant error from LaTeX log file."""
-    log_file = tex_path.with_suffix(".log")
     if log_file.exists():
         try:
             log_content = log_file.read_text(errors="replace")
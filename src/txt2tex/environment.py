@@ -0,0 +1,213 @@
+"""Dependency check behind ``txt2tex --check-env``.
+
+All required LaTeX packages are probed with a single pdflatex run: one
+throwaway document reports each package through ``\\IfFileExists`` in its
+log.  The tool probes (pdflatex, latexmk, bibtex, fuzz, tex-fmt) run
+concurrently with that pdflatex run.
+
+A complete package result is cached next to the generation cache, keyed
+by the resolved pdflatex path and its mtime, so repeat checks against the
+same TeX installation skip pdflatex entirely.  Results with a missing
+package are never cached: the next check re-probes, picking up a package
+installed in the meantime.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from txt2tex.cache import default_cache_dir
+
+REQUIRED_PACKAGES = ("adjustbox", "natbib", "geometry", "amsfonts", "hyperref")
+
+_PROBE_MARKER = "TXT2TEX-PROBE"
+_PROBE_LINE = re.compile(rf"^{_PROBE_MARKER} (\S+) (yes|no)$", re.MULTILINE)
+_CACHE_FILE = "check-env.json"
+_VERSION_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class ToolStatus:
+    """Location and version banner of one external tool."""
+
+    name: str
+    path: str | None
+    version: str = ""
+
+
+# (tool, arguments that print a version banner, or None to skip)
+_TOOLS: tuple[tuple[str, tuple[str, ...] | None], ...] = (
+    ("pdflatex", ("--version",)),
+    ("latexmk", ("-v",)),
+    ("bibtex", ("--version",)),
+    ("fuzz", None),
+    ("tex-fmt", ("--version",)),
+)
+
+
+def _probe_tool(name: str, version_args: tuple[str, ...] | None) -> ToolStatus:
+    """Locate a tool and read the first line of its version banner."""
+    path = shutil.which(name)
+    if path is None or version_args is None:
+        return ToolStatus(name, path)
+    try:
+        result = subprocess.run(  # noqa: S603
+            [path, *version_args],
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            timeout=_VERSION_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ToolStatus(name, path)
+    if result.returncode != 0:
+        return ToolStatus(name, path)
+    banner = (result.stdout or result.stderr).strip().splitlines()
+    return ToolStatus(name, path, banner[0] if banner else "")
+
+
+def _probe_document(packages: tuple[str, ...]) -> str:
+    lines = [r"\documentclass{article}"]
+    # \IfFileExists is robust and does not expand inside \typeout, so each
+    # branch writes its own complete message.
+    lines.extend(
+        rf"\IfFileExists{{{pkg}.sty}}"
+        rf"{{\typeout{{{_PROBE_MARKER} {pkg} yes}}}}"
+        rf"{{\typeout{{{_PROBE_MARKER} {pkg} no}}}}"
+        for pkg in packages
+    )
+    lines.append(r"\begin{document}\end{document}")
+    return "\n".join(lines) + "\n"
+
+
+def probe_packages(pdflatex: str, packages: tuple[str, ...]) -> dict[str, bool]:
+    """Report which LaTeX packages are installed using one pdflatex run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tex_file = Path(tmpdir) / "probe.tex"
+        tex_file.write_text(_probe_document(packages))
+        subprocess.run(  # noqa: S603
+            [pdflatex, "-interaction=batchmode", "-halt-on-error", "probe.tex"],
+            cwd=tmpdir,
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            check=False,
+        )
+        log_file = tex_file.with_suffix(".log")
+        log = log_file.read_text(errors="replace") if log_file.exists() else ""
+    found = {name: answer == "yes" for name, answer in _PROBE_LINE.findall(log)}
+    return {pkg: found.get(pkg, False) for pkg in packages}
+
+
+def _distribution_key(pdflatex: str) -> str:
+    """Identify the TeX installation by its resolved pdflatex path and mtime."""
+    resolved = Path(pdflatex).resolve()
+    return f"{resolved}:{resolved.stat().st_mtime_ns}"
+
+
+def _load_cached(cache_file: Path, key: str) -> dict[str, bool] | None:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    packages = data.get("packages")
+    if not isinstance(packages, dict) or set(packages) != set(REQUIRED_PACKAGES):
+        return None
+    return {pkg: bool(packages[pkg]) for pkg in REQUIRED_PACKAGES}
+
+
+def _store_cached(cache_file: Path, key: str, packages: dict[str, bool]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"key": key, "packages": packages}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
+def package_status(pdflatex: str, *, use_cache: bool = True) -> dict[str, bool]:
+    """Return package availability, from the cache when it is still valid."""
+    cache_file = default_cache_dir() / _CACHE_FILE
+    key = _distribution_key(pdflatex)
+    if use_cache:
+        cached = _load_cached(cache_file, key)
+        if cached is not None:
+            return cached
+    packages = probe_packages(pdflatex, REQUIRED_PACKAGES)
+    if use_cache and all(packages.values()):
+        _store_cached(cache_file, key, packages)
+    return packages
+
+
+def check_environment(*, use_cache: bool = True) -> int:
+    """Check for required and optional dependencies."""
+    print("txt2tex environment check")
+    print("=" * 40)
+
+    pdflatex = shutil.which("pdflatex")
+    with ThreadPoolExecutor(max_workers=len(_TOOLS) + 1) as pool:
+        package_future = (
+            pool.submit(package_status, pdflatex, use_cache=use_cache)
+            if pdflatex
+            else None
+        )
+        tool_futures = [pool.submit(_probe_tool, *tool) for tool in _TOOLS]
+        tools = {status.name: status for status in (f.result() for f in tool_futures)}
+        packages = package_future.result() if package_future else {}
+
+    all_ok = True
+
+    # Check pdflatex (required for PDF)
+    if pdflatex:
+        print(f"✓ pdflatex: {_describe(tools['pdflatex'])}")
+    else:
+        print("✗ pdflatex: NOT FOUND (required for PDF generation)")
+        all_ok = False
+
+    # Check required LaTeX packages (only if pdflatex found)
+    if pdflatex:
+        print("\nLaTeX packages:")
+        for pkg in REQUIRED_PACKAGES:
+            if packages[pkg]:
+                print(f"  ✓ {pkg}")
+            else:
+                print(f"  ✗ {pkg}: NOT FOUND")
+                all_ok = False
+
+    print("\nOptional tools:")
+    optional = (
+        ("latexmk", "recommended for bibliography"),
+        ("bibtex", "for bibliography"),
+        ("fuzz", "for Z notation type checking"),
+        ("tex-fmt", "for --format"),
+    )
+    for name, purpose in optional:
+        status = tools[name]
+        if status.path:
+            print(f"  ✓ {name}: {_describe(status)}")
+        else:
+            print(f"  ○ {name}: not found ({purpose})")
+
+    print("\n" + "=" * 40)
+    if all_ok:
+        print("Environment OK - ready for PDF generation")
+        return 0
+
+    print("Missing required dependencies - use --tex-only or install LaTeX")
+    print("On Ubuntu/Debian: sudo apt install texlive-latex-extra")
+    print("On macOS: Install MacTeX from https://www.tug.org/mactex/")
+    return 1
+
+
+def _describe(status: ToolStatus) -> str:
+    return f"{status.path} ({status.version})" if status.version else str(status.path)
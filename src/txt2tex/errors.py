@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 
+from txt2tex.source import SourceFile
+
 # Hints for common error patterns - maps regex patterns to suggestion messages
 ERROR_HINTS: dict[str, str] = {
     r"Expected 'end'": "Did you forget 'end' before starting a new block?",
@@ -31,14 +33,15 @@ class ErrorFormatter:
     - Optional hints for common mistakes
     """
 
-    def __init__(self, source: str) -> None:
+    def __init__(self, source: str | SourceFile) -> None:
         """Initialize formatter with source text.
 
         Args:
-            source: The complete source text being parsed
+            source: The complete source text being parsed, or the
+                SourceFile the lexer was given (its line index is reused)
         """
-        self.source = source
-        self.lines = source.splitlines()
+        self.source_file = SourceFile.of(source)
+        self.source = self.source_file.text
 
     def format_error(
         self,
@@ -93,7 +96,7 @@ class ErrorFormatter:
 
         # Calculate range (clamped to valid indices)
         start_idx = max(0, error_idx - context_lines)
-        end_idx = min(len(self.lines), error_idx + context_lines + 1)
+        end_idx = min(self.source_file.line_count, error_idx + context_lines + 1)
 
         # Calculate line number width for alignment
         max_line_num = end_idx
@@ -103,7 +106,7 @@ class ErrorFormatter:
 
         for idx in range(start_idx, end_idx):
             line_num = idx + 1  # Convert back to 1-based
-            line_content = self.lines[idx] if idx < len(self.lines) else ""
+            line_content = self.source_file.line(line_num)
 
             # Format line with number
             prefix = f"{line_num:>{num_width}} | "
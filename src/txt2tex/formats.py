@@ -0,0 +1,170 @@
+"""Precompiled LaTeX formats for the fixed txt2tex preamble.
+
+Every generated document starts with the same preamble for its package
+family (fuzz or zed-*), and pdflatex re-reads all of it on every pass.  In
+the opt-in precompiled mode that preamble is loaded once with
+``pdflatex -ini`` and dumped to a ``.fmt`` file; documents are then
+compiled with ``-fmt=...`` so each pass starts with the packages already
+in memory.
+
+The format also redefines ``\\documentclass`` as a no-op, so documents are
+compiled unchanged: their ``\\documentclass`` line is skipped and their
+``\\usepackage`` lines are no-ops for packages the format already loaded
+(with the same options).  A document whose preamble is not a subset of
+the format's falls back to a normal build.
+
+Formats are cached under ``<cache dir>/formats`` and named by a digest of
+the preamble, the bundled ``.sty`` files and the pdflatex binary, so a
+TeX or txt2tex upgrade builds a fresh one.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from txt2tex.cache import default_cache_dir
+
+DOCUMENT_CLASS = r"\documentclass[a4paper,10pt,fleqn]{article}"
+
+_COMMON_PACKAGES = (
+    r"\usepackage[margin=1in]{geometry}",
+    r"\usepackage{amssymb}",
+    r"\usepackage{adjustbox}",
+    r"\usepackage{natbib}",
+    r"\usepackage[colorlinks=true,linkcolor=blue,citecolor=blue,urlcolor=blue]{hyperref}",
+)
+_FAMILY_PACKAGE = {"fuzz": r"\usepackage{fuzz}", "zed": r"\usepackage{zed-cm}"}
+_SHARED_PACKAGES = (
+    r"\usepackage{schemapk}",
+    r"\usepackage{zed-maths}",
+    r"\usepackage{zed-proof}",
+)
+
+FAMILIES = tuple(_FAMILY_PACKAGE)
+
+_build_lock = threading.Lock()
+
+
+def preamble_lines(family: str) -> list[str]:
+    """Return the fixed preamble ``generate_document`` emits for a family."""
+    return [
+        DOCUMENT_CLASS,
+        *_COMMON_PACKAGES,
+        _FAMILY_PACKAGE[family],
+        *_SHARED_PACKAGES,
+    ]
+
+
+def format_family(tex_content: str) -> str | None:
+    """Return the format family a document can be compiled against.
+
+    The document must open with the txt2tex ``\\documentclass`` line
+    followed by ``\\usepackage`` lines that all appear in one family's
+    preamble; anything else (a hand-written preamble, an extra package)
+    returns None.
+    """
+    lines = tex_content.splitlines()
+    if not lines or lines[0] != DOCUMENT_CLASS:
+        return None
+    packages: set[str] = set()
+    for line in lines[1:]:
+        if not line.startswith(r"\usepackage"):
+            break
+        packages.add(line)
+    for family in FAMILIES:
+        if _FAMILY_PACKAGE[family] in packages and packages <= set(
+            preamble_lines(family)
+        ):
+            return family
+    return None
+
+
+def _format_source(family: str) -> str:
+    return "\n".join(
+        [
+            *preamble_lines(family),
+            # Let documents keep their own \documentclass line.
+            r"\renewcommand{\documentclass}[2][]{}",
+            r"\dump",
+            "",
+        ]
+    )
+
+
+def _bundled_files(latex_dir: Path) -> list[Path]:
+    """The bundled .sty and .mf files the preamble loads (fonts included)."""
+    return sorted([*latex_dir.glob("*.sty"), *latex_dir.glob("*.mf")])
+
+
+def _format_digest(family: str, pdflatex: str, latex_dir: Path) -> str:
+    digest = hashlib.sha256(_format_source(family).encode())
+    resolved = Path(pdflatex).resolve()
+    digest.update(f"{resolved}:{resolved.stat().st_mtime_ns}\n".encode())
+    for bundled in _bundled_files(latex_dir):
+        digest.update(bundled.name.encode())
+        digest.update(bundled.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _build_format(family: str, pdflatex: str, latex_dir: Path, fmt_path: Path) -> bool:
+    """Run ``pdflatex -ini`` over the preamble and store the dump."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        work_dir = Path(tmpdir)
+        for bundled in _bundled_files(latex_dir):
+            shutil.copy(bundled, work_dir / bundled.name)
+        (work_dir / "preamble.tex").write_text(_format_source(family))
+        subprocess.run(  # noqa: S603
+            [
+                pdflatex,
+                "-ini",
+                "-interaction=batchmode",
+                "-halt-on-error",
+                f"-jobname={fmt_path.stem}",
+                "&pdflatex",
+                "preamble.tex",
+            ],
+            cwd=work_dir,
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            check=False,
+        )
+        built = work_dir / fmt_path.name
+        if not built.exists():
+            return False
+        try:
+            fmt_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in fmt_path.parent.glob(f"txt2tex-{family}-*.fmt"):
+                stale.unlink(missing_ok=True)
+            shutil.move(built, fmt_path)
+        except OSError:
+            return False
+    return True
+
+
+def ensure_format(family: str, pdflatex: str, latex_dir: Path) -> Path | None:
+    """Return the cached format for a family, building it if needed.
+
+    Returns:
+        Path to the ``.fmt`` file, or None if it could not be built (the
+        caller then compiles without it).
+    """
+    try:
+        name = f"txt2tex-{family}-{_format_digest(family, pdflatex, latex_dir)}"
+    except OSError:
+        return None
+    fmt_path = default_cache_dir() / "formats" / f"{name}.fmt"
+    with _build_lock:
+        if fmt_path.exists():
+            # Mark it used, so cache eviction removes idle formats first.
+            with contextlib.suppress(OSError):
+                fmt_path.touch()
+            return fmt_path
+        if _build_format(family, pdflatex, latex_dir, fmt_path):
+            return fmt_path
+    return None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
+from txt2tex.ast_intern import NodeInterner, is_interned, shape_of
 from txt2tex.ast_nodes import (
+    ASTNode,
     BagLiteral,
     BinaryOp,
     Conditional,
@@ -45,114 +47,125 @@ from txt2tex.ast_nodes import (
     UnaryOp,
     Ungroup,
 )
+from txt2tex.ast_walk import iter_children
 
 _EMPTY: frozenset[str] = frozenset()
 
+# Nodes that bind nothing: their free variables are those of all their
+# children, as listed by ast_walk.
+_PASS_THROUGH: tuple[type, ...] = (
+    BinaryOp,
+    UnaryOp,
+    Subscript,
+    Superscript,
+    FunctionApp,
+    FunctionType,
+    Tuple,
+    SetLiteral,
+    BagLiteral,
+    SequenceLiteral,
+    RelationalImage,
+    GenericInstantiation,
+    Range,
+    TupleProjection,
+    Conditional,
+    GuardedBranch,
+    GuardedCases,
+    Theta,
+    Restrict,
+    Project,
+    RelationRename,
+    Group,
+    Ungroup,
+    NaturalJoin,
+    Divide,
+)
+
+# A node's own free names, and its children each with the names the node
+# binds over that child.  The node's free variables are its own names plus,
+# for every child, the child's free variables minus the bound names.
+_Scoped = tuple[frozenset[str], list[tuple[Expr, frozenset[str]]]]
 
-def _union(exprs: Iterable[Expr]) -> frozenset[str]:
-    """Return the union of free variables across a sequence of expressions.
+
+def _unbound(exprs: Iterable[Expr]) -> list[tuple[Expr, frozenset[str]]]:
+    """Pair each expression with an empty bound set.
 
     Accepts any ``Iterable[Expr]`` (covariant read) so callers can pass a
     ``list[GuardedBranch]`` or ``list[Identifier]`` without an ``arg-type``
     cast — both are ``Expr`` subtypes, but ``list[T]`` is invariant in T.
     """
-    result: frozenset[str] = _EMPTY
-    for e in exprs:
-        result = result | expr_free_vars(e)
-    return result
+    return [(e, _EMPTY) for e in exprs]
 
 
-def _free_vars_binder(expr: Quantifier | Lambda | SetComprehension) -> frozenset[str]:
-    """Return free variables for binder nodes (Quantifier, Lambda, SetComprehension).
+def _scoped_binder(expr: Quantifier | Lambda | SetComprehension) -> _Scoped:
+    """Return scoped children for binder nodes (Quantifier, Lambda, SetComprehension).
 
     Domain expressions are NOT scoped by the binder's own variables per Z RM
     §3.9 (Quantifier), §3.12 (Lambda), §3.10 (SetComprehension).
     """
     if isinstance(expr, Quantifier):
         bound = frozenset(expr.variables)
-        domain_free = expr_free_vars(expr.domain) if expr.domain is not None else _EMPTY
-        body_free = expr_free_vars(expr.body) - bound
-        expr_part_free = (
-            expr_free_vars(expr.expression) - bound
-            if expr.expression is not None
-            else _EMPTY
-        )
-        return domain_free | body_free | expr_part_free
+        children: list[tuple[Expr, frozenset[str]]] = []
+        if expr.domain is not None:
+            children.append((expr.domain, _EMPTY))
+        children.append((expr.body, bound))
+        if expr.expression is not None:
+            children.append((expr.expression, bound))
+        return _EMPTY, children
 
     if isinstance(expr, Lambda):
         bound = frozenset(expr.variables)
-        return expr_free_vars(expr.domain) | (expr_free_vars(expr.body) - bound)
+        return _EMPTY, [(expr.domain, _EMPTY), (expr.body, bound)]
 
     # SetComprehension — sequential scoping within extra_declarations (Z RM §3.10).
-    primary_bound = frozenset(expr.variables)
-    domain_free = expr_free_vars(expr.domain) if expr.domain is not None else _EMPTY
-    accumulated_bound = primary_bound
-    extra_free: frozenset[str] = _EMPTY
+    children = []
+    if expr.domain is not None:
+        children.append((expr.domain, _EMPTY))
+    accumulated_bound = frozenset(expr.variables)
     if expr.extra_declarations:
         for extra_var, extra_domain in expr.extra_declarations:
-            extra_free = extra_free | (expr_free_vars(extra_domain) - accumulated_bound)
+            children.append((extra_domain, accumulated_bound))
             accumulated_bound = accumulated_bound | {extra_var}
-    all_bound = accumulated_bound
-    pred_free = (
-        expr_free_vars(expr.predicate) - all_bound
-        if expr.predicate is not None
-        else _EMPTY
-    )
-    expr_part_free = (
-        expr_free_vars(expr.expression) - all_bound
-        if expr.expression is not None
-        else _EMPTY
-    )
-    return domain_free | extra_free | pred_free | expr_part_free
+    if expr.predicate is not None:
+        children.append((expr.predicate, accumulated_bound))
+    if expr.expression is not None:
+        children.append((expr.expression, accumulated_bound))
+    return _EMPTY, children
 
 
-def _free_vars_schema_calculus(
+def _scoped_schema_calculus(
     expr: SchemaCompose
     | SchemaPipe
     | SchemaProject
     | SchemaHide
     | SchemaRename
     | SchemaText,
-) -> frozenset[str]:
-    """Return free variables for schema-calculus nodes (conservative over-report).
+) -> _Scoped:
+    """Return scoped children for schema-calculus nodes (conservative over-report).
 
     Shadow analysis requires a type-driven symbol table not present here.
     Over-reporting may produce unnecessary nesting but never fuzz-invalid Z.
     """
     if isinstance(expr, (SchemaCompose, SchemaPipe, SchemaProject)):
-        return expr_free_vars(expr.left) | expr_free_vars(expr.right)
+        return _EMPTY, _unbound((expr.left, expr.right))
     if isinstance(expr, (SchemaHide, SchemaRename)):
         # Hidden/renamed names stay in the free-var set (conservative).
-        return expr_free_vars(expr.schema)
+        return _EMPTY, _unbound((expr.schema,))
     # SchemaText: collect predicates only; declaration-side names omitted.
-    result: frozenset[str] = _EMPTY
-    for pred in expr.predicates:
-        result = result | expr_free_vars(pred)
-    return result
+    return _EMPTY, _unbound(expr.predicates)
 
 
-def expr_free_vars(expr: Expr) -> frozenset[str]:
-    """Return the set of free variable names in expr.
-
-    Conservative: may over-report for schema-calculus nodes where shadow
-    analysis requires type information.  Over-report produces unnecessary
-    nesting (always Z-valid).  Under-report produces fuzz-rejected output
-    — so err toward over-report.
-
-    Z RM references:
-    - Quantifier scoping: Z RM §3.9
-    - Lambda scoping: Z RM §3.12
-    - Set comprehension scoping: Z RM §3.10
-    """
+def _scoped_children(expr: Expr) -> _Scoped:
+    """Return expr's own free names and its children with their bound names."""
     # Leaf nodes
     if isinstance(expr, Identifier):
-        return frozenset({expr.name})
+        return frozenset({expr.name}), []
     if isinstance(expr, (Number, StringLit)):
-        return _EMPTY
+        return _EMPTY, []
 
     # Binder nodes
     if isinstance(expr, (Quantifier, Lambda, SetComprehension)):
-        return _free_vars_binder(expr)
+        return _scoped_binder(expr)
 
     # Schema-calculus nodes
     _schema_calc = (
@@ -164,57 +177,127 @@ def expr_free_vars(expr: Expr) -> frozenset[str]:
         SchemaText,
     )
     if isinstance(expr, _schema_calc):
-        return _free_vars_schema_calculus(expr)
+        return _scoped_schema_calculus(expr)
 
     # Pass-through nodes — union of children's free vars.
-    if isinstance(expr, BinaryOp):
-        return expr_free_vars(expr.left) | expr_free_vars(expr.right)
-    if isinstance(expr, UnaryOp):
-        return expr_free_vars(expr.operand)
-    if isinstance(expr, Subscript):
-        return expr_free_vars(expr.base) | expr_free_vars(expr.index)
-    if isinstance(expr, Superscript):
-        return expr_free_vars(expr.base) | expr_free_vars(expr.exponent)
-    if isinstance(expr, FunctionApp):
-        return expr_free_vars(expr.function) | _union(expr.args)
-    if isinstance(expr, FunctionType):
-        return expr_free_vars(expr.domain) | expr_free_vars(expr.range)
-    if isinstance(expr, (Tuple, SetLiteral, BagLiteral, SequenceLiteral)):
-        return _union(expr.elements)
-    if isinstance(expr, RelationalImage):
-        return expr_free_vars(expr.relation) | expr_free_vars(expr.set)
-    if isinstance(expr, GenericInstantiation):
-        return expr_free_vars(expr.base) | _union(expr.type_params)
-    if isinstance(expr, Range):
-        return expr_free_vars(expr.start) | expr_free_vars(expr.end)
-    if isinstance(expr, TupleProjection):
-        return expr_free_vars(expr.base)
-    if isinstance(expr, Conditional):
-        return (
-            expr_free_vars(expr.condition)
-            | expr_free_vars(expr.then_expr)
-            | expr_free_vars(expr.else_expr)
-        )
-    if isinstance(expr, GuardedBranch):
-        return expr_free_vars(expr.expression) | expr_free_vars(expr.guard)
-    if isinstance(expr, GuardedCases):
-        return _union(expr.branches)
-    if isinstance(expr, Theta):
-        return expr_free_vars(expr.expr)
-    if isinstance(expr, Restrict):
-        return expr_free_vars(expr.predicate) | expr_free_vars(expr.relation)
-    if isinstance(expr, (Project, RelationRename, Group, Ungroup, GroupAggregate)):
-        return expr_free_vars(expr.relation)
-    if isinstance(expr, NaturalJoin):
-        sub_free = (
-            expr_free_vars(expr.subscript) if expr.subscript is not None else _EMPTY
-        )
-        return expr_free_vars(expr.left) | expr_free_vars(expr.right) | sub_free
-    if isinstance(expr, Divide):
-        return expr_free_vars(expr.left) | expr_free_vars(expr.right)
+    if isinstance(expr, _PASS_THROUGH):
+        return _EMPTY, _unbound(iter_children(expr))
+    if isinstance(expr, GroupAggregate):
+        return _EMPTY, _unbound((expr.relation,))
     # Binding is the only remaining Expr member at this point.
     msg = (
         f"expr_free_vars: Binding node not yet supported "
         f"(line={expr.line}, column={expr.column})"
     )
     raise NotImplementedError(msg)
+
+
+def expr_free_vars(expr: Expr) -> frozenset[str]:
+    """Return the set of free variable names in expr.
+
+    Conservative: may over-report for schema-calculus nodes where shadow
+    analysis requires type information.  Over-report produces unnecessary
+    nesting (always Z-valid).  Under-report produces fuzz-rejected output
+    — so err toward over-report.
+
+    The tree is walked from an explicit stack, so nesting depth is not
+    limited by Python's recursion limit.
+
+    Z RM references:
+    - Quantifier scoping: Z RM §3.9
+    - Lambda scoping: Z RM §3.12
+    - Set comprehension scoping: Z RM §3.10
+    """
+    return frozenset(_free_vars(expr))
+
+
+def _free_vars(
+    expr: Expr, known: Callable[[Expr], frozenset[str] | None] | None = None
+) -> set[str]:
+    """Free variables of ``expr``, reusing ``known(node)`` where it has them."""
+    # Post-order walk: a node is popped twice, first to push its children,
+    # then to fold their results off ``values``.  Each result set is owned by
+    # its parent, so the largest one is extended in place; copying it at every
+    # level would make long chains quadratic.
+    values: list[set[str]] = []
+    stack: list[tuple[Expr, _Scoped | None]] = [(expr, None)]
+    while stack:
+        node, scoped = stack.pop()
+        if scoped is None:
+            if known is not None and (free := known(node)) is not None:
+                values.append(set(free))
+                continue
+            scoped = _scoped_children(node)
+            stack.append((node, scoped))
+            stack.extend((child, None) for child, _ in reversed(scoped[1]))
+            continue
+        own, children = scoped
+        if not children:
+            values.append(set(own))
+            continue
+        child_sets = values[-len(children) :]
+        del values[-len(children) :]
+        largest = max(range(len(children)), key=lambda i: len(child_sets[i]))
+        free = child_sets[largest]
+        free -= children[largest][1]
+        free |= own
+        for i, (_, bound) in enumerate(children):
+            if i != largest:
+                free |= child_sets[i] - bound
+        values.append(free)
+    return values[0]
+
+
+class FreeVariables:
+    """Memoized :func:`expr_free_vars`, keyed by subtree shape.
+
+    AST nodes are immutable, so a computed set never needs invalidating;
+    it is keyed by the subtree's interned shape (:mod:`txt2tex.ast_intern`)
+    and so also answers for every structurally equal subtree.  Computing a
+    new expression reuses the sets of the subtrees asked about before, so
+    a chain of nested domains asked about level by level is walked once
+    overall rather than once per level.  Equal sets are stored as one
+    frozenset.
+
+    Only the expressions asked about are stored: caching every subtree
+    would hold a set per level of a long ``land`` chain, quadratic in its
+    length.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        # id(shape) -> free variables.  ``_shapes`` keeps every key's shape
+        # alive, so the ids cannot be reused while in use.
+        self._sets: dict[int, frozenset[str]] = {}
+        self._shapes: list[ASTNode] = []
+        self._frozensets: dict[frozenset[str], frozenset[str]] = {}
+        # Interns expressions not interned yet, such as those of a document
+        # the generator's annotations have not seen.
+        self._interner = NodeInterner()
+
+    def __len__(self) -> int:
+        """Number of expressions (by shape) cached."""
+        return len(self._sets)
+
+    def __call__(self, expr: Expr) -> frozenset[str]:
+        """Return the set of free variable names in expr (cached)."""
+        if not is_interned(expr):
+            self._interner.intern(expr)
+        shape = shape_of(expr)
+        free = self._sets.get(id(shape))
+        if free is None:
+            found = frozenset(_free_vars(expr, self._cached))
+            free = self._frozensets.setdefault(found, found)
+            self._sets[id(shape)] = free
+            self._shapes.append(shape)
+        return free
+
+    def clear(self) -> None:
+        """Forget every cached set."""
+        self._sets.clear()
+        self._shapes.clear()
+        self._frozensets.clear()
+        self._interner = NodeInterner()
+
+    def _cached(self, node: Expr) -> frozenset[str] | None:
+        return self._sets.get(id(shape_of(node)))
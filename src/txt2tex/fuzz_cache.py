@@ -0,0 +1,200 @@
+"""Per-paragraph cache of fuzz typecheck verdicts.
+
+Most edits touch one Z paragraph, yet fuzz re-checks the whole document.
+Here the generated LaTeX is split into its Z paragraphs (``zed``,
+``axdef``, ``schema``, ``gendef`` and ``syntax`` environments) and each is
+keyed by a hash of its own text plus the text of every earlier paragraph
+it depends on: the given sets, free types, abbreviations, schemas and
+global declarations whose names it mentions, transitively.  A paragraph
+whose key was seen in a passing fuzz run is not checked again; fuzz runs
+on a reduced document holding only the remaining paragraphs and their
+dependency closure.
+
+Dependencies are found lexically and over-approximated: a paragraph also
+depends on earlier ones that mention a name it defines, so a clashing
+redefinition is checked together with the original.  A missed dependency
+shows up as an undefined name in the reduced document, so any failure is
+re-checked on the full document before it is reported: errors always come
+from a full fuzz run with the real line numbers.  Only passing verdicts
+are cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from txt2tex.cache import default_cache_dir
+
+Z_ENVIRONMENTS = ("zed", "axdef", "schema", "gendef", "syntax")
+_PARAGRAPH = re.compile(
+    rf"^\\begin\{{({'|'.join(Z_ENVIRONMENTS)})\}}(.*?)\\end\{{\1\}}",
+    re.MULTILINE | re.DOTALL,
+)
+_IDENTIFIER = re.compile(r"(?<![\\\w])[A-Za-z]\w*")
+# Schema name and generic parameters opening a schema/gendef body
+_SCHEMA_HEADER = re.compile(r"\{([^}]*)\}(?:\[[^\]]*\])?")
+_GENERIC_HEADER = re.compile(r"\[[^\]]*\]")
+_ITEM_SEPARATOR = re.compile(r"\\\\|\\also\b|;")
+
+
+@dataclass(frozen=True)
+class ZParagraph:
+    """One Z paragraph of a generated document."""
+
+    text: str
+    defines: frozenset[str]
+    uses: frozenset[str]
+
+
+def _identifiers(text: str) -> list[str]:
+    return _IDENTIFIER.findall(text.replace("\\_", "_"))
+
+
+def _first_identifier(text: str) -> set[str]:
+    names = _identifiers(text)
+    return {names[0]} if names else set()
+
+
+def _zed_definitions(body: str) -> set[str]:
+    """Names introduced by given sets, free types, abbreviations, \\defs."""
+    defined: set[str] = set()
+    for item in _ITEM_SEPARATOR.split(body.replace("&", " ")):
+        item = item.strip()
+        if item.startswith("["):
+            defined.update(_identifiers(item[: item.find("]") + 1]))
+        elif "::=" in item:
+            lhs, rhs = item.split("::=", 1)
+            defined |= _first_identifier(lhs)
+            for branch in rhs.split("|"):
+                defined |= _first_identifier(branch)
+        elif "==" in item:
+            defined |= _first_identifier(item.split("==", 1)[0])
+        elif "\\defs" in item:
+            defined |= _first_identifier(item.split("\\defs", 1)[0])
+    return defined
+
+
+def _declared_names(body: str) -> set[str]:
+    """Names declared left of ``:`` in a declaration part."""
+    declarations = body.split("\\where", 1)[0]
+    defined: set[str] = set()
+    for item in _ITEM_SEPARATOR.split(declarations):
+        if ":" in item:
+            defined.update(_identifiers(item.split(":", 1)[0]))
+    return defined
+
+
+def _paragraph(environment: str, text: str, body: str) -> ZParagraph:
+    if environment in {"zed", "syntax"}:
+        defines = _zed_definitions(body)
+    elif environment == "schema":
+        match = _SCHEMA_HEADER.match(body)
+        defines = _first_identifier(match.group(1)) if match else set()
+    else:
+        if environment == "gendef" and (match := _GENERIC_HEADER.match(body)):
+            body = body[match.end() :]
+        defines = _declared_names(body)
+    return ZParagraph(text, frozenset(defines), frozenset(_identifiers(text)))
+
+
+def split_paragraphs(tex_content: str) -> list[ZParagraph]:
+    """Return the Z paragraphs of a document in source order."""
+    return [
+        _paragraph(match.group(1), match.group(0), match.group(2))
+        for match in _PARAGRAPH.finditer(tex_content)
+    ]
+
+
+def dependency_closures(paragraphs: list[ZParagraph]) -> list[list[int]]:
+    """For each paragraph, the sorted indices of itself and its dependencies.
+
+    Paragraph i depends on an earlier paragraph j when j defines a name
+    that i mentions, or mentions a name that i defines.
+    """
+    closures: list[list[int]] = []
+    for i, paragraph in enumerate(paragraphs):
+        closure = {i}
+        for j in range(i):
+            earlier = paragraphs[j]
+            if earlier.defines & paragraph.uses or earlier.uses & paragraph.defines:
+                closure.update(closures[j])
+        closures.append(sorted(closure))
+    return closures
+
+
+def _fuzz_identity(fuzz: str) -> str:
+    resolved = Path(fuzz).resolve()
+    try:
+        return f"{resolved}:{resolved.stat().st_mtime_ns}"
+    except OSError:
+        return str(resolved)
+
+
+def paragraph_keys(paragraphs: list[ZParagraph], fuzz: str, preamble: str) -> list[str]:
+    """Cache key per paragraph: fuzz, the preamble and its closure's text.
+
+    The preamble is part of every reduced document fuzz checks, so a
+    change to it (packages, macros) invalidates every verdict.
+    """
+    identity = _fuzz_identity(fuzz)
+    keys = []
+    for closure in dependency_closures(paragraphs):
+        digest = hashlib.sha256(identity.encode())
+        digest.update(b"\0" + preamble.encode())
+        for index in closure:
+            digest.update(b"\0" + paragraphs[index].text.encode())
+        keys.append(digest.hexdigest())
+    return keys
+
+
+def document_preamble(tex_content: str) -> str:
+    """The text before ``\\begin{document}`` (empty if there is none)."""
+    marker = "\\begin{document}"
+    return tex_content.split(marker, 1)[0] if marker in tex_content else ""
+
+
+def reduced_document(tex_content: str, paragraphs: list[ZParagraph]) -> str:
+    """The document preamble followed by only the given paragraphs."""
+    marker = "\\begin{document}"
+    preamble = document_preamble(tex_content)
+    body = "\n\n".join(paragraph.text for paragraph in paragraphs)
+    return f"{preamble}{marker}\n\n{body}\n\n\\end{{document}}\n"
+
+
+@dataclass(frozen=True)
+class VerdictCache:
+    """Directory of marker files, one per paragraph key that passed fuzz.
+
+    The markers live under the txt2tex cache root and count towards its
+    size budget (:meth:`txt2tex.cache.GenerationCache.evict`); a hit
+    touches its marker so eviction removes unused verdicts first.
+    """
+
+    root: Path
+
+    @classmethod
+    def default(cls) -> VerdictCache:
+        """Cache under the txt2tex cache directory."""
+        return cls(default_cache_dir() / "fuzz")
+
+    def passed(self, key: str) -> bool:
+        """Whether a fuzz run has already accepted this paragraph key."""
+        try:
+            os.utime(self.root / key[:2] / key)
+        except OSError:
+            return False
+        return True
+
+    def record(self, keys: list[str]) -> None:
+        """Remember that fuzz accepted every paragraph in ``keys``."""
+        try:
+            for key in keys:
+                marker = self.root / key[:2] / key
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+        except OSError:
+            pass
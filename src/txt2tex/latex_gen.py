@@ -4,43 +4,22 @@ from __future__ import annotations
 
 __all__ = ["LaTeXGenerator", "toc_depth_from_keyword"]
 
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from txt2tex.__version__ import __version__
 from txt2tex.ast_nodes import (
     Abbreviation,
-    BinaryOp,
-    Conditional,
     Contents,
-    Divide,
     Document,
     DocumentItem,
     Expr,
     FreeType,
-    FunctionApp,
-    GenericInstantiation,
     GivenType,
-    Group,
-    GroupAggregate,
     Identifier,
-    Lambda,
-    NaturalJoin,
     Part,
-    Project,
-    Quantifier,
-    RelationalImage,
-    RelationRename,
-    Restrict,
     Section,
     SequenceLiteral,
-    SetComprehension,
-    SetLiteral,
     Solution,
-    Subscript,
-    Superscript,
-    Tuple,
-    UnaryOp,
-    Ungroup,
 )
 from txt2tex.codegen._dispatch import CodegenDispatch
 from txt2tex.codegen._smoke import (
@@ -50,6 +29,7 @@ from txt2tex.codegen._toc import toc_depth_from_keyword
 from txt2tex.codegen.algebra import (
     _AlgebraCodegen,  # pyright: ignore[reportPrivateUsage]
 )
+from txt2tex.codegen.annotations import NodeAnnotations
 from txt2tex.codegen.bindings import (
     _BindingsCodegen,  # pyright: ignore[reportPrivateUsage]
 )
@@ -83,6 +63,12 @@ from txt2tex.codegen.text_pipeline import (
 from txt2tex.codegen.types import (
     _TypesCodegen,  # pyright: ignore[reportPrivateUsage]
 )
+from txt2tex.free_vars import FreeVariables
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from txt2tex.source import SourceFile
 
 
 class LaTeXGenerator(
@@ -172,6 +158,7 @@ class LaTeXGenerator(
     _warn_overflow: bool
     _overflow_threshold: int
     _overflow_warnings: list[str]
+    _source: SourceFile | None
     _dollar_sanitise_registry: dict[str, str]
     _synth_abbrev_counter: int
     _in_hidden_fuzz_block: bool
@@ -183,6 +170,7 @@ class LaTeXGenerator(
         toc_parts: bool = False,
         warn_overflow: bool = True,
         overflow_threshold: int | None = None,
+        source: SourceFile | None = None,
     ) -> None:
         """Initialize generator with package choice and TOC options.
 
@@ -192,6 +180,8 @@ class LaTeXGenerator(
             warn_overflow: Emit warnings for lines that may overflow page margins.
             overflow_threshold: LaTeX character threshold for overflow warnings.
                 Defaults to DEFAULT_OVERFLOW_THRESHOLD (~100 chars).
+            source: The source being converted; overflow warnings then quote
+                the source line instead of the start of the generated LaTeX.
         """
         self.use_fuzz = use_fuzz
         self.toc_parts = toc_parts
@@ -203,6 +193,8 @@ class LaTeXGenerator(
         # True when generating inside axdef/schema/gendef/zed
         self._in_z_paragraph = False
         self._quantifier_depth = 0  # Track nesting for \t1, \t2 indentation
+        # Depths of the current proof tree's subtrees, by node id
+        self._proof_tree_depths: dict[int, int] = {}
         self._warn_overflow = warn_overflow
         self._overflow_threshold = (
             overflow_threshold
@@ -210,17 +202,26 @@ class LaTeXGenerator(
             else self.DEFAULT_OVERFLOW_THRESHOLD
         )
         self._overflow_warnings = []  # Collected warnings to emit
+        self._source = source
         # Populated by _pre_sanitise_dollars, consumed by _restore_dollar_sanitise
         self._dollar_sanitise_registry = {}
         self._synth_abbrev_counter = 0
         self._in_hidden_fuzz_block = False
+        # Per-subtree facts (line breaks, relational constructs) for the
+        # document being generated; filled in one pass by generate_document.
+        self._annotations = NodeAnnotations(
+            dat_types=self._DAT_EXPRESSION_TYPES, connective_ops=self._CONNECTIVE_OPS
+        )
+        # Free variables of binder domains, asked about at every level of a
+        # nested lambda, quantifier or set comprehension.
+        self._free_vars = FreeVariables()
 
     def _next_synth_name(self) -> str:
         """Generate the next synthetic abbreviation name for fuzz validation."""
         self._synth_abbrev_counter += 1
         return f"zS_{self._synth_abbrev_counter}"
 
-    def _find_contents_depth(self, items: list[DocumentItem]) -> int | None:
+    def _find_contents_depth(self, items: Sequence[DocumentItem]) -> int | None:
         """Return the toc depth from the first Contents node found in document order.
 
         Performs a pre-order DFS through items, descending into the .items of
@@ -238,7 +239,7 @@ class LaTeXGenerator(
                     return result
         return None
 
-    def _resolve_toc_depth(self, items: list[DocumentItem]) -> None:
+    def _resolve_toc_depth(self, items: Sequence[DocumentItem]) -> None:
         """Set self._toc_depth for one document body.
 
         Reset to the default, derive from the first Contents node anywhere in
@@ -444,6 +445,9 @@ class LaTeXGenerator(
         Returns:
             Complete LaTeX source code ready for compilation.
         """
+        self._annotations.clear()
+        self._annotations.annotate(ast)
+        self._free_vars.clear()
         lines: list[str] = []
 
         # Preamble
@@ -555,7 +559,10 @@ class LaTeXGenerator(
     # fallback body for bare Expr items).
 
     def _has_line_breaks(self, expr: Expr) -> bool:
-        """Recursively check if expression contains any line breaks.
+        """Check if expression contains any line breaks.
+
+        Answered from the annotation table filled by ``generate_document``
+        (see :mod:`txt2tex.codegen.annotations`), not by walking ``expr``.
 
         Args:
             expr: The expression to check
@@ -563,87 +570,7 @@ class LaTeXGenerator(
         Returns:
             True if expr or any sub-expression has line breaks
         """
-        # Nodes with line_break_after flag — check flag first, then children
-        if isinstance(
-            expr, (BinaryOp, NaturalJoin, Divide, Group, Ungroup, GroupAggregate)
-        ):
-            return self._has_line_breaks_flagged(expr)
-        # Quantifier has a different flag name
-        if isinstance(expr, Quantifier):
-            if expr.line_break_after_pipe:
-                return True
-            if expr.domain and self._has_line_breaks(expr.domain):
-                return True
-            return self._has_line_breaks(expr.body)
-        # Relational algebra wrappers: recurse into the inner relation
-        if isinstance(expr, (Restrict, Project, RelationRename)):
-            has_rel = self._has_line_breaks(expr.relation)
-            if isinstance(expr, Restrict):
-                return has_rel or self._has_line_breaks(expr.predicate)
-            return has_rel
-        return self._has_line_breaks_structural(expr)
-
-    def _has_line_breaks_flagged(
-        self,
-        expr: BinaryOp | NaturalJoin | Divide | Group | Ungroup | GroupAggregate,
-    ) -> bool:
-        """Check line breaks for nodes that carry a line_break_after flag."""
-        if expr.line_break_after:
-            return True
-        if isinstance(expr, BinaryOp):
-            return self._has_line_breaks(expr.left) or self._has_line_breaks(expr.right)
-        if isinstance(expr, NaturalJoin):
-            left_has = self._has_line_breaks(expr.left)
-            right_has = self._has_line_breaks(expr.right)
-            sub_has = bool(expr.subscript and self._has_line_breaks(expr.subscript))
-            return left_has or right_has or sub_has
-        if isinstance(expr, Divide):
-            return self._has_line_breaks(expr.left) or self._has_line_breaks(expr.right)
-        # Group, Ungroup, GroupAggregate: only the relation child matters
-        return self._has_line_breaks(expr.relation)
-
-    def _has_line_breaks_structural(self, expr: Expr) -> bool:
-        """Check line breaks for structural/container expression nodes."""
-        if isinstance(expr, UnaryOp):
-            return self._has_line_breaks(expr.operand)
-        if isinstance(expr, Lambda):
-            return self._has_line_breaks(expr.body)
-        if isinstance(expr, Subscript):
-            return self._has_line_breaks(expr.base) or self._has_line_breaks(expr.index)
-        if isinstance(expr, Superscript):
-            return self._has_line_breaks(expr.base) or self._has_line_breaks(
-                expr.exponent
-            )
-        if isinstance(expr, SetComprehension):
-            if expr.domain and self._has_line_breaks(expr.domain):
-                return True
-            if expr.predicate and self._has_line_breaks(expr.predicate):
-                return True
-            return bool(expr.expression and self._has_line_breaks(expr.expression))
-        if isinstance(expr, (SetLiteral, SequenceLiteral)):
-            return any(self._has_line_breaks(elem) for elem in expr.elements)
-        if isinstance(expr, FunctionApp):
-            if self._has_line_breaks(expr.function):
-                return True
-            return any(self._has_line_breaks(arg) for arg in expr.args)
-        if isinstance(expr, Tuple):
-            return any(self._has_line_breaks(elem) for elem in expr.elements)
-        if isinstance(expr, RelationalImage):
-            return self._has_line_breaks(expr.relation) or self._has_line_breaks(
-                expr.set
-            )
-        if isinstance(expr, GenericInstantiation):
-            if self._has_line_breaks(expr.base):
-                return True
-            return any(self._has_line_breaks(param) for param in expr.type_params)
-        if isinstance(expr, Conditional):
-            return (
-                self._has_line_breaks(expr.condition)
-                or self._has_line_breaks(expr.then_expr)
-                or self._has_line_breaks(expr.else_expr)
-            )
-        # Base cases: Identifier, Number, StringLit, etc. - no line breaks
-        return False
+        return self._annotations.has_line_breaks(expr)
 
     # generate_expr is inherited from _CodegenDispatch (dispatch stub).
 
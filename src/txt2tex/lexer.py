@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import re
+from array import array
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from txt2tex.source import SourceFile
+from txt2tex.token_store import TokenStore
 from txt2tex.tokens import Token, TokenType
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Keyword to token type mapping for simple keywords.
 # This replaces ~40 individual if-statements in _scan_identifier,
 # reducing cyclomatic complexity significantly.
@@ -194,6 +206,152 @@ RESERVED_WORDS: frozenset[str] = frozenset(
     }
 )
 
+# Title metadata keywords (TITLE:, AUTHOR:, ...) that capture the rest of the line.
+TITLE_KEYWORDS: dict[str, TokenType] = {
+    "TITLE": TokenType.TITLE,
+    "SUBTITLE": TokenType.SUBTITLE,
+    "AUTHOR": TokenType.AUTHOR,
+    "DATE": TokenType.DATE,
+    "INSTITUTION": TokenType.INSTITUTION,
+}
+
+# Capitalized words that start a prose line (auto-detected as TEXT).
+# Articles (A, An) are handled separately since they may be type names.
+PROSE_STARTERS: frozenset[str] = frozenset(
+    {
+        "The",
+        "This",
+        "These",
+        "Those",
+        "That",
+        "We",
+        "It",
+        "They",
+        "There",
+        "Here",
+        "In",
+        "On",
+        "At",
+        "For",
+        "When",
+        "Where",
+        "Why",
+        "How",
+        "What",
+        "If",
+        "Since",
+        "Because",
+        "Although",
+        "While",
+        "Each",
+        "Every",
+        "Some",
+        "All",
+        "Any",
+        "By",
+        "From",
+        "To",
+        "With",
+        "Without",
+        "First",
+        "Second",
+        "Third",
+        "Finally",
+        "Next",
+        "Then",
+        "Note",
+        "Consider",
+        "Suppose",
+        "Recall",
+        "Let",
+        "Given",
+        "Assuming",
+        "Hence",
+        "Thus",
+        "Therefore",
+        "Show",
+        "Prove",
+        "Verify",
+        "Check",
+        "Using",
+        "Calculate",
+        "Find",
+        "Determine",
+        # Common contractions
+        "Let's",
+        "It's",
+        "That's",
+        "There's",
+        "Here's",
+        "What's",
+        "Who's",
+        "Where's",
+        "When's",
+        "How's",
+        "We're",
+        "They're",
+        "You're",
+        "Don't",
+        "Doesn't",
+        "Didn't",
+        "Can't",
+        "Won't",
+        "Shouldn't",
+        "Wouldn't",
+        "Haven't",
+        "Hasn't",
+        "Hadn't",
+        "Aren't",
+        "Isn't",
+        "Wasn't",
+        "Weren't",
+    }
+)
+
+# Z keywords that, after a leading A/An, mean a type name rather than prose.
+ARTICLE_Z_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "land",
+        "lor",
+        "lnot",
+        "union",
+        "intersect",
+        "elem",
+        "notin",
+        "subset",
+        "subseteq",
+        "psubset",
+        "cross",
+        "dom",
+        "ran",
+        "inv",
+        "id",
+        "comp",
+        "shows",
+        "forall",
+        "exists",
+        "exists1",
+        "mu",
+        "lambda",
+        "given",
+        "axdef",
+        "schema",
+        "gendef",
+        "zed",
+        "syntax",
+        "where",
+        "end",
+        "if",
+        "then",
+        "else",
+        "otherwise",
+        "mod",
+        "defs",
+        "group",
+        "ungroup",
+    }
+)
+
 # Single-character tokens that don't require lookahead.
 # These can be dispatched directly without peek checks.
 # Note: Characters like (, [, {, |, ., :, +, -, *, = require lookahead
@@ -209,6 +367,96 @@ SINGLE_CHAR_TOKENS: dict[str, TokenType] = {
 }
 
 
+# Context-free operators, keyed by their exact text.  Each leading
+# character's alternatives appear in _FAST_TOKEN in the same order as the
+# checks in _scan_special_token, so the longest operator wins exactly as it
+# does there.
+_FAST_OPERATORS: dict[str, TokenType] = {
+    **SINGLE_CHAR_TOKENS,
+    "=>": TokenType.IMPLIES,
+    "==": TokenType.ABBREV,
+    "=": TokenType.EQUALS,
+    "<=>": TokenType.IFF,
+    "<->": TokenType.RELATION,
+    "<<|": TokenType.NDRES,
+    "<|": TokenType.DRES,
+    "<=": TokenType.LESS_EQUAL,
+    ">=": TokenType.GREATER_EQUAL,
+    ">>": TokenType.PIPE_PIPE,
+    ">->>": TokenType.BIJECTION,
+    ">+>": TokenType.PINJ,
+    ">->": TokenType.TINJ,
+    "(|": TokenType.LIMG,
+    "(": TokenType.LPAREN,
+    "[": TokenType.LBRACKET,
+    "{": TokenType.LBRACE,
+    "|->": TokenType.MAPLET,
+    "|>>": TokenType.NRRES,
+    "|>": TokenType.RRES,
+    "|)": TokenType.RIMG,
+    "|": TokenType.PIPE,
+    "...": TokenType.ELLIPSIS,
+    "..": TokenType.RANGE,
+    ".": TokenType.PERIOD,
+    "::=": TokenType.FREE_TYPE,
+    "::": TokenType.DOUBLE_COLON,
+    ":": TokenType.COLON,
+    "!=": TokenType.NOT_EQUAL,
+    "/=": TokenType.NOT_EQUAL,
+    "/in": TokenType.NOTIN,
+    "/": TokenType.SLASH,
+    "+->>": TokenType.PSURJ,
+    "+->": TokenType.PFUN,
+    "++": TokenType.OVERRIDE,
+    "+": TokenType.PLUS,
+    "*": TokenType.STAR,
+    "-->>": TokenType.TSURJ,
+    "-|>": TokenType.PINJ_ALT,
+    "->": TokenType.TFUN,
+    "---": TokenType.DERIVE,
+    "-": TokenType.MINUS,
+    "77->": TokenType.FINFUN,
+}
+
+# Master pattern for the scanner's fast path: one C-level match per token.
+# Anything it does not match — context-dependent tokens (===, **, |}, ^,
+# backslash, quotes, part labels, separator lines) and non-ASCII
+# characters — is left to _scan_special_token.  [^\W_] is exactly
+# str.isalnum() and \w is isalnum() or "_".
+_FAST_TOKEN = re.compile(
+    r"""
+    (?P<ws>[ \t]+)
+    | (?P<nl>\n)
+    | (?P<comment>//[^\n]*)
+    | (?P<op>
+        [)\]},;\#~]
+        | => | ==(?!=) | =(?!=)
+        | <=> | <-> | <<\| | <\| | <=
+        | >= | (?<=[ \t])>> | >->> | >\+> | >->
+        | \(\| | \( | \[ | \{(?!\|)
+        | \|-> | \|>> | \|> | \|\) | \|(?!\})
+        | \.\.\. | \.\. | \.
+        | ::= | :: | :
+        | != | /= | /in(?!\w) | /
+        | \+->> | \+-> | \+\+ | \+
+        | \*(?!\*)
+        | -->> | -\|> | -> | --- | -
+        | 77->
+      )
+    | (?P<langle><(?=[>(<]|[^\W_]))
+    | (?P<lt><)
+    | (?P<rangle>(?:(?<=[^\W_])|(?<=[<>),]))>)
+    | (?P<gt>>)
+    | (?P<lbind>\{\|)
+    | (?P<word>[A-Za-z_]\w*)
+    | (?P<digit>[0-9])
+    """,
+    re.VERBOSE,
+)
+_WORD_RUN = re.compile(r"\w*")
+_DIGIT_RUN = re.compile(r"[0-9]*")
+
+
 class LexerError(Exception):
     """Raised when lexer encounters invalid input."""
 
@@ -225,6 +473,52 @@ class LexerError(Exception):
         self.column = column
 
 
+@dataclass(frozen=True)
+class TokenDelta:
+    """Change to a token list after an edit, as computed by ``Lexer.relex``.
+
+    ``tokens`` replaces ``old[start:end]``; tokens from ``end`` onward are
+    unchanged except that their line numbers move by ``line_shift``.
+    """
+
+    start: int
+    end: int
+    tokens: list[Token]
+    line_shift: int = 0
+
+    def apply(self, old: list[Token]) -> list[Token]:
+        """Return the token list for the edited text."""
+        tail = old[self.end :]
+        if self.line_shift:
+            shift = self.line_shift
+            tail = [replace(token, line=token.line + shift) for token in tail]
+        return [*old[: self.start], *self.tokens, *tail]
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the longest common prefix (slice compares, not a char loop)."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix, at most ``limit``."""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid : len(a) - low] == b[len(b) - mid : len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
 class Lexer:
     """Tokenizes input text for txt2tex.
 
@@ -235,23 +529,31 @@ class Lexer:
     """
 
     # Instance variable type annotations
+    source: SourceFile
     text: str
     pos: int
-    line: int
-    column: int
     _in_solution_marker: bool
     _bind_depth: int  # Tracks nested {| ... |} binding bracket depth
-    _token_buffer: list[Token]  # Buffer for tokens produced as lookahead side-effects
-
-    def __init__(self, text: str) -> None:
-        """Initialize lexer with input text."""
-        self.text = text
+    _token_buffer: deque[Token]  # Buffer for tokens produced as lookahead side-effects
+    # Safe restart points of the last run: line starts (after a NEWLINE token)
+    # where no {| ... |} or ** ... ** is open, as offsets and token indices
+    _restart_offsets: array[int]
+    _restart_tokens: array[int]
+
+    def __init__(self, text: str | SourceFile) -> None:
+        """Initialize lexer with input text (or an already indexed source)."""
+        self.source = SourceFile.of(text)
+        self.text = self.source.text
         self.pos = 0
-        self.line = 1
-        self.column = 1
+        # Bounds of the line holding pos, so most positions need no search
+        self._line_number = 1
+        self._line_start = 0
+        self._next_line_start = 0
         self._in_solution_marker = False  # Track if inside ** ... **
         self._bind_depth = 0  # Track open {| ... |} nesting depth
-        self._token_buffer = []  # Drain before scanning new characters
+        self._token_buffer = deque()  # Drain before scanning new characters
+        self._restart_offsets = array("i")
+        self._restart_tokens = array("i")
 
     def _raise_infinite_loop_error(
         self,
@@ -289,20 +591,111 @@ class Lexer:
 
     def tokenize(self) -> list[Token]:
         """Tokenize entire input and return list of tokens."""
-        tokens: list[Token] = []
-        while not self._at_end() or self._token_buffer:
+        return list(self.iter_tokens())
+
+    def tokenize_compact(self) -> TokenStore:
+        """Tokenize entire input into a compact :class:`TokenStore`."""
+        return TokenStore(self.source, self.iter_tokens())
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """Yield tokens as they are scanned, ending with EOF.
+
+        Lets the parser start before the whole input is lexed; see
+        :class:`~txt2tex.parser_pkg.token_window.TokenWindow`.
+        """
+        self._restart_offsets = array("i")
+        self._restart_tokens = array("i")
+        return self._scan_from(0, self._restart_offsets, self._restart_tokens)
+
+    def _scan_from(
+        self, index: int, offsets: array[int], indices: array[int]
+    ) -> Iterator[Token]:
+        """Yield tokens from pos (token ``index`` onward), ending with EOF.
+
+        Appends each safe restart point passed to ``offsets``/``indices``.
+        """
+        buffer = self._token_buffer
+        text_len = len(self.text)
+        while self.pos < text_len or buffer:
             # Drain the side-effect buffer before consuming more characters.
-            if self._token_buffer:
-                tokens.append(self._token_buffer.pop(0))
+            if buffer:
+                yield buffer.popleft()
+                index += 1
                 continue
             token = self._scan_token()
             if token is not None:
-                tokens.append(token)
-        # Drain any remaining buffered tokens before EOF.
-        while self._token_buffer:
-            tokens.append(self._token_buffer.pop(0))
-        tokens.append(self._make_token(TokenType.EOF, ""))
-        return tokens
+                index += 1
+                if (
+                    token.type is TokenType.NEWLINE
+                    and not self._bind_depth
+                    and not self._in_solution_marker
+                    and not buffer
+                ):
+                    offsets.append(self.pos)
+                    indices.append(index)
+                yield token
+        yield self._make_token(TokenType.EOF, "")
+
+    def relex(self, tokens: list[Token], text: str) -> TokenDelta:
+        """Re-tokenize after the input changed to ``text``.
+
+        ``tokens`` must be the complete list this lexer last produced (from
+        ``tokenize`` or a previous ``relex`` applied to it).  Scanning
+        restarts at the last safe restart point before the first changed
+        character and stops at the first restart point past the change
+        where the old stream had one too: from there on both texts are
+        identical and the lexer is in the same state, so the old tokens
+        stand, moved by the change in line count.  Afterwards the lexer
+        holds ``text``, ready for the next edit.
+
+        Raises:
+            LexerError: If the new text does not tokenize; the lexer's
+                restart points are then incomplete, so start over with
+                ``tokenize``.
+        """
+        old_lines = len(self.source.line_starts)
+        prefix = _common_prefix(self.text, text)
+        suffix = _common_suffix(
+            self.text, text, min(len(self.text), len(text)) - prefix
+        )
+        changed_end = len(text) - suffix
+        shift = len(text) - len(self.text)
+        offsets, indices = self._restart_offsets, self._restart_tokens
+        restart = bisect_right(offsets, prefix) - 1
+        start = indices[restart] if restart >= 0 else 0
+
+        self._restart_at(text, offsets[restart] if restart >= 0 else 0)
+        new_offsets, new_indices = offsets[: restart + 1], indices[: restart + 1]
+        self._restart_offsets, self._restart_tokens = new_offsets, new_indices
+        new_tokens: list[Token] = []
+        seen = len(new_offsets)
+        for token in self._scan_from(start, new_offsets, new_indices):
+            new_tokens.append(token)
+            if len(new_offsets) == seen:
+                continue
+            seen += 1
+            if new_offsets[-1] < changed_end:
+                continue
+            # Past the change: resync if the old stream restarted here too
+            old_offset = new_offsets[-1] - shift
+            old = bisect_right(offsets, old_offset) - 1
+            if old > restart and offsets[old] == old_offset:
+                token_shift = new_indices[-1] - indices[old]
+                new_offsets.extend(o + shift for o in offsets[old + 1 :])
+                new_indices.extend(i + token_shift for i in indices[old + 1 :])
+                line_shift = len(self.source.line_starts) - old_lines
+                return TokenDelta(start, indices[old], new_tokens, line_shift)
+        return TokenDelta(start, len(tokens), new_tokens)
+
+    def _restart_at(self, text: str, pos: int) -> None:
+        """Load ``text`` and continue from ``pos``, a safe restart point."""
+        self.source = SourceFile(text)
+        self.text = text
+        self.pos = pos
+        self._seek_line(pos)
+        self._in_solution_marker = False
+        self._bind_depth = 0
+        self._token_buffer.clear()
 
     def _at_end(self) -> bool:
         """Check if we've reached end of input."""
@@ -321,27 +714,117 @@ class Lexer:
             return ""
         return self.text[pos]
 
+    @property
+    def line(self) -> int:
+        """Line (1-based) of the current position."""
+        return self._position()[0]
+
+    @property
+    def column(self) -> int:
+        """Column (1-based) of the current position."""
+        return self._position()[1]
+
+    def _position(self) -> tuple[int, int]:
+        """Line and column of the current position."""
+        pos = self.pos
+        if not self._line_start <= pos < self._next_line_start:
+            self._seek_line(pos)
+        return self._line_number, pos - self._line_start + 1
+
+    def _seek_line(self, pos: int) -> None:
+        """Find the line holding ``pos`` in the source's line index."""
+        line, column = self.source.position(pos)
+        self._line_number = line
+        self._line_start = pos - column + 1
+        starts = self.source.line_starts
+        self._next_line_start = (
+            starts[line] if line < len(starts) else len(self.text) + 1
+        )
+
     def _advance(self) -> str:
-        """Consume and return current character, updating position."""
+        """Consume and return current character."""
         if self._at_end():
             return ""
         char = self.text[self.pos]
         self.pos += 1
-        if char == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
         return char
 
+    def _advance_to(self, end: int) -> None:
+        """Consume text up to ``end``."""
+        self.pos = end
+
+    def _line_end(self) -> int:
+        """Position of the next newline (or end of input) from pos."""
+        end = self.text.find("\n", self.pos)
+        return len(self.text) if end == -1 else end
+
     def _make_token(self, token_type: TokenType, value: str) -> Token:
-        """Create token at current position."""
-        return Token(token_type, value, self.line, self.column - len(value))
+        """Create token ending at the current position."""
+        line, column = self._position()
+        return Token(token_type, value, line, column - len(value))
 
-    def _scan_token(self) -> Token | None:  # noqa: C901
-        """Scan next token from input."""
-        start_line = self.line
-        start_column = self.column
+    def _scan_token(self) -> Token | None:
+        """Scan next token from input.
+
+        Common tokens (whitespace runs, newlines, comments, operators,
+        identifiers, numbers) are recognised by one match of _FAST_TOKEN;
+        everything else goes through _scan_special_token.
+        """
+        match = _FAST_TOKEN.match(self.text, self.pos)
+        if match is None:
+            return self._scan_special_token()
+        kind = match.lastgroup
+        end = match.end()
+        if kind == "ws" or kind == "comment":
+            self.pos = end
+            return None
+        pos = self.pos
+        if not self._line_start <= pos < self._next_line_start:
+            self._seek_line(pos)
+        line = self._line_number
+        column = pos - self._line_start + 1
+        if kind == "nl":
+            self.pos = end
+            # Step to the next line without searching the index
+            starts = self.source.line_starts
+            self._line_number = line + 1
+            self._line_start = end
+            self._next_line_start = (
+                starts[line + 1] if line + 1 < len(starts) else len(self.text) + 1
+            )
+            return Token(TokenType.NEWLINE, "\n", line, column)
+        if kind == "word":
+            return self._scan_identifier(line, column, run_end=end)
+        if kind == "digit":
+            return self._scan_digits(line, column)
+
+        value = match.group()
+        if kind == "op":
+            # Part labels and separator lines are only recognised at column 1
+            if column == 1 and value[0] in "(-":
+                return self._scan_special_token()
+            token_type = _FAST_OPERATORS[value]
+        elif kind == "lbind":
+            self._bind_depth += 1
+            token_type = TokenType.LBIND
+        elif kind == "langle":
+            token_type = TokenType.LANGLE
+        elif kind == "lt":
+            token_type = TokenType.LESS_THAN
+        elif kind == "rangle":
+            token_type = TokenType.RANGLE
+        else:
+            token_type = TokenType.GREATER_THAN
+        self.pos = end
+        return Token(token_type, value, line, column)
+
+    def _scan_special_token(self) -> Token | None:  # noqa: C901
+        """Scan next token from input, one check at a time.
+
+        Handles every token; _scan_token only sends the cases its master
+        pattern cannot decide here.
+        """
+        start_line, start_column = self._position()
 
         char = self._current_char()
 
@@ -353,8 +836,7 @@ class Lexer:
         # Line comments: // ... (skip to end of line)
         if char == "/" and self._peek_char() == "/":
             # Skip the entire line including the newline
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             # Don't consume the newline - let normal newline handling do it
             return None
 
@@ -407,8 +889,7 @@ class Lexer:
                 raw_title = self.text[raw_title_start : self.pos].strip()
 
                 # Consume the closing ===
-                close_line = self.line
-                close_column = self.column
+                close_line, close_column = self._position()
                 self._advance()
                 self._advance()
                 self._advance()
@@ -876,8 +1357,7 @@ class Lexer:
             # If 10+ consecutive dashes at start of line, treat as TEXT separator
             if consecutive_dashes >= 10:
                 text_start = self.pos
-                while not self._at_end() and self._current_char() != "\n":
-                    self._advance()
+                self._advance_to(self._line_end())
                 text_content = self.text[text_start : self.pos]
                 return Token(TokenType.TEXT, text_content, start_line, start_column)
 
@@ -914,25 +1394,7 @@ class Lexer:
             return Token(TokenType.FINFUN, "77->", start_line, start_column)
 
         if char.isdigit():
-            # Peek ahead to determine if this is identifier or number
-            # Scan all digits first
-            temp_pos = self.pos
-            while temp_pos < len(self.text) and self.text[temp_pos].isdigit():
-                temp_pos += 1
-
-            # Check if followed by underscore and then letter/digit
-            # Pattern: 479_courses (digit+underscore+alphanumeric)
-            if (
-                temp_pos < len(self.text)
-                and self.text[temp_pos] == "_"
-                and temp_pos + 1 < len(self.text)
-                and (self.text[temp_pos + 1].isalnum())
-            ):
-                # It's an identifier starting with digits
-                return self._scan_identifier(start_line, start_column)
-
-            # It's a plain number
-            return self._scan_number(start_line, start_column)
+            return self._scan_digits(start_line, start_column)
 
         # Unicode symbols
         if char == "×":  # noqa: RUF001
@@ -1034,8 +1496,42 @@ class Lexer:
         # Unknown character
         raise LexerError(f"Unexpected character: {char!r}", self.line, self.column)
 
-    def _scan_identifier(self, start_line: int, start_column: int) -> Token:  # noqa: C901
-        """Scan identifier or keyword."""
+    def _scan_digits(self, start_line: int, start_column: int) -> Token:
+        """Scan a number, or an identifier starting with digits."""
+        # Peek ahead to determine if this is identifier or number
+        # Scan all digits first
+        temp_pos = self._digit_run_end()
+
+        # Check if followed by underscore and then letter/digit
+        # Pattern: 479_courses (digit+underscore+alphanumeric)
+        if (
+            temp_pos < len(self.text)
+            and self.text[temp_pos] == "_"
+            and temp_pos + 1 < len(self.text)
+            and (self.text[temp_pos + 1].isalnum())
+        ):
+            # It's an identifier starting with digits
+            return self._scan_identifier(start_line, start_column)
+
+        # It's a plain number
+        return self._scan_number(start_line, start_column)
+
+    def _digit_run_end(self) -> int:
+        """End of the str.isdigit() run at pos (ASCII digits in one match)."""
+        run = _DIGIT_RUN.match(self.text, self.pos)
+        end = run.end() if run else self.pos
+        while end < len(self.text) and self.text[end].isdigit():
+            end += 1
+        return end
+
+    def _scan_identifier(  # noqa: C901
+        self, start_line: int, start_column: int, run_end: int | None = None
+    ) -> Token:
+        """Scan identifier or keyword.
+
+        ``run_end`` is the end of the alnum/underscore run when the caller
+        has already matched it.
+        """
         start_pos = self.pos
 
         # Check for special o9 operator - composition
@@ -1045,12 +1541,10 @@ class Lexer:
             return Token(TokenType.CIRC, "o9", start_line, start_column)
 
         # Consume the alnum/underscore run.
-        while not self._at_end():
-            current = self._current_char()
-            if current.isalnum() or current == "_":
-                self._advance()
-            else:
-                break
+        if run_end is None:
+            run = _WORD_RUN.match(self.text, self.pos)
+            run_end = run.end() if run else self.pos
+        self.pos = run_end
 
         # Consume any trailing decoration suffix per Z RM §3.3:
         # primes ('), inputs (?), outputs (!).
@@ -1075,14 +1569,13 @@ class Lexer:
             next_ch = self._current_char()
             if next_ch in ("'", "?", "!"):
                 # Point the error at the decoration character, not the keyword start.
-                deco_line = self.line
-                deco_column = self.column
+                deco_line, deco_column = self._position()
                 msg = f"Cannot decorate reserved keyword {base_value!r}"
                 raise LexerError(msg, deco_line, deco_column)
 
         seen_question = False
         seen_bang = False
-        while not self._at_end():
+        while self._current_char() in ("?", "!", "'"):
             current = self._current_char()
             if current == "?":
                 if seen_question:
@@ -1107,8 +1600,6 @@ class Lexer:
         # Check for multi-word keyword: TRUTH TABLE:
         if value == "TRUTH" and self._current_char() == " ":
             saved_pos = self.pos
-            saved_line = self.line
-            saved_column = self.column
 
             self._advance()  # skip space
             # Skip additional spaces
@@ -1132,8 +1623,6 @@ class Lexer:
                 )
             # Not "TABLE:", restore position
             self.pos = saved_pos
-            self.line = saved_line
-            self.column = saved_column
 
         # Check for ARGUE: or EQUIV: keywords (both map to ARGUE token)
         # EQUIV is backwards-compatible alias for ARGUE
@@ -1167,8 +1656,7 @@ class Lexer:
 
             # Capture the rest of the line as raw text (don't tokenize)
             text_start = self.pos
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
 
             # Extract the raw text content
             text_content = self.text[text_start : self.pos]
@@ -1185,8 +1673,7 @@ class Lexer:
 
             # Capture the rest of the line as raw text (don't tokenize)
             text_start = self.pos
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
 
             # Extract the raw text content
             text_content = self.text[text_start : self.pos]
@@ -1223,8 +1710,7 @@ class Lexer:
                 found_end = False
                 while not self._at_end():
                     line_start = self.pos
-                    while not self._at_end() and self._current_char() != "\n":
-                        self._advance()
+                    self._advance_to(self._line_end())
                     raw_line = self.text[line_start : self.pos]
                     if not self._at_end() and self._current_char() == "\n":
                         self._advance()
@@ -1244,21 +1730,13 @@ class Lexer:
             while not self._at_end() and self._current_char() in " \t":
                 self._advance()
             text_start = self.pos
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             text_content = self.text[text_start : self.pos]
             return Token(TokenType.LATEX, text_content, start_line, start_column)
 
         # Check for title metadata keywords: TITLE:, AUTHOR:, DATE:, etc.
-        title_keywords = {
-            "TITLE": TokenType.TITLE,
-            "SUBTITLE": TokenType.SUBTITLE,
-            "AUTHOR": TokenType.AUTHOR,
-            "DATE": TokenType.DATE,
-            "INSTITUTION": TokenType.INSTITUTION,
-        }
-        if value in title_keywords and self._current_char() == ":":
-            token_type = title_keywords[value]
+        if value in TITLE_KEYWORDS and self._current_char() == ":":
+            token_type = TITLE_KEYWORDS[value]
             self._advance()  # Consume ':'
 
             # Skip any whitespace after the colon
@@ -1267,8 +1745,7 @@ class Lexer:
 
             # Capture the rest of the line as raw text (don't tokenize)
             text_start = self.pos
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
 
             # Extract the raw text content
             text_content = self.text[text_start : self.pos]
@@ -1283,8 +1760,7 @@ class Lexer:
                 self._advance()
             # Capture optional depth parameter (e.g., "full" or "2")
             depth_start = self.pos
-            while not self._at_end() and self._current_char() not in "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             depth_value = self.text[depth_start : self.pos].strip()
             return Token(TokenType.CONTENTS, depth_value, start_line, start_column)
 
@@ -1296,8 +1772,7 @@ class Lexer:
                 self._advance()
             # Capture style value (e.g., "inline" or "subsection")
             style_start = self.pos
-            while not self._at_end() and self._current_char() not in "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             style_value = self.text[style_start : self.pos].strip()
             return Token(TokenType.PARTS, style_value, start_line, start_column)
 
@@ -1309,8 +1784,7 @@ class Lexer:
                 self._advance()
             # Capture filename (e.g., "references.bib")
             file_start = self.pos
-            while not self._at_end() and self._current_char() not in "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             file_value = self.text[file_start : self.pos].strip()
             return Token(TokenType.BIBLIOGRAPHY, file_value, start_line, start_column)
 
@@ -1322,8 +1796,7 @@ class Lexer:
                 self._advance()
             # Capture style name (e.g., "harvard", "plainnat")
             style_start = self.pos
-            while not self._at_end() and self._current_char() not in "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             style_value = self.text[style_start : self.pos].strip()
             return Token(
                 TokenType.BIBLIOGRAPHY_STYLE, style_value, start_line, start_column
@@ -1346,8 +1819,7 @@ class Lexer:
         if value == "B" and self._current_char() == ":":
             self._advance()  # consume ':'
             # Skip optional trailing whitespace/rest of B: line up to newline
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
             # Consume the newline that ends the B: line, if present
             if not self._at_end() and self._current_char() == "\n":
                 self._advance()
@@ -1357,8 +1829,7 @@ class Lexer:
             while not self._at_end():
                 # Scan one line
                 line_start = self.pos
-                while not self._at_end() and self._current_char() != "\n":
-                    self._advance()
+                self._advance_to(self._line_end())
                 # Capture the line content (without its trailing newline)
                 raw_line = self.text[line_start : self.pos]
                 # Consume the newline, if present
@@ -1394,99 +1865,11 @@ class Lexer:
         # Also detect prose after part labels (any column)
         # Check for capitalized prose starters
         # Exclude articles (A, An) that might be type names
-        prose_starters = {
-            "The",
-            "This",
-            "These",
-            "Those",
-            "That",
-            "We",
-            "It",
-            "They",
-            "There",
-            "Here",
-            "In",
-            "On",
-            "At",
-            "For",
-            "When",
-            "Where",
-            "Why",
-            "How",
-            "What",
-            "If",
-            "Since",
-            "Because",
-            "Although",
-            "While",
-            "Each",
-            "Every",
-            "Some",
-            "All",
-            "Any",
-            "By",
-            "From",
-            "To",
-            "With",
-            "Without",
-            "First",
-            "Second",
-            "Third",
-            "Finally",
-            "Next",
-            "Then",
-            "Note",
-            "Consider",
-            "Suppose",
-            "Recall",
-            "Let",
-            "Given",
-            "Assuming",
-            "Hence",
-            "Thus",
-            "Therefore",
-            "Show",
-            "Prove",
-            "Verify",
-            "Check",
-            "Using",
-            "Calculate",
-            "Find",
-            "Determine",
-            # Common contractions
-            "Let's",
-            "It's",
-            "That's",
-            "There's",
-            "Here's",
-            "What's",
-            "Who's",
-            "Where's",
-            "When's",
-            "How's",
-            "We're",
-            "They're",
-            "You're",
-            "Don't",
-            "Doesn't",
-            "Didn't",
-            "Can't",
-            "Won't",
-            "Shouldn't",
-            "Wouldn't",
-            "Haven't",
-            "Hasn't",
-            "Hadn't",
-            "Aren't",
-            "Isn't",
-            "Wasn't",
-            "Weren't",
-        }
 
         # Prose detection at column 1 OR after whitespace (for prose after part labels)
         # BUT NOT inside solution markers (** ... **) to avoid consuming closing **
         # AND NOT in section headers (lines containing ===)
-        if value in prose_starters and not self._in_solution_marker:
+        if value in PROSE_STARTERS and not self._in_solution_marker:
             # Check if the rest of the line contains "===" (section header)
             temp_pos = self.pos
             while temp_pos < len(self.text) and self.text[temp_pos] != "\n":
@@ -1502,8 +1885,7 @@ class Lexer:
             # Looks like prose, capture whole line
             text_start = start_pos
 
-            while not self._at_end() and self._current_char() != "\n":
-                self._advance()
+            self._advance_to(self._line_end())
 
             text_content = self.text[start_pos : self.pos]
             return Token(TokenType.TEXT, text_content, start_line, start_column)
@@ -1531,53 +1913,10 @@ class Lexer:
                         temp_pos += 1
                     next_word = self.text[next_word_start:temp_pos]
 
-                    # Z keywords that shouldn't trigger prose mode
-                    z_keywords = {
-                        "land",
-                        "lor",
-                        "lnot",
-                        "union",
-                        "intersect",
-                        "elem",
-                        "notin",
-                        "subset",
-                        "subseteq",
-                        "psubset",
-                        "cross",
-                        "dom",
-                        "ran",
-                        "inv",
-                        "id",
-                        "comp",
-                        "shows",
-                        "forall",
-                        "exists",
-                        "exists1",
-                        "mu",
-                        "lambda",
-                        "given",
-                        "axdef",
-                        "schema",
-                        "gendef",
-                        "zed",
-                        "syntax",
-                        "where",
-                        "end",
-                        "if",
-                        "then",
-                        "else",
-                        "otherwise",
-                        "mod",
-                        "defs",
-                        "group",
-                        "ungroup",
-                    }
-
                     # If next word is NOT a Z keyword, treat as prose
-                    if next_word not in z_keywords:
+                    if next_word not in ARTICLE_Z_KEYWORDS:
                         text_start = start_pos
-                        while not self._at_end() and self._current_char() != "\n":
-                            self._advance()
+                        self._advance_to(self._line_end())
                         text_content = self.text[text_start : self.pos]
                         return Token(
                             TokenType.TEXT, text_content, start_line, start_column
@@ -1598,8 +1937,7 @@ class Lexer:
     def _scan_number(self, start_line: int, start_column: int) -> Token:
         """Scan number."""
         start_pos = self.pos
-        while not self._at_end() and self._current_char().isdigit():
-            self._advance()
+        self._advance_to(self._digit_run_end())
 
         value = self.text[start_pos : self.pos]
         return Token(TokenType.NUMBER, value, start_line, start_column)
@@ -1632,3 +1970,30 @@ class Lexer:
                 content.append(ch)
                 self._advance()
         return Token(TokenType.STRING, "".join(content), start_line, start_column)
+
+
+class IncrementalLexer:
+    """Tokenize successive versions of one document, re-lexing each edit.
+
+    The first ``tokenize`` scans the whole text; later calls hand the
+    previous tokens to :meth:`Lexer.relex` and splice in its delta, so an
+    edit costs the region it touched.  A text that fails to tokenize drops
+    the kept state and the next call scans from scratch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no previous version."""
+        self._lexer: Lexer | None = None
+        self._tokens: list[Token] = []
+
+    def tokenize(self, source: SourceFile) -> list[Token]:
+        """Return the tokens of ``source``, the next version of the document."""
+        lexer = self._lexer
+        self._lexer = None
+        if lexer is None:
+            lexer = Lexer(source)
+            tokens = lexer.tokenize()
+        else:
+            tokens = lexer.relex(self._tokens, source.text).apply(self._tokens)
+        self._lexer, self._tokens = lexer, tokens
+        return tokens
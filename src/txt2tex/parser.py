@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+import dataclasses
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
 
 from txt2tex.ast_nodes import (
+    BibliographyMetadata,
     Declaration,
     Document,
     DocumentItem,
     Expr,
     SchemaInclusion,
+    Section,
     TitleMetadata,
 )
 from txt2tex.parser_pkg._base import ParserBase, ParserError as ParserError
 from txt2tex.parser_pkg.algebra import (
     _AlgebraParser,  # pyright: ignore[reportPrivateUsage]
 )
+from txt2tex.parser_pkg.blocks import split_blocks
 from txt2tex.parser_pkg.errors import (
     _ErrorsParser,  # pyright: ignore[reportPrivateUsage]
 )
@@ -37,11 +46,40 @@ from txt2tex.parser_pkg.schemas import (
 from txt2tex.parser_pkg.text_blocks import (
     _TextBlocksParser,  # pyright: ignore[reportPrivateUsage]
 )
+from txt2tex.parser_pkg.token_window import TokenWindow
 from txt2tex.parser_pkg.types import (
     _TypesParser,  # pyright: ignore[reportPrivateUsage]
 )
 from txt2tex.tokens import Token, TokenType
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Executor
+
+    from txt2tex.parser_pkg.blocks import Block
+    from txt2tex.parser_pkg.token_index import TokenIndex
+
+
+@dataclass(frozen=True)
+class _DocumentHead:
+    """Metadata of a multi-item document and its items parsed so far."""
+
+    items: list[DocumentItem]
+    title_metadata: TitleMetadata | None
+    parts_format: str
+    bibliography_metadata: BibliographyMetadata | None
+    line: int
+
+    def document(self, items: list[DocumentItem]) -> Document:
+        return Document(
+            items=items,
+            title_metadata=self.title_metadata,
+            parts_format=self.parts_format,
+            bibliography_metadata=self.bibliography_metadata,
+            line=self.line,
+            column=1,
+        )
+
 
 class Parser(
     _ParagraphsParser,
@@ -76,6 +114,9 @@ class Parser(
         atom       ::= prefix_op atom | IDENTIFIER | NUMBER | '(' expr ')' |
                        '{' set_comprehension '}' | '⟨' sequence '⟩' | '[[' bag ']]'
 
+    The binary levels from iff down to postfix are parsed by precedence
+    climbing over the table in ``parser_pkg/precedence.py``.
+
     Document structure:
         document ::= document_item*
         document_item ::= section | solution | part | truth_table | equiv_chain |
@@ -94,7 +135,7 @@ class Parser(
     """
 
     # Instance variable type annotations
-    tokens: list[Token]
+    tokens: Sequence[Token] | TokenWindow
     pos: int
     last_token_end_column: int
     last_token_line: int
@@ -105,17 +146,26 @@ class Parser(
     _current_quantifier_vars: set[str]
     _in_relational_context: bool
 
-    def __init__(self, tokens: list[Token]) -> None:
-        """Initialize parser with token list.
+    def __init__(self, tokens: Iterable[Token] | TokenWindow) -> None:
+        """Initialize parser with a token list or stream.
 
         Args:
-            tokens: List of tokens from Lexer to parse.
+            tokens: Tokens from Lexer to parse: a sequence (the list from
+                ``tokenize()`` or the ``TokenStore`` from
+                ``tokenize_compact()``), or any other iterable (such as
+                ``iter_tokens()``), which is read lazily through a
+                :class:`TokenWindow`.
         """
-        self.tokens = tokens
+        if isinstance(tokens, (Sequence, TokenWindow)):
+            self.tokens = tokens
+        else:
+            self.tokens = TokenWindow(tokens)
         self.pos = 0
         # Track the end position of the last consumed token for whitespace detection
         self.last_token_end_column = 0
         self.last_token_line = 1
+        # Lookahead index over a complete token sequence; built on first use.
+        self._lookahead: TokenIndex | None = None
         # Track whether we're parsing schema text (lambda/set comp declarations)
         # where periods are separators, not projection operators
         self._parsing_schema_text = False
@@ -139,6 +189,9 @@ class Parser(
         # pi, join, div, group, ungroup operands).  Governs disambiguation of
         # Expr[new/old] postfix: RelationRename when True, SchemaRename when False.
         self._in_relational_context: bool = False
+        # Packrat memo for rules re-entered after backtracking; see _memoized.
+        # Cleared between document items.
+        self._memo: dict[tuple[object, ...], tuple[object, int, int, int]] = {}
 
     def parse(self) -> Document | Expr:
         """Parse tokens and return AST.
@@ -154,6 +207,183 @@ class Parser(
         Raises:
             ParserError: If the input contains syntax errors.
         """
+        head = self._parse_head()
+        if not isinstance(head, _DocumentHead):
+            return head
+        return head.document([*head.items, *self._iter_document_items()])
+
+    def parse_parallel(
+        self, jobs: int | None = None, executor: Executor | None = None
+    ) -> Document | Expr:
+        """Parse like :meth:`parse`, with sections and solutions in parallel.
+
+        The token stream is split at line-initial section and solution heads
+        (:func:`~txt2tex.parser_pkg.blocks.split_blocks`); the blocks are
+        parsed in a process pool and reassembled into the same
+        ``Document`` :meth:`parse` returns.  Tokens before the first block
+        are parsed here.  If a block fails to parse, the whole input is
+        parsed serially so the ``ParserError`` is the one :meth:`parse`
+        raises.  Input with fewer than two blocks, or streamed through a
+        :class:`TokenWindow`, is parsed serially.
+
+        Args:
+            jobs: Worker processes (default: one per CPU).  With
+                ``executor``, only used to size the batches of blocks.
+            executor: Pool to run the blocks on, kept open by the caller.
+
+        Raises:
+            ParserError: If the input contains syntax errors.
+        """
+        if isinstance(self.tokens, TokenWindow):
+            return self.parse()
+        tokens = self.tokens
+        blocks = split_blocks(tokens)
+        if len(blocks) < 2:
+            return self.parse()
+
+        head = self._parse_head()
+        if not isinstance(head, _DocumentHead):
+            return head
+        items = list(head.items)
+        self._skip_newlines()
+        while not self._at_end() and self.pos < blocks[0].start:
+            self._release_tokens()
+            items.append(self._parse_document_item())
+            self._skip_newlines()
+        if self.pos != blocks[0].start:
+            # A leading item ran on into the first block.
+            return Parser(tokens).parse()
+
+        block_tokens = [
+            [*tokens[block.start : block.end], self._block_eof(block)]
+            for block in blocks
+        ]
+        last_tokens = [self._token_end(block.start - 1) for block in blocks]
+        workers = jobs or os.cpu_count() or 1
+        try:
+            with ExitStack() as stack:
+                if executor is None:
+                    executor = stack.enter_context(
+                        ProcessPoolExecutor(max_workers=workers)
+                    )
+                parsed = list(
+                    executor.map(
+                        self._parse_block,
+                        block_tokens,
+                        last_tokens,
+                        chunksize=max(1, len(blocks) // (4 * workers)),
+                    )
+                )
+        except ParserError:
+            return Parser(tokens).parse()
+
+        assembled = self._assemble_blocks(blocks, parsed)
+        if assembled is None:
+            return Parser(tokens).parse()
+        self.pos = blocks[-1].end
+        return head.document([*items, *assembled])
+
+    @classmethod
+    def _parse_block(
+        cls, tokens: list[Token], last_token: tuple[int, int]
+    ) -> list[DocumentItem]:
+        """Parse the items of one section or solution block (pool worker).
+
+        ``tokens`` ends with an EOF standing in for the next block's head;
+        ``last_token`` is the line and end column of the token before the
+        block.
+        """
+        parser = cls(tokens)
+        parser.last_token_line, parser.last_token_end_column = last_token
+        items: list[DocumentItem] = []
+        while not parser._at_end():
+            parser._release_tokens()
+            items.append(parser._parse_document_item())
+            parser._skip_newlines()
+        return items
+
+    def _block_eof(self, block: Block) -> Token:
+        """EOF token closing ``block``, placed at the token that follows it."""
+        following = self.tokens[block.end]
+        return Token(TokenType.EOF, "", following.line, following.column)
+
+    def _token_end(self, pos: int) -> tuple[int, int]:
+        """Line and end column of the token at ``pos`` (or the start state)."""
+        if pos < 0:
+            return 1, 0
+        token = self.tokens[pos]
+        return token.line, token.column + len(token.value)
+
+    @staticmethod
+    def _assemble_blocks(
+        blocks: list[Block], parsed: list[list[DocumentItem]]
+    ) -> list[DocumentItem] | None:
+        """Reattach each solution block's items to its section.
+
+        Returns None if a section block did not parse to a single
+        ``Section``, which serial parsing would not produce either.
+        """
+        sections: dict[int, Section] = {}
+        section_items: dict[int, list[DocumentItem]] = {}
+        top_level: list[DocumentItem | int] = []
+        for index, (block, block_items) in enumerate(zip(blocks, parsed, strict=True)):
+            if block.kind == "section":
+                section = block_items[0] if len(block_items) == 1 else None
+                if not isinstance(section, Section):
+                    return None
+                sections[index] = section
+                section_items[index] = list(section.items)
+                top_level.append(index)
+            elif block.section is None:
+                top_level.extend(block_items)
+            else:
+                section_items[block.section].extend(block_items)
+        return [
+            dataclasses.replace(sections[entry], items=section_items[entry])
+            if isinstance(entry, int)
+            else entry
+            for entry in top_level
+        ]
+
+    def iter_items(self) -> Iterator[DocumentItem]:
+        """Parse the token stream, yielding top-level items as they complete.
+
+        Fed from :meth:`Lexer.iter_tokens`, the first items arrive before the
+        rest of the input is lexed, and the tokens of finished items are
+        released, so memory stays bounded by the largest item rather than
+        the document.  Single-expression input yields that expression.
+        Title, bibliography and parts metadata are only returned by
+        :meth:`parse`.
+
+        Raises:
+            ParserError: If the input contains syntax errors.
+        """
+        head = self._parse_head()
+        if isinstance(head, Document):
+            yield from head.items
+        elif isinstance(head, _DocumentHead):
+            yield from head.items
+            yield from self._iter_document_items()
+        else:
+            yield head
+
+    def _iter_document_items(self) -> Iterator[DocumentItem]:
+        """Parse the remaining top-level items."""
+        self._skip_newlines()
+        while not self._at_end():
+            self._release_tokens()
+            yield self._parse_document_item()
+            self._skip_newlines()
+
+    def _parse_head(self) -> _DocumentHead | Document | Expr:
+        """Parse up to the first top-level item and classify the input.
+
+        Returns:
+            _DocumentHead: For a multi-item document; the caller parses the
+                rest with :meth:`_iter_document_items`.
+            Document: For empty input.
+            Expr: For single expression input.
+        """
         self._skip_newlines()
 
         # Empty input
@@ -178,17 +408,12 @@ class Parser(
         # Check if we start with a structural element (section, solution, etc.)
         if self._is_structural_token():
             # Parse as document with structural elements
-            items: list[DocumentItem] = []
-            while not self._at_end():
-                items.append(self._parse_document_item())
-                self._skip_newlines()
-            return Document(
-                items=items,
+            return _DocumentHead(
+                items=[],
                 title_metadata=title_metadata,
                 parts_format=parts_format,
                 bibliography_metadata=bibliography_metadata,
                 line=first_line,
-                column=1,
             )
 
         # Check for abbreviation (identifier ==) or free type (identifier ::=)
@@ -199,6 +424,7 @@ class Parser(
         # Prefix-operator keywords (F, P, F1, P1) can also be abbreviation
         # names when followed by ==.  Check for that before falling through
         # to expression parsing, which would consume them as operators.
+        first_item: DocumentItem | None = None
         if self._match(
             TokenType.IDENTIFIER,
             TokenType.FINSET,
@@ -208,171 +434,67 @@ class Parser(
         ):
             next_token = self._peek_ahead(1)
             if next_token.type == TokenType.FREE_TYPE:
-                # Parse free type and check for more items
-                first_free_type = self._parse_free_type()
-                self._skip_newlines()
-                # Check if there are more items (multi-line document)
-                if not self._at_end():
-                    items_with_free: list[DocumentItem] = [first_free_type]
-                    while not self._at_end():
-                        items_with_free.append(self._parse_document_item())
-                        self._skip_newlines()
-                    return Document(
-                        items=items_with_free,
-                        title_metadata=None,
-                        parts_format=parts_format,
-                        bibliography_metadata=None,
-                        line=first_line,
-                        column=1,
-                    )
-                # Single free type
-                return Document(
-                    items=[first_free_type],
-                    title_metadata=None,
-                    parts_format=parts_format,
-                    bibliography_metadata=None,
-                    line=first_line,
-                    column=1,
-                )
+                first_item = self._parse_free_type()
             # Detect horizontal schema definition: Name defs ... or Name[X] defs ...
-            is_horiz = next_token.type == TokenType.DEFS or (
+            elif next_token.type == TokenType.DEFS or (
                 next_token.type == TokenType.LBRACKET
                 and self._scan_for_defs_after_brackets(offset=1)
-            )
-            if is_horiz:
-                first_hd = self._parse_horiz_def()
-                self._skip_newlines()
-                if not self._at_end():
-                    items_with_hd: list[DocumentItem] = [first_hd]
-                    while not self._at_end():
-                        items_with_hd.append(self._parse_document_item())
-                        self._skip_newlines()
-                    return Document(
-                        items=items_with_hd,
-                        title_metadata=None,
-                        parts_format=parts_format,
-                        bibliography_metadata=None,
-                        line=first_line,
-                        column=1,
-                    )
-                return Document(
-                    items=[first_hd],
-                    title_metadata=None,
-                    parts_format=parts_format,
-                    bibliography_metadata=None,
-                    line=first_line,
-                    column=1,
-                )
-            # Check for abbreviation with or without postfix operator
-            # Cases: "R ==", "R+ ==", "R* ==", "R~ ==" (partial support, GitHub #3 open)
-            is_abbrev = next_token.type == TokenType.ABBREV
-            if not is_abbrev and next_token.type in (
-                TokenType.PLUS,
-                TokenType.STAR,
-                TokenType.TILDE,
             ):
-                # Check if postfix operator is followed by ==
-                token_after_postfix = self._peek_ahead(2)
-                is_abbrev = token_after_postfix.type == TokenType.ABBREV
-            if is_abbrev:
-                # Parse abbreviation and check for more items
-                first_abbrev = self._parse_abbreviation()
-                self._skip_newlines()
-                # Check if there are more items (multi-line document)
-                if not self._at_end():
-                    items_with_abbrev: list[DocumentItem] = [first_abbrev]
-                    while not self._at_end():
-                        items_with_abbrev.append(self._parse_document_item())
-                        self._skip_newlines()
-                    return Document(
-                        items=items_with_abbrev,
-                        title_metadata=None,
-                        parts_format=parts_format,
-                        bibliography_metadata=None,
-                        line=first_line,
-                        column=1,
-                    )
-                # Single abbreviation
-                return Document(
-                    items=[first_abbrev],
-                    title_metadata=None,
-                    parts_format=parts_format,
-                    bibliography_metadata=None,
-                    line=first_line,
-                    column=1,
-                )
+                first_item = self._parse_horiz_def()
+            elif self._is_abbreviation_head(next_token):
+                first_item = self._parse_abbreviation()
         # Check for abbreviation with generic parameters [X, Y] Name == expression
         # Note: Bag literals [[x]] start with [[ which is distinct
-        if self._match(TokenType.LBRACKET):
+        elif self._match(TokenType.LBRACKET):
             # Check if this is a bag literal [[...]] or abbreviation [X, Y] Name ==
             next_token = self._peek_ahead(1)
             if next_token.type == TokenType.LBRACKET:
                 # It's a bag literal - parse as expression
-                first_item = self._parse_expr()
-                # Single expression
-                if not self._at_end():
-                    self._reject_stray_slash()
-                    raise ParserError(
-                        f"Unexpected token after expression: {self._current().value!r}",
-                        self._current(),
-                    )
-                return first_item
-            # Parse abbreviation with generic parameters and check for more items
-            first_generic_abbrev = self._parse_abbreviation()
-            self._skip_newlines()
-            # Check if there are more items (multi-line document)
-            if not self._at_end():
-                items_with_generic: list[DocumentItem] = [first_generic_abbrev]
-                while not self._at_end():
-                    items_with_generic.append(self._parse_document_item())
-                    self._skip_newlines()
-                return Document(
-                    items=items_with_generic,
-                    title_metadata=None,
-                    parts_format=parts_format,
-                    bibliography_metadata=None,
-                    line=first_line,
-                    column=1,
-                )
-            # Single abbreviation with generic parameters
-            return Document(
-                items=[first_generic_abbrev],
-                title_metadata=None,
-                parts_format=parts_format,
-                bibliography_metadata=None,
-                line=first_line,
-                column=1,
-            )
-
-        # Try to parse as expression
-        first_item = self._parse_expr()
+                return self._parse_single_expr()
+            first_item = self._parse_abbreviation()
+
+        if first_item is None:
+            # Try to parse as expression; more lines make it a document
+            first_expr = self._parse_expr()
+            if not self._match(TokenType.NEWLINE):
+                # Single expression (backward compatibility)
+                return self._finish_single_expr(first_expr)
+            first_item = first_expr
+
+        # A Z definition or expression, possibly followed by more items
+        return _DocumentHead(
+            items=[first_item],
+            title_metadata=None,
+            parts_format=parts_format,
+            bibliography_metadata=None,
+            line=first_line,
+        )
 
-        # Check if there are more items (multi-line document)
-        if self._match(TokenType.NEWLINE):
-            items_list: list[DocumentItem] = [first_item]
-            self._skip_newlines()
+    def _is_abbreviation_head(self, next_token: Token) -> bool:
+        """Check for abbreviation with or without postfix operator.
 
-            while not self._at_end():
-                items_list.append(self._parse_document_item())
-                self._skip_newlines()
+        Cases: "R ==", "R+ ==", "R* ==", "R~ ==" (partial support, GitHub #3 open)
+        """
+        if next_token.type == TokenType.ABBREV:
+            return True
+        # Check if postfix operator is followed by ==
+        return (
+            next_token.type in (TokenType.PLUS, TokenType.STAR, TokenType.TILDE)
+            and self._peek_ahead(2).type == TokenType.ABBREV
+        )
 
-            return Document(
-                items=items_list,
-                title_metadata=None,
-                parts_format=parts_format,
-                bibliography_metadata=None,
-                line=first_line,
-                column=1,
-            )
+    def _parse_single_expr(self) -> Expr:
+        """Parse input that must be exactly one expression."""
+        return self._finish_single_expr(self._parse_expr())
 
-        # Single expression (backward compatibility)
+    def _finish_single_expr(self, expr: Expr) -> Expr:
         if not self._at_end():
             self._reject_stray_slash()
             raise ParserError(
                 f"Unexpected token after expression: {self._current().value!r}",
                 self._current(),
             )
-        return first_item
+        return expr
 
     def _parse_title_metadata(self) -> TitleMetadata | None:
         """Parse title metadata at document start (TITLE:, AUTHOR:, etc.).
@@ -610,6 +732,9 @@ class Parser(
         type expression within generic args) is not mistaken for the
         declaration colon.  Only a COLON at depth 0 signals a typed declaration.
         """
+        index = self._token_index()
+        if index is not None:
+            return index.colon_before_newline(self.pos)
         offset = 0
         depth = 0
         while True:
@@ -846,6 +971,9 @@ class Parser(
         Generic parameters must be on the same line as the name — a NEWLINE
         inside the bracket group ends the scan and returns False.
         """
+        index = self._token_index()
+        if index is not None:
+            return index.defs_after_brackets(self.pos + offset)
         tok = self._peek_ahead(offset)
         if tok.type != TokenType.LBRACKET:
             return False
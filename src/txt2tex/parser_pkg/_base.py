@@ -14,11 +14,14 @@ after later moves) and are reached through the normal MRO.
 
 As subsequent moves consolidate helpers into their own mixin files, the
 declarations migrate out of this module in lockstep.
+
+The module also holds :class:`ParserError` and :func:`drive_steps`, which
+runs the rules written as steps from an explicit stack.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from txt2tex.tokens import (
     Token,
@@ -39,8 +42,43 @@ class ParserError(Exception):
         self.message = message
         self.token = token
 
+    def __reduce__(self) -> tuple[type[ParserError], tuple[str, Token]]:
+        """Pickle from the constructor arguments (for process-pool workers)."""
+        return (type(self), (self.message, self.token))
+
+
+def drive_steps(steps: Generator[Any, Any, T]) -> T:
+    """Run a rule's steps, and those of every rule nested in it.
+
+    A waiting rule sits on ``stack`` while the steps it yielded run, and is
+    sent their result.  A ParserError is thrown into the waiting rule, so
+    its handlers and ``finally`` blocks run as they would around a call.
+    """
+    stack = [steps]
+    result: object = None
+    error: ParserError | None = None
+    while True:
+        try:
+            nested = stack[-1].send(result) if error is None else stack[-1].throw(error)
+        except StopIteration as done:
+            stack.pop()
+            if not stack:
+                value: T = done.value
+                return value
+            result, error = done.value, None
+        except ParserError as e:
+            stack.pop()
+            if not stack:
+                raise
+            result, error = None, e
+        else:
+            stack.append(nested)
+            result, error = None, None
+
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
     from txt2tex.ast_nodes import (
         Abbreviation,
         Aggregator,
@@ -71,6 +109,7 @@ if TYPE_CHECKING:
         ProofNode,
         ProofTree,
         PureParagraph,
+        Quantifier,
         RawLatexBlock,
         SchemaBinding,
         SchemaInclusion,
@@ -84,6 +123,19 @@ if TYPE_CHECKING:
         Ungroup,
         Zed,
     )
+    from txt2tex.parser_pkg.token_index import TokenIndex
+    from txt2tex.parser_pkg.token_window import TokenWindow
+
+    T = TypeVar("T")
+
+    # An expression rule's steps, run by drive_steps: they yield the steps of
+    # each nested expression and are sent its result.
+    Steps = Generator["Steps", Expr, Expr]
+    # A proof rule's steps, also run by drive_steps: they yield the steps of
+    # each nested proof node or case and are sent the parsed node.
+    ProofSteps = Generator[
+        "ProofSteps", "ProofNode | CaseAnalysis", "ProofNode | CaseAnalysis"
+    ]
 
 
 class ParserBase:
@@ -102,10 +154,11 @@ class ParserBase:
         _RESERVED_DECL_NAMES: ClassVar[frozenset[str]]
 
         # --- Token stream + position state ---
-        tokens: list[Token]
+        tokens: Sequence[Token] | TokenWindow
         pos: int
         last_token_end_column: int
         last_token_line: int
+        _lookahead: TokenIndex | None
 
         # --- Context flags ---
         _parsing_schema_text: bool
@@ -115,6 +168,9 @@ class ParserBase:
         _current_quantifier_vars: set[str]
         _in_relational_context: bool
 
+        # --- Packrat memo: (rule, pos, context) -> (result, end state) ---
+        _memo: dict[tuple[object, ...], tuple[object, int, int, int]]
+
         # --- Token-cursor helpers (Move 21 → lexer_state.py) ---
         def _at_end(self) -> bool: ...
         def _current(self) -> Token: ...
@@ -123,6 +179,9 @@ class ParserBase:
         def _peek_ahead(self, offset: int = 1) -> Token: ...
         def _skip_newlines(self) -> None: ...
         def _has_blank_line(self) -> bool: ...
+        def _token_index(self) -> TokenIndex | None: ...
+        def _release_tokens(self) -> None: ...
+        def _memoized(self, rule: str, parse: Callable[[], T]) -> T: ...
         def _is_keyword_usable_as_identifier(self) -> bool: ...
         def _is_operand_start(self) -> bool: ...
         def _is_attr_name_token(self) -> bool: ...
@@ -136,42 +195,72 @@ class ParserBase:
 
         # --- Expression parser (Move 16) ---
         def _parse_expr(self) -> Expr: ...
+        def _expr_steps(self) -> Steps: ...
         def _parse_conditional(self) -> Expr: ...
+        def _conditional_steps(self) -> Steps: ...
+        def _parse_binary(self, min_level: int) -> Expr: ...
+        def _binary_steps(self, min_level: int) -> Steps: ...
+        def _next_infix_level(self, min_level: int, ceiling: int) -> int: ...
+        def _infix_steps(self, level: int, left: Expr) -> Steps: ...
+        def _parse_line_continuation(self) -> bool: ...
         def _parse_iff(self) -> Expr: ...
         def _parse_implies(self) -> Expr: ...
         def _parse_implies_rhs(self) -> Expr: ...
+        def _implies_rhs_steps(self) -> Steps: ...
         def _parse_or(self) -> Expr: ...
         def _parse_and(self) -> Expr: ...
         def _parse_unary(self) -> Expr: ...
+        def _unary_steps(self) -> Steps: ...
         def _parse_additive(self) -> Expr: ...
         def _parse_range(self) -> Expr: ...
         def _parse_multiplicative(self) -> Expr: ...
         def _parse_comparison(self) -> Expr: ...
+        def _comparison_rhs_steps(self, left: Expr, op_token: Token) -> Steps: ...
         def _parse_relation(self) -> Expr: ...
         def _parse_set_op(self) -> Expr: ...
         def _parse_union(self) -> Expr: ...
         def _parse_intersect(self) -> Expr: ...
         def _parse_cross(self) -> Expr: ...
+        def _parse_cross_operator(self, left: Expr, op_token: Token) -> Expr: ...
         def _parse_postfix(self, *, allow_space_separated: bool = True) -> Expr: ...
+        def _postfix_steps(self, *, allow_space_separated: bool = True) -> Steps: ...
+        def _postfix_tail_steps(
+            self, base: Expr, *, allow_space_separated: bool = True
+        ) -> Steps: ...
         def _parse_atom(self) -> Expr: ...
-        def _parse_argument_list(self) -> list[Expr]: ...
+        def _atom_steps(self) -> Steps: ...
+        def _argument_list_steps(self) -> Generator[Steps, Expr, list[Expr]]: ...
         def _parse_parenthesized_expr_or_tuple(self) -> Expr: ...
+        def _paren_steps(self) -> Steps: ...
+        def _nesting_atom_steps(self) -> Steps: ...
         def _parse_set(self) -> Expr: ...
-        def _parse_set_comprehension_from_brace(self) -> Expr: ...
-        def _parse_set_predicate(self) -> Expr: ...
-        def _parse_set_expression(self) -> Expr: ...
+        def _set_steps(self) -> Steps: ...
+        def _set_comprehension_steps(self) -> Steps: ...
+        def _set_predicate_steps(self) -> Steps: ...
+        def _set_expression_steps(self) -> Steps: ...
         def _parse_sequence_literal(self) -> Expr: ...
+        def _sequence_literal_steps(self) -> Steps: ...
         def _parse_bag_literal(self) -> Expr: ...
+        def _bag_literal_steps(self) -> Steps: ...
         def _parse_quantifier(self) -> Expr: ...
-        def _parse_quantifier_continuation(
-            self, quantifier: str, line: int, column: int
-        ) -> Expr: ...
-        def _parse_schema_quantifier_body(
+        def _quantifier_steps(self) -> Steps: ...
+        def _quantifier_continuation_steps(
+            self,
+            quantifier: str,
+            line: int,
+            column: int,
+            inherited_vars: set[str] | None = None,
+        ) -> Steps: ...
+        def _schema_quantifier_body_steps(
             self, quant_token: Token, schema_binding: SchemaBinding
-        ) -> Expr: ...
+        ) -> Generator[Steps, Expr, Quantifier]: ...
         def _parse_lambda(self) -> Expr: ...
+        def _lambda_steps(self) -> Steps: ...
         def _parse_binding(self) -> Expr: ...
-        def _parse_binding_component(self) -> tuple[str, Expr]: ...
+        def _binding_steps(self) -> Steps: ...
+        def _binding_component_steps(
+            self,
+        ) -> Generator[Steps, Expr, tuple[str, Expr]]: ...
         def _should_parse_space_separated_arg(self) -> bool: ...
         def _try_parse_guarded_cases(self, first_expr: Expr) -> Expr: ...
 
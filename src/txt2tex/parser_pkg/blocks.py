@@ -0,0 +1,104 @@
+"""Split a document's token stream into independently parseable blocks.
+
+A section runs from its ``=== Title ===`` line to the next section, and a
+solution from its ``** Solution N **`` line to the next solution or
+section.  Every item rule stops at those heads, so a line-initial head
+always starts a new item, and the tokens between two heads parse to the
+same items whether or not the rest of the document is there.
+:meth:`Parser.parse_parallel <txt2tex.parser.Parser.parse_parallel>`
+parses the blocks in a process pool and reattaches each solution to the
+section it falls in.
+
+Solutions before the first section are top-level items; later ones are
+items of their section.  Tokens before the first block (title metadata
+and any leading items) are not part of any block.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from txt2tex.tokens import TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from txt2tex.tokens import Token
+
+BlockKind = Literal["section", "solution"]
+
+
+@dataclass(frozen=True)
+class Block:
+    """Token range ``[start, end)`` of one section or solution.
+
+    ``section`` is the index (in the block list) of the section block a
+    solution belongs to, or None for a top-level block.
+    """
+
+    kind: BlockKind
+    start: int
+    end: int
+    section: int | None = None
+
+
+def _is_line_start(tokens: Sequence[Token], pos: int) -> bool:
+    return pos == 0 or tokens[pos - 1].type == TokenType.NEWLINE
+
+
+def _closes_on_line(tokens: Sequence[Token], pos: int, marker: TokenType) -> bool:
+    """True if another ``marker`` follows ``pos`` before the line ends."""
+    pos += 1
+    while pos < len(tokens):
+        token_type = tokens[pos].type
+        if token_type == marker:
+            return True
+        if token_type in (TokenType.NEWLINE, TokenType.EOF):
+            return False
+        pos += 1
+    return False
+
+
+def _head_kind(tokens: Sequence[Token], pos: int) -> BlockKind | None:
+    """Kind of block a line-initial head at ``pos`` starts, if any."""
+    token_type = tokens[pos].type
+    if token_type == TokenType.SECTION_MARKER:
+        # The lexer splits "=== Title ===" into marker, TEXT, marker.
+        if (
+            pos + 2 < len(tokens)
+            and tokens[pos + 1].type == TokenType.TEXT
+            and tokens[pos + 2].type == TokenType.SECTION_MARKER
+        ):
+            return "section"
+    elif token_type == TokenType.SOLUTION_MARKER and _closes_on_line(
+        tokens, pos, TokenType.SOLUTION_MARKER
+    ):
+        return "solution"
+    return None
+
+
+def split_blocks(tokens: Sequence[Token]) -> list[Block]:
+    """Return the section and solution blocks of ``tokens``, in order.
+
+    ``tokens`` must end with EOF, which belongs to no block.
+    """
+    starts: list[tuple[BlockKind, int]] = []
+    for pos in range(len(tokens) - 1):
+        if not _is_line_start(tokens, pos):
+            continue
+        kind = _head_kind(tokens, pos)
+        if kind is not None:
+            starts.append((kind, pos))
+
+    blocks: list[Block] = []
+    section: int | None = None
+    eof = len(tokens) - 1
+    for i, (kind, start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else eof
+        if kind == "section":
+            section = len(blocks)
+            blocks.append(Block(kind, start, end))
+        else:
+            blocks.append(Block(kind, start, end, section))
+    return blocks
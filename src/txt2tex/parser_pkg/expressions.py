@@ -1,21 +1,36 @@
-"""Parser rules for general expression grammar (recursive descent).
-
-Covers the full Pratt-style expression grammar from ``_parse_expr``
-down to ``_parse_atom``: conditionals, iff/implies, or/and, unary,
-arithmetic, range, comparison, relation/set ops, union, cross,
-intersect, postfix, plus quantifier/lambda/binding/set-comprehension
-parsers and atom literals (sequence, bag).
+"""Parser rules for general expression grammar.
+
+Covers the full expression grammar from ``_parse_expr`` down to
+``_parse_atom``: conditionals, iff/implies, or/and, unary, arithmetic,
+range, comparison, relation/set ops, union, cross, intersect, postfix,
+plus quantifier/lambda/binding/set-comprehension parsers and atom
+literals (sequence, bag).
+
+The binary-operator levels are parsed by one precedence-climbing loop,
+``_parse_binary``, driven by the table in
+:mod:`~txt2tex.parser_pkg.precedence`; ``_parse_iff`` ... ``_parse_multiplicative``
+enter it at their level, so an operand costs a few calls rather than one
+per level.  Operator-specific right-hand sides (comparison, cross-level
+relational operators) keep their own methods.
+
+Rules through which expressions nest (``_parse_expr``, the binary loop,
+its operands and their postfix operators and argument lists, quantifiers,
+lambdas, conditionals, parentheses, set comprehensions and set, sequence,
+bag and binding literals) are written as *steps*: generators that yield
+the steps of each nested expression they need instead of calling its
+rule, and are sent the parsed expression back.
+:func:`~txt2tex.parser_pkg._base.drive_steps` runs them from an
+explicit stack, so nesting depth is bounded by memory rather than the
+recursion limit.  Each ``_parse_*`` entry point for such a rule drives
+its steps.
 
 This mixin is composed into :class:`Parser` via multiple inheritance.
-Method bodies are byte-identical to their counterparts in the
-pre-refactor monolithic ``parser.py``; only their file location has
-changed.
 """
 
 from __future__ import annotations
 
 import dataclasses
-from typing import ClassVar, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from txt2tex.ast_nodes import (
     Aggregator,
@@ -26,6 +41,7 @@ from txt2tex.ast_nodes import (
     Divide,
     Expr,
     FunctionApp,
+    FunctionType,
     GenericInstantiation,
     Group,
     GroupAggregate,
@@ -52,27 +68,70 @@ from txt2tex.ast_nodes import (
     Ungroup,
 )
 from txt2tex.constants import PROSE_WORDS
-from txt2tex.parser_pkg._base import ParserBase, ParserError
+from txt2tex.parser_pkg._base import ParserBase, ParserError, drive_steps
+from txt2tex.parser_pkg.precedence import (
+    ADDITIVE,
+    AND,
+    BREAKABLE_LEVELS,
+    CHAINING_LEVELS,
+    COMPARISON,
+    CROSS,
+    FUNCTION_TYPE,
+    IFF,
+    IMPLIES,
+    INFIX_LEVELS,
+    INTERSECT,
+    MULTIPLICATIVE,
+    OR,
+    RANGE,
+    RELATION,
+    SET_OP,
+    UNARY,
+    UNION,
+)
 from txt2tex.tokens import Token, TokenType
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from txt2tex.parser_pkg._base import Steps
+
+_COMPARISON_OPERATORS = frozenset(
+    token_type for token_type, levels in INFIX_LEVELS.items() if levels == (COMPARISON,)
+)
+_QUANTIFIERS = (TokenType.FORALL, TokenType.EXISTS, TokenType.EXISTS1, TokenType.MU)
+# Atoms that contain a whole nested expression
+_NESTING_ATOMS = (
+    TokenType.LPAREN,
+    TokenType.LAMBDA,
+    TokenType.IF,
+    *_QUANTIFIERS,
+    TokenType.LBRACE,
+    TokenType.LANGLE,
+    TokenType.LBRACKET,
+    TokenType.LBIND,
+)
+
 
 class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
     """Mixin: full expression-grammar parser."""
 
     def _parse_expr(self) -> Expr:
         """Parse expression (entry point)."""
+        return drive_steps(self._expr_steps())
+
+    def _expr_steps(self) -> Steps:
+        """Steps of ``_parse_expr``: the rule the current token starts."""
         # Check for quantifier first (forall, exists, exists1, mu)
-        if self._match(
-            TokenType.FORALL, TokenType.EXISTS, TokenType.EXISTS1, TokenType.MU
-        ):
-            return self._parse_quantifier()
+        if self._match(*_QUANTIFIERS):
+            return self._quantifier_steps()
         # Check for lambda expression
         if self._match(TokenType.LAMBDA):
-            return self._parse_lambda()
+            return self._lambda_steps()
         # Check for conditional expression (if/then/else)
         if self._match(TokenType.IF):
-            return self._parse_conditional()
-        return self._parse_iff()
+            return self._conditional_steps()
+        return self._binary_steps(IFF)
 
     def _parse_conditional(self) -> Expr:
         """Parse conditional expression: if condition then expr1 else expr2.
@@ -90,10 +149,14 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         The condition is parsed with _parse_iff() (no quantifiers/lambdas/conditionals),
         but the then/else branches use _parse_expr() to allow nested conditionals.
         """
+        return drive_steps(self._conditional_steps())
+
+    def _conditional_steps(self) -> Steps:
+        """Steps of ``_parse_conditional``."""
         if_token = self._advance()  # Consume 'if'
 
         # Parse condition (up to 'then') - no quantifiers/lambdas/conditionals
-        condition = self._parse_iff()
+        condition = yield self._binary_steps(IFF)
 
         # Check for explicit line break after condition (before 'then')
         line_break_after_condition = False
@@ -113,7 +176,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         self._skip_newlines()
 
         # Parse then branch - allow nested conditionals
-        then_expr = self._parse_expr()
+        then_expr = yield self._expr_steps()
 
         # Check for explicit line break after then expression (before 'else')
         line_break_after_then = False
@@ -133,7 +196,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         self._skip_newlines()
 
         # Parse else branch - allow nested conditionals
-        else_expr = self._parse_expr()
+        else_expr = yield self._expr_steps()
 
         return Conditional(
             condition=condition,
@@ -145,42 +208,198 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             column=if_token.column,
         )
 
-    def _parse_iff(self) -> Expr:
-        """Parse iff operation (<=>), lowest precedence.
+    def _parse_binary(self, min_level: int) -> Expr:
+        """Parse an operand and every infix operator binding at ``min_level`` or
+        tighter (precedence climbing over :mod:`~txt2tex.parser_pkg.precedence`).
 
-        Supports multi-line expressions with natural line breaks.
+        Equivalent to descending one rule per level from ``min_level``: after
+        an operator at level L only operators at L (for chaining levels) or
+        looser may follow, which is where the per-level loops left off.
+
+        Right-associative operators (``=>``, function arrows) do not recurse
+        for their right operand: the operator waits on ``pending`` while the
+        loop parses the operand at the operator's own level, and is folded in
+        when the operand ends, so a chain of any length takes one frame.
         """
-        left = self._parse_implies()
+        return drive_steps(self._binary_steps(min_level))
 
-        while self._match(TokenType.IFF):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                # Skip newline and any leading whitespace on next line
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            elif self._match(TokenType.NEWLINE):
-                # Natural line break without \ marker (WYSIWYG)
-                has_continuation = True
-                self._skip_newlines()
+    def _binary_steps(self, min_level: int) -> Steps:
+        """Steps of ``_parse_binary``."""
+        # Right-associative operators awaiting their right operand:
+        # (level, left operand, operator, line break after, enclosing min_level)
+        pending: list[tuple[int, Expr, Token, bool, int]] = []
+        # None until the operand that starts the current level is parsed
+        left: Expr | None = None
+        ceiling = MULTIPLICATIVE
+
+        while True:
+            if left is None:
+                # ``ceiling`` is the tightest level an operator after the
+                # operand may have: a prefix operator already took every
+                # tighter one.
+                if min_level <= UNARY and self._match(
+                    TokenType.NOT, TokenType.HASH, TokenType.MINUS
+                ):
+                    left = yield self._unary_steps()
+                    ceiling = UNARY
+                else:
+                    if self._match(*_NESTING_ATOMS):
+                        left = yield self._nesting_atom_steps()
+                    else:
+                        left = self._parse_atom()
+                    left = yield from self._postfix_tail_steps(left)
+                    ceiling = MULTIPLICATIVE
+            level = self._next_infix_level(min_level, ceiling)
+            if not level:
+                if not pending:
+                    return left
+                level, op_left, op_token, has_continuation, min_level = pending.pop()
+                if level == IMPLIES:
+                    left = BinaryOp(
+                        operator=op_token.value,
+                        left=op_left,
+                        right=left,
+                        line_break_after=has_continuation,
+                        line=op_token.line,
+                        column=op_token.column,
+                    )
+                else:
+                    # Right-associative: A -> B -> C parses as A -> (B -> C)
+                    left = FunctionType(
+                        arrow=op_token.value,
+                        domain=op_left,
+                        range=left,
+                        line=op_token.line,
+                        column=op_token.column,
+                    )
+            elif level in (IMPLIES, FUNCTION_TYPE):
+                op_token = self._advance()
+                has_continuation = level == IMPLIES and self._parse_line_continuation()
+                if level == IMPLIES and self._match(
+                    *_QUANTIFIERS, TokenType.LAMBDA, TokenType.IF
+                ):
+                    # Allow quantifiers/lambdas/conditionals but NOT iff (<=>)
+                    # This ensures => binds tighter than <=>
+                    right = yield self._implies_rhs_steps()
+                    left = BinaryOp(
+                        operator=op_token.value,
+                        left=left,
+                        right=right,
+                        line_break_after=has_continuation,
+                        line=op_token.line,
+                        column=op_token.column,
+                    )
+                else:
+                    pending.append((level, left, op_token, has_continuation, min_level))
+                    min_level = level
+                    left = None
+                    continue
             else:
-                # No line break, but still skip newlines for flexibility
-                self._skip_newlines()
-            right = self._parse_implies()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
+                left = yield from self._infix_steps(level, left)
+            ceiling = level if level in CHAINING_LEVELS else level - 1
+
+    def _next_infix_level(self, min_level: int, ceiling: int) -> int:
+        """Return the level of the infix operator at the cursor, or 0.
+
+        0 means the current token is not an operator at a level between
+        ``min_level`` and ``ceiling``.  Newlines before a comparison operator
+        are consumed when that level is in range.
+        """
+        token = self._current()
+        levels = INFIX_LEVELS.get(token.type)
+        if levels is None:
+            # A comparison may follow on the next line: "a\n= b"
+            if not (
+                token.type == TokenType.NEWLINE and min_level <= COMPARISON <= ceiling
+            ):
+                return 0
+            saved_pos = self.pos
+            self._skip_newlines()
+            if self._current().type not in _COMPARISON_OPERATORS:
+                # No comparison operator, restore position to not
+                # consume newlines
+                self.pos = saved_pos
+                return 0
+            return COMPARISON
+        for level in levels:
+            if min_level <= level <= ceiling:
+                break
+        else:
+            return 0
+        # Lookahead for + and *: only infix if followed by operand,
+        # otherwise postfix closure (R+, R*) left for the caller
+        if (
+            token.type == TokenType.PLUS or token.type == TokenType.STAR
+        ) and not self._is_operand_start():
+            return 0
+        return level
+
+    def _infix_steps(self, level: int, left: Expr) -> Steps:
+        """Parse the current left-associative or single infix operator at
+        ``level`` and its right operand."""
+        op_token = self._advance()
+        if level == CROSS:
+            return self._parse_cross_operator(left, op_token)
+        if level == COMPARISON:
+            return (yield from self._comparison_rhs_steps(left, op_token))
+        if level == RANGE:
+            end = yield self._binary_steps(ADDITIVE)
+            return Range(
+                start=left,
+                end=end,
                 line=op_token.line,
                 column=op_token.column,
             )
 
-        return left
+        has_continuation = (
+            self._parse_line_continuation() if level in BREAKABLE_LEVELS else False
+        )
+        right: Expr
+        if level == AND and self._match(*_QUANTIFIERS):
+            # Quantifiers can appear after 'and' (e.g., p and forall x : T | q)
+            right = yield self._quantifier_steps()
+        elif level == MULTIPLICATIVE:
+            if self._match(*_NESTING_ATOMS):
+                right = yield self._nesting_atom_steps()
+            else:
+                right = self._parse_atom()
+            right = yield from self._postfix_tail_steps(right)
+        else:
+            right = yield self._binary_steps(level + 1)
+        return BinaryOp(
+            operator=op_token.value,
+            left=left,
+            right=right,
+            line_break_after=has_continuation,
+            line=op_token.line,
+            column=op_token.column,
+        )
+
+    def _parse_line_continuation(self) -> bool:
+        """Consume a line break after an infix operator.
+
+        Returns True for a ``\\`` continuation marker or a natural newline
+        (WYSIWYG); newlines are skipped either way.
+        """
+        if self._match(TokenType.CONTINUATION):
+            self._advance()  # consume \
+            # Skip newline and any leading whitespace on next line
+            if self._match(TokenType.NEWLINE):
+                self._advance()
+            self._skip_newlines()
+            return True
+        if self._match(TokenType.NEWLINE):
+            # Natural line break without \ marker (WYSIWYG)
+            self._skip_newlines()
+            return True
+        return False
+
+    def _parse_iff(self) -> Expr:
+        """Parse iff operation (<=>), lowest precedence.
+
+        Supports multi-line expressions with natural line breaks.
+        """
+        return self._parse_binary(IFF)
 
     def _parse_implies(self) -> Expr:
         """Parse implies operation (=>).
@@ -193,39 +412,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         Supports multi-line expressions with natural line breaks.
         """
-        left = self._parse_or()
-
-        while self._match(TokenType.IMPLIES):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                # Skip newline and any leading whitespace on next line
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            elif self._match(TokenType.NEWLINE):
-                # Natural line break without \ marker (WYSIWYG)
-                has_continuation = True
-                self._skip_newlines()
-            else:
-                # No line break, but still skip newlines for flexibility
-                self._skip_newlines()
-            # Parse RHS: allow quantifiers/lambdas/conditionals but NOT iff (<=>)
-            # This ensures => binds tighter than <=>
-            right = self._parse_implies_rhs()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(IMPLIES)
 
     def _parse_implies_rhs(self) -> Expr:
         """Parse right-hand side of implies: allows quantifiers but not iff.
@@ -233,56 +420,28 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         This ensures proper precedence: a => b <=> c parses as (a => b) <=> c
         while still allowing: a => forall x : T | P
         """
+        return drive_steps(self._implies_rhs_steps())
+
+    def _implies_rhs_steps(self) -> Steps:
+        """Steps of ``_parse_implies_rhs``."""
         # Check for quantifier first (forall, exists, exists1, mu)
-        if self._match(
-            TokenType.FORALL, TokenType.EXISTS, TokenType.EXISTS1, TokenType.MU
-        ):
-            return self._parse_quantifier()
+        if self._match(*_QUANTIFIERS):
+            return self._quantifier_steps()
         # Check for lambda expression
         if self._match(TokenType.LAMBDA):
-            return self._parse_lambda()
+            return self._lambda_steps()
         # Check for conditional expression (if/then/else)
         if self._match(TokenType.IF):
-            return self._parse_conditional()
+            return self._conditional_steps()
         # Parse implies level (right-associative) - NOT iff level
-        return self._parse_implies()
+        return self._binary_steps(IMPLIES)
 
     def _parse_or(self) -> Expr:
         """Parse or operation.
 
         Supports multi-line expressions with natural line breaks.
         """
-        left = self._parse_and()
-
-        while self._match(TokenType.OR):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                # Skip newline and any leading whitespace on next line
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            elif self._match(TokenType.NEWLINE):
-                # Natural line break without \ marker (WYSIWYG)
-                has_continuation = True
-                self._skip_newlines()
-            else:
-                # No line break, but still skip newlines for flexibility
-                self._skip_newlines()
-            right = self._parse_and()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(OR)
 
     def _parse_and(self) -> Expr:
         """Parse and operation.
@@ -290,83 +449,31 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Allows quantifiers after 'and' (e.g., p and forall x : T | q).
         Supports multi-line expressions with natural line breaks.
         """
-        left = self._parse_comparison()
-
-        while self._match(TokenType.AND):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                # Skip newline and any leading whitespace on next line
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            elif self._match(TokenType.NEWLINE):
-                # Natural line break without \ marker (WYSIWYG)
-                has_continuation = True
-                self._skip_newlines()
-            else:
-                # No line break, but still skip newlines for flexibility
-                self._skip_newlines()
-            # Quantifiers can appear after 'and' (e.g., p and forall x : T | q)
-            # Check if next token is a quantifier keyword
-            if self._match(
-                TokenType.FORALL, TokenType.EXISTS, TokenType.EXISTS1, TokenType.MU
-            ):
-                right = self._parse_quantifier()
-            else:
-                right = self._parse_comparison()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(AND)
 
     def _parse_unary(self) -> Expr:
         """Parse unary operation (not, #, -).
 
         Handles logical not, cardinality (#), and arithmetic negation (-).
         """
-        if self._match(TokenType.NOT):
-            op_token = self._advance()
-            operand = self._parse_unary()
-            return UnaryOp(
-                operator=op_token.value,
-                operand=operand,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        # Cardinality operator (#)
-        if self._match(TokenType.HASH):
-            op_token = self._advance()
-            operand = self._parse_unary()
-            return UnaryOp(
-                operator=op_token.value,
-                operand=operand,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        # Unary negation (-)
-        if self._match(TokenType.MINUS):
-            op_token = self._advance()
-            operand = self._parse_unary()
-            return UnaryOp(
+        return drive_steps(self._unary_steps())
+
+    def _unary_steps(self) -> Steps:
+        """Steps of ``_parse_unary``."""
+        # A run of prefix operators is collected first and applied innermost
+        # out, so "lnot lnot ... p" does not recurse per operator.
+        prefixes: list[Token] = []
+        while self._match(TokenType.NOT, TokenType.HASH, TokenType.MINUS):
+            prefixes.append(self._advance())
+        operand = yield self._binary_steps(RANGE)
+        for op_token in reversed(prefixes):
+            operand = UnaryOp(
                 operator=op_token.value,
                 operand=operand,
                 line=op_token.line,
                 column=op_token.column,
             )
-
-        return self._parse_range()
+        return operand
 
     def _parse_additive(self) -> Expr:
         """Parse additive operators (+ and - and ⌢).
@@ -375,31 +482,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Sequence operator: ⌢ (concatenation)
         Note: + can also be postfix (transitive closure R+), handled by lookahead
         """
-        left = self._parse_multiplicative()
-
-        while self._match(
-            TokenType.PLUS,
-            TokenType.MINUS,
-            TokenType.CAT,
-            TokenType.FILTER,
-            TokenType.BAG_UNION,
-            TokenType.BAG_DIFF,
-        ):
-            # Lookahead for +: only treat as infix if followed by operand
-            # CAT, FILTER, BAG_UNION, BAG_DIFF, and MINUS are always infix
-            if self._match(TokenType.PLUS) and not self._is_operand_start():
-                break
-            op_token = self._advance()
-            right = self._parse_multiplicative()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(ADDITIVE)
 
     def _parse_range(self) -> Expr:
         """Parse range operator (m..n).
@@ -408,19 +491,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Range has lower precedence than addition, so 1+2..3+4 means (1+2)..(3+4)
         Examples: 1..10, 1993..current, x.2..x.3
         """
-        left = self._parse_additive()
-
-        if self._match(TokenType.RANGE):
-            op_token = self._advance()
-            right = self._parse_additive()
-            return Range(
-                start=left,
-                end=right,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(RANGE)
 
     def _parse_multiplicative(self) -> Expr:
         """Parse multiplicative operators (*, /, mod).
@@ -429,23 +500,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Note: * can also be postfix (reflexive-transitive closure R*),
         handled by lookahead
         """
-        left = self._parse_postfix()
-
-        while self._match(TokenType.STAR, TokenType.MOD):
-            # Lookahead for *: only treat as infix if followed by operand
-            if self._match(TokenType.STAR) and not self._is_operand_start():
-                break
-            op_token = self._advance()
-            right = self._parse_postfix()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(MULTIPLICATIVE)
 
     def _is_operand_start(self) -> bool:
         """Check if next token could start an operand expression.
@@ -636,6 +691,10 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             exists S | P
             exists S' | P
         """
+        return drive_steps(self._quantifier_steps())
+
+    def _quantifier_steps(self) -> Steps:
+        """Steps of ``_parse_quantifier``."""
         quant_token = self._advance()  # Consume 'forall', 'exists', 'exists1', or 'mu'
 
         # --- Schema-text quantification (Z RM §3.10) ---
@@ -658,7 +717,11 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 line=schema_token.line,
                 column=schema_token.column,
             )
-            return self._parse_schema_quantifier_body(quant_token, schema_binding)
+            return (
+                yield from self._schema_quantifier_body_steps(
+                    quant_token, schema_binding
+                )
+            )
 
         # Check for bare IDENTIFIER followed by | (schema-as-declaration or primed).
         #
@@ -693,7 +756,11 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                     line=ident_token.line,
                     column=ident_token.column,
                 )
-                return self._parse_schema_quantifier_body(quant_token, schema_binding)
+                return (
+                    yield from self._schema_quantifier_body_steps(
+                        quant_token, schema_binding
+                    )
+                )
             # Fall through to value-binding path (: follows, or lowercase name)
 
         # Parse variable pattern: simple identifiers or tuple pattern like (x, y)
@@ -753,7 +820,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             # Set flag to prevent .identifier from being parsed as projection
             self._parsing_schema_text = True
             try:
-                domain = self._parse_function_type()
+                domain = yield self._binary_steps(FUNCTION_TYPE)
             finally:
                 self._parsing_schema_text = False
 
@@ -770,7 +837,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
             # Parse the rest as if it were a new quantifier of the same type
             # This will handle: y : U | body or y : U; z : V | body
-            nested_quant = self._parse_quantifier_continuation(
+            nested_quant = yield self._quantifier_continuation_steps(
                 quant_token.value,
                 nested_line,
                 nested_column,
@@ -820,7 +887,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         self._in_comprehension_body = True
         try:
             # Parse body (may be followed by constraint pipe)
-            body = self._parse_expr()
+            body = yield self._expr_steps()
 
             # Check for second pipe (constrained quantifier)
             # forall x : T | constraint | body → constraint => body
@@ -838,7 +905,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                     self._skip_newlines()
 
                 constraint = body
-                actual_body = self._parse_expr()
+                actual_body = yield self._expr_steps()
                 # Combine constraint and body with IMPLIES (filter semantics)
                 body = BinaryOp(
                     operator="implies",
@@ -871,7 +938,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
                 # Expression after bullet is not part of comprehension body
                 self._in_comprehension_body = False
-                expression = self._parse_iff()  # Parse the expression part
+                expression = yield self._binary_steps(IFF)  # Parse the expression part
         finally:
             self._in_comprehension_body = False
             self._current_quantifier_vars = prev_quantifier_vars
@@ -889,11 +956,11 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             column=quant_token.column,
         )
 
-    def _parse_schema_quantifier_body(
+    def _schema_quantifier_body_steps(
         self,
         quant_token: Token,
         schema_binding: SchemaBinding,
-    ) -> Quantifier:
+    ) -> Generator[Steps, Expr, Quantifier]:
         """Parse the ``| body`` tail of a schema-text quantifier (Z RM §3.10).
 
         Called after the schema binding (Delta S / Xi S / S / S') has been
@@ -926,7 +993,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         self._in_comprehension_body = True
         try:
-            body = self._parse_expr()
+            body = yield self._expr_steps()
         finally:
             self._in_comprehension_body = False
 
@@ -944,13 +1011,13 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             column=quant_token.column,
         )
 
-    def _parse_quantifier_continuation(
+    def _quantifier_continuation_steps(
         self,
         quantifier: str,
         line: int,
         column: int,
         inherited_vars: set[str] | None = None,
-    ) -> Expr:
+    ) -> Steps:
         """Parse continuation of semicolon-separated quantifier bindings.
 
         Helper for parsing y : U | body or y : U; z : V | body
@@ -997,14 +1064,14 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             # compound domain types like X -> Y stop at PIPE/PERIOD correctly.
             self._parsing_schema_text = True
             try:
-                domain = self._parse_function_type()
+                domain = yield self._binary_steps(FUNCTION_TYPE)
             finally:
                 self._parsing_schema_text = False
 
         # Check for another semicolon (more bindings)
         if self._match(TokenType.SEMICOLON):
             self._advance()  # Consume ';'
-            nested_quant = self._parse_quantifier_continuation(
+            nested_quant = yield self._quantifier_continuation_steps(
                 quantifier,
                 self._current().line,
                 self._current().column,
@@ -1051,7 +1118,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         self._in_comprehension_body = True
         try:
             # Parse body (constraint part if bullet separator follows)
-            body = self._parse_iff()
+            body = yield self._binary_steps(IFF)
 
             # Check for bullet separator (Q x : T | pred . expr)
             expression: Expr | None = None
@@ -1075,7 +1142,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
                 # Expression after bullet is not part of comprehension body
                 self._in_comprehension_body = False
-                expression = self._parse_iff()
+                expression = yield self._binary_steps(IFF)
         finally:
             self._in_comprehension_body = False
             self._current_quantifier_vars = prev_quantifier_vars
@@ -1101,6 +1168,10 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         - lambda x, y : N . x and y
         - lambda f : X -> Y . lambda x : X . f(x)
         """
+        return drive_steps(self._lambda_steps())
+
+    def _lambda_steps(self) -> Steps:
+        """Steps of ``_parse_lambda``."""
         lambda_token = self._advance()  # Consume 'lambda'
 
         # Parse first variable
@@ -1124,16 +1195,16 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         # Set flag to prevent .identifier from being parsed as projection
         self._parsing_schema_text = True
         try:
-            domain = self._parse_comparison()
+            domain = yield self._binary_steps(COMPARISON)
         finally:
             self._parsing_schema_text = False
 
         # Multi-decl form: lambda s : Ship; c : Class | P . E
-        # Delegate to _parse_quantifier_continuation (same path as forall/exists/mu),
+        # Delegate to _quantifier_continuation_steps (same path as forall/exists/mu),
         # which handles PIPE + optional bullet, producing nested Quantifier nodes.
         if self._match(TokenType.SEMICOLON):
             self._advance()  # Consume ';'
-            nested_quant = self._parse_quantifier_continuation(
+            nested_quant = yield self._quantifier_continuation_steps(
                 "lambda",
                 self._current().line,
                 self._current().column,
@@ -1159,12 +1230,12 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             self._current_quantifier_vars = set(variables)
             self._in_comprehension_body = True
             try:
-                body = self._parse_iff()
+                body = yield self._binary_steps(IFF)
                 expression: Expr | None = None
                 if self._match(TokenType.PERIOD):
                     self._advance()  # Consume '.'
                     self._in_comprehension_body = False
-                    expression = self._parse_iff()
+                    expression = yield self._binary_steps(IFF)
             finally:
                 self._in_comprehension_body = False
                 self._current_quantifier_vars = prev_quantifier_vars
@@ -1189,7 +1260,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         # quantifiers and lambdas in the body
         # Lambda binds tighter than quantifiers, so "lambda x : X . forall y : Y | P"
         # means the body is the entire quantifier expression
-        body = self._parse_expr()
+        body = yield self._expr_steps()
 
         return Lambda(
             variables=variables,
@@ -1199,7 +1270,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             column=lambda_token.column,
         )
 
-    def _parse_binding(self) -> Binding:
+    def _parse_binding(self) -> Expr:
         r"""Parse a Z binding literal: {| name == expr, ... |} (Z RM §3.7).
 
         Consumes LBIND, then a comma-separated list of ``IDENTIFIER == expr``
@@ -1214,6 +1285,10 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             ParserError: Missing ``==``, missing label, missing value, missing
                 closing ``|}``, or semicolon used between components.
         """
+        return drive_steps(self._binding_steps())
+
+    def _binding_steps(self) -> Steps:
+        """Steps of ``_parse_binding``."""
         start_token = self._current()
         self._advance()  # consume {|
 
@@ -1225,14 +1300,14 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             return Binding(pairs=[], line=start_token.line, column=start_token.column)
 
         # Parse first component
-        pairs.append(self._parse_binding_component())
+        pairs.append((yield from self._binding_component_steps()))
 
         # Parse remaining components
         while self._match(TokenType.COMMA):
             self._advance()  # consume ,
             # Skip any newlines between components
             self._skip_newlines()
-            pairs.append(self._parse_binding_component())
+            pairs.append((yield from self._binding_component_steps()))
 
         # Closing |}
         if not self._match(TokenType.RBIND):
@@ -1256,7 +1331,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         return Binding(pairs=pairs, line=start_token.line, column=start_token.column)
 
-    def _parse_binding_component(self) -> tuple[str, Expr]:
+    def _binding_component_steps(self) -> Generator[Steps, Expr, tuple[str, Expr]]:
         """Parse a single binding component: IDENTIFIER == expr.
 
         Raises:
@@ -1302,7 +1377,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 f" {label_token.value!r}",
                 cur,
             )
-        value = self._parse_expr()
+        value = yield self._expr_steps()
 
         return (label_token.value, value)
 
@@ -1316,6 +1391,10 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Strategy: Look ahead for : or | to determine type.
         Multi-variable comprehensions like {x, y : N | ...} need special handling.
         """
+        return drive_steps(self._set_steps())
+
+    def _set_steps(self) -> Steps:
+        """Steps of ``_parse_set``."""
         start_token = self._current()  # Save position before '{'
         self._advance()  # Consume '{'
 
@@ -1329,18 +1408,18 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         # Look ahead to distinguish literal from comprehension
         # Strategy: Parse potential identifiers, check for : to determine type
         saved_pos = self.pos
-        first_elem = self._parse_expr()
+        first_elem = yield self._expr_steps()
 
         # Case 1: Immediate colon -> single-variable comprehension
         if self._match(TokenType.COLON):
             self.pos = saved_pos
-            return self._parse_set_comprehension_from_brace()
+            return (yield from self._set_comprehension_steps())
 
         # Case 2: Immediate pipe + identifier -> comprehension without domain
         if self._match(TokenType.PIPE):
             if isinstance(first_elem, Identifier):
                 self.pos = saved_pos
-                return self._parse_set_comprehension_from_brace()
+                return (yield from self._set_comprehension_steps())
             raise ParserError(
                 "Unexpected '|' in set literal",
                 self._current(),
@@ -1356,7 +1435,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 if self._match(TokenType.RBRACE):
                     # Trailing comma: {1, 2,}
                     break
-                items.append(self._parse_expr())
+                items.append((yield self._expr_steps()))
 
             # Check what follows the comma-separated items
             if self._match(TokenType.COLON):
@@ -1369,7 +1448,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                     )
                 # Backtrack and parse as comprehension
                 self.pos = saved_pos
-                return self._parse_set_comprehension_from_brace()
+                return (yield from self._set_comprehension_steps())
 
             # It's a literal: {1, 2, 3} or {a, b, c}
             if not self._match(TokenType.RBRACE):
@@ -1393,11 +1472,12 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             "Expected ',', ':', '|', or '}' in set expression", self._current()
         )
 
-    def _parse_set_comprehension_from_brace(self) -> Expr:
+    def _set_comprehension_steps(self) -> Steps:
         """Parse set comprehension after '{' already consumed.
 
-        Helper for _parse_set().
+        Helper for _set_steps().
         """
+        start_token = self.tokens[self.pos - 1]  # The '{'
         # Parse first variable
         if not self._match(TokenType.IDENTIFIER):
             raise ParserError(
@@ -1423,7 +1503,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             # Set flag to prevent .identifier from being parsed as projection
             self._parsing_schema_text = True
             try:
-                domain = self._parse_function_type()
+                domain = yield self._binary_steps(FUNCTION_TYPE)
             finally:
                 self._parsing_schema_text = False
 
@@ -1453,7 +1533,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 self._advance()  # Consume ':'
                 self._parsing_schema_text = True
                 try:
-                    extra_domain = self._parse_function_type()
+                    extra_domain = yield self._binary_steps(FUNCTION_TYPE)
                 finally:
                     self._parsing_schema_text = False
             if extra_domain is None:
@@ -1485,7 +1565,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 bullet_continuation = True
                 self._skip_newlines()
             predicate = None
-            expression = self._parse_set_expression()
+            expression = yield self._set_expression_steps()
         elif self._match(TokenType.PIPE):
             # Pipe separator: parse predicate, optionally followed by . expr
             self._advance()  # Consume '|'
@@ -1511,7 +1591,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             self._current_quantifier_vars = all_comp_vars
             self._in_comprehension_body = True
             try:
-                predicate = self._parse_set_predicate()
+                predicate = yield self._set_predicate_steps()
 
                 # Parse optional expression part (. expression)
                 expression = None
@@ -1528,7 +1608,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                     elif self._match(TokenType.NEWLINE):
                         bullet_continuation = True
                         self._skip_newlines()
-                    expression = self._parse_set_expression()
+                    expression = yield self._set_expression_steps()
             finally:
                 self._in_comprehension_body = False
                 self._current_quantifier_vars = prev_quantifier_vars
@@ -1551,8 +1631,6 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             )
         self._advance()  # Consume '}'
 
-        # Use saved start position from _parse_set
-        start_token = self.tokens[self.pos - len(variables) - 5]  # Approximate
         return SetComprehension(
             variables=variables,
             domain=domain,
@@ -1565,15 +1643,15 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             column=start_token.column,
         )
 
-    def _parse_set_predicate(self) -> Expr:
+    def _set_predicate_steps(self) -> Steps:
         """Parse predicate in set comprehension (up to . or })."""
         # Parse expression, but stop at PERIOD or RBRACE
         # This is tricky because we need to parse a full expression
         # but stop before . or }
         # For now, use the standard expression parser but be aware of context
-        return self._parse_iff()
+        return self._binary_steps(IFF)
 
-    def _parse_set_expression(self) -> Expr:
+    def _set_expression_steps(self) -> Steps:
         """Parse expression in set comprehension (after . and up to }).
 
         Newlines between the bullet separator and the expression are skipped
@@ -1584,7 +1662,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         """
         # Skip newlines before expression (multi-line comprehension support)
         self._skip_newlines()
-        return self._parse_iff()
+        return self._binary_steps(IFF)
 
     def _parse_comparison(self) -> Expr:
         """Parse comparison operators (<, >, <=, >=, =, !=).
@@ -1593,63 +1671,43 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Supports guarded cases after = operator (pattern matching).
         Supports line continuation with \\ after = operator.
         """
-        left = self._parse_function_type()
+        return self._parse_binary(COMPARISON)
 
-        # Peek ahead to see if there's a comparison operator
-        # We need to skip newlines to check, but restore position if no operator
-        saved_pos = self.pos
-        self._skip_newlines()
+    def _comparison_rhs_steps(self, left: Expr, op_token: Token) -> Steps:
+        """Parse the right operand of a consumed comparison operator."""
+        # Detect line continuation (backslash after operator)
+        has_continuation = False
+        if self._match(TokenType.CONTINUATION):
+            self._advance()  # consume \
+            has_continuation = True
+            # Skip newline and any leading whitespace on next line
+            if self._match(TokenType.NEWLINE):
+                self._advance()
+            self._skip_newlines()
+        else:
+            # Allow newlines after comparison operator
+            self._skip_newlines()
 
-        if self._match(
-            TokenType.LESS_THAN,
-            TokenType.GREATER_THAN,
-            TokenType.LESS_EQUAL,
-            TokenType.GREATER_EQUAL,
-            TokenType.EQUALS,
-            TokenType.NOT_EQUAL,
-            TokenType.SHOWS,
-        ):
-            # Found comparison operator, consume it
-            op_token = self._advance()
-
-            # Detect line continuation (backslash after operator)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                # Skip newline and any leading whitespace on next line
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            else:
-                # Allow newlines after comparison operator
-                self._skip_newlines()
-
-            prev_in_comparison_rhs = self._in_comparison_rhs
-            self._in_comparison_rhs = True
-            try:
-                right = self._parse_function_type()
-            finally:
-                self._in_comparison_rhs = prev_in_comparison_rhs
-
-            # Check for guarded cases after = operator (pattern matching)
-            # Syntax: expr1 = expr2 \n if cond2 \n expr3 \n if cond3 ...
-            if op_token.type == TokenType.EQUALS:
-                right = self._try_parse_guarded_cases(right)
-
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
-                line=op_token.line,
-                column=op_token.column,
-            )
-        else:
-            # No comparison operator, restore position to not consume newlines
-            self.pos = saved_pos
-
-        return left
+        prev_in_comparison_rhs = self._in_comparison_rhs
+        self._in_comparison_rhs = True
+        try:
+            right = yield self._binary_steps(FUNCTION_TYPE)
+        finally:
+            self._in_comparison_rhs = prev_in_comparison_rhs
+
+        # Check for guarded cases after = operator (pattern matching)
+        # Syntax: expr1 = expr2 \n if cond2 \n expr3 \n if cond3 ...
+        if op_token.type == TokenType.EQUALS:
+            right = self._try_parse_guarded_cases(right)
+
+        return BinaryOp(
+            operator=op_token.value,
+            left=left,
+            right=right,
+            line_break_after=has_continuation,
+            line=op_token.line,
+            column=op_token.column,
+        )
 
     def _try_parse_guarded_cases(self, first_expr: Expr) -> Expr:
         """Try to parse guarded cases for pattern matching.
@@ -1749,51 +1807,13 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         Infix: <->, |->, <|, |>, <<|, |>>, o9/comp
         """
-        left = self._parse_set_op()
-
-        # Infix relation operators (left-associative)
-        # Note: SEMICOLON is NOT included here - it's used for declaration separators
-        # Use 'o9' for relational composition instead
-        while self._match(
-            TokenType.RELATION,  # <->
-            TokenType.MAPLET,  # |->
-            TokenType.DRES,  # <| (domain restriction)
-            TokenType.RRES,  # |> (range restriction)
-            TokenType.NDRES,  # <<| (domain subtraction)
-            TokenType.NRRES,  # |>> (range subtraction)
-            TokenType.CIRC,  # o9 (relational composition)
-            TokenType.COMP,  # comp
-        ):
-            op_token = self._advance()
-            right = self._parse_set_op()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        # Note: SEMICOLON is NOT a relation operator - it's used for declaration
+        # separators.  Use 'o9' for relational composition instead
+        return self._parse_binary(RELATION)
 
     def _parse_set_op(self) -> Expr:
         """Parse set operators (in, notin, subset, psubset)."""
-        left = self._parse_union()
-
-        if self._match(
-            TokenType.IN, TokenType.NOTIN, TokenType.SUBSET, TokenType.PSUBSET
-        ):
-            op_token = self._advance()
-            right = self._parse_union()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(SET_OP)
 
     def _parse_union(self) -> Expr:
         """Parse union and override operators.
@@ -1804,11 +1824,37 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         Supports multi-line expressions with natural line breaks.
         """
-        left = self._parse_cross()
+        return self._parse_binary(UNION)
 
-        while self._match(TokenType.UNION, TokenType.OVERRIDE):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
+    def _parse_cross(self) -> Expr:
+        """Parse product, join, division, GROUP, UNGROUP, and EXTEND.
+
+        CROSS, JOIN, DIV, GROUP, UNGROUP, and EXTEND sit at the same
+        precedence level between set operators and arithmetic (Phase 2.2 / 4.1).
+        JOIN handles an optional subscript bracket: R join [p] S.
+        GROUP and UNGROUP are Date's nested-relation operators; EXTEND adds
+        a per-tuple computed attribute.
+
+        Supports multi-line expressions with natural line breaks.
+        """
+        return self._parse_binary(CROSS)
+
+    def _parse_cross_operator(self, left: Expr, op_token: Token) -> Expr:
+        """Parse the right-hand side of a consumed cross-level operator."""
+        if op_token.type == TokenType.JOIN:
+            # Check for theta-join subscript: join [predicate]
+            subscript: Expr | None = None
+            if self._match(TokenType.LBRACKET):
+                bracket_tok = self._advance()  # consume '['
+                if self._match(TokenType.RBRACKET):
+                    raise ParserError(
+                        "Expected predicate in join subscript", self._current()
+                    )
+                subscript = self._parse_expr()
+                if not self._match(TokenType.RBRACKET):
+                    raise ParserError("Expected ']' after join predicate", bracket_tok)
+                self._advance()  # consume ']'
+            # Detect line continuation after optional subscript
             has_continuation = False
             if self._match(TokenType.CONTINUATION):
                 self._advance()  # consume \
@@ -1821,215 +1867,150 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 self._skip_newlines()
             else:
                 self._skip_newlines()
-            right = self._parse_cross()
-            left = BinaryOp(
-                operator=op_token.value,
+            prev_relational = self._in_relational_context
+            self._in_relational_context = True
+            try:
+                right = self._parse_binary(INTERSECT)
+            finally:
+                self._in_relational_context = prev_relational
+            left = NaturalJoin(
                 left=left,
                 right=right,
+                subscript=subscript,
                 line_break_after=has_continuation,
                 line=op_token.line,
                 column=op_token.column,
             )
-
-        return left
-
-    def _parse_cross(self) -> Expr:
-        """Parse product, join, division, GROUP, UNGROUP, and EXTEND.
-
-        CROSS, JOIN, DIV, GROUP, UNGROUP, and EXTEND sit at the same
-        precedence level between set operators and arithmetic (Phase 2.2 / 4.1).
-        JOIN handles an optional subscript bracket: R join [p] S.
-        GROUP and UNGROUP are Date's nested-relation operators; EXTEND adds
-        a per-tuple computed attribute.
-
-        Supports multi-line expressions with natural line breaks.
-        """
-        left = self._parse_intersect()
-
-        while self._match(
-            TokenType.CROSS,
-            TokenType.JOIN,
-            TokenType.DIV,
-            TokenType.GROUP,
-            TokenType.UNGROUP,
-            TokenType.EXTEND,
-        ):
-            op_token = self._advance()
-
-            if op_token.type == TokenType.JOIN:
-                # Check for theta-join subscript: join [predicate]
-                subscript: Expr | None = None
-                if self._match(TokenType.LBRACKET):
-                    bracket_tok = self._advance()  # consume '['
-                    if self._match(TokenType.RBRACKET):
-                        raise ParserError(
-                            "Expected predicate in join subscript", self._current()
-                        )
-                    subscript = self._parse_expr()
-                    if not self._match(TokenType.RBRACKET):
-                        raise ParserError(
-                            "Expected ']' after join predicate", bracket_tok
-                        )
-                    self._advance()  # consume ']'
-                # Detect line continuation after optional subscript
-                has_continuation = False
-                if self._match(TokenType.CONTINUATION):
-                    self._advance()  # consume \
-                    has_continuation = True
-                    if self._match(TokenType.NEWLINE):
-                        self._advance()
-                    self._skip_newlines()
-                elif self._match(TokenType.NEWLINE):
-                    has_continuation = True
-                    self._skip_newlines()
-                else:
-                    self._skip_newlines()
-                prev_relational = self._in_relational_context
-                self._in_relational_context = True
-                try:
-                    right = self._parse_intersect()
-                finally:
-                    self._in_relational_context = prev_relational
-                left = NaturalJoin(
-                    left=left,
-                    right=right,
-                    subscript=subscript,
-                    line_break_after=has_continuation,
-                    line=op_token.line,
-                    column=op_token.column,
-                )
-            elif op_token.type == TokenType.DIV:
-                # Detect line continuation
-                has_continuation = False
-                if self._match(TokenType.CONTINUATION):
-                    self._advance()  # consume \
-                    has_continuation = True
-                    if self._match(TokenType.NEWLINE):
-                        self._advance()
-                    self._skip_newlines()
-                elif self._match(TokenType.NEWLINE):
-                    has_continuation = True
-                    self._skip_newlines()
-                else:
-                    self._skip_newlines()
-                prev_relational = self._in_relational_context
-                self._in_relational_context = True
-                try:
-                    right = self._parse_intersect()
-                finally:
-                    self._in_relational_context = prev_relational
-                left = Divide(
-                    left=left,
-                    right=right,
-                    line_break_after=has_continuation,
-                    line=op_token.line,
-                    column=op_token.column,
-                )
-            elif op_token.type == TokenType.GROUP:
-                group_node = self._parse_group_rhs(left, op_token)
-                # Detect line continuation after full GROUP expression.
-                # Unlike Divide/Join (which check *before* their right
-                # operand), GROUP checks *after* its fully-parsed RHS.
-                # A bare NEWLINE is only a continuation when a chaining
-                # relational operator immediately follows on the next line
-                # (join, div, cross, group, ungroup).  A NEWLINE before
-                # EOF or any non-relational token is just a statement
-                # terminator; treating it as a continuation injects \\
-                # into inline math, producing invalid LaTeX.
-                has_continuation = False
-                if self._match(TokenType.CONTINUATION):
-                    self._advance()  # consume \
-                    has_continuation = True
-                    if self._match(TokenType.NEWLINE):
-                        self._advance()
-                    self._skip_newlines()
-                elif self._match(TokenType.NEWLINE):
-                    has_continuation = self._next_non_newline_is_cross_op()
-                    self._skip_newlines()
-                else:
-                    self._skip_newlines()
-                if has_continuation:
-                    # Replace the frozen node with line_break_after=True
-                    if isinstance(group_node, GroupAggregate):
-                        left = GroupAggregate(
-                            relation=group_node.relation,
-                            clauses=group_node.clauses,
-                            line_break_after=True,
-                            line=group_node.line,
-                            column=group_node.column,
-                        )
-                    else:
-                        left = Group(
-                            relation=group_node.relation,
-                            attrs=group_node.attrs,
-                            alias=group_node.alias,
-                            line_break_after=True,
-                            line=group_node.line,
-                            column=group_node.column,
-                        )
-                else:
-                    left = group_node
-            elif op_token.type == TokenType.UNGROUP:
-                ungroup_node = self._parse_ungroup_rhs(left, op_token)
-                # Detect line continuation after full UNGROUP expression
-                has_continuation = False
-                if self._match(TokenType.CONTINUATION):
-                    self._advance()  # consume \
-                    has_continuation = True
-                    if self._match(TokenType.NEWLINE):
-                        self._advance()
-                    self._skip_newlines()
-                elif self._match(TokenType.NEWLINE):
-                    has_continuation = True
-                    self._skip_newlines()
-                else:
-                    self._skip_newlines()
-                if has_continuation:
-                    # Replace the frozen Ungroup node with line_break_after=True
-                    left = Ungroup(
-                        relation=ungroup_node.relation,
-                        alias=ungroup_node.alias,
+        elif op_token.type == TokenType.DIV:
+            # Detect line continuation
+            has_continuation = False
+            if self._match(TokenType.CONTINUATION):
+                self._advance()  # consume \
+                has_continuation = True
+                if self._match(TokenType.NEWLINE):
+                    self._advance()
+                self._skip_newlines()
+            elif self._match(TokenType.NEWLINE):
+                has_continuation = True
+                self._skip_newlines()
+            else:
+                self._skip_newlines()
+            prev_relational = self._in_relational_context
+            self._in_relational_context = True
+            try:
+                right = self._parse_binary(INTERSECT)
+            finally:
+                self._in_relational_context = prev_relational
+            left = Divide(
+                left=left,
+                right=right,
+                line_break_after=has_continuation,
+                line=op_token.line,
+                column=op_token.column,
+            )
+        elif op_token.type == TokenType.GROUP:
+            group_node = self._parse_group_rhs(left, op_token)
+            # Detect line continuation after full GROUP expression.
+            # Unlike Divide/Join (which check *before* their right
+            # operand), GROUP checks *after* its fully-parsed RHS.
+            # A bare NEWLINE is only a continuation when a chaining
+            # relational operator immediately follows on the next line
+            # (join, div, cross, group, ungroup).  A NEWLINE before
+            # EOF or any non-relational token is just a statement
+            # terminator; treating it as a continuation injects \\
+            # into inline math, producing invalid LaTeX.
+            has_continuation = False
+            if self._match(TokenType.CONTINUATION):
+                self._advance()  # consume \
+                has_continuation = True
+                if self._match(TokenType.NEWLINE):
+                    self._advance()
+                self._skip_newlines()
+            elif self._match(TokenType.NEWLINE):
+                has_continuation = self._next_non_newline_is_cross_op()
+                self._skip_newlines()
+            else:
+                self._skip_newlines()
+            if has_continuation:
+                # Replace the frozen node with line_break_after=True
+                if isinstance(group_node, GroupAggregate):
+                    left = GroupAggregate(
+                        relation=group_node.relation,
+                        clauses=group_node.clauses,
                         line_break_after=True,
-                        line=ungroup_node.line,
-                        column=ungroup_node.column,
+                        line=group_node.line,
+                        column=group_node.column,
                     )
                 else:
-                    left = ungroup_node
-            elif op_token.type == TokenType.EXTEND:
-                left = self._parse_extend_full(left, op_token)
+                    left = Group(
+                        relation=group_node.relation,
+                        attrs=group_node.attrs,
+                        alias=group_node.alias,
+                        line_break_after=True,
+                        line=group_node.line,
+                        column=group_node.column,
+                    )
             else:
-                # CROSS
-                has_continuation = False
-                if self._match(TokenType.CONTINUATION):
-                    self._advance()  # consume \
-                    has_continuation = True
-                    if self._match(TokenType.NEWLINE):
-                        self._advance()
-                    self._skip_newlines()
-                elif self._match(TokenType.NEWLINE):
-                    has_continuation = True
-                    self._skip_newlines()
-                else:
-                    self._skip_newlines()
-                right = self._parse_intersect()
-                left = BinaryOp(
-                    operator=op_token.value,
-                    left=left,
-                    right=right,
-                    line_break_after=has_continuation,
-                    line=op_token.line,
-                    column=op_token.column,
+                left = group_node
+        elif op_token.type == TokenType.UNGROUP:
+            ungroup_node = self._parse_ungroup_rhs(left, op_token)
+            # Detect line continuation after full UNGROUP expression
+            has_continuation = False
+            if self._match(TokenType.CONTINUATION):
+                self._advance()  # consume \
+                has_continuation = True
+                if self._match(TokenType.NEWLINE):
+                    self._advance()
+                self._skip_newlines()
+            elif self._match(TokenType.NEWLINE):
+                has_continuation = True
+                self._skip_newlines()
+            else:
+                self._skip_newlines()
+            if has_continuation:
+                # Replace the frozen Ungroup node with line_break_after=True
+                left = Ungroup(
+                    relation=ungroup_node.relation,
+                    alias=ungroup_node.alias,
+                    line_break_after=True,
+                    line=ungroup_node.line,
+                    column=ungroup_node.column,
                 )
+            else:
+                left = ungroup_node
+        elif op_token.type == TokenType.EXTEND:
+            left = self._parse_extend_full(left, op_token)
+        else:
+            # CROSS
+            has_continuation = False
+            if self._match(TokenType.CONTINUATION):
+                self._advance()  # consume \
+                has_continuation = True
+                if self._match(TokenType.NEWLINE):
+                    self._advance()
+                self._skip_newlines()
+            elif self._match(TokenType.NEWLINE):
+                has_continuation = True
+                self._skip_newlines()
+            else:
+                self._skip_newlines()
+            right = self._parse_binary(INTERSECT)
+            left = BinaryOp(
+                operator=op_token.value,
+                left=left,
+                right=right,
+                line_break_after=has_continuation,
+                line=op_token.line,
+                column=op_token.column,
+            )
 
-            # After constructing the node, check for trailing continuation
-            # that marks a break before the next operator in the chain.
-            # Example: R join S \    ← \ after RHS, before next join
-            #            join T
-            # The just-constructed node gets line_break_after=True so the
-            # caller knows to emit \\ before the next operator.
-            left = self._apply_trailing_continuation(left)
-
-        return left
+        # After constructing the node, check for trailing continuation
+        # that marks a break before the next operator in the chain.
+        # Example: R join S \    ← \ after RHS, before next join
+        #            join T
+        # The just-constructed node gets line_break_after=True so the
+        # caller knows to emit \\ before the next operator.
+        return self._apply_trailing_continuation(left)
 
     def _next_non_newline_is_cross_op(self) -> bool:
         """Peek ahead past newlines to see if a cross-level operator follows.
@@ -2037,12 +2018,15 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Returns True when the next non-newline token is one of CROSS, JOIN,
         DIV, GROUP, UNGROUP, or EXTEND, indicating a natural line break in a chain.
         """
-        pos = self.pos
-        while pos < len(self.tokens) and self.tokens[pos].type == TokenType.NEWLINE:
-            pos += 1
-        if pos >= len(self.tokens):
-            return False
-        return self.tokens[pos].type in (
+        index = self._token_index()
+        if index is not None:
+            next_type = index.type_at(index.next_non_newline(self.pos))
+        else:
+            offset = 0
+            while self._peek_ahead(offset).type == TokenType.NEWLINE:
+                offset += 1
+            next_type = self._peek_ahead(offset).type
+        return next_type in (
             TokenType.CROSS,
             TokenType.JOIN,
             TokenType.DIV,
@@ -2119,34 +2103,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         Supports multi-line expressions with natural line breaks.
         """
-        left = self._parse_unary()
-
-        while self._match(TokenType.INTERSECT, TokenType.SETMINUS):
-            op_token = self._advance()
-            # Detect line continuation (backslash or natural newline)
-            has_continuation = False
-            if self._match(TokenType.CONTINUATION):
-                self._advance()  # consume \
-                has_continuation = True
-                if self._match(TokenType.NEWLINE):
-                    self._advance()
-                self._skip_newlines()
-            elif self._match(TokenType.NEWLINE):
-                has_continuation = True
-                self._skip_newlines()
-            else:
-                self._skip_newlines()
-            right = self._parse_unary()
-            left = BinaryOp(
-                operator=op_token.value,
-                left=left,
-                right=right,
-                line_break_after=has_continuation,
-                line=op_token.line,
-                column=op_token.column,
-            )
-
-        return left
+        return self._parse_binary(INTERSECT)
 
     def _dot_is_spaced(self, next_token: Token) -> bool:
         """True when the current PERIOD token has whitespace before the next token.
@@ -2173,7 +2130,23 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         The allow_space_separated parameter prevents right-associativity when
         parsing arguments recursively.
         """
-        base = self._parse_atom()
+        return drive_steps(
+            self._postfix_steps(allow_space_separated=allow_space_separated)
+        )
+
+    def _postfix_steps(self, *, allow_space_separated: bool = True) -> Steps:
+        """Steps of ``_parse_postfix``."""
+        base = yield from self._atom_steps()
+        return (
+            yield from self._postfix_tail_steps(
+                base, allow_space_separated=allow_space_separated
+            )
+        )
+
+    def _postfix_tail_steps(
+        self, base: Expr, *, allow_space_separated: bool = True
+    ) -> Steps:
+        """Parse the postfix operators and application after atom ``base``."""
 
         # Check for generic instantiation S[X] or schema rename S[a/b].
         # Only treat [ as such if:
@@ -2397,7 +2370,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             # Check for function application expr(...)
             elif self._match(TokenType.LPAREN):
                 lparen_token = self._advance()  # Consume '('
-                args = self._parse_argument_list()
+                args = yield from self._argument_list_steps()
                 if not self._match(TokenType.RPAREN):
                     raise ParserError(
                         "Expected ')' after function arguments", self._current()
@@ -2427,7 +2400,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             # Relational image R(| S |)
             if self._match(TokenType.LIMG):
                 limg_token = self._advance()  # Consume '(|'
-                set_expr = self._parse_expr()  # Parse the set argument
+                set_expr = yield self._expr_steps()  # Parse the set argument
                 if not self._match(TokenType.RIMG):
                     raise ParserError(
                         "Expected '|)' after relational image argument", self._current()
@@ -2445,7 +2418,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
             if op_token.type == TokenType.CARET:
                 # Superscript takes an operand
-                operand = self._parse_atom()
+                operand = yield from self._atom_steps()
                 base = Superscript(
                     base=base,
                     exponent=operand,
@@ -2454,7 +2427,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 )
             elif op_token.type == TokenType.UNDERSCORE:
                 # Subscript takes an operand
-                operand = self._parse_atom()
+                operand = yield from self._atom_steps()
                 base = Subscript(
                     base=base,
                     index=operand,
@@ -2479,7 +2452,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
                 # Parse argument with all its postfix operators
                 # but WITHOUT space-separated application (prevents right-associativity)
-                arg = self._parse_postfix(allow_space_separated=False)
+                arg = yield from self._postfix_steps(allow_space_separated=False)
 
                 # Wrap in function application
                 base = FunctionApp(
@@ -2500,6 +2473,10 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         When _in_schema_expr_context is True, the inner expression is parsed
         with schema-calculus precedence so that ``(S ; T)`` works correctly.
         """
+        return drive_steps(self._paren_steps())
+
+    def _paren_steps(self) -> Steps:
+        """Steps of ``_parse_parenthesized_expr_or_tuple``."""
         lparen_token = self._advance()  # Consume '('
 
         # Parse first expression — use schema-calculus entry point when in
@@ -2507,7 +2484,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         if self._in_schema_expr_context:
             first_expr = self._parse_schema_pipe()
         else:
-            first_expr = self._parse_expr()
+            first_expr = yield self._expr_steps()
 
         # Allow newlines for multi-line expressions
         self._skip_newlines()
@@ -2527,7 +2504,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 if self._in_schema_expr_context:
                     elements.append(self._parse_schema_pipe())
                 else:
-                    elements.append(self._parse_expr())
+                    elements.append((yield self._expr_steps()))
                 # Allow newlines for multi-line tuples
                 self._skip_newlines()
 
@@ -2552,6 +2529,31 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         return first_expr
 
+    def _nesting_atom_steps(self) -> Steps:
+        """Steps of the atom at the current parenthesis, lambda, conditional,
+        quantifier or literal bracket (one of ``_NESTING_ATOMS``)."""
+        if self._match(TokenType.LPAREN):
+            return self._paren_steps()
+        if self._match(TokenType.LAMBDA):
+            return self._lambda_steps()
+        if self._match(TokenType.IF):
+            return self._conditional_steps()
+        if self._match(TokenType.LBRACE):
+            return self._set_steps()
+        if self._match(TokenType.LANGLE):
+            return self._sequence_literal_steps()
+        if self._match(TokenType.LBRACKET):
+            return self._bag_literal_steps()
+        if self._match(TokenType.LBIND):
+            return self._binding_steps()
+        return self._quantifier_steps()
+
+    def _atom_steps(self) -> Steps:
+        """Steps of ``_parse_atom``: a nesting atom's steps run on the stack."""
+        if self._match(*_NESTING_ATOMS):
+            return (yield self._nesting_atom_steps())
+        return self._parse_atom()
+
     # ------------------------------------------------------------------
     # Relational algebra parsers (Phase 2.2)
     # ------------------------------------------------------------------
@@ -2724,16 +2726,8 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             return self._parse_sequence_literal()
 
         # Bag literals [[a, b, c]]
-        # Check for two consecutive left brackets
         if self._match(TokenType.LBRACKET):
-            # Peek ahead to see if next token is also LBRACKET
-            if self._peek_ahead(1).type == TokenType.LBRACKET:
-                return self._parse_bag_literal()
-            # Single bracket - not a bag literal, error out
-            raise ParserError(
-                "Unexpected '[' - did you mean '[[' for bag literal?",
-                self._current(),
-            )
+            return self._parse_bag_literal()
 
         # Handle unary prefix operators in restricted contexts
         # This allows # and not to work in set comprehension predicates
@@ -2747,7 +2741,7 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             self._current(),
         )
 
-    def _parse_argument_list(self) -> list[Expr]:
+    def _argument_list_steps(self) -> Generator[Steps, Expr, list[Expr]]:
         """Parse comma-separated argument list for function application.
 
         Handles empty list f(), single arg f(x), multiple args f(x, y, z).
@@ -2760,17 +2754,21 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             return args
 
         # Parse first argument
-        args.append(self._parse_expr())
+        args.append((yield self._expr_steps()))
 
         # Parse remaining arguments (comma-separated)
         while self._match(TokenType.COMMA):
             self._advance()  # Consume ','
-            args.append(self._parse_expr())
+            args.append((yield self._expr_steps()))
 
         return args
 
     def _parse_sequence_literal(self) -> Expr:
         """Parse sequence literal: ⟨⟩, ⟨a⟩, ⟨a, b, c⟩."""
+        return drive_steps(self._sequence_literal_steps())
+
+    def _sequence_literal_steps(self) -> Steps:
+        """Steps of ``_parse_sequence_literal``."""
         langle_token = self._advance()  # Consume '⟨'
 
         elements: list[Expr] = []
@@ -2785,14 +2783,14 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             )
 
         # Parse comma-separated elements
-        elements.append(self._parse_expr())
+        elements.append((yield self._expr_steps()))
 
         while self._match(TokenType.COMMA):
             self._advance()  # Consume ','
             # Check for trailing comma: ⟨a, b,⟩
             if self._match(TokenType.RANGLE):
                 break
-            elements.append(self._parse_expr())
+            elements.append((yield self._expr_steps()))
 
         # Expect closing angle bracket
         if not self._match(TokenType.RANGLE):
@@ -2810,24 +2808,31 @@ class _ExpressionsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         Bag literals use double brackets: [[...]]
         """
-        # Consume first '['
+        return drive_steps(self._bag_literal_steps())
+
+    def _bag_literal_steps(self) -> Steps:
+        """Steps of ``_parse_bag_literal``."""
+        # A single bracket cannot start an atom
+        if self._peek_ahead(1).type != TokenType.LBRACKET:
+            raise ParserError(
+                "Unexpected '[' - did you mean '[[' for bag literal?",
+                self._current(),
+            )
+        # Consume both '['
         lbag_token = self._advance()
-        # Consume second '['
-        if not self._match(TokenType.LBRACKET):
-            raise ParserError("Expected second '[' for bag literal", self._current())
         self._advance()
 
         elements: list[Expr] = []
 
         # Parse comma-separated elements
-        elements.append(self._parse_expr())
+        elements.append((yield self._expr_steps()))
 
         while self._match(TokenType.COMMA):
             self._advance()  # Consume ','
             # Check for closing brackets
             if self._match(TokenType.RBRACKET):
                 break
-            elements.append(self._parse_expr())
+            elements.append((yield self._expr_steps()))
 
         # Expect first closing bracket
         if not self._match(TokenType.RBRACKET):
@@ -1,9 +1,10 @@
 """Token-cursor helpers for the recursive-descent parser.
 
 Covers: ``_at_end``, ``_current``, ``_advance``, ``_match``,
-``_peek_ahead``, ``_skip_newlines``, ``_has_blank_line``,
-``_bracket_contains_slash``.  Every rule method in the parser_pkg
-reaches the token stream through these helpers.
+``_peek_ahead``, ``_skip_newlines``, ``_has_blank_line``, ``_token_index``,
+``_bracket_contains_slash``, ``_release_tokens``, ``_memoized``.  Every
+rule method in the parser_pkg reaches the token stream through these
+helpers.
 
 This mixin is composed into :class:`Parser` via multiple inheritance.
 Method bodies are byte-identical to their counterparts in the
@@ -13,9 +14,18 @@ changed.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, TypeVar, cast
+
 from txt2tex.parser_pkg._base import ParserBase
+from txt2tex.parser_pkg.token_index import TokenIndex
+from txt2tex.parser_pkg.token_window import TokenWindow
 from txt2tex.tokens import Token, TokenType
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
 
 class _LexerStateParser(ParserBase):  # pyright: ignore[reportUnusedClass]
     """Mixin: token-cursor helpers."""
@@ -45,6 +55,8 @@ class _LexerStateParser(ParserBase):  # pyright: ignore[reportUnusedClass]
     def _peek_ahead(self, offset: int = 1) -> Token:
         """Look ahead at token without consuming it."""
         pos = self.pos + offset
+        if isinstance(self.tokens, TokenWindow):
+            return self.tokens[pos]  # EOF if past end
         if pos < len(self.tokens):
             return self.tokens[pos]
         return self.tokens[-1]  # Return EOF if past end
@@ -60,20 +72,25 @@ class _LexerStateParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Returns:
             True if there are 2+ consecutive NEWLINE tokens (indicating blank line)
         """
+        index = self._token_index()
+        if index is not None:
+            return index.blank_line_at(self.pos)
+
         if not self._match(TokenType.NEWLINE):
             return False
 
-        # Count consecutive newlines
-        newline_count = 0
-        offset = 0
-        while (
-            self.pos + offset < len(self.tokens)
-            and self.tokens[self.pos + offset].type == TokenType.NEWLINE
-        ):
-            newline_count += 1
-            offset += 1
+        # The current token is a newline; a blank line needs a second one
+        return self._peek_ahead(1).type == TokenType.NEWLINE
 
-        return newline_count >= 2
+    def _token_index(self) -> TokenIndex | None:
+        """Return the lookahead index, building it on first use.
+
+        None when tokens stream through a :class:`TokenWindow`, which never
+        holds the whole sequence; the lookahead helpers then scan instead.
+        """
+        if self._lookahead is None and not isinstance(self.tokens, TokenWindow):
+            self._lookahead = TokenIndex(self.tokens)
+        return self._lookahead
 
     def _bracket_contains_slash(self) -> bool:
         """Return True if the next bracket group (starting at '[') contains '/'.
@@ -81,6 +98,9 @@ class _LexerStateParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Scans ahead from the current position (which must point at '[') for a
         SLASH token at bracket depth 0.  Does not consume any tokens.
         """
+        index = self._token_index()
+        if index is not None:
+            return index.bracket_contains_slash(self.pos)
         depth = 0
         offset = 1  # start scanning past the '['
         while True:
@@ -96,3 +116,46 @@ class _LexerStateParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             elif tok.type in (TokenType.EOF, TokenType.NEWLINE):
                 return False
             offset += 1
+
+    def _release_tokens(self) -> None:
+        """Let a streamed token window drop the tokens before ``pos``.
+
+        Only called between document items, where no backtracking mark
+        can still point at an earlier token; the parse memo is dropped too.
+        """
+        if isinstance(self.tokens, TokenWindow):
+            self.tokens.release(self.pos)
+        self._memo.clear()
+
+    def _memoized(self, rule: str, parse: Callable[[], T]) -> T:
+        """Run ``parse`` at ``pos`` once; replay its result when re-entered.
+
+        Packrat memo for rules a backtracking caller may run again at the
+        same position.  The key includes every context flag that changes
+        what a rule accepts, so a hit is only taken where ``parse`` would
+        have produced the same result and stopped at the same token.
+        Failures are not recorded: a ``ParserError`` propagates as usual.
+        """
+        vars_in_scope = self._current_quantifier_vars
+        key = (
+            rule,
+            self.pos,
+            self._parsing_schema_text,
+            self._in_comprehension_body,
+            self._in_schema_expr_context,
+            self._in_comparison_rhs,
+            self._in_relational_context,
+            frozenset(vars_in_scope) if vars_in_scope else None,
+        )
+        entry = self._memo.get(key)
+        if entry is not None:
+            result, self.pos, self.last_token_end_column, self.last_token_line = entry
+            return cast("T", result)
+        result = parse()
+        self._memo[key] = (
+            result,
+            self.pos,
+            self.last_token_end_column,
+            self.last_token_line,
+        )
+        return result
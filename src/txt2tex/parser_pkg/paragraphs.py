@@ -383,7 +383,7 @@ class _ParagraphsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         # Parse name (may include postfix operator suffix like R+, R*, R~)
         name_token = self._current()  # Save for line/column info
-        name = self._parse_compound_identifier_name()
+        name = self._memoized("compound_name", self._parse_compound_identifier_name)
 
         if not self._match(TokenType.ABBREV):
             raise ParserError("Expected '==' in abbreviation", self._current())
@@ -605,7 +605,9 @@ class _ParagraphsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
                 # Try to parse as compound identifier (handles R, R+, R*, R~, etc.)
                 try:
-                    _ = self._parse_compound_identifier_name()
+                    _ = self._memoized(
+                        "compound_name", self._parse_compound_identifier_name
+                    )
 
                     # Check what follows the identifier
                     if self._match(TokenType.FREE_TYPE):
@@ -0,0 +1,101 @@
+"""Binding levels and infix-operator table for the expression engine.
+
+The levels follow the grammar in the :class:`~txt2tex.parser.Parser`
+docstring, loosest first, and agree with ``PRECEDENCE`` in
+``codegen/paren_policy.py`` for the operators both tables know.  The
+parser splits two of its levels: function-type arrows bind looser than
+the relation operators, and prefix ``not``/``#``/``-`` sit between the
+set operators and range/arithmetic.
+
+``_ExpressionsParser._parse_binary`` climbs these levels from one
+operand instead of descending one method per level.
+"""
+
+from __future__ import annotations
+
+from txt2tex.tokens import TokenType
+
+IFF = 1
+IMPLIES = 2
+OR = 3
+AND = 4
+COMPARISON = 5
+FUNCTION_TYPE = 6
+RELATION = 7
+SET_OP = 8
+UNION = 9
+CROSS = 10
+INTERSECT = 11
+UNARY = 12
+RANGE = 13
+ADDITIVE = 14
+MULTIPLICATIVE = 15
+
+# Levels whose operator may repeat at the same level (a => b => c,
+# a land b land c).  At the others (a = b, A -> B, x elem S, m..n) one
+# operator ends the level: the right operand of a function arrow already
+# took any further arrows, and a second comparison, set operator or range
+# is left for the caller.
+CHAINING_LEVELS: frozenset[int] = frozenset(
+    {IFF, IMPLIES, OR, AND, RELATION, UNION, CROSS, INTERSECT, ADDITIVE, MULTIPLICATIVE}
+)
+
+# Levels where a newline or ``\`` right after the operator marks a line break.
+BREAKABLE_LEVELS: frozenset[int] = frozenset({IFF, IMPLIES, OR, AND, UNION, INTERSECT})
+
+# Token type -> levels at which it is an infix operator, tightest first.
+INFIX_LEVELS: dict[TokenType, tuple[int, ...]] = {
+    TokenType.IFF: (IFF,),
+    TokenType.IMPLIES: (IMPLIES,),
+    TokenType.OR: (OR,),
+    TokenType.AND: (AND,),
+    TokenType.LESS_THAN: (COMPARISON,),
+    TokenType.GREATER_THAN: (COMPARISON,),
+    TokenType.LESS_EQUAL: (COMPARISON,),
+    TokenType.GREATER_EQUAL: (COMPARISON,),
+    TokenType.EQUALS: (COMPARISON,),
+    TokenType.NOT_EQUAL: (COMPARISON,),
+    TokenType.SHOWS: (COMPARISON,),
+    TokenType.TFUN: (FUNCTION_TYPE,),  # ->
+    TokenType.PFUN: (FUNCTION_TYPE,),  # +->
+    TokenType.TINJ: (FUNCTION_TYPE,),  # >->
+    TokenType.PINJ: (FUNCTION_TYPE,),  # >+>
+    TokenType.PINJ_ALT: (FUNCTION_TYPE,),  # -|>
+    TokenType.TSURJ: (FUNCTION_TYPE,),  # -->>
+    TokenType.PSURJ: (FUNCTION_TYPE,),  # +->>
+    TokenType.BIJECTION: (FUNCTION_TYPE,),  # >->>
+    TokenType.FINFUN: (FUNCTION_TYPE,),  # 77->
+    # <-> is a relation operator, and a relation type only where the
+    # relation level is out of reach.
+    TokenType.RELATION: (RELATION, FUNCTION_TYPE),
+    TokenType.MAPLET: (RELATION,),  # |->
+    TokenType.DRES: (RELATION,),  # <|
+    TokenType.RRES: (RELATION,),  # |>
+    TokenType.NDRES: (RELATION,),  # <<|
+    TokenType.NRRES: (RELATION,),  # |>>
+    TokenType.CIRC: (RELATION,),  # o9
+    TokenType.COMP: (RELATION,),  # comp
+    TokenType.IN: (SET_OP,),
+    TokenType.NOTIN: (SET_OP,),
+    TokenType.SUBSET: (SET_OP,),
+    TokenType.PSUBSET: (SET_OP,),
+    TokenType.UNION: (UNION,),
+    TokenType.OVERRIDE: (UNION,),
+    TokenType.CROSS: (CROSS,),
+    TokenType.JOIN: (CROSS,),
+    TokenType.DIV: (CROSS,),
+    TokenType.GROUP: (CROSS,),
+    TokenType.UNGROUP: (CROSS,),
+    TokenType.EXTEND: (CROSS,),
+    TokenType.INTERSECT: (INTERSECT,),
+    TokenType.SETMINUS: (INTERSECT,),
+    TokenType.RANGE: (RANGE,),
+    TokenType.PLUS: (ADDITIVE,),
+    TokenType.MINUS: (ADDITIVE,),
+    TokenType.CAT: (ADDITIVE,),
+    TokenType.FILTER: (ADDITIVE,),
+    TokenType.BAG_UNION: (ADDITIVE,),
+    TokenType.BAG_DIFF: (ADDITIVE,),
+    TokenType.STAR: (MULTIPLICATIVE,),
+    TokenType.MOD: (MULTIPLICATIVE,),
+}
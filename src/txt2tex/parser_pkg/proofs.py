@@ -6,15 +6,15 @@ Covers: ProofTree, ProofNode, CaseAnalysis, ArgueChain
 methods.
 
 This mixin is composed into :class:`Parser` via multiple inheritance.
-Method bodies are byte-identical to their counterparts in the
-pre-refactor monolithic ``parser.py``; only their file location has
-changed.
+Proof nodes and case analyses are parsed as steps, run by
+:func:`~txt2tex.parser_pkg._base.drive_steps`, so indentation nests to
+any depth.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, cast
 
 from txt2tex.ast_nodes import (
     ArgueChain,
@@ -26,9 +26,14 @@ from txt2tex.ast_nodes import (
     ProofNode,
     ProofTree,
 )
-from txt2tex.parser_pkg._base import ParserBase, ParserError
+from txt2tex.parser_pkg._base import ParserBase, ParserError, drive_steps
 from txt2tex.tokens import TokenType
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from txt2tex.parser_pkg._base import ProofSteps
+
 
 class _ProofsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
     """Mixin: rules for proof constructs."""
@@ -343,6 +348,12 @@ class _ProofsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         self, base_indent: int, parent_indent: int | None
     ) -> ProofNode:
         """Parse a single proof node with Path C syntax."""
+        return drive_steps(self._proof_node_steps(base_indent, parent_indent))
+
+    def _proof_node_steps(
+        self, base_indent: int, parent_indent: int | None
+    ) -> Generator[ProofSteps, ProofNode | CaseAnalysis, ProofNode]:
+        """Steps of ``_parse_proof_node``: children are yielded, not parsed."""
         if self._at_end() or self._is_structural_token():
             raise ParserError("Expected proof node", self._current())
 
@@ -433,13 +444,13 @@ class _ProofsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
             # Check for case analysis
             if self._match(TokenType.IDENTIFIER) and self._current().value == "case":
-                case_analysis = self._parse_case_analysis(
+                case_analysis = yield self._case_analysis_steps(
                     base_indent=base_indent, parent_indent=current_indent
                 )
                 children.append(case_analysis)
             else:
                 # Regular proof node
-                child = self._parse_proof_node(
+                child = yield self._proof_node_steps(
                     base_indent=base_indent, parent_indent=current_indent
                 )
                 children.append(child)
@@ -463,6 +474,12 @@ class _ProofsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
 
         parent_indent can be None for top-level cases.
         """
+        return drive_steps(self._case_analysis_steps(base_indent, parent_indent))
+
+    def _case_analysis_steps(
+        self, base_indent: int, parent_indent: int | None
+    ) -> Generator[ProofSteps, ProofNode | CaseAnalysis, CaseAnalysis]:
+        """Steps of ``_parse_case_analysis``: steps are yielded, not parsed."""
         if not self._match(TokenType.IDENTIFIER) or self._current().value != "case":
             raise ParserError("Expected 'case' keyword", self._current())
 
@@ -510,10 +527,10 @@ class _ProofsParser(ParserBase):  # pyright: ignore[reportUnusedClass]
                 break  # Stop parsing this case
 
             # Parse proof node for this case
-            step = self._parse_proof_node(
+            step = yield self._proof_node_steps(
                 base_indent=base_indent, parent_indent=case_indent
             )
-            steps.append(step)
+            steps.append(cast("ProofNode", step))
 
         return CaseAnalysis(
             case_name=case_name,
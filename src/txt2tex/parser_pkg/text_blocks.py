@@ -398,6 +398,7 @@ class _TextBlocksParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         # Parse section content until next section or end
         items: list[DocumentItem] = []
         while not self._at_end() and not self._match(TokenType.SECTION_MARKER):
+            self._release_tokens()
             items.append(self._parse_document_item())
             self._skip_newlines()
 
@@ -436,6 +437,7 @@ class _TextBlocksParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         while not self._at_end() and not self._match(
             TokenType.SOLUTION_MARKER, TokenType.SECTION_MARKER
         ):
+            self._release_tokens()
             items.append(self._parse_document_item())
             self._skip_newlines()
 
@@ -458,6 +460,7 @@ class _TextBlocksParser(ParserBase):  # pyright: ignore[reportUnusedClass]
             TokenType.SOLUTION_MARKER,
             TokenType.SECTION_MARKER,
         ):
+            self._release_tokens()
             items.append(self._parse_document_item())
             self._skip_newlines()
 
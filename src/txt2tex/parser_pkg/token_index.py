@@ -0,0 +1,175 @@
+"""Line-at-a-time lookahead index over a complete token sequence.
+
+Several parser decisions look ahead without consuming tokens: does the
+``[`` group at the cursor contain a top-level ``/`` (a rename), is there a
+declaration colon before the end of the line, is a ``[...]`` group
+followed by ``defs``, is the newline at the cursor a blank line, which
+token follows a run of newlines.  Scanning for the answer from the
+cursor costs time proportional to the distance, and backtracking rules
+ask the same question at the same position more than once.
+
+:class:`TokenIndex` answers all of them in constant time from tables.
+A query on a line not yet indexed fills the tables for the rest of that
+line in one left-to-right and one right-to-left pass; later queries on
+the line are lookups.  Lines the parser never asks about are never
+indexed, which keeps the index cheaper than the scans it replaces on
+ordinary documents, where most lines need no lookahead at all.
+
+Every answer depends only on the tokens from the queried position to the
+end of its line: brackets are matched within a line, a ``NEWLINE`` or
+``EOF`` closing every open ``[`` exactly where the scans gave up.  The
+index needs random access to the whole stream, so the parser builds one
+for a token list or :class:`~txt2tex.token_store.TokenStore` and keeps
+scanning when it reads through a
+:class:`~txt2tex.parser_pkg.token_window.TokenWindow`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from txt2tex.token_store import TokenStore
+from txt2tex.tokens import TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from txt2tex.tokens import Token
+
+_NO_MATCH = -1
+_UNKNOWN = -1
+
+
+class TokenIndex:
+    """Lookahead answers, indexed by absolute token position.
+
+    Positions past the end read as the final (EOF) token, as
+    ``Parser._peek_ahead`` does.
+    """
+
+    def __init__(self, tokens: Sequence[Token]) -> None:
+        """Index ``tokens``, which must end with an EOF token."""
+        self._type_at: Callable[[int], TokenType]
+        if isinstance(tokens, TokenStore):
+            self._type_at = tokens.type_at
+        else:
+            self._type_at = lambda i: tokens[i].type
+        count = len(tokens)
+        self._last = count - 1
+        # Positions whose line has been indexed from there on.
+        self._indexed = bytearray(count)
+        # Position of the ``]`` closing the ``[`` at i on the same line.
+        self.bracket_match = array("i", [_NO_MATCH]) * count
+        # The ``[`` at i has a ``/`` directly inside it, before it closes or
+        # the line ends.
+        self.bracket_slash = bytearray(count)
+        # A COLON at the bracket depth of i follows i before the next NEWLINE,
+        # WHERE, END, SEMICOLON or EOF (depth may go negative past an
+        # unmatched ``]``).
+        self.colon_ahead = bytearray(count)
+        # Number of consecutive NEWLINE tokens starting at i.
+        self.newline_run = array("i", [_UNKNOWN]) * count
+
+    def _at(self, pos: int) -> int:
+        return pos if pos < self._last else self._last
+
+    def _index_line(self, start: int) -> None:
+        """Fill the bracket and colon tables from ``start`` to its line end."""
+        # Token types are compared by identity against locals: enum
+        # attribute lookups and ``Enum.__hash__`` would dominate the loops.
+        lbracket, rbracket = TokenType.LBRACKET, TokenType.RBRACKET
+        slash, colon = TokenType.SLASH, TokenType.COLON
+        newline, eof = TokenType.NEWLINE, TokenType.EOF
+        where, end, semicolon = TokenType.WHERE, TokenType.END, TokenType.SEMICOLON
+        type_at = self._type_at
+
+        # Left to right: bracket matches and slashes, and the bracket depth
+        # of each token within its clause (None for the clause terminators).
+        open_brackets: list[int] = []
+        depths: list[int | None] = []
+        depth = 0
+        pos = start
+        while True:
+            token_type = type_at(pos)
+            if token_type is newline or token_type is eof:
+                depths.append(None)
+                break
+            if token_type is where or token_type is end or token_type is semicolon:
+                depths.append(None)
+                depth = 0
+            else:
+                depths.append(depth)
+                if token_type is lbracket:
+                    depth += 1
+                    open_brackets.append(pos)
+                elif token_type is rbracket:
+                    depth -= 1
+                    if open_brackets:
+                        self.bracket_match[open_brackets.pop()] = pos
+                elif token_type is slash and open_brackets:
+                    self.bracket_slash[open_brackets[-1]] = 1
+            pos += 1
+
+        # Right to left: the depths at which a colon lies ahead in the clause.
+        colon_ahead = self.colon_ahead
+        colon_depths: set[int] = set()
+        for offset in range(len(depths) - 1, -1, -1):
+            token_depth = depths[offset]
+            if token_depth is None:
+                colon_depths.clear()
+                continue
+            if type_at(start + offset) is colon:
+                colon_depths.add(token_depth)
+            if token_depth in colon_depths:
+                colon_ahead[start + offset] = 1
+        self._indexed[start : pos + 1] = b"\x01" * (pos + 1 - start)
+
+    def _line_indexed(self, pos: int) -> int:
+        pos = self._at(pos)
+        if not self._indexed[pos]:
+            self._index_line(pos)
+        return pos
+
+    def bracket_contains_slash(self, pos: int) -> bool:
+        """True if the ``[`` at ``pos`` has a top-level ``/`` on its line."""
+        return bool(self.bracket_slash[self._line_indexed(pos)])
+
+    def colon_before_newline(self, pos: int) -> bool:
+        """True if a depth-0 ``:`` comes before the line or clause ends."""
+        return bool(self.colon_ahead[self._line_indexed(pos)])
+
+    def defs_after_brackets(self, pos: int) -> bool:
+        """True if a ``[...]`` group at ``pos`` closes on its line before DEFS."""
+        pos = self._line_indexed(pos)
+        if self._type_at(pos) is not TokenType.LBRACKET:
+            return False
+        close = self.bracket_match[pos]
+        return close != _NO_MATCH and self.type_at(close + 1) is TokenType.DEFS
+
+    def newline_run_at(self, pos: int) -> int:
+        """Number of consecutive NEWLINE tokens starting at ``pos``."""
+        pos = self._at(pos)
+        run = self.newline_run[pos]
+        if run == _UNKNOWN:
+            newline = TokenType.NEWLINE
+            end = pos
+            while self._type_at(end) is newline:
+                end += 1
+            for i in range(pos, end + 1):
+                self.newline_run[i] = end - i
+            run = end - pos
+        return run
+
+    def blank_line_at(self, pos: int) -> bool:
+        """True if two or more NEWLINE tokens start at ``pos``."""
+        return self.newline_run_at(pos) >= 2
+
+    def next_non_newline(self, pos: int) -> int:
+        """Position of the first token at or after ``pos`` that is not NEWLINE."""
+        pos = self._at(pos)
+        return pos + self.newline_run_at(pos)
+
+    def type_at(self, pos: int) -> TokenType:
+        """Type of the token at ``pos``."""
+        return self._type_at(self._at(pos))
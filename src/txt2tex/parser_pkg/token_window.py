@@ -0,0 +1,104 @@
+"""Bounded lookahead window over a lazily produced token stream.
+
+``Parser`` reads tokens by absolute position: ``_current`` and ``_advance``
+at ``pos``, ``_peek_ahead`` past it, and backtracking rules save ``pos``
+and later set it back.  Given a list, every position stays reachable.
+Given an iterator (``Lexer.iter_tokens``), the parser reads through a
+:class:`TokenWindow` instead: a ring buffer holding only the tokens
+between the release mark and the furthest lookahead, pulling more from
+the lexer on demand.
+
+The parser releases tokens at top-level document item boundaries.  Every
+backtracking mark is a local of a rule method that is still running, so
+none can point before the start of the item being parsed; the window
+therefore never drops a token a reset could return to, and its size is
+bounded by the largest item plus its lookahead rather than by the
+document.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from txt2tex.tokens import Token, TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_CAPACITY = 256
+
+
+class TokenWindow:
+    """Ring buffer of tokens, indexed by absolute stream position.
+
+    Positions past the end of the stream read as its EOF token, the same
+    token the stream ends with.
+    """
+
+    def __init__(self, tokens: Iterable[Token], capacity: int = DEFAULT_CAPACITY):
+        """Wrap a token iterable; ``capacity`` is rounded up to a power of two."""
+        self._source = iter(tokens)
+        self._capacity = 1 << max(capacity - 1, 1).bit_length()
+        self._ring: list[Token] = []
+        self._start = 0  # oldest position still held
+        self._end = 0  # one past the newest position fetched
+        self._released = 0  # positions below this may be dropped
+        self._eof: Token | None = None
+
+    def __getitem__(self, index: int) -> Token:
+        """Return the token at absolute position ``index``."""
+        if index < self._end:
+            if index < self._start:
+                msg = f"token {index} was released (window starts at {self._start})"
+                raise IndexError(msg)
+            return self._ring[index & (len(self._ring) - 1)]
+        return self._fetch(index)
+
+    @property
+    def held(self) -> int:
+        """Number of tokens currently held in the window."""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        """Current ring size (grows only when unreleased tokens fill it)."""
+        return len(self._ring) or self._capacity
+
+    def release(self, position: int) -> None:
+        """Allow tokens before ``position`` to be dropped.
+
+        The caller promises never to read or reset to those positions again.
+        """
+        self._released = max(self._released, min(position, self._end))
+
+    def _fetch(self, index: int) -> Token:
+        while self._end <= index:
+            if self._eof is not None:
+                return self._eof
+            token = next(self._source, None)
+            if token is None:
+                msg = "token stream ended without an EOF token"
+                raise ValueError(msg)
+            self._store(token)
+            if token.type == TokenType.EOF:
+                self._eof = token
+        return self._ring[index & (len(self._ring) - 1)]
+
+    def _store(self, token: Token) -> None:
+        if not self._ring:
+            self._ring = [token] * self._capacity
+        elif self._end - self._start == len(self._ring):
+            if self._start < self._released:
+                self._start = self._released
+            else:
+                self._grow()
+        self._ring[self._end & (len(self._ring) - 1)] = token
+        self._end += 1
+
+    def _grow(self) -> None:
+        """Double the ring, keeping every held token at its position."""
+        old, old_mask = self._ring, len(self._ring) - 1
+        self._ring = [old[0]] * (2 * len(old))
+        new_mask = len(self._ring) - 1
+        for position in range(self._start, self._end):
+            self._ring[position & new_mask] = old[position & old_mask]
@@ -11,8 +11,9 @@ changed.
 
 from __future__ import annotations
 
-from txt2tex.ast_nodes import Expr, FunctionType, GenericInstantiation
+from txt2tex.ast_nodes import Expr, GenericInstantiation
 from txt2tex.parser_pkg._base import ParserBase, ParserError
+from txt2tex.parser_pkg.precedence import FUNCTION_TYPE
 from txt2tex.tokens import TokenType
 
 
@@ -60,33 +61,7 @@ class _TypesParser(ParserBase):  # pyright: ignore[reportUnusedClass]
         Right-associative: A -> B -> C parses as A -> (B -> C)
         Also used in quantifier domains: forall f : X -> Y | P
         """
-        left = self._parse_relation()
-
-        # Check for function/relation type operators (right-associative)
-        if self._match(
-            TokenType.TFUN,  # ->
-            TokenType.PFUN,  # +->
-            TokenType.TINJ,  # >->
-            TokenType.PINJ,  # >+>
-            TokenType.PINJ_ALT,  # -|>
-            TokenType.TSURJ,  # -->>
-            TokenType.PSURJ,  # +->>
-            TokenType.BIJECTION,  # >->>
-            TokenType.FINFUN,  # 77-> (finite partial function)
-            TokenType.RELATION,  # <-> (relation type)
-        ):
-            arrow_token = self._advance()
-            # Right-associative: recursively parse the right side as function type
-            right = self._parse_function_type()
-            return FunctionType(
-                arrow=arrow_token.value,
-                domain=left,
-                range=right,
-                line=arrow_token.line,
-                column=arrow_token.column,
-            )
-
-        return left
+        return self._parse_binary(FUNCTION_TYPE)
 
     def _parse_generic_params(self) -> list[str] | None:
         """Parse optional generic parameters: [X, Y, Z].
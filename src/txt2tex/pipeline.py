@@ -0,0 +1,125 @@
+"""Source-to-LaTeX conversion pipeline shared by the CLI front ends.
+
+``convert_text`` runs the lexer, parser and generator over one source text
+and returns a :class:`ConversionResult` rather than printing.  Diagnostics
+are pre-formatted with :class:`ErrorFormatter` so the result is a plain,
+picklable value: batch workers hand it back across a process boundary and
+the single-file CLI prints it exactly as before.
+
+When a :class:`~txt2tex.cache.GenerationCache` is supplied, successful
+conversions are stored and later calls with the same source and options
+return the cached document without lexing or parsing.
+
+The lexer, parser and generator are imported on the first conversion that
+needs them, so importing this module (for the option and result types, or
+for a cache hit) stays cheap.  Long-running front ends call
+:func:`preload` to pay that import up front.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from txt2tex.cache import GenerationCache
+    from txt2tex.lexer import IncrementalLexer
+
+
+@dataclass(frozen=True)
+class ConversionOptions:
+    """Generator options that affect the emitted LaTeX."""
+
+    use_fuzz: bool = True
+    toc_parts: bool = False
+    warn_overflow: bool = True
+    overflow_threshold: int | None = None
+
+
+@dataclass(frozen=True)
+class ConversionResult:
+    """Outcome of converting one source text.
+
+    Exactly one of ``latex`` and ``error`` is meaningful: on a lexer or
+    parser error ``error`` holds the formatted diagnostic and ``latex`` is
+    empty.  ``warnings`` carries the generator's overflow warnings in
+    emission order.
+    """
+
+    latex: str
+    warnings: tuple[str, ...] = ()
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the source converted without a lexer/parser error."""
+        return self.error is None
+
+
+def preload() -> None:
+    """Import the lexer, parser and generator ahead of the first conversion."""
+    import txt2tex.errors  # noqa: PLC0415
+    import txt2tex.latex_gen  # noqa: PLC0415
+    import txt2tex.lexer  # noqa: PLC0415
+    import txt2tex.parser  # noqa: F401, PLC0415
+
+
+def convert_text(
+    text: str,
+    options: ConversionOptions,
+    cache: GenerationCache | None = None,
+    lexer: IncrementalLexer | None = None,
+) -> ConversionResult:
+    """Convert whiteboard source text to a complete LaTeX document.
+
+    Args:
+        text: The source text.
+        options: Generator options.
+        cache: Optional generation cache consulted before converting and
+            updated after a successful conversion.  Errors are not cached.
+        lexer: Optional lexer holding the previous version of this
+            document, so only the edited region is re-lexed.
+
+    Returns:
+        The generated document and warnings, or a formatted diagnostic.
+    """
+    if cache is not None:
+        cached = cache.get(text, options)
+        if cached is not None:
+            return ConversionResult(latex=cached.latex, warnings=cached.warnings)
+
+    from txt2tex.errors import ErrorFormatter  # noqa: PLC0415
+    from txt2tex.latex_gen import LaTeXGenerator  # noqa: PLC0415
+    from txt2tex.lexer import Lexer, LexerError  # noqa: PLC0415
+    from txt2tex.parser import Parser, ParserError  # noqa: PLC0415
+    from txt2tex.source import SourceFile  # noqa: PLC0415
+
+    source = SourceFile(text)
+    formatter = ErrorFormatter(source)
+    try:
+        tokens = Lexer(source).tokenize() if lexer is None else lexer.tokenize(source)
+        ast = Parser(tokens).parse()
+    except LexerError as e:
+        return ConversionResult(
+            latex="", error=formatter.format_error(e.message, e.line, e.column)
+        )
+    except ParserError as e:
+        return ConversionResult(
+            latex="",
+            error=formatter.format_error(e.message, e.token.line, e.token.column),
+        )
+
+    generator = LaTeXGenerator(
+        use_fuzz=options.use_fuzz,
+        toc_parts=options.toc_parts,
+        warn_overflow=options.warn_overflow,
+        overflow_threshold=options.overflow_threshold,
+        source=source,
+    )
+    latex = generator.generate_document(ast)
+    warnings = tuple(generator.get_warnings())
+    if cache is not None:
+        from txt2tex.cache import CachedGeneration  # noqa: PLC0415
+
+        cache.put(text, options, CachedGeneration(latex=latex, warnings=warnings))
+    return ConversionResult(latex=latex, warnings=warnings)
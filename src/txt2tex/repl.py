@@ -17,6 +17,7 @@ from txt2tex.errors import ErrorFormatter
 from txt2tex.latex_gen import LaTeXGenerator
 from txt2tex.lexer import Lexer, LexerError
 from txt2tex.parser import Parser, ParserError
+from txt2tex.source import SourceFile
 
 # Import readline for history/editing if available (side effect: enables line editing)
 with contextlib.suppress(ImportError):
@@ -137,6 +138,7 @@ def process_input(
     *,
     latex_only: bool = False,
     temp_dir: Path | None = None,
+    precompiled: bool = False,
 ) -> bool:
     """Process input text and generate output.
 
@@ -145,14 +147,16 @@ def process_input(
         generator: LaTeX generator instance.
         latex_only: If True, only show LaTeX (no PDF).
         temp_dir: Temp directory for PDF generation.
+        precompiled: Compile the preview against the precompiled preamble.
 
     Returns:
         True if processing succeeded.
     """
-    formatter = ErrorFormatter(text)
+    source = SourceFile(text)
+    formatter = ErrorFormatter(source)
 
     try:
-        lexer = Lexer(text)
+        lexer = Lexer(source)
         tokens = lexer.tokenize()
 
         parser_obj = Parser(tokens)
@@ -198,7 +202,7 @@ def process_input(
     copy_latex_files(temp_dir)
 
     # Compile
-    if compile_pdf(tex_path, keep_aux=False):
+    if compile_pdf(tex_path, keep_aux=False, precompiled=precompiled):
         pdf_path = tex_path.with_suffix(".pdf")
         if pdf_path.exists():
             print("done.")
@@ -229,11 +233,13 @@ Input:
     )
 
 
-def repl_main(*, use_fuzz: bool = True) -> int:
+def repl_main(*, use_fuzz: bool = True, precompiled_preamble: bool = False) -> int:
     """Run the interactive REPL.
 
     Args:
         use_fuzz: Whether to use fuzz package (default) or zed-* packages.
+        precompiled_preamble: Compile previews against a cached ``.fmt``
+            dump of the preamble, so each preview skips package loading.
 
     Returns:
         Exit code (0 for success).
@@ -307,6 +313,7 @@ def repl_main(*, use_fuzz: bool = True) -> int:
                     generator,
                     latex_only=latex_only,
                     temp_dir=temp_dir if not latex_only else None,
+                    precompiled=precompiled_preamble,
                 )
 
             except KeyboardInterrupt:
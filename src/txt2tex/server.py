@@ -0,0 +1,251 @@
+"""Conversion daemon and thin client over a Unix domain socket.
+
+``txt2tex serve`` imports the pipeline once and answers conversion requests
+for as long as it runs, so editor integrations that convert on every save
+skip interpreter start-up and the codegen import.  ``txt2tex --client``
+sends its source to the daemon and falls back to converting in-process
+when none is listening.
+
+The protocol is newline-delimited JSON; a connection may carry any number
+of request/response pairs.  A request is::
+
+    {"source": "...", "options": {"use_fuzz": true, "toc_parts": false,
+                                  "warn_overflow": true,
+                                  "overflow_threshold": null}}
+
+where every option is optional.  The response is::
+
+    {"ok": true, "latex": "...", "diagnostics": [], "warnings": [...],
+     "timings": {"convert_ms": 12.3}}
+
+``diagnostics`` holds formatted lexer/parser errors (or a protocol error)
+and is non-empty exactly when ``ok`` is false.  A conversion that fails
+inside the daemon (a bug rather than a syntax error) is answered with
+``"internal": true``, and the client converts in-process instead.
+
+Without ``$XDG_RUNTIME_DIR`` the default socket lives in a private
+(0700) per-user directory under the temporary directory, and the client
+only talks to a socket owned by the current user, so another local user
+cannot stand in for the daemon.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any
+
+from txt2tex.pipeline import (
+    ConversionOptions,
+    ConversionResult,
+    convert_text,
+    preload,
+)
+
+SOCKET_ENV = "TXT2TEX_SOCKET"
+CLIENT_TIMEOUT = 30.0
+
+_OPTION_NAMES = frozenset(f.name for f in fields(ConversionOptions))
+
+
+def default_socket_path() -> Path:
+    """Return ``$TXT2TEX_SOCKET``, else a per-user socket path."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "txt2tex.sock"
+    return Path(tempfile.gettempdir()) / f"txt2tex-{os.getuid()}" / "txt2tex.sock"
+
+
+def _owned_by_user(path: Path) -> bool:
+    """Whether ``path`` exists and belongs to the current user."""
+    try:
+        return path.lstat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+class ProtocolError(Exception):
+    """A malformed daemon request or response."""
+
+
+def _parse_options(raw: object) -> ConversionOptions:
+    if raw is None:
+        return ConversionOptions()
+    if not isinstance(raw, dict):
+        msg = "'options' must be an object"
+        raise ProtocolError(msg)
+    unknown = set(raw) - _OPTION_NAMES
+    if unknown:
+        msg = f"unknown option(s): {', '.join(sorted(unknown))}"
+        raise ProtocolError(msg)
+    try:
+        return ConversionOptions(**raw)
+    except TypeError as e:
+        raise ProtocolError(str(e)) from e
+
+
+def _failure(diagnostic: str, *, internal: bool = False) -> dict[str, Any]:
+    response: dict[str, Any] = {
+        "ok": False,
+        "latex": "",
+        "diagnostics": [diagnostic],
+        "warnings": [],
+        "timings": {},
+    }
+    if internal:
+        response["internal"] = True
+    return response
+
+
+def handle_request(line: bytes) -> dict[str, Any]:
+    """Answer one JSON request line (also used directly by tests)."""
+    start = time.perf_counter()
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict) or not isinstance(request.get("source"), str):
+            msg = "request must be an object with a string 'source'"
+            raise ProtocolError(msg)
+        options = _parse_options(request.get("options"))
+    except (ProtocolError, ValueError) as e:
+        return _failure(f"invalid request: {e}")
+
+    result = convert_text(request["source"], options)
+    return {
+        "ok": result.ok,
+        "latex": result.latex,
+        "diagnostics": [] if result.error is None else [result.error],
+        "warnings": list(result.warnings),
+        "timings": {"convert_ms": (time.perf_counter() - start) * 1000},
+    }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serve request lines on one connection until the client hangs up."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = handle_request(line)
+            except Exception as e:  # noqa: BLE001
+                response = _failure(f"internal error: {e!r}", internal=True)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class ConversionServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix-socket server answering conversion requests."""
+
+    daemon_threads = True
+
+
+def _daemon_running(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: Path) -> int:
+    """Run the daemon in the foreground until interrupted.
+
+    A stale socket file left by a crashed daemon is replaced; a live one is
+    an error.  A missing socket directory is created private to the user.
+    """
+    try:
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Error: cannot create {socket_path.parent}: {e}", file=sys.stderr)
+        return 1
+    if socket_path.exists():
+        if _daemon_running(socket_path):
+            print(
+                f"Error: a txt2tex daemon is already listening on {socket_path}",
+                file=sys.stderr,
+            )
+            return 1
+        socket_path.unlink()
+
+    preload()
+    with ConversionServer(str(socket_path), _RequestHandler) as server:
+        print(f"txt2tex daemon listening on {socket_path} (Ctrl-C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print()
+        finally:
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def request_conversion(
+    text: str, options: ConversionOptions, socket_path: Path
+) -> ConversionResult | None:
+    """Convert ``text`` via the daemon.
+
+    Returns:
+        The daemon's result, or None when no daemon answers or the socket
+        belongs to another user (so the caller can convert in-process).
+
+    Raises:
+        ProtocolError: If the daemon replies with something unreadable, or
+            fails internally.
+    """
+    if not _owned_by_user(socket_path):
+        return None
+    request = json.dumps({"source": text, "options": asdict(options)})
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(socket_path))
+            sock.sendall(request.encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    try:
+        response = json.loads(line)
+        diagnostics = response["diagnostics"]
+        if response.get("internal"):
+            msg = f"daemon failed: {'; '.join(diagnostics)}"
+            raise ProtocolError(msg)
+        return ConversionResult(
+            latex=response["latex"],
+            warnings=tuple(response["warnings"]),
+            error="\n".join(diagnostics) if diagnostics else None,
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        msg = f"unreadable daemon response: {e}"
+        raise ProtocolError(msg) from e
+
+
+def serve_main(argv: list[str]) -> int:
+    """Entry point for ``txt2tex serve``."""
+    parser = argparse.ArgumentParser(
+        prog="txt2tex serve",
+        description="Run a persistent txt2tex conversion daemon",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help=f"Unix socket path (default: ${SOCKET_ENV} or a per-user path)",
+    )
+    args = parser.parse_args(argv)
+    return serve(args.socket or default_socket_path())
@@ -0,0 +1,76 @@
+"""Source text with a precomputed line index.
+
+:class:`SourceFile` is built once per input and shared by everything that
+needs positions: the lexer, which tracks only an offset and derives line
+and column when it makes a token; the error formatter, which shows lines
+around an error; the token store; and overflow warnings, which quote the
+source line they refer to.
+
+Lines are separated by ``\\n`` only, matching how the lexer counts them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+
+class SourceFile:
+    """Source text plus the offset at which each of its lines starts."""
+
+    def __init__(self, text: str) -> None:
+        """Index ``text``; one pass over it with ``str.find``."""
+        self.text = text
+        starts = array("i", [0])
+        newline = text.find("\n")
+        while newline != -1:
+            starts.append(newline + 1)
+            newline = text.find("\n", newline + 1)
+        self.line_starts = starts
+        self._lines: dict[int, str] = {}
+
+    @classmethod
+    def of(cls, source: str | SourceFile) -> SourceFile:
+        """Return ``source`` itself, or a new SourceFile for a string."""
+        return source if isinstance(source, SourceFile) else cls(source)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, not counting an empty one after a final newline."""
+        if not self.text:
+            return 0
+        count = len(self.line_starts)
+        if count > 1 and self.line_starts[-1] == len(self.text):
+            count -= 1
+        return count
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Return the 1-based (line, column) of ``offset``."""
+        index = bisect_right(self.line_starts, offset) - 1
+        return index + 1, offset - self.line_starts[index] + 1
+
+    def offset(self, line: int, column: int) -> int:
+        """Return the offset of a 1-based (line, column), or -1 if no such line."""
+        if 1 <= line <= len(self.line_starts):
+            return self.line_starts[line - 1] + column - 1
+        return -1
+
+    def line(self, number: int) -> str:
+        """Return line ``number`` (1-based) without its line ending.
+
+        Lines outside the text are empty.
+        """
+        cached = self._lines.get(number)
+        if cached is not None:
+            return cached
+        if not 1 <= number <= self.line_count:
+            return ""
+        start = self.line_starts[number - 1]
+        end = (
+            self.line_starts[number] - 1
+            if number < len(self.line_starts)
+            else len(self.text)
+        )
+        text = self.text[start:end].removesuffix("\r")
+        self._lines[number] = text
+        return text
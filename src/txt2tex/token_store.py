@@ -0,0 +1,103 @@
+"""Compact struct-of-arrays storage for a token stream.
+
+A ``list[Token]`` holds one frozen dataclass per token, each with its own
+copy of the token text.  :class:`TokenStore` keeps the same stream as five
+parallel ``array('i')`` columns (type ordinal, start and end offset into
+the source, line, column) over the original source string, about 20 bytes
+per token.  ``Token`` objects are built only when indexed, and the few
+recently built ones are kept in a small direct-mapped cache, since the
+parser reads the tokens around its cursor many times over.
+
+Most token values are the exact source slice they were scanned from.  The
+rest (prose lines, ``TITLE:`` text, quoted strings, tokens the lexer
+synthesises) keep their value in a side table.
+
+``Parser`` accepts a store wherever it accepts a token list::
+
+    store = Lexer(text).tokenize_compact()
+    ast = Parser(store).parse()
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+from txt2tex.source import SourceFile
+from txt2tex.tokens import Token, TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_TYPES = tuple(TokenType)
+_ORDINAL = {token_type: ordinal for ordinal, token_type in enumerate(_TYPES)}
+_CACHE_SIZE = 64  # power of two
+
+
+class TokenStore(Sequence[Token]):
+    """Token stream stored as parallel integer columns over the source."""
+
+    def __init__(self, source: str | SourceFile, tokens: Iterable[Token]) -> None:
+        """Store ``tokens`` scanned from ``source`` (consumed lazily)."""
+        self.source = SourceFile.of(source)
+        self.types = array("i")
+        self.starts = array("i")
+        self.ends = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        self._values: dict[int, str] = {}
+        self._cache: list[Token | None] = [None] * _CACHE_SIZE
+        self._cache_index = array("i", [-1]) * _CACHE_SIZE
+        for token in tokens:
+            self.append(token)
+
+    def append(self, token: Token) -> None:
+        """Add one token at the end of the stream."""
+        index = len(self.types)
+        start = self.source.offset(token.line, token.column)
+        end = start + len(token.value)
+        if start < 0 or self.source.text[start:end] != token.value:
+            self._values[index] = token.value
+            start = end = max(start, 0)
+        self.types.append(_ORDINAL[token.type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(token.line)
+        self.columns.append(token.column)
+
+    def __len__(self) -> int:
+        """Number of tokens in the store."""
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Token]: ...
+
+    def __getitem__(self, index: int | slice) -> Token | list[Token]:
+        """Materialise the token at ``index`` (or a list for a slice)."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self.types)
+        slot = index & (_CACHE_SIZE - 1)
+        cached = self._cache[slot]
+        if cached is not None and self._cache_index[slot] == index:
+            return cached
+        token = self._materialise(index)
+        self._cache[slot] = token
+        self._cache_index[slot] = index
+        return token
+
+    def _materialise(self, index: int) -> Token:
+        token_type = _TYPES[self.types[index]]  # raises IndexError past the end
+        value = self._values.get(index)
+        if value is None:
+            value = self.source.text[self.starts[index] : self.ends[index]]
+        return Token(token_type, value, self.lines[index], self.columns[index])
+
+    def type_at(self, index: int) -> TokenType:
+        """Type of the token at ``index`` without materialising it."""
+        return _TYPES[self.types[index]]
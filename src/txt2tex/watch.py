@@ -0,0 +1,186 @@
+"""Watch mode: rebuild a document whenever its source changes.
+
+``txt2tex --watch FILE.txt`` stays in one process, so the lexer, parser and
+generator are imported once and every later cycle pays only for the work
+itself.  The source is polled with ``stat``; a changed mtime or size
+triggers a read, and the text is regenerated only when its content differs
+from the last build.  PDFs are rebuilt incrementally (latexmk without
+``-gg``), reusing the auxiliary files of the previous cycle, kept in the
+document's persistent build directory or, without one, next to the .tex.
+Between cycles the watcher keeps the previous token list, so each rebuild
+re-lexes only the edited region (see :meth:`txt2tex.lexer.Lexer.relex`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from txt2tex.compile import build_dir_for, compile_pdf, format_tex, typecheck_fuzz
+from txt2tex.lexer import IncrementalLexer
+from txt2tex.pipeline import ConversionOptions, convert_text
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from txt2tex.cache import GenerationCache
+
+DEFAULT_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class WatchOptions:
+    """Settings for a watch session."""
+
+    conversion: ConversionOptions
+    tex_only: bool = False
+    format_tex: bool = False
+    interval: float = DEFAULT_INTERVAL
+    cache: GenerationCache | None = None
+    precompiled_preamble: bool = False
+    persistent_build: bool = False
+
+
+@dataclass(frozen=True)
+class CycleReport:
+    """Timing and outcome of one rebuild cycle (milliseconds)."""
+
+    ok: bool
+    stage: str
+    generate_ms: float
+    build_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Wall time of the whole cycle."""
+        return self.generate_ms + self.build_ms
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def _failed(stage: str, generate_ms: float, build_ms: float) -> CycleReport:
+    return CycleReport(
+        ok=False, stage=stage, generate_ms=generate_ms, build_ms=build_ms
+    )
+
+
+class Watcher:
+    """Poll one source file and rebuild its outputs when it changes."""
+
+    def __init__(
+        self, input_path: Path, output_path: Path, options: WatchOptions
+    ) -> None:
+        self.input_path = input_path
+        self.output_path = output_path
+        self.options = options
+        self._last_stat: tuple[int, int] | None = None
+        self._last_digest: bytes | None = None
+        self._lexer = IncrementalLexer()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self.input_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> CycleReport | None:
+        """Rebuild if the source content changed since the last cycle.
+
+        Returns:
+            The cycle report, or None when nothing needed rebuilding.
+        """
+        current = self._stat()
+        if current is None or current == self._last_stat:
+            return None
+        self._last_stat = current
+
+        try:
+            text = self.input_path.read_text()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: cannot read {self.input_path}: {e}", file=sys.stderr)
+            return None
+        digest = hashlib.sha256(text.encode()).digest()
+        if digest == self._last_digest:
+            return None
+        self._last_digest = digest
+        return self._rebuild(text)
+
+    def _rebuild(self, text: str) -> CycleReport:
+        start = time.perf_counter()
+        result = convert_text(
+            text, self.options.conversion, self.options.cache, self._lexer
+        )
+        if result.error is not None:
+            print(result.error, file=sys.stderr)
+            return _failed("generate", _elapsed_ms(start), 0.0)
+        for warning in result.warnings:
+            print(warning, file=sys.stderr)
+        try:
+            self.output_path.write_text(result.latex)
+        except OSError as e:
+            print(f"Error writing output file: {e}", file=sys.stderr)
+            return _failed("write", _elapsed_ms(start), 0.0)
+        generate_ms = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        if self.options.format_tex:
+            format_tex(self.output_path)
+        if self.options.conversion.use_fuzz and not typecheck_fuzz(
+            self.output_path, use_cache=self.options.cache is not None
+        ):
+            return _failed("typecheck", generate_ms, _elapsed_ms(start))
+        if not self.options.tex_only and not compile_pdf(
+            self.output_path,
+            incremental=True,
+            precompiled=self.options.precompiled_preamble,
+            build_dir=(
+                build_dir_for(self.output_path)
+                if self.options.persistent_build
+                else None
+            ),
+        ):
+            return _failed("compile", generate_ms, _elapsed_ms(start))
+        return CycleReport(
+            ok=True, stage="done", generate_ms=generate_ms, build_ms=_elapsed_ms(start)
+        )
+
+    def run(self) -> int:
+        """Watch until interrupted (Ctrl-C), reporting each cycle."""
+        print(f"Watching {self.input_path} (Ctrl-C to stop)")
+        if self.options.conversion.use_fuzz and shutil.which("fuzz") is None:
+            print(
+                "Note: fuzz typechecker not found. Skipping type checking.",
+                file=sys.stderr,
+            )
+        try:
+            while True:
+                report = self.poll()
+                if report is not None:
+                    _print_report(self.output_path, report)
+                time.sleep(self.options.interval)
+        except KeyboardInterrupt:
+            print()
+        return 0
+
+
+def _print_report(output_path: Path, report: CycleReport) -> None:
+    """Print one line of per-cycle latency."""
+    stamp = time.strftime("%H:%M:%S")
+    if report.ok:
+        print(
+            f"[{stamp}] Rebuilt {output_path} in {report.total_ms:.0f} ms "
+            f"(generate {report.generate_ms:.0f} ms, "
+            f"build {report.build_ms:.0f} ms)"
+        )
+    else:
+        print(
+            f"[{stamp}] Failed at {report.stage} after {report.total_ms:.0f} ms",
+            file=sys.stderr,
+        )
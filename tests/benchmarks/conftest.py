@@ -0,0 +1,34 @@
+"""Shared helpers for the benchmark suite.
+
+Every test collected under ``tests/benchmarks`` is marked ``benchmark`` so
+the default ``pytest`` run (``-m 'not e2e and not benchmark'``) skips them.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+SRC_DIR = REPO_ROOT / "src"
+EXAMPLES_DIR = REPO_ROOT / "examples"
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Apply the ``benchmark`` marker to everything in this directory."""
+    here = Path(__file__).parent
+    for item in items:
+        if here in item.path.parents:
+            item.add_marker(pytest.mark.benchmark)
+
+
+def budget(name: str, default: float) -> float:
+    """Return a budget, overridable through the environment variable ``name``."""
+    return float(os.environ.get(name, default))
+
+
+def report(label: str, value: float, unit: str) -> None:
+    """Print one benchmark measurement (visible with ``pytest -s``)."""
+    print(f"\n[bench] {label}: {value:.2f} {unit}")
@@ -0,0 +1,75 @@
+"""Cost of interning parsed trees, and how much structure they share.
+
+Parses every example, then interns a fresh (pickled, hence uninterned)
+copy of each tree through one :class:`NodeInterner`, best of five runs.
+Reports the interning time per node and as a share of the parse time,
+and the number of distinct shapes per node: the fraction of the work a
+per-subtree cache keyed by shape still has to do.
+
+Budget: ``TXT2TEX_AST_INTERN_MAX_SHARE`` (default 0.35): interning may
+take at most this fraction of the time spent parsing.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.ast_intern import NodeInterner
+from txt2tex.ast_nodes import ASTNode
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+
+RUNS = 5
+
+
+def _parse_all() -> tuple[list[ASTNode], float]:
+    sources = [Lexer(p.read_text()).tokenize() for p in EXAMPLES_DIR.rglob("*.txt")]
+    trees: list[ASTNode] = []
+    start = time.perf_counter()
+    for tokens in sources:
+        try:
+            trees.append(Parser(tokens).parse())
+        except ParserError:
+            continue
+    return trees, time.perf_counter() - start
+
+
+def _intern_all(trees: list[ASTNode]) -> tuple[float, int, int]:
+    """Seconds to intern fresh copies of ``trees``, then nodes and shapes."""
+    copies = pickle.loads(pickle.dumps(trees))  # noqa: S301 - local data
+    interner = NodeInterner()
+    start = time.perf_counter()
+    for tree in copies:
+        interner.intern(tree)
+    elapsed = time.perf_counter() - start
+    nodes = len({id(node) for node in _nodes(copies)})
+    return elapsed, nodes, len(interner)
+
+
+def _nodes(trees: list[ASTNode]) -> list[ASTNode]:
+    found: list[ASTNode] = []
+    stack: list[object] = list(trees)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            found.append(value)
+            stack.extend(getattr(value, name) for name in value.__dataclass_fields__)
+        elif isinstance(value, tuple):
+            stack.extend(value)
+    return found
+
+
+def test_intern_examples() -> None:
+    parse = min(_parse_all()[1] for _ in range(RUNS))
+    trees, _ = _parse_all()
+    runs = [_intern_all(trees) for _ in range(RUNS)]
+    intern = min(elapsed for elapsed, _, _ in runs)
+    _, nodes, shapes = runs[0]
+
+    report(f"examples ({nodes} nodes) intern", intern / nodes * 1e6, "us/node")
+    report("examples shapes", shapes / nodes, "shapes/node")
+    share = intern / parse
+    report("examples intern / parse", share, "ratio")
+    assert share < budget("TXT2TEX_AST_INTERN_MAX_SHARE", 0.35)
@@ -0,0 +1,161 @@
+"""Memory held by an AST: slotted tuple-backed nodes versus ``__dict__`` nodes.
+
+Parses the five largest examples and a synthetic specification of more
+than 100,000 nodes, then rebuilds each tree twice under ``tracemalloc``:
+once from the node classes themselves (slots, tuple children) and once
+from plain frozen dataclasses with the same fields and ``list`` children,
+the representation the nodes had before.  Both copies share their leaf
+strings, so the difference is the node objects and their child
+containers.  Reports bytes and allocated blocks per node.
+
+Budget: ``TXT2TEX_AST_MEMORY_MAX_RATIO`` (default 0.75): the slotted tree
+must hold at most this fraction of the dict-backed tree's memory.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.ast_nodes import ASTNode, _sequence_fields
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LARGEST_EXAMPLES = 5
+MIN_SYNTHETIC_NODES = 100_000
+SYNTHETIC_BLOCKS = 2_000  # schema + axdef pairs, about 51 nodes each
+
+Factory = tuple[type, type]  # (node class to build, sequence container)
+
+_sequences = cache(_sequence_fields)
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _synthetic_spec() -> str:
+    blocks: list[str] = []
+    for i in range(SYNTHETIC_BLOCKS):
+        blocks.append(
+            f"schema State{i}\n"
+            f"  items{i} : P N\n  count{i} : N\n  f{i} : N -> N\n"
+            f"where\n"
+            f"  count{i} = # items{i}\n"
+            f"  forall x : items{i} | x > 0 land f{i}(x) >= x\n"
+            f"  {{ y : items{i} | y < count{i} . y * y }} subset N\n"
+            f"end\n"
+        )
+        blocks.append(
+            f"axdef\n  g{i} : seq N\nwhere\n"
+            f"  g{i} = <{i}, {i + 1}, {i + 2}> land # g{i} = 3\n"
+            f"end\n"
+        )
+    return "\n".join(blocks)
+
+
+def _dict_backed(cls: type, cache: dict[type, type]) -> type:
+    """A frozen dataclass with ``cls``'s fields but no slots."""
+    if cls not in cache:
+        cache[cls] = make_dataclass(
+            cls.__name__, [(f.name, f.type) for f in fields(cls)], frozen=True
+        )
+    return cache[cls]
+
+
+def _rebuild(tree: ASTNode, factory: Callable[[type], Factory]) -> tuple[object, int]:
+    """Copy ``tree`` with ``factory``'s classes; return it and its node count."""
+    count = 0
+
+    def copy(value: object) -> object:
+        nonlocal count
+        if not isinstance(value, ASTNode):
+            return value
+        count += 1
+        cls, container = factory(type(value))
+        flat, nested = _sequences(type(value))
+        args: list[object] = []
+        for name in _field_names(type(value)):
+            item = getattr(value, name)
+            if item is None:
+                args.append(item)
+            elif name in flat:
+                args.append(container(_copy_element(e, copy) for e in item))
+            elif name in nested:
+                args.append(container(container(map(copy, g)) for g in item))
+            else:
+                args.append(copy(item))
+        return cls(*args)
+
+    return copy(tree), count
+
+
+def _copy_element(element: object, copy: Callable[[object], object]) -> object:
+    if isinstance(element, tuple):  # (name, expr) pairs stay tuples
+        return tuple(map(copy, element))
+    return copy(element)
+
+
+def _retained(
+    tree: ASTNode, factory: Callable[[type], Factory]
+) -> tuple[int, int, int]:
+    """Bytes and blocks kept alive by a rebuilt copy of ``tree``, and nodes."""
+    _rebuild(tree, factory)  # create any dict-backed classes outside the trace
+    tracemalloc.start()
+    try:
+        copy, count = _rebuild(tree, factory)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    del copy
+    return sum(s.size for s in stats), sum(s.count for s in stats), count
+
+
+def _measure(label: str, trees: list[ASTNode]) -> float:
+    cache: dict[type, type] = {}
+    slotted_bytes = dict_bytes = slotted_blocks = dict_blocks = nodes = 0
+    for tree in trees:
+        size, blocks, count = _retained(tree, lambda cls: (cls, tuple))
+        slotted_bytes += size
+        slotted_blocks += blocks
+        nodes += count
+        size, blocks, _ = _retained(tree, lambda cls: (_dict_backed(cls, cache), list))
+        dict_bytes += size
+        dict_blocks += blocks
+
+    report(f"{label} ({nodes} nodes) slotted", slotted_bytes / nodes, "bytes/node")
+    report(f"{label} ({nodes} nodes) __dict__", dict_bytes / nodes, "bytes/node")
+    report(f"{label} slotted", slotted_blocks / nodes, "blocks/node")
+    report(f"{label} __dict__", dict_blocks / nodes, "blocks/node")
+    ratio = slotted_bytes / dict_bytes
+    report(f"{label} slotted / __dict__", ratio, "ratio")
+    return ratio
+
+
+def _parse(text: str) -> ASTNode:
+    return Parser(Lexer(text).tokenize()).parse()
+
+
+def test_largest_examples_memory() -> None:
+    paths = sorted(
+        EXAMPLES_DIR.rglob("*.txt"), key=lambda p: p.stat().st_size, reverse=True
+    )
+    trees = [_parse(p.read_text()) for p in paths[:LARGEST_EXAMPLES]]
+    ratio = _measure(f"{LARGEST_EXAMPLES} largest examples", trees)
+    assert ratio < budget("TXT2TEX_AST_MEMORY_MAX_RATIO", 0.75)
+
+
+def test_synthetic_spec_memory() -> None:
+    tree = _parse(_synthetic_spec())
+    _, count = _rebuild(tree, lambda cls: (cls, tuple))
+    assert count >= MIN_SYNTHETIC_NODES
+    ratio = _measure("synthetic spec", [tree])
+    assert ratio < budget("TXT2TEX_AST_MEMORY_MAX_RATIO", 0.75)
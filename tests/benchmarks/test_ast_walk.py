@@ -0,0 +1,94 @@
+"""Walking an AST through per-class child tables versus by reflection.
+
+Visits every node of the parsed examples and of a synthetic specification
+of more than 100,000 nodes twice (best of five runs each): with
+:func:`txt2tex.ast_walk.walk`, which reads only each class's child fields
+through one precomputed getter, and with the reflective walk analysis
+passes used before, which reads every dataclass field of every node and
+tests what it holds.  Both must visit the same number of nodes.
+
+Budget: ``TXT2TEX_AST_WALK_MAX_RATIO`` (default 0.8): the table walk may
+take at most this fraction of the reflective walk's time.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from tests.benchmarks.test_ast_memory import _synthetic_spec
+from txt2tex.ast_nodes import ASTNode
+from txt2tex.ast_walk import walk
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RUNS = 5
+MIN_SYNTHETIC_NODES = 100_000
+
+
+def _reflective_walk(root: ASTNode) -> int:
+    """Count ``root``'s nodes, finding children through every field."""
+    count = 0
+    stack: list[object] = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple):
+            stack.extend(cast("tuple[object, ...]", node))
+            continue
+        fields = getattr(node, "__dataclass_fields__", None)
+        if fields is None:
+            continue
+        count += 1
+        stack.extend(getattr(node, field_name) for field_name in fields)
+    return count
+
+
+def _table_walk(root: ASTNode) -> int:
+    return sum(1 for _ in walk(root))
+
+
+def _best(count: Callable[[ASTNode], int], trees: list[ASTNode]) -> tuple[float, int]:
+    best = float("inf")
+    nodes = 0
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        nodes = sum(map(count, trees))
+        best = min(best, time.perf_counter() - start)
+    return best, nodes
+
+
+def _measure(label: str, trees: list[ASTNode]) -> float:
+    reflective, nodes = _best(_reflective_walk, trees)
+    table, visited = _best(_table_walk, trees)
+    assert visited == nodes
+    report(f"{label} ({nodes} nodes) reflective", reflective / nodes * 1e6, "us/node")
+    report(f"{label} ({nodes} nodes) tables", table / nodes * 1e6, "us/node")
+    ratio = table / reflective
+    report(f"{label} tables / reflective", ratio, "ratio")
+    return ratio
+
+
+def _parse(text: str) -> ASTNode:
+    return Parser(Lexer(text).tokenize()).parse()
+
+
+def test_walk_examples() -> None:
+    trees: list[ASTNode] = []
+    for path in sorted(EXAMPLES_DIR.rglob("*.txt")):
+        try:
+            trees.append(_parse(path.read_text()))
+        except ParserError:
+            continue
+    ratio = _measure("examples", trees)
+    assert ratio < budget("TXT2TEX_AST_WALK_MAX_RATIO", 0.8)
+
+
+def test_walk_synthetic_spec() -> None:
+    tree = _parse(_synthetic_spec())
+    assert _table_walk(tree) >= MIN_SYNTHETIC_NODES
+    ratio = _measure("synthetic spec", [tree])
+    assert ratio < budget("TXT2TEX_AST_WALK_MAX_RATIO", 0.8)
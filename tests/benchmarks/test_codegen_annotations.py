@@ -0,0 +1,87 @@
+"""Cost of a generator subtree query against the size of the subtree.
+
+``_has_line_breaks`` and ``_expression_contains_dat_construct`` are
+answered from the annotation table ``generate_document`` fills in one
+pass, so asking about a 2,000-operand predicate should cost the same as
+asking about a 4-operand one.  Each pair of queries is timed on both
+(best of five runs).  The annotation pass itself is timed per node over
+the examples corpus.
+
+Budget: ``TXT2TEX_ANNOTATION_QUERY_MAX_RATIO`` (default 3.0): a query on
+the large subtree may cost at most this many times one on the small one.
+"""
+
+from __future__ import annotations
+
+import time
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.ast_nodes import ASTNode, BinaryOp, Document
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+
+RUNS = 5
+QUERIES = 2000
+SMALL, LARGE = 4, 2000
+
+
+def _chain(operands: int) -> str:
+    return " land ".join(f"x{i} > {i}" for i in range(operands)) + "\n"
+
+
+def _per_query(operands: int) -> float:
+    document = Parser(Lexer(_chain(operands)).tokenize()).parse()
+    assert isinstance(document, Document)
+    expr = document.items[0]
+    assert isinstance(expr, BinaryOp)
+    generator = LaTeXGenerator()
+    generator.generate_document(expr)
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            generator._has_line_breaks(expr)
+            generator._expression_contains_dat_construct(expr)
+        best = min(best, time.perf_counter() - start)
+    return best / QUERIES
+
+
+def _annotation_pass() -> tuple[float, int]:
+    """Best seconds to annotate every example, and the nodes annotated."""
+    trees: list[ASTNode] = []
+    for path in EXAMPLES_DIR.rglob("*.txt"):
+        try:
+            trees.append(Parser(Lexer(path.read_text()).tokenize()).parse())
+        except ParserError:
+            continue
+    generator = LaTeXGenerator()
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for tree in trees:
+            generator._annotations.clear()
+            generator._annotations.annotate(tree)
+        best = min(best, time.perf_counter() - start)
+    nodes = 0
+    for tree in trees:
+        generator._annotations.clear()
+        generator._annotations.annotate(tree)
+        nodes += len(generator._annotations)
+    return best, nodes
+
+
+def test_query_cost_independent_of_subtree_size() -> None:
+    small = _per_query(SMALL)
+    large = _per_query(LARGE)
+    report(f"{SMALL}-operand predicate", small * 1e6, "us/query pair")
+    report(f"{LARGE}-operand predicate", large * 1e6, "us/query pair")
+    ratio = large / small
+    report(f"{LARGE} / {SMALL} operands", ratio, "ratio")
+    assert ratio < budget("TXT2TEX_ANNOTATION_QUERY_MAX_RATIO", 3.0)
+
+
+def test_annotation_pass_over_examples() -> None:
+    elapsed, annotated = _annotation_pass()
+    report(f"examples ({annotated} distinct subtrees)", elapsed * 1e3, "ms")
+    report("examples annotation", elapsed / annotated * 1e6, "us/subtree")
@@ -0,0 +1,63 @@
+"""Cost per level of deeply nested operator chains, quantifiers, lambdas,
+conditionals, parentheses, set literals and applications, end to end.
+
+Parsing, LaTeX generation and the free-variable walk run from explicit
+stacks, so a level of nesting should cost the same at depth 10,000 as at
+depth 1,000.  Each chain is lexed, parsed, generated and walked at both
+depths and the time per level compared (best of three runs).
+
+Budget: ``TXT2TEX_DEEP_NESTING_MAX_RATIO`` (default 3.0): a level at depth
+10,000 may cost at most this many times a level at depth 1,000.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tests.benchmarks.conftest import budget, report
+from txt2tex.ast_nodes import Document
+from txt2tex.free_vars import expr_free_vars
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+RUNS = 3
+SHALLOW, DEEP = 1_000, 10_000
+
+SHAPES = {
+    "implies": lambda n: " => ".join(f"p{i}" for i in range(n)),
+    "land": lambda n: " land ".join(f"p{i}" for i in range(n)),
+    "lnot": lambda n: "lnot " * n + "p",
+    "arrow": lambda n: " -> ".join(f"A{i}" for i in range(n)),
+    "forall": lambda n: "".join(f"forall x{i} : N | " for i in range(n)) + "p",
+    "parens": lambda n: "(" * n + "p" + "".join(f" land q{i})" for i in range(n)),
+    "lambda": lambda n: "".join(f"lambda x{i} : N . " for i in range(n)) + "x0",
+    "if_else": lambda n: "".join(f"if x = {i} then {i} else " for i in range(n)) + "0",
+    "set": lambda n: "{" * n + "x" + "}" * n,
+    "application": lambda n: "f(a, " * n + "x" + ")" * n,
+}
+
+
+def _per_level(source: str, depth: int) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        ast = Parser(Lexer(source).tokenize()).parse()
+        LaTeXGenerator().generate_document(ast)
+        assert not isinstance(ast, Document)
+        expr_free_vars(ast)
+        best = min(best, time.perf_counter() - start)
+    return best / depth
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_deep_nesting_scales_linearly(name: str) -> None:
+    shape = SHAPES[name]
+    shallow = _per_level(shape(SHALLOW), SHALLOW)
+    deep = _per_level(shape(DEEP), DEEP)
+
+    report(f"{name} depth {SHALLOW}", shallow * 1e6, "us/level")
+    report(f"{name} depth {DEEP}", deep * 1e6, "us/level")
+    assert deep / shallow < budget("TXT2TEX_DEEP_NESTING_MAX_RATIO", 3.0)
@@ -0,0 +1,90 @@
+"""Parser calls per operand in long ``land``/``lor`` chains and schema predicates.
+
+The binary-operator levels are parsed by one precedence-climbing loop, so
+an operand costs the same handful of parser calls whatever level its
+operator sits at, instead of one call per grammar level between
+``_parse_iff`` and ``_parse_atom``.  Calls into the parser modules are
+counted with :func:`sys.setprofile`, which is exact and machine
+independent; parse time per token is reported alongside (best of five
+runs).
+
+Budget: ``TXT2TEX_EXPR_MAX_CALLS_PER_OPERAND`` (default 60; the
+one-method-per-level parser made about 85).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.conftest import budget, report
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType
+
+RUNS = 5
+OPERANDS = 2000
+PREDICATES = 300
+
+
+def _chain(op: str) -> tuple[str, int]:
+    return f" {op} ".join(f"p{i}" for i in range(OPERANDS)), OPERANDS
+
+
+def _schema() -> tuple[str, int]:
+    predicates = "\n".join(
+        f"x{i} elem S union T land y{i} <= {i}" for i in range(PREDICATES)
+    )
+    return f"schema Big\nwhere\n{predicates}\nend\n", 5 * PREDICATES
+
+
+def _parser_calls(source: str) -> int:
+    tokens = Lexer(source).tokenize()
+    calls = 0
+
+    def profile(frame: FrameType, event: str, _arg: object) -> None:
+        nonlocal calls
+        if event == "call" and "parser" in frame.f_code.co_filename:
+            calls += 1
+
+    sys.setprofile(profile)
+    try:
+        Parser(tokens).parse()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def _per_token(source: str) -> float:
+    tokens = Lexer(source).tokenize()
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        Parser(tokens).parse()
+        best = min(best, time.perf_counter() - start)
+    return best / len(tokens)
+
+
+@pytest.mark.parametrize(
+    ("name", "shape"),
+    [
+        ("land chain", lambda: _chain("land")),
+        ("lor chain", lambda: _chain("lor")),
+        ("schema predicates", _schema),
+    ],
+)
+def test_parser_calls_per_operand(
+    name: str, shape: Callable[[], tuple[str, int]]
+) -> None:
+    source, operands = shape()
+    per_operand = _parser_calls(source) / operands
+
+    report(f"{name} parse", _per_token(source) * 1e6, "us/token")
+    report(f"{name} parser calls", per_operand, "per operand")
+    assert per_operand < budget("TXT2TEX_EXPR_MAX_CALLS_PER_OPERAND", 60)
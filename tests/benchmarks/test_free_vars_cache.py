@@ -0,0 +1,113 @@
+"""Free variables of nested binder domains, recomputed versus memoized.
+
+When the generator collapses a chain of nested quantifiers into one
+schema text, it asks for the free variables of the domain at every
+level.  When each level's domain contains the previous one (``forall x0
+: s0 | forall x1 : s0 union {s1} | ...``), walking every domain from
+scratch visits the earlier domains again at each level: quadratic in the
+chain length.  :class:`txt2tex.free_vars.FreeVariables` reuses the set it
+cached for the previous domain instead.  A parsed 300-level chain is
+collapsed with ``LaTeXGenerator._collect_quantifier_chain`` and the time
+spent in its free-variable queries is measured both ways (best of three
+runs); the memoized cost per level is compared between 30 and 300
+levels.
+
+Budget: ``TXT2TEX_FREE_VARS_CACHED_MAX_RATIO`` (default 0.1): the
+memoized queries may take at most this fraction of the recomputed ones.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.conftest import budget, report
+from txt2tex.ast_nodes import Quantifier
+from txt2tex.free_vars import FreeVariables, expr_free_vars
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from txt2tex.ast_nodes import Expr
+
+RUNS = 3
+LEVELS = 300
+SHORT = 30
+
+
+@functools.cache
+def _chain(levels: int) -> Quantifier:
+    """Parse a ``levels``-deep forall chain, each domain extending the last."""
+    domain = "s0"
+    binders = []
+    for i in range(levels):
+        if i:
+            domain = f"{domain} union {{s{i}}}"
+        binders.append(f"forall x{i} : {domain} | ")
+    root = Parser(Lexer("".join(binders) + "p").tokenize()).parse()
+    assert isinstance(root, Quantifier)
+    return root
+
+
+class _Timed:
+    """A free-variable query that adds up the time spent answering it."""
+
+    def __init__(self, free_vars: Callable[[Expr], frozenset[str]]) -> None:
+        self.free_vars = free_vars
+        self.seconds = 0.0
+
+    def __call__(self, expr: Expr) -> frozenset[str]:
+        start = time.perf_counter()
+        try:
+            return self.free_vars(expr)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+def _best(query: Callable[[], Callable[[Expr], frozenset[str]]], levels: int) -> float:
+    """Best time spent in the queries of collapsing a ``levels``-deep chain."""
+    root = _chain(levels)
+    best = float("inf")
+    for _ in range(RUNS):
+        generator = LaTeXGenerator()
+        generator._free_vars = timed = _Timed(query())  # type: ignore[assignment]
+        bindings, _, _, _ = generator._collect_quantifier_chain(root)
+        assert len(bindings) == levels
+        best = min(best, timed.seconds)
+    return best
+
+
+def _recomputed(levels: int) -> float:
+    return _best(lambda: expr_free_vars, levels)
+
+
+def _memoized(levels: int) -> float:
+    return _best(FreeVariables, levels)
+
+
+def test_memoized_nested_domains() -> None:
+    innermost = _chain(LEVELS)
+    while isinstance(innermost.body, Quantifier):
+        innermost = innermost.body
+    assert innermost.domain is not None
+    assert FreeVariables()(innermost.domain) == expr_free_vars(innermost.domain)
+    recomputed = _recomputed(LEVELS)
+    memoized = _memoized(LEVELS)
+    report(f"{LEVELS}-level chain recomputed", recomputed * 1e3, "ms")
+    report(f"{LEVELS}-level chain memoized", memoized * 1e3, "ms")
+    ratio = memoized / recomputed
+    report(f"{LEVELS}-level chain memoized / recomputed", ratio, "ratio")
+    assert ratio < budget("TXT2TEX_FREE_VARS_CACHED_MAX_RATIO", 0.1)
+
+
+def test_memoized_cost_per_level() -> None:
+    for label, measure in (("recomputed", _recomputed), ("memoized", _memoized)):
+        per_short = measure(SHORT) / SHORT
+        per_long = measure(LEVELS) / LEVELS
+        report(f"{SHORT} levels {label}", per_short * 1e6, "us/level")
+        report(f"{LEVELS} levels {label}", per_long * 1e6, "us/level")
+        report(f"{LEVELS} / {SHORT} levels {label}", per_long / per_short, "ratio")
@@ -0,0 +1,76 @@
+"""Cold-start import budget for the CLI.
+
+Runs ``python -X importtime`` in a fresh interpreter for the light CLI
+modes and checks that they neither import the pipeline (lexer, parser,
+code generator, REPL/readline) nor exceed the cumulative import budget.
+
+Budget: ``TXT2TEX_IMPORT_BUDGET_MS`` (default 150 ms of total import time
+for the whole run, interpreter start-up included, best of three runs).
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.benchmarks.conftest import SRC_DIR, budget, report
+
+HEAVY_MODULES = (
+    "txt2tex.latex_gen",
+    "txt2tex.parser",
+    "txt2tex.lexer",
+    "txt2tex.ast_nodes",
+    "txt2tex.repl",
+    "readline",
+)
+RUNS = 3
+
+
+def _import_profile(cli_args: list[str]) -> dict[str, int]:
+    """Return cumulative import time (us) per module imported by a CLI run.
+
+    The ``""`` key holds the total over top-level imports.
+    """
+    code = (
+        "import sys\n"
+        f"sys.argv = ['txt2tex', *{cli_args!r}]\n"
+        "from txt2tex.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "PATH": ""}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    profile: dict[str, int] = {"": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue  # column header
+        profile[name.strip()] = int(cumulative)
+        if not name.startswith("  "):
+            profile[""] += int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("mode", ["--version", "--help", "--check-env"])
+def test_light_modes_import_budget(mode: str) -> None:
+    profiles = [_import_profile([mode]) for _ in range(RUNS)]
+    for profile in profiles:
+        loaded = sorted(set(HEAVY_MODULES) & set(profile))
+        assert not loaded, f"{mode} imported {loaded}"
+
+    best_ms = min(profile[""] for profile in profiles) / 1000
+    report(f"txt2tex {mode} imports", best_ms, "ms")
+    assert best_ms < budget("TXT2TEX_IMPORT_BUDGET_MS", 150.0)
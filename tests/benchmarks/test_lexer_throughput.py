@@ -0,0 +1,32 @@
+"""Lexer throughput over the examples corpus.
+
+Tokenizes every ``examples/**/*.txt`` file and reports megabytes of
+source per second (best of five runs).
+
+Budget: ``TXT2TEX_LEXER_MIN_MBPS`` (default 0.5 MB/s).
+"""
+
+from __future__ import annotations
+
+import time
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.lexer import Lexer
+
+RUNS = 5
+
+
+def test_lexer_throughput() -> None:
+    texts = [path.read_text() for path in sorted(EXAMPLES_DIR.rglob("*.txt"))]
+    size_mb = sum(len(text.encode()) for text in texts) / 1e6
+
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for text in texts:
+            Lexer(text).tokenize()
+        best = min(best, time.perf_counter() - start)
+
+    throughput = size_mb / best
+    report(f"lexer over {len(texts)} examples ({size_mb:.2f} MB)", throughput, "MB/s")
+    assert throughput > budget("TXT2TEX_LEXER_MIN_MBPS", 0.5)
@@ -0,0 +1,97 @@
+"""Cost of a parser lookahead query against the distance it looks.
+
+``_scan_for_colon_before_newline``, ``_bracket_contains_slash`` and the
+other lookahead helpers answer from a :class:`TokenIndex` built once per
+token list, so a query should cost the same whether the answer is two
+tokens away or two thousand.  Each query is timed at the start of a
+short and a long line (best of five runs) and the per-query times
+compared.  Lines are indexed on first query, so the share of the examples
+corpus that ever gets indexed is reported too.
+
+Budget: ``TXT2TEX_LOOKAHEAD_MAX_RATIO`` (default 3.0): a query over the
+long line may cost at most this many times one over the short line.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RUNS = 5
+QUERIES = 2000
+SHORT, LONG = 4, 2000
+
+
+def _declaration(names: int) -> str:
+    return ", ".join(f"x{i}" for i in range(names)) + " : N\n"
+
+
+def _rename(pairs: int) -> str:
+    renames = ", ".join(f"a{i}[X] cross b{i}" for i in range(pairs))
+    return f"S[{renames}, new/old]\n"
+
+
+def _blank_run(newlines: int) -> str:
+    return "R" + "\n" * newlines + "cross S\n"
+
+
+SHAPES: dict[str, tuple[Callable[[int], str], Callable[[Parser], bool]]] = {
+    "colon before newline": (
+        _declaration,
+        lambda p: p._scan_for_colon_before_newline(),
+    ),
+    "bracket contains slash": (_rename, lambda p: p._bracket_contains_slash()),
+    "cross op after newlines": (
+        _blank_run,
+        lambda p: p._next_non_newline_is_cross_op(),
+    ),
+}
+
+
+def _per_query(source: str, query: Callable[[Parser], bool], start: int) -> float:
+    parser = Parser(Lexer(source).tokenize())
+    parser.pos = start
+    query(parser)  # build the index outside the timed loop
+    best = float("inf")
+    for _ in range(RUNS):
+        begin = time.perf_counter()
+        for _ in range(QUERIES):
+            query(parser)
+        best = min(best, time.perf_counter() - begin)
+    return best / QUERIES
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_lookahead_cost_is_flat(name: str) -> None:
+    build, query = SHAPES[name]
+    start = 1 if name == "bracket contains slash" else 0  # at the '['
+    short = _per_query(build(SHORT), query, start)
+    long = _per_query(build(LONG), query, start)
+
+    report(f"{name} short line", short * 1e9, "ns/query")
+    report(f"{name} long line", long * 1e9, "ns/query")
+    assert long / short < budget("TXT2TEX_LOOKAHEAD_MAX_RATIO", 3.0)
+
+
+def test_examples_index_few_tokens() -> None:
+    indexed = total = 0
+    for path in sorted(EXAMPLES_DIR.rglob("*.txt")):
+        parser = Parser(Lexer(path.read_text()).tokenize())
+        try:
+            parser.parse()
+        except ParserError:
+            continue
+        index = parser._token_index()
+        assert index is not None
+        indexed += sum(index._indexed)
+        total += len(parser.tokens)
+    report("examples tokens indexed", 100 * indexed / total, "%")
@@ -0,0 +1,71 @@
+"""Parse cost of deeply nested ``{ {...} }`` set expressions.
+
+``_parse_set`` parses a first element speculatively and rewinds when it
+turns out to start a comprehension, so a rule that re-parsed what it
+rewound over would make nesting cost grow faster than the input.  Each
+shape is parsed at depth 5 and depth 40 and the time per token compared
+(best of five runs).
+
+Budget: ``TXT2TEX_NESTED_SET_MAX_RATIO`` (default 3.0): parsing a token at
+depth 40 may cost at most this many times a token at depth 5.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.conftest import budget, report
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from txt2tex.tokens import Token
+
+RUNS = 5
+SHALLOW, DEEP = 5, 40
+
+
+def _literal(depth: int) -> str:
+    return "x = " + "{ " * depth + "1" + ", 2 }" * depth
+
+
+def _comprehension(depth: int) -> str:
+    heads = "".join(f"{{ x{i} : " for i in range(depth))
+    tails = "".join(f" | x{i} > 0 }}" for i in reversed(range(depth)))
+    return f"x = {heads}N{tails}"
+
+
+def _multi_variable(depth: int) -> str:
+    heads = "".join(f"{{ a{i}, b{i} : " for i in range(depth))
+    tails = "".join(f" | a{i} = b{i} }}" for i in reversed(range(depth)))
+    return f"x = {heads}N{tails}"
+
+
+def _per_token(tokens: list[Token]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        Parser(tokens).parse()
+        best = min(best, time.perf_counter() - start)
+    return best / len(tokens)
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [_literal, _comprehension, _multi_variable],
+    ids=["literal", "comprehension", "multi_variable"],
+)
+def test_nested_set_parse_scales_linearly(shape: Callable[[int], str]) -> None:
+    shallow = _per_token(Lexer(shape(SHALLOW)).tokenize())
+    deep = _per_token(Lexer(shape(DEEP)).tokenize())
+
+    name = shape.__name__.lstrip("_")
+    report(f"{name} depth {DEEP}", deep * 1e6, "us/token")
+    ratio = deep / shallow
+    report(f"{name} depth {DEEP} / depth {SHALLOW}", ratio, "ratio")
+    assert ratio < budget("TXT2TEX_NESTED_SET_MAX_RATIO", 3.0)
@@ -0,0 +1,70 @@
+"""Wall time of ``Parser.parse_parallel`` against ``Parser.parse``.
+
+A synthetic document of many sections, each holding several solutions, is
+parsed serially and through a process pool of one worker per CPU (at
+most four), best of three runs.  The pool is started before timing, as a
+long-running front end would keep it.  On one CPU the ratio measures the
+cost of shipping token slices and ASTs between processes; with more
+CPUs it should fall well below 1.
+
+Budget: ``TXT2TEX_PARALLEL_PARSE_MAX_RATIO`` (default 2.5): the parallel
+parse may take at most this many times the serial parse.  The default
+holds on one CPU, where the transfer costs about 0.6x of the serial
+parse on top of it; set it below 1 on a multi-core machine.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.conftest import budget, report
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RUNS = 3
+SECTIONS = 40
+SOLUTIONS = 8
+
+
+def _document() -> str:
+    blocks: list[str] = []
+    for section in range(SECTIONS):
+        blocks.append(f"=== Section {section} ===\n")
+        for solution in range(SOLUTIONS):
+            n = section * SOLUTIONS + solution
+            blocks.append(
+                f"** Solution {n} **\n\n"
+                f"(a) forall x{n} : N | x{n} > 0 land x{n} elem S union T\n\n"
+                f"(b) {{ y : N | y < {n} . y * y }} subset N\n\n"
+                f"axdef\n  f{n} : N -> N\nwhere\n  f{n}(0) = {n}\nend\n"
+            )
+    return "\n".join(blocks)
+
+
+def _best(parse: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        parse()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_parallel_parse_wall_time() -> None:
+    tokens = Lexer(_document()).tokenize()
+    workers = min(4, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        Parser(tokens).parse_parallel(executor=pool)  # warm the workers
+        serial = _best(lambda: Parser(tokens).parse())
+        parallel = _best(lambda: Parser(tokens).parse_parallel(executor=pool))
+
+    report("serial parse", serial * 1e3, "ms")
+    report(f"parallel parse ({workers} workers)", parallel * 1e3, "ms")
+    report("parallel / serial", parallel / serial, "x")
+    assert parallel / serial < budget("TXT2TEX_PARALLEL_PARSE_MAX_RATIO", 2.5)
@@ -0,0 +1,45 @@
+"""Memory held by a token stream: ``list[Token]`` versus ``TokenStore``.
+
+Tokenizes the examples corpus (concatenated into one source) both ways
+and reports the bytes each representation keeps alive per token, as
+measured by ``tracemalloc`` (the source string itself is not counted).
+
+Budget: ``TXT2TEX_TOKEN_STORE_MAX_RATIO`` (default 0.5): the store must
+hold at most this fraction of the list's memory.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.conftest import EXAMPLES_DIR, budget, report
+from txt2tex.lexer import Lexer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sized
+
+
+def _retained(build: Callable[[], Sized]) -> tuple[int, int]:
+    """Bytes still allocated after ``build`` returns, and the token count."""
+    tracemalloc.start()
+    try:
+        tokens = build()
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained, len(tokens)
+
+
+def test_token_store_memory() -> None:
+    text = "\n".join(path.read_text() for path in sorted(EXAMPLES_DIR.rglob("*.txt")))
+
+    list_bytes, count = _retained(lambda: Lexer(text).tokenize())
+    store_bytes, store_count = _retained(lambda: Lexer(text).tokenize_compact())
+    assert store_count == count
+
+    report(f"list[Token] ({count} tokens)", list_bytes / count, "bytes/token")
+    report(f"TokenStore ({count} tokens)", store_bytes / count, "bytes/token")
+    ratio = store_bytes / list_bytes
+    report("TokenStore / list[Token]", ratio, "ratio")
+    assert ratio < budget("TXT2TEX_TOKEN_STORE_MAX_RATIO", 0.5)
@@ -1,7 +1,17 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to Python path for test discovery
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_generation_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep CLI tests from reading or populating the user's cache."""
+    monkeypatch.setenv("TXT2TEX_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
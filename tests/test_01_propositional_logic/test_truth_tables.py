@@ -25,7 +25,7 @@ class TestTruthTableParsing:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, Document)
-        assert ast.items == []
+        assert ast.items == ()
 
     def test_single_expression_returns_expr(self) -> None:
         """Test that single expression still returns Expr (backward compatible)."""
@@ -246,8 +246,8 @@ def test_simple_truth_table() -> None:
     """Test basic truth table with two columns."""
     text = "\nTRUTH TABLE:\np | lnot p\nT | F\nF | T\n"
     table = parse_truth_table(text)
-    assert table.headers == ["p", "lnot p"]
-    assert table.rows == [["T", "F"], ["F", "T"]]
+    assert table.headers == ("p", "lnot p")
+    assert table.rows == (("T", "F"), ("F", "T"))
 
 
 def test_truth_table_with_and() -> None:
@@ -256,10 +256,10 @@ def test_truth_table_with_and() -> None:
         "\nTRUTH TABLE:\np | q | p land q\nT | T | T\nT | F | F\nF | T | F\nF | F | F\n"
     )
     table = parse_truth_table(text)
-    assert table.headers == ["p", "q", "p land q"]
+    assert table.headers == ("p", "q", "p land q")
     assert len(table.rows) == 4
-    assert table.rows[0] == ["T", "T", "T"]
-    assert table.rows[3] == ["F", "F", "F"]
+    assert table.rows[0] == ("T", "T", "T")
+    assert table.rows[3] == ("F", "F", "F")
 
 
 def test_truth_table_with_implies() -> None:
@@ -268,7 +268,7 @@ def test_truth_table_with_implies() -> None:
         "\nTRUTH TABLE:\np | q | p => q\nT | T | T\nT | F | F\nF | T | T\nF | F | T\n"
     )
     table = parse_truth_table(text)
-    assert table.headers == ["p", "q", "p => q"]
+    assert table.headers == ("p", "q", "p => q")
     assert len(table.rows) == 4
 
 
@@ -287,8 +287,8 @@ def test_truth_table_with_lowercase() -> None:
     """Test truth table with lowercase t/f values."""
     text = "\nTRUTH TABLE:\np | q\nt | t\nt | f\nf | t\nf | f\n"
     table = parse_truth_table(text)
-    assert table.rows[0] == ["T", "T"]
-    assert table.rows[1] == ["T", "F"]
+    assert table.rows[0] == ("T", "T")
+    assert table.rows[1] == ("T", "F")
 
 
 def test_truth_table_with_iff() -> None:
@@ -297,9 +297,9 @@ def test_truth_table_with_iff() -> None:
         "\nTRUTH TABLE:\np | q | p <=> q\nT | T | T\nT | F | F\nF | T | F\nF | F | T\n"
     )
     table = parse_truth_table(text)
-    assert table.headers == ["p", "q", "p <=> q"]
-    assert table.rows[0] == ["T", "T", "T"]
-    assert table.rows[1] == ["T", "F", "F"]
+    assert table.headers == ("p", "q", "p <=> q")
+    assert table.rows[0] == ("T", "T", "T")
+    assert table.rows[1] == ("T", "F", "F")
 
 
 def test_truth_table_latex_generation() -> None:
@@ -325,9 +325,9 @@ def test_truth_table_with_or() -> None:
         "\nTRUTH TABLE:\np | q | p lor q\nT | T | T\nT | F | T\nF | T | T\nF | F | F\n"
     )
     table = parse_truth_table(text)
-    assert table.headers == ["p", "q", "p lor q"]
-    assert table.rows[0] == ["T", "T", "T"]
-    assert table.rows[3] == ["F", "F", "F"]
+    assert table.headers == ("p", "q", "p lor q")
+    assert table.rows[0] == ("T", "T", "T")
+    assert table.rows[3] == ("F", "F", "F")
 
 
 def test_truth_table_with_not() -> None:
@@ -348,15 +348,15 @@ def test_truth_table_three_variables() -> None:
     table = parse_truth_table(text)
     assert len(table.headers) == 4
     assert len(table.rows) == 8
-    assert table.rows[0] == ["T", "T", "T", "T"]
-    assert table.rows[7] == ["F", "F", "F", "F"]
+    assert table.rows[0] == ("T", "T", "T", "T")
+    assert table.rows[7] == ("F", "F", "F", "F")
 
 
 def test_truth_table_f_token() -> None:
     """Test that F token (from FINSET) works in truth tables."""
     text = "\nTRUTH TABLE:\np | q\nF | F\nF | T\nT | F\nT | T\n"
     table = parse_truth_table(text)
-    assert table.rows[0] == ["F", "F"]
-    assert table.rows[1] == ["F", "T"]
-    assert table.rows[2] == ["T", "F"]
-    assert table.rows[3] == ["T", "T"]
+    assert table.rows[0] == ("F", "F")
+    assert table.rows[1] == ("F", "T")
+    assert table.rows[2] == ("T", "F")
+    assert table.rows[3] == ("T", "T")
@@ -23,7 +23,7 @@ def test_simple_tuple_pattern_forall():
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
     assert quant.quantifier == "forall"
-    assert quant.variables == ["x", "y"]
+    assert quant.variables == ("x", "y")
     assert isinstance(quant.tuple_pattern, Tuple)
     assert len(quant.tuple_pattern.elements) == 2
     assert isinstance(quant.tuple_pattern.elements[0], Identifier)
@@ -41,7 +41,7 @@ def test_tuple_pattern_with_three_variables():
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
     assert quant.quantifier == "exists"
-    assert quant.variables == ["a", "b", "c"]
+    assert quant.variables == ("a", "b", "c")
     assert isinstance(quant.tuple_pattern, Tuple)
     assert len(quant.tuple_pattern.elements) == 3
 
@@ -68,7 +68,7 @@ def test_tuple_pattern_with_complex_domain():
     parser = Parser(tokens)
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
-    assert quant.variables == ["x", "y"]
+    assert quant.variables == ("x", "y")
     assert quant.tuple_pattern is not None
 
 
@@ -81,7 +81,7 @@ def test_tuple_pattern_exists1():
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
     assert quant.quantifier == "exists1"
-    assert quant.variables == ["x", "y"]
+    assert quant.variables == ("x", "y")
     assert quant.tuple_pattern is not None
 
 
@@ -127,7 +127,7 @@ def test_regular_quantifier_still_works():
     parser = Parser(tokens)
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
-    assert quant.variables == ["x"]
+    assert quant.variables == ("x",)
     assert quant.tuple_pattern is None
 
 
@@ -139,7 +139,7 @@ def test_multi_variable_quantifier_still_works():
     parser = Parser(tokens)
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
-    assert quant.variables == ["x", "y"]
+    assert quant.variables == ("x", "y")
     assert quant.tuple_pattern is None
 
 
@@ -152,12 +152,12 @@ def test_tuple_pattern_in_nested_quantifier():
     outer_quant = parser.parse()
     assert isinstance(outer_quant, Quantifier)
     assert outer_quant.quantifier == "forall"
-    assert outer_quant.variables == ["x", "y"]
+    assert outer_quant.variables == ("x", "y")
     assert outer_quant.tuple_pattern is not None
     inner_quant = outer_quant.body
     assert isinstance(inner_quant, Quantifier)
     assert inner_quant.quantifier == "exists"
-    assert inner_quant.variables == ["z"]
+    assert inner_quant.variables == ("z",)
 
 
 def test_tuple_pattern_with_constrained_quantifier():
@@ -168,7 +168,7 @@ def test_tuple_pattern_with_constrained_quantifier():
     parser = Parser(tokens)
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
-    assert quant.variables == ["x", "y"]
+    assert quant.variables == ("x", "y")
     assert quant.tuple_pattern is not None
 
 
@@ -207,7 +207,7 @@ def test_realistic_example_from_spec():
     quant = parser.parse()
     assert isinstance(quant, Quantifier)
     assert quant.quantifier == "forall"
-    assert quant.variables == ["b", "c"]
+    assert quant.variables == ("b", "c")
     assert quant.tuple_pattern is not None
     generator = LaTeXGenerator(use_fuzz=False)
     latex = generator.generate_expr(quant)
@@ -162,7 +162,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert ast.domain is None
         assert isinstance(ast.body, BinaryOp)
 
@@ -174,7 +174,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
 
@@ -186,7 +186,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists"
-        assert ast.variables == ["y"]
+        assert ast.variables == ("y",)
 
     def test_quantifier_multi_variable(self) -> None:
         """Test parsing forall with multiple variables."""
@@ -196,7 +196,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x", "y"]
+        assert ast.variables == ("x", "y")
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
 
@@ -208,7 +208,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists1"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
 
     def test_quantifier_multi_variable_no_domain(self) -> None:
         """Test parsing multi-variable quantifier without domain."""
@@ -218,7 +218,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists"
-        assert ast.variables == ["x", "y"]
+        assert ast.variables == ("x", "y")
         assert ast.domain is None
 
     def test_complex_quantified_expr(self) -> None:
@@ -611,7 +611,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.body, BinaryOp)
@@ -631,7 +631,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists"
-        assert ast.variables == ["y"]
+        assert ast.variables == ("y",)
         assert ast.expression is not None
         gen = LaTeXGenerator()
         latex = gen.generate_expr(ast)
@@ -646,7 +646,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists1"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert ast.expression is not None
         gen = LaTeXGenerator()
         latex = gen.generate_expr(ast)
@@ -662,7 +662,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x", "y"]
+        assert ast.variables == ("x", "y")
         assert ast.expression is not None
         gen = LaTeXGenerator()
         latex = gen.generate_expr(ast)
@@ -735,7 +735,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["e_1", "e_2"]
+        assert ast.variables == ("e_1", "e_2")
         assert ast.expression is not None
         assert isinstance(ast.body, BinaryOp)
         assert ast.body.operator == "land"
@@ -757,7 +757,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.body, BinaryOp)
         assert ast.body.operator == ">"
         assert isinstance(ast.expression, BinaryOp)
@@ -783,7 +783,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.body, BinaryOp)
         assert ast.body.operator == ">"
         assert isinstance(ast.expression, BinaryOp)
@@ -802,7 +802,7 @@ class TestBulletSeparator:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["r"]
+        assert ast.variables == ("r",)
         # Body should be the constraint (r elem ran hd)
         assert isinstance(ast.body, BinaryOp)
         assert ast.body.operator == "elem"
@@ -86,7 +86,7 @@ class TestParser:
         assert len(ast.items) == 1
         given = ast.items[0]
         assert isinstance(given, GivenType)
-        assert given.names == ["Person"]
+        assert given.names == ("Person",)
 
     def test_given_type_multiple(self) -> None:
         """Test parsing given type with multiple names."""
@@ -97,7 +97,7 @@ class TestParser:
         assert isinstance(ast, Document)
         given = ast.items[0]
         assert isinstance(given, GivenType)
-        assert given.names == ["Person", "Company"]
+        assert given.names == ("Person", "Company")
 
     def test_free_type_simple(self) -> None:
         """Test parsing simple free type."""
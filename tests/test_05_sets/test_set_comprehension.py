@@ -22,7 +22,7 @@ class TestSetComprehensionParsing:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, SetComprehension)
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.predicate, BinaryOp)
@@ -36,7 +36,7 @@ class TestSetComprehensionParsing:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, SetComprehension)
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.predicate, BinaryOp)
@@ -51,7 +51,7 @@ class TestSetComprehensionParsing:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, SetComprehension)
-        assert ast.variables == ["x", "y"]
+        assert ast.variables == ("x", "y")
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.predicate, BinaryOp)
@@ -64,7 +64,7 @@ class TestSetComprehensionParsing:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, SetComprehension)
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert ast.domain is None
         assert isinstance(ast.predicate, BinaryOp)
         assert ast.predicate.operator == "elem"
@@ -267,7 +267,7 @@ class TestSetComprehensionIntegration:
         parser = Parser(tokens)
         ast = parser.parse()
         assert isinstance(ast, SetComprehension)
-        assert ast.variables == ["x", "y", "z"]
+        assert ast.variables == ("x", "y", "z")
         gen = LaTeXGenerator()
         latex = gen.generate_expr(ast)
         assert "x" in latex
@@ -283,7 +283,7 @@ def test_set_comp_with_period_separator() -> None:
     parser = Parser(tokens)
     result = parser.parse()
     assert isinstance(result, SetComprehension)
-    assert result.variables == ["p"]
+    assert result.variables == ("p",)
     assert result.predicate is None
     assert result.expression is not None
 
@@ -54,7 +54,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "mu"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.body, BinaryOp)
@@ -68,7 +68,7 @@ class TestParser:
         ast = parser.parse()
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "mu"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert ast.domain is None
 
     def test_not_equal_comparison(self) -> None:
@@ -38,7 +38,7 @@ class TestGenericParameterParsing:
         assert isinstance(ast.items[0], Abbreviation)
         abbrev = ast.items[0]
         assert abbrev.name == "Pair"
-        assert abbrev.generic_params == ["X"]
+        assert abbrev.generic_params == ("X",)
 
     def test_abbreviation_with_multiple_generics(self) -> None:
         """Test parsing abbreviation with multiple generic parameters."""
@@ -53,7 +53,7 @@ class TestGenericParameterParsing:
         assert isinstance(ast.items[0], Abbreviation)
         abbrev = ast.items[0]
         assert abbrev.name == "Triple"
-        assert abbrev.generic_params == ["X", "Y", "Z"]
+        assert abbrev.generic_params == ("X", "Y", "Z")
 
     def test_axdef_without_generics(self) -> None:
         """Test parsing axiomatic definition without generics."""
@@ -90,7 +90,7 @@ end"""
         assert len(ast.items) == 1
         assert isinstance(ast.items[0], AxDef)
         axdef = ast.items[0]
-        assert axdef.generic_params == ["X"]
+        assert axdef.generic_params == ("X",)
 
     def test_axdef_with_multiple_generics(self) -> None:
         """Test parsing axdef with multiple generic parameters."""
@@ -107,7 +107,7 @@ end"""
         assert len(ast.items) == 1
         assert isinstance(ast.items[0], AxDef)
         axdef = ast.items[0]
-        assert axdef.generic_params == ["X", "Y"]
+        assert axdef.generic_params == ("X", "Y")
 
     def test_schema_without_generics(self) -> None:
         """Test parsing schema without generics."""
@@ -143,7 +143,7 @@ end"""
         assert isinstance(ast.items[0], Schema)
         schema = ast.items[0]
         assert schema.name == "Stack"
-        assert schema.generic_params == ["X"]
+        assert schema.generic_params == ("X",)
 
     def test_schema_with_multiple_generics(self) -> None:
         """Test parsing schema with multiple generic parameters."""
@@ -161,7 +161,7 @@ end"""
         assert isinstance(ast.items[0], Schema)
         schema = ast.items[0]
         assert schema.name == "Relation"
-        assert schema.generic_params == ["X", "Y"]
+        assert schema.generic_params == ("X", "Y")
 
 
 class TestGenericParameterLaTeX:
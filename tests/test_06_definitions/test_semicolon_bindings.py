@@ -34,12 +34,12 @@ class TestSemicolonQuantifiers:
         ast = parse_expr("forall x : N; y : N | x + y > 0")
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "N"
         assert isinstance(ast.body, Quantifier)
         assert ast.body.quantifier == "forall"
-        assert ast.body.variables == ["y"]
+        assert ast.body.variables == ("y",)
         assert isinstance(ast.body.domain, Identifier)
         assert ast.body.domain.name == "N"
         assert isinstance(ast.body.body, BinaryOp)
@@ -49,22 +49,22 @@ class TestSemicolonQuantifiers:
         """Test forall x : T; y : U; z : V | P."""
         ast = parse_expr("forall x : T; y : U; z : V | x = y")
         assert isinstance(ast, Quantifier)
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.body, Quantifier)
-        assert ast.body.variables == ["y"]
+        assert ast.body.variables == ("y",)
         assert isinstance(ast.body.body, Quantifier)
-        assert ast.body.body.variables == ["z"]
+        assert ast.body.body.variables == ("z",)
         assert isinstance(ast.body.body.body, BinaryOp)
 
     def test_forall_comma_and_semicolon(self):
         """Test forall x, y : T; z : U | P (mixed comma land semicolon)."""
         ast = parse_expr("forall x, y : T; z : U | x = z")
         assert isinstance(ast, Quantifier)
-        assert ast.variables == ["x", "y"]
+        assert ast.variables == ("x", "y")
         assert isinstance(ast.domain, Identifier)
         assert ast.domain.name == "T"
         assert isinstance(ast.body, Quantifier)
-        assert ast.body.variables == ["z"]
+        assert ast.body.variables == ("z",)
         assert isinstance(ast.body.domain, Identifier)
         assert ast.body.domain.name == "U"
 
@@ -73,10 +73,10 @@ class TestSemicolonQuantifiers:
         ast = parse_expr("exists x : N; y : N | x > y")
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "exists"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.body, Quantifier)
         assert ast.body.quantifier == "exists"
-        assert ast.body.variables == ["y"]
+        assert ast.body.variables == ("y",)
 
     def test_mixed_quantifiers_not_supported(self):
         """Test that we can't mix quantifier types with semicolon."""
@@ -120,16 +120,16 @@ class TestSolution40Examples:
         ast = parse_expr("forall x : Title; s : seq(Title) | x = s")
         assert isinstance(ast, Quantifier)
         assert ast.quantifier == "forall"
-        assert ast.variables == ["x"]
+        assert ast.variables == ("x",)
         assert isinstance(ast.body, Quantifier)
         assert ast.body.quantifier == "forall"
-        assert ast.body.variables == ["s"]
+        assert ast.body.variables == ("s",)
 
     def test_nested_forall_in_predicate(self):
         """Test complex nested quantifiers."""
         text = "forall r : R; i1, i2 : dom r | i1 /= i2 => true"
         ast = parse_expr(text)
         assert isinstance(ast, Quantifier)
-        assert ast.variables == ["r"]
+        assert ast.variables == ("r",)
         assert isinstance(ast.body, Quantifier)
-        assert ast.body.variables == ["i1", "i2"]
+        assert ast.body.variables == ("i1", "i2")
@@ -93,7 +93,7 @@ class TestSemicolonDeclarationsParsing:
         assert isinstance(ast.items[0], AxDef)
         axdef = ast.items[0]
         assert len(axdef.declarations) == 2
-        assert axdef.generic_params == ["X"]
+        assert axdef.generic_params == ("X",)
 
     def test_schema_two_declarations_with_semicolon(self) -> None:
         """Test schema with two declarations separated by semicolon."""
@@ -124,7 +124,7 @@ class TestSemicolonDeclarationsParsing:
         assert isinstance(ast.items[0], Schema)
         schema = ast.items[0]
         assert len(schema.declarations) == 2
-        assert schema.generic_params == ["X", "Y"]
+        assert schema.generic_params == ("X", "Y")
 
 
 class TestSemicolonDeclarationsLaTeXGeneration:
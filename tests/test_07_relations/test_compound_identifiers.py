@@ -89,7 +89,7 @@ class TestCompoundIdentifierParsing:
         result = parser._parse_abbreviation()
         assert isinstance(result, Abbreviation)
         assert result.name == "R+"
-        assert result.generic_params == ["X"]
+        assert result.generic_params == ("X",)
 
     def test_parse_schema_with_plus(self) -> None:
         """Test parsing schema S+ with compound name."""
@@ -154,13 +154,13 @@ class TestHorizDefSchemaRef:
         item = first_item("Stack[X] defs Op")
         assert isinstance(item, HorizDef)
         assert item.name == "Stack"
-        assert item.generics == ["X"]
+        assert item.generics == ("X",)
 
     def test_generic_lhs_multi_param(self) -> None:
         """``Map[K, V] defs Op`` carries generics=["K", "V"]."""
         item = first_item("Map[K, V] defs Op")
         assert isinstance(item, HorizDef)
-        assert item.generics == ["K", "V"]
+        assert item.generics == ("K", "V")
 
 
 # ---------------------------------------------------------------------------
@@ -208,7 +208,7 @@ class TestHorizDefSchemaText:
         """``Stack[X] defs [s : seq X | true]`` combines generic LHS and inline text."""
         item = first_item("Stack[X] defs [s : seq X | true]")
         assert isinstance(item, HorizDef)
-        assert item.generics == ["X"]
+        assert item.generics == ("X",)
         assert isinstance(item.body, SchemaText)
 
 
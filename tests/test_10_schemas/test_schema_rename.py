@@ -80,7 +80,7 @@ class TestSchemaRenameAST:
         assert isinstance(body, SchemaRename)
         assert isinstance(body.schema, Identifier)
         assert body.schema.name == "Op"
-        assert body.pairs == [("a", "b")]
+        assert body.pairs == (("a", "b"),)
 
     def test_multiple_pairs(self) -> None:
         """``S defs Op[a/b, c/d]`` produces two rename pairs."""
@@ -88,7 +88,7 @@ class TestSchemaRenameAST:
         assert isinstance(item, HorizDef)
         body = item.body
         assert isinstance(body, SchemaRename)
-        assert body.pairs == [("a", "b"), ("c", "d")]
+        assert body.pairs == (("a", "b"), ("c", "d"))
 
     def test_three_pairs(self) -> None:
         """``S defs Op[a/b, c/d, e/f]`` produces three rename pairs."""
@@ -96,7 +96,7 @@ class TestSchemaRenameAST:
         assert isinstance(item, HorizDef)
         body = item.body
         assert isinstance(body, SchemaRename)
-        assert body.pairs == [("a", "b"), ("c", "d"), ("e", "f")]
+        assert body.pairs == (("a", "b"), ("c", "d"), ("e", "f"))
 
     def test_schema_ref_is_identifier(self) -> None:
         """The schema field is an Identifier node."""
@@ -131,7 +131,7 @@ class TestSchemaRenameDecorated:
         assert isinstance(body, SchemaRename)
         assert isinstance(body.schema, Identifier)
         assert body.schema.name == "S'"
-        assert body.pairs == [("a", "b")]
+        assert body.pairs == (("a", "b"),)
 
     def test_decorated_source_name(self) -> None:
         """``R defs S[a'/b]`` — primed source name in pair."""
@@ -139,7 +139,7 @@ class TestSchemaRenameDecorated:
         assert isinstance(item, HorizDef)
         body = item.body
         assert isinstance(body, SchemaRename)
-        assert body.pairs == [("a'", "b")]
+        assert body.pairs == (("a'", "b"),)
 
     def test_decorated_target_name(self) -> None:
         """``R defs S[a/b']`` — primed target name in pair."""
@@ -147,7 +147,7 @@ class TestSchemaRenameDecorated:
         assert isinstance(item, HorizDef)
         body = item.body
         assert isinstance(body, SchemaRename)
-        assert body.pairs == [("a", "b'")]
+        assert body.pairs == (("a", "b'"),)
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +197,7 @@ class TestSchemaRenameAcceptanceProbe:
         assert isinstance(body, SchemaRename)
         assert isinstance(body.schema, Identifier)
         assert body.schema.name == "Counter"
-        assert body.pairs == [("count'", "count")]
+        assert body.pairs == (("count'", "count"),)
 
     def test_acceptance_probe_latex(self) -> None:
         """``Op2 defs Counter[count'/count]`` round-trips to correct LaTeX."""
@@ -227,7 +227,7 @@ class TestSchemaRenameInExpr:
         assert isinstance(expr, FunctionApp)
         assert len(expr.args) == 1
         assert isinstance(expr.args[0], SchemaRename)
-        assert expr.args[0].pairs == [("a", "b")]
+        assert expr.args[0].pairs == (("a", "b"),)
 
 
 # ---------------------------------------------------------------------------
@@ -273,7 +273,7 @@ class TestZedBlockMixedContent:
         assert isinstance(zed_block.content, Document)
         given = zed_block.content.items[0]
         assert isinstance(given, GivenType)
-        assert given.names == ["A", "B"]
+        assert given.names == ("A", "B")
 
     def test_free_type_in_zed(self) -> None:
         """Test zed block with free type."""
@@ -317,7 +317,7 @@ class TestZedBlockMixedContent:
         abbrev = zed_block.content.items[0]
         assert isinstance(abbrev, Abbreviation)
         assert abbrev.name == "Pair"
-        assert abbrev.generic_params == ["X"]
+        assert abbrev.generic_params == ("X",)
 
     def test_compound_identifier_abbreviation(self) -> None:
         """Test zed block with compound identifier abbreviation (R+, R*, etc)."""
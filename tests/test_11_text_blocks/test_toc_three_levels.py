@@ -14,12 +14,12 @@ from txt2tex.lexer import Lexer
 from txt2tex.parser import Parser
 
 
-def _latex(src: str, **kwargs: bool) -> str:
+def _latex(src: str, *, toc_parts: bool = False) -> str:
     """Parse src and return generated LaTeX body."""
     lexer = Lexer(src)
     tokens = lexer.tokenize()
     ast = Parser(tokens).parse()
-    gen = LaTeXGenerator(**kwargs)
+    gen = LaTeXGenerator(toc_parts=toc_parts)
     return gen.generate_document(ast)
 
 
@@ -174,13 +174,13 @@ class TestProjectParser:
         """pi[a](R) produces Project with one attribute."""
         node = _expr("pi[a](R)")
         assert isinstance(node, Project)
-        assert node.attrs == ["a"]
+        assert node.attrs == ("a",)
 
     def test_project_multiple_attrs(self) -> None:
         """pi[class, country](Class) produces Project with two attributes."""
         node = _expr("pi[class, country](Class)")
         assert isinstance(node, Project)
-        assert node.attrs == ["class", "country"]
+        assert node.attrs == ("class", "country")
 
     def test_project_position(self) -> None:
         """Project node carries start position of pi keyword."""
@@ -199,7 +199,7 @@ class TestProjectParser:
         """pi[a,b]R (no parentheses) produces Project."""
         node = _expr("pi[a,b]R")
         assert isinstance(node, Project)
-        assert node.attrs == ["a", "b"]
+        assert node.attrs == ("a", "b")
         assert isinstance(node.relation, Identifier)
         assert node.relation.name == "R"
 
@@ -207,7 +207,7 @@ class TestProjectParser:
         """pi[a]R — paren-free with single attribute."""
         node = _expr("pi[a]R")
         assert isinstance(node, Project)
-        assert node.attrs == ["a"]
+        assert node.attrs == ("a",)
         assert isinstance(node.relation, Identifier)
         assert node.relation.name == "R"
 
@@ -225,7 +225,7 @@ class TestRelationRenameParser:
         node = _expr("pi[b](R[b/a])")
         assert isinstance(node, Project)
         assert isinstance(node.relation, RelationRename)
-        assert node.relation.pairs == [("b", "a")]
+        assert node.relation.pairs == (("b", "a"),)
         assert isinstance(node.relation.relation, Identifier)
         assert node.relation.relation.name == "R"
 
@@ -234,14 +234,14 @@ class TestRelationRenameParser:
         node = _expr("pi[b, d](R[b/a, d/c])")
         assert isinstance(node, Project)
         assert isinstance(node.relation, RelationRename)
-        assert node.relation.pairs == [("b", "a"), ("d", "c")]
+        assert node.relation.pairs == (("b", "a"), ("d", "c"))
 
     def test_rename_in_sigma(self) -> None:
         """R[b/a] inside sigma[p](R[b/a]) produces RelationRename."""
         node = _expr("sigma[b != 0](R[b/a])")
         assert isinstance(node, Restrict)
         assert isinstance(node.relation, RelationRename)
-        assert node.relation.pairs == [("b", "a")]
+        assert node.relation.pairs == (("b", "a"),)
 
     def test_rename_right_of_join(self) -> None:
         """R[b/a] as right operand of join produces RelationRename."""
@@ -251,27 +251,27 @@ class TestRelationRenameParser:
         inner = node.relation
         assert isinstance(inner, NaturalJoin)
         assert isinstance(inner.right, RelationRename)
-        assert inner.right.pairs == [("b", "a")]
+        assert inner.right.pairs == (("b", "a"),)
 
     def test_rename_on_parenthesised_join(self) -> None:
         """(S join T)[a/x] — rename on a parenthesised compound expression."""
         node = _expr("(S join T)[a/x]")
         assert isinstance(node, RelationRename)
-        assert node.pairs == [("a", "x")]
+        assert node.pairs == (("a", "x"),)
         assert isinstance(node.relation, NaturalJoin)
 
     def test_rename_on_sigma_result(self) -> None:
         """sigma[p](R)[a/x] — rename on the result of a sigma."""
         node = _expr("sigma[p](R)[a/x]")
         assert isinstance(node, RelationRename)
-        assert node.pairs == [("a", "x")]
+        assert node.pairs == (("a", "x"),)
         assert isinstance(node.relation, Restrict)
 
     def test_rename_on_pi_result(self) -> None:
         """pi[a,b](R)[c/a] — rename on the result of a pi."""
         node = _expr("pi[a,b](R)[c/a]")
         assert isinstance(node, RelationRename)
-        assert node.pairs == [("c", "a")]
+        assert node.pairs == (("c", "a"),)
         assert isinstance(node.relation, Project)
 
     def test_rename_position(self) -> None:
@@ -289,7 +289,7 @@ class TestRelationRenameParser:
         assert isinstance(node, Project)
         inner = node.relation
         assert isinstance(inner, RelationRename)
-        assert inner.pairs == [("b", "a")]
+        assert inner.pairs == (("b", "a"),)
         assert isinstance(inner.relation, Project)
 
     def test_rename_pair_direction(self) -> None:
@@ -306,7 +306,7 @@ class TestRelationRenameParser:
         item = ast.items[0]
         assert isinstance(item, Abbreviation)
         assert isinstance(item.expression, RelationRename)
-        assert item.expression.pairs == [("new", "old")]
+        assert item.expression.pairs == (("new", "old"),)
 
     def test_top_level_abbreviation_rename_emits_inline_math(self) -> None:
         """`B == R[a/b]` emits via `\\noindent $...$`, not inside a Z paragraph.
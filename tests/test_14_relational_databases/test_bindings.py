@@ -177,7 +177,7 @@ class TestBindingParserPositive:
         """{| |} → Binding with no pairs (Z RM permits it)."""
         node = _parse_expr("{| |}")
         assert isinstance(node, Binding)
-        assert node.pairs == []
+        assert node.pairs == ()
 
     def test_field_projection_as_value(self) -> None:
         """{| name == s.name |} has TupleProjection as value."""
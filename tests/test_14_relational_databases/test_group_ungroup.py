@@ -116,21 +116,21 @@ class TestGroupParser:
         assert isinstance(node, Group)
         assert isinstance(node.relation, Identifier)
         assert node.relation.name == "R"
-        assert node.attrs == ["A"]
+        assert node.attrs == ("A",)
         assert node.alias == "members"
 
     def test_group_multi_attr(self) -> None:
         """R group ({A, B, C} as nested) produces Group with three attributes."""
         node = _expr("R group ({A, B, C} as nested)")
         assert isinstance(node, Group)
-        assert node.attrs == ["A", "B", "C"]
+        assert node.attrs == ("A", "B", "C")
         assert node.alias == "nested"
 
     def test_group_two_attrs(self) -> None:
         """R group ({A, B} as sub) produces Group with two attributes."""
         node = _expr("R group ({A, B} as sub)")
         assert isinstance(node, Group)
-        assert node.attrs == ["A", "B"]
+        assert node.attrs == ("A", "B")
         assert node.alias == "sub"
 
     def test_group_position(self) -> None:
@@ -144,7 +144,7 @@ class TestGroupParser:
         node = _expr("pi[X](R group ({A} as nested))")
         assert isinstance(node, Project)
         assert isinstance(node.relation, Group)
-        assert node.relation.attrs == ["A"]
+        assert node.relation.attrs == ("A",)
         assert node.relation.alias == "nested"
 
 
@@ -238,7 +238,7 @@ class TestGroupUngroupNegative:
         doc = _parse("R group ({group} as nested)")
         node = doc.items[0]
         assert isinstance(node, Group)
-        assert node.attrs == ["group"]
+        assert node.attrs == ("group",)
 
     def test_ungroup_alias_named_ungroup_is_legal(self) -> None:
         """An attribute literally named 'ungroup' is allowed as the alias."""
@@ -345,7 +345,7 @@ class TestGroupUngroupAcceptance:
         doc = _parse(src)
         group_node = doc.items[0]
         assert isinstance(group_node, Group)
-        assert group_node.attrs == ["username"]
+        assert group_node.attrs == ("username",)
         assert group_node.alias == "members"
 
         result = _expr_latex(src)
@@ -233,7 +233,7 @@ class TestSchemaHide:
         assert isinstance(body, SchemaHide)
         assert isinstance(body.schema, Identifier)
         assert body.schema.name == "S"
-        assert body.names == ["x"]
+        assert body.names == ("x",)
 
     def test_multiple_names(self) -> None:
         """``R defs S hide (x, y, z)`` produces SchemaHide with three names."""
@@ -241,7 +241,7 @@ class TestSchemaHide:
         assert isinstance(item, HorizDef)
         body = item.body
         assert isinstance(body, SchemaHide)
-        assert body.names == ["x", "y", "z"]
+        assert body.names == ("x", "y", "z")
 
     def test_latex_hide(self) -> None:
         """``R defs S hide (x, y)`` emits ``S \\hide (x, y)``."""
@@ -318,7 +318,7 @@ class TestSchemaPrecedence:
         # Left is hiding
         assert isinstance(body.left, SchemaHide)
         assert body.left.schema.name == "S"  # type: ignore[union-attr]
-        assert body.left.names == ["x"]
+        assert body.left.names == ("x",)
         # Right is T
         assert isinstance(body.right, Identifier)
         assert body.right.name == "T"
@@ -351,7 +351,7 @@ class TestSchemaPrecedence:
         body = item.body
         assert isinstance(body, SchemaHide)
         assert isinstance(body.schema, SchemaCompose)
-        assert body.names == ["temp"]
+        assert body.names == ("temp",)
 
     def test_latex_combined_pipe_and_hide(self) -> None:
         """``OpFiltered defs (Op1 land Op2) hide (temp)`` — land inside parens."""
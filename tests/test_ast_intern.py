@@ -0,0 +1,127 @@
+"""Structurally equal subtrees share one interned shape.
+
+Nodes keep their own positions; :func:`shape_of` maps every node an
+interner has seen to the first node with the same structure, so equality of
+shapes is structural equality ignoring ``line`` and ``column``.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+from txt2tex.ast_intern import NodeInterner, is_interned, shape_of
+from txt2tex.ast_nodes import (
+    BinaryOp,
+    Document,
+    Identifier,
+    Paragraph,
+    Schema,
+    SetLiteral,
+)
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+
+def _id(name: str, column: int = 1, line: int = 1) -> Identifier:
+    return Identifier(line=line, column=column, name=name)
+
+
+def _plus(left: str, right: str, line: int = 1) -> BinaryOp:
+    return BinaryOp(
+        line=line,
+        column=3,
+        operator="+",
+        left=_id(left, 1, line),
+        right=_id(right, 5, line),
+    )
+
+
+def test_equal_subtrees_share_a_shape_but_keep_positions() -> None:
+    interner = NodeInterner()
+    first = interner.intern(_plus("x", "y", line=1))
+    second = interner.intern(_plus("x", "y", line=7))
+    assert shape_of(second) is first
+    assert shape_of(second.left) is first.left
+    assert second.line == 7
+    assert second.left.line == 7
+    assert len(interner) == 3
+
+
+def test_different_structures_get_different_shapes() -> None:
+    interner = NodeInterner()
+    shapes = {
+        id(shape_of(interner.intern(node)))
+        for node in (
+            _plus("x", "y"),
+            _plus("y", "x"),
+            BinaryOp(line=1, column=1, operator="-", left=_id("x"), right=_id("y")),
+            SetLiteral(line=1, column=1, elements=[_id("x"), _id("y")]),
+            SetLiteral(line=1, column=1, elements=[_id("y"), _id("x")]),
+        )
+    }
+    assert len(shapes) == 5
+
+
+def test_repeated_child_and_nested_sequences() -> None:
+    interner = NodeInterner()
+    shared = _id("x")
+    literal = interner.intern(SetLiteral(line=1, column=1, elements=[shared, shared]))
+    assert shape_of(literal.elements[1]) is shared
+    schema = Schema(
+        line=1, column=1, name="S", declarations=[], predicates=[[_id("x", 9)], []]
+    )
+    interner.intern(schema)
+    assert shape_of(schema.predicates[0][0]) is shared
+
+
+def test_uninterned_node_is_its_own_shape() -> None:
+    node = _id("x")
+    assert not is_interned(node)
+    assert shape_of(node) is node
+    interner = NodeInterner()
+    assert interner.intern(node) is node
+    assert is_interned(node)
+    assert interner.intern(node) is node  # already interned: not visited again
+    assert len(interner) == 1
+
+
+def test_deep_chain_interns_without_recursion() -> None:
+    depth = 20_000
+    node: Identifier | BinaryOp = _id("x")
+    for _ in range(depth):
+        node = BinaryOp(line=1, column=1, operator="+", left=node, right=_id("x"))
+    interner = NodeInterner()
+    interner.intern(node)
+    assert len(interner) == depth + 1
+
+
+def test_parser_does_not_intern_and_generator_does() -> None:
+    text = "x + y = z\n\ny = x + y\n\nTEXT: x + y\n"
+    document = Parser(Lexer(text).tokenize()).parse()
+    assert isinstance(document, Document)
+    assert not is_interned(document)
+    LaTeXGenerator(use_fuzz=False).generate_document(document)
+    assert is_interned(document)
+    first, second = document.items[0], document.items[1]
+    assert not isinstance(first, Paragraph)
+    assert not isinstance(second, Paragraph)
+    assert isinstance(first, BinaryOp)
+    assert isinstance(second, BinaryOp)
+    assert isinstance(second.right, BinaryOp)
+    assert shape_of(second.right) is shape_of(first.left)
+    assert second.right.line == 3
+
+
+def test_streamed_items_are_not_interned() -> None:
+    text = "".join(f"x{i} + y\n\n" for i in range(3))
+    items = list(Parser(Lexer(text).iter_tokens()).iter_items())
+    assert len(items) == 3
+    assert not any(map(is_interned, items))
+
+
+def test_pickled_tree_drops_shapes() -> None:
+    document = NodeInterner().intern(Parser(Lexer("x + y\n").tokenize()).parse())
+    restored = pickle.loads(pickle.dumps(document))  # noqa: S301 - round trip
+    assert restored == document
+    assert not is_interned(restored)
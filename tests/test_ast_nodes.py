@@ -0,0 +1,97 @@
+"""AST nodes are slotted and store their children in tuples.
+
+Constructors still take lists, as the parser passes them; the node keeps
+a tuple, so a finished tree is immutable and hashable all the way down.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import pickle
+
+import pytest
+
+from txt2tex import ast_nodes
+from txt2tex.ast_nodes import (
+    ASTNode,
+    Declaration,
+    Document,
+    FunctionApp,
+    Identifier,
+    Restrict,
+    Schema,
+    SchemaRename,
+    SetLiteral,
+    TruthTable,
+)
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+NODE_CLASSES = [
+    cls
+    for _, cls in inspect.getmembers(ast_nodes, inspect.isclass)
+    if issubclass(cls, ASTNode)
+]
+
+
+def _x(column: int = 1) -> Identifier:
+    return Identifier(line=1, column=column, name="x")
+
+
+@pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda c: c.__name__)
+def test_every_node_is_slotted(cls: type[ASTNode]) -> None:
+    assert dataclasses.is_dataclass(cls)
+    assert "__slots__" in cls.__dict__
+    assert cls.__dictoffset__ == 0
+
+
+def test_list_arguments_are_stored_as_tuples() -> None:
+    literal = SetLiteral(line=1, column=1, elements=[_x(2), _x(5)])
+    assert literal.elements == (_x(2), _x(5))
+    rename = SchemaRename(line=1, column=1, schema=_x(), pairs=[("a", "b")])
+    assert rename.pairs == (("a", "b"),)
+    table = TruthTable(line=1, column=1, headers=["p"], rows=[["T"], ["F"]])
+    assert table.rows == (("T",), ("F",))
+
+
+def test_nested_and_optional_sequences() -> None:
+    declaration = Declaration(line=2, column=3, variable="x", type_expr=_x())
+    schema = Schema(
+        line=1,
+        column=1,
+        name="S",
+        declarations=[declaration],
+        predicates=[[_x()], []],
+    )
+    assert schema.predicates == ((_x(),), ())
+    assert schema.generic_params is None
+    assert hash(schema) == hash(dataclasses.replace(schema, predicates=[[_x()], []]))
+
+
+def test_nodes_are_immutable_and_hashable() -> None:
+    literal = SetLiteral(line=1, column=1, elements=[_x()])
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        literal.elements = ()  # type: ignore[misc]
+    assert {literal, SetLiteral(line=1, column=1, elements=(_x(),))} == {literal}
+
+
+def test_parsed_tree_round_trips_through_pickle() -> None:
+    text = "schema S\n  x : N\nwhere\n  x > 0\n  { y : N | y < x }\nend\n"
+    document = Parser(Lexer(text).tokenize()).parse()
+    assert isinstance(document, Document)
+    assert isinstance(document.items, tuple)
+    restored = pickle.loads(pickle.dumps(document))  # noqa: S301 - round trip
+    assert restored == document
+    assert hash(restored) == hash(document)
+
+
+def test_reflective_walk_descends_into_tuple_children() -> None:
+    restrict = Restrict(line=1, column=3, predicate=_x(), relation=_x())
+    app = FunctionApp(line=1, column=1, function=_x(), args=[_x(), restrict])
+    generator = LaTeXGenerator()
+    assert generator._expression_contains_dat_construct(app)
+    assert not generator._expression_contains_dat_construct(
+        FunctionApp(line=1, column=1, function=_x(), args=[_x()])
+    )
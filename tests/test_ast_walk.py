@@ -0,0 +1,151 @@
+"""Child-field tables drive ``children``, ``walk`` and ``transform``.
+
+The tables are derived from each node class's annotations; ``children``
+must find exactly the nodes a reflective scan of every field finds.
+"""
+
+from __future__ import annotations
+
+import inspect
+from pathlib import Path
+
+import pytest
+
+from txt2tex import ast_nodes
+from txt2tex.ast_intern import NodeInterner, is_interned
+from txt2tex.ast_nodes import (
+    ASTNode,
+    BinaryOp,
+    Identifier,
+    Number,
+    Schema,
+    SetComprehension,
+    SetLiteral,
+)
+from txt2tex.ast_walk import ChildFields, child_fields, children, transform, walk
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+NODE_CLASSES = [
+    cls
+    for _, cls in inspect.getmembers(ast_nodes, inspect.isclass)
+    if issubclass(cls, ASTNode)
+]
+
+
+def _x(name: str = "x", column: int = 1) -> Identifier:
+    return Identifier(line=1, column=column, name=name)
+
+
+def _reflective_children(node: ASTNode) -> list[ASTNode]:
+    found: list[ASTNode] = []
+    stack: list[object] = [getattr(node, name) for name in node.__dataclass_fields__]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            found.append(value)
+        elif isinstance(value, tuple):
+            stack.extend(value)
+    return found
+
+
+@pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda c: c.__name__)
+def test_every_class_has_a_table(cls: type[ASTNode]) -> None:
+    fields = child_fields(cls)
+    names = set(cls.__dataclass_fields__)
+    listed = fields.nodes + fields.sequences + fields.nested
+    assert set(listed) <= names
+    assert set(fields.optional) <= set(listed)
+    assert "line" not in listed
+
+
+def test_fields_are_classified_by_annotation() -> None:
+    assert child_fields(BinaryOp) == ChildFields(("left", "right"), (), (), ())
+    assert child_fields(SetLiteral) == ChildFields((), ("elements",), (), ())
+    assert child_fields(Identifier) == ChildFields((), (), (), ())
+    schema = child_fields(Schema)
+    assert schema.sequences == ("declarations",)
+    assert schema.nested == ("predicates",)
+    comprehension = child_fields(SetComprehension)
+    assert comprehension.nodes == ("domain", "predicate", "expression")
+    assert comprehension.nested == ("extra_declarations",)
+    assert "domain" in comprehension.optional
+
+
+def test_children_in_field_order() -> None:
+    comprehension = SetComprehension(
+        line=1,
+        column=1,
+        variables=["x"],
+        domain=_x("N"),
+        predicate=_x("p"),
+        expression=None,
+        extra_declarations=[("y", _x("M"))],
+    )
+    assert [c.name for c in children(comprehension)] == ["N", "p", "M"]  # type: ignore[attr-defined]
+    assert list(children(_x())) == []
+
+
+def test_children_match_reflective_scan_on_examples() -> None:
+    for path in sorted(EXAMPLES_DIR.rglob("*.txt"))[::7]:
+        tree = Parser(Lexer(path.read_text()).tokenize()).parse()
+        for node in walk(tree):
+            assert sorted(map(id, children(node))) == sorted(
+                map(id, _reflective_children(node))
+            )
+
+
+def test_walk_is_pre_order() -> None:
+    tree = BinaryOp(
+        line=1,
+        column=1,
+        operator="+",
+        left=BinaryOp(line=1, column=1, operator="*", left=_x("a"), right=_x("b")),
+        right=_x("c"),
+    )
+    order = [getattr(n, "name", getattr(n, "operator", None)) for n in walk(tree)]
+    assert order == ["+", "*", "a", "b", "c"]
+
+
+def test_transform_rebuilds_changed_paths_only() -> None:
+    untouched = SetLiteral(line=1, column=1, elements=[_x("a")])
+    tree = BinaryOp(
+        line=1,
+        column=1,
+        operator="+",
+        left=untouched,
+        right=SetLiteral(line=1, column=1, elements=[_x("x"), _x("b")]),
+    )
+    NodeInterner().intern(tree)
+
+    def rename(node: ASTNode) -> ASTNode:
+        if isinstance(node, Identifier) and node.name == "x":
+            return Number(line=node.line, column=node.column, value="1")
+        return node
+
+    result = transform(tree, rename)
+    assert isinstance(result, BinaryOp)
+    assert result.left is untouched
+    assert isinstance(result.right, SetLiteral)
+    assert result.right.elements[0] == Number(line=1, column=1, value="1")
+    assert result.right.elements[1] is tree.right.elements[1]  # type: ignore[attr-defined]
+    assert not is_interned(result)
+    assert transform(tree, lambda node: node) is tree
+
+
+def test_deep_chain_walks_and_transforms_without_recursion() -> None:
+    depth = 20_000
+    node: ASTNode = _x()
+    for _ in range(depth):
+        node = BinaryOp(line=1, column=1, operator="+", left=node, right=_x("y"))
+    assert sum(1 for _ in walk(node)) == 2 * depth + 1
+
+    def rename(n: ASTNode) -> ASTNode:
+        return _x("z") if isinstance(n, Identifier) and n.name == "y" else n
+
+    renamed = transform(node, rename)
+    assert sum(isinstance(n, Identifier) and n.name == "z" for n in walk(renamed)) == (
+        depth
+    )
@@ -0,0 +1,142 @@
+"""Tests for multi-file batch mode (txt2tex a.txt b.txt dir/ --jobs N)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.batch import (
+    BatchOptions,
+    FileStatus,
+    _build_file,
+    collect_inputs,
+    run_batch,
+)
+from txt2tex.cli import main
+from txt2tex.pipeline import ConversionOptions, convert_text
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> list[Path]:
+    """Three small valid sources, one of them in a subdirectory."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    paths = [tmp_path / "a.txt", tmp_path / "b.txt", sub / "c.txt"]
+    paths[0].write_text("x = 1")
+    paths[1].write_text("given Person\n")
+    paths[2].write_text("schema S\n  n : N\nwhere\n  n > 0\nend\n")
+    return paths
+
+
+def test_collect_inputs_expands_directories(
+    tmp_path: Path, sources: list[Path]
+) -> None:
+    """Directories expand recursively to sorted .txt files; duplicates drop."""
+    (tmp_path / "notes.md").write_text("ignored")
+    collected = collect_inputs([sources[1], tmp_path])
+    assert collected == [sources[1], sources[0], sources[2]]
+
+
+def test_batch_converts_all_files(
+    sources: list[Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Every input gets a .tex identical to single-file conversion."""
+    argv = ["txt2tex", *map(str, sources), "--tex-only", "--jobs", "2"]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 0
+    for source in sources:
+        expected = convert_text(source.read_text(), ConversionOptions()).latex
+        assert source.with_suffix(".tex").read_text() == expected
+    out = capsys.readouterr().out
+    assert "Batch summary: 3 files, 3 succeeded, 0 failed" in out
+
+
+def test_batch_directory_argument(tmp_path: Path, sources: list[Path]) -> None:
+    """A single directory argument triggers batch mode."""
+    with patch.object(sys, "argv", ["txt2tex", str(tmp_path), "--tex-only"]):
+        result = main()
+    assert result == 0
+    assert all(source.with_suffix(".tex").exists() for source in sources)
+
+
+def test_batch_aggregates_failures(
+    tmp_path: Path, sources: list[Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """One bad file fails the run but the others are still converted."""
+    bad = tmp_path / "bad.txt"
+    bad.write_text("{x : N | x > 0")
+    argv = ["txt2tex", str(bad), *map(str, sources), "--tex-only", "-j", "2"]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 1
+    assert all(source.with_suffix(".tex").exists() for source in sources)
+    assert not bad.with_suffix(".tex").exists()
+    captured = capsys.readouterr()
+    assert "3 succeeded, 1 failed" in captured.out
+    assert f"FAILED  {bad} (generate)" in captured.out
+    assert "Error:" in captured.err
+
+
+def test_batch_missing_file_reports_read_stage(tmp_path: Path) -> None:
+    """Unreadable inputs are reported per file rather than aborting the run."""
+    options = BatchOptions(conversion=ConversionOptions(), tex_only=True, jobs=1)
+    missing = tmp_path / "missing.txt"
+    with patch("txt2tex.batch._print_summary") as summary:
+        assert run_batch([missing], options) == 1
+    (statuses,) = summary.call_args.args
+    assert statuses == [
+        FileStatus(missing, ok=False, stage="read", message="file not found")
+    ]
+
+
+def test_batch_survives_raising_build_worker(
+    sources: list[Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A worker exception fails its file only; the summary still prints."""
+    options = BatchOptions(conversion=ConversionOptions(), jobs=2)
+
+    def build(status: FileStatus, _options: BatchOptions) -> FileStatus:
+        if status.source == sources[1]:
+            raise OSError("disk full")
+        return status
+
+    with patch("txt2tex.batch._build_file", side_effect=build):
+        assert run_batch(sources, options) == 1
+    captured = capsys.readouterr()
+    assert "2 succeeded, 1 failed" in captured.out
+    assert f"FAILED  {sources[1]} (build)" in captured.out
+    assert "disk full" in captured.err
+
+
+def test_build_stage_reports_typecheck_failure(tmp_path: Path) -> None:
+    """A fuzz failure stops the file before PDF compilation."""
+    status = FileStatus(tmp_path / "a.txt", ok=True, stage="done")
+    options = BatchOptions(conversion=ConversionOptions(use_fuzz=True))
+    with (
+        patch("txt2tex.batch.typecheck_fuzz", return_value=False),
+        patch("txt2tex.batch.compile_pdf") as compile_pdf,
+    ):
+        outcome = _build_file(status, options)
+    assert outcome.stage == "typecheck"
+    assert not outcome.ok
+    compile_pdf.assert_not_called()
+
+
+def test_batch_rejects_output_option(sources: list[Path]) -> None:
+    """-o is ambiguous with several inputs."""
+    argv = ["txt2tex", *map(str, sources), "-o", "out.tex"]
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+
+
+def test_batch_rejects_zero_jobs(sources: list[Path]) -> None:
+    """--jobs must be positive."""
+    argv = ["txt2tex", *map(str, sources), "--jobs", "0"]
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
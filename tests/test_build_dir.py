@@ -0,0 +1,146 @@
+"""Tests for incremental PDF builds in a persistent build directory."""
+
+from __future__ import annotations
+
+import stat
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.compile import build_dir_for, compile_pdf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Stand-in for pdflatex: copies the document's \citation/\bibdata/\bibstyle
+# lines into <stem>.aux (as \cite and \bibliography would), writes the PDF
+# and counts its runs.
+FAKE_PDFLATEX = """\
+#!{python}
+import sys
+from pathlib import Path
+
+calls = Path(__file__).parent / "pdflatex-calls"
+calls.write_text(str(int(calls.read_text()) + 1) if calls.exists() else "1")
+out = Path(next(a.split("=", 1)[1] for a in sys.argv if a.startswith("-output-")))
+tex = Path(sys.argv[-1])
+keep = ("\\\\citation", "\\\\bibdata", "\\\\bibstyle")
+aux = [line for line in tex.read_text().splitlines() if line.startswith(keep)]
+(out / (tex.stem + ".aux")).write_text("\\\\relax\\n" + "\\n".join(aux))
+(out / (tex.stem + ".log")).write_text("")
+(out / (tex.stem + ".pdf")).write_text("pdf")
+"""
+
+FAKE_BIBTEX = """\
+#!{python}
+import sys
+from pathlib import Path
+
+calls = Path(__file__).parent / "bibtex-calls"
+calls.write_text(str(int(calls.read_text()) + 1) if calls.exists() else "1")
+Path(sys.argv[1] + ".bbl").write_text("bbl")
+"""
+
+
+def _install(bin_dir: Path, name: str, script: str) -> str:
+    path = bin_dir / name
+    path.write_text(script.replace("{python}", sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def _calls(bin_dir: Path, name: str) -> int:
+    counter = bin_dir / f"{name}-calls"
+    return int(counter.read_text()) if counter.exists() else 0
+
+
+@pytest.fixture
+def tools(tmp_path: Path) -> Iterator[Path]:
+    """Fake pdflatex/bibtex on a private PATH; latexmk is unavailable."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    found = {
+        "pdflatex": _install(bin_dir, "pdflatex", FAKE_PDFLATEX),
+        "bibtex": _install(bin_dir, "bibtex", FAKE_BIBTEX),
+    }
+    with patch("txt2tex.compile.shutil.which", side_effect=found.get):
+        yield bin_dir
+
+
+@pytest.fixture
+def document(tmp_path: Path) -> Path:
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    tex_path = source_dir / "doc.tex"
+    tex_path.write_text("\\documentclass{article}\n")
+    return tex_path
+
+
+def test_build_dir_is_per_document_under_cache(tmp_path: Path) -> None:
+    a, b = tmp_path / "a" / "doc.tex", tmp_path / "b" / "doc.tex"
+    assert build_dir_for(a) != build_dir_for(b)
+    assert build_dir_for(a) == build_dir_for(a)
+    assert build_dir_for(a).name.startswith("doc-")
+
+
+def test_unchanged_document_needs_one_pass(tools: Path, document: Path) -> None:
+    build_dir = build_dir_for(document)
+    assert compile_pdf(document, build_dir=build_dir)
+    first = _calls(tools, "pdflatex")
+    assert first == 2  # fresh .aux triggers a second pass
+
+    assert compile_pdf(document, build_dir=build_dir)
+    assert _calls(tools, "pdflatex") == first + 1
+
+    assert document.with_suffix(".pdf").read_text() == "pdf"
+    assert (build_dir / "doc.aux").exists()
+    assert sorted(p.name for p in document.parent.iterdir()) == ["doc.pdf", "doc.tex"]
+
+
+def test_bibtex_reruns_only_when_citations_or_bib_change(
+    tools: Path, document: Path
+) -> None:
+    bib = document.parent / "refs.bib"
+    bib.write_text("@book{a, title={A}}")
+    document.write_text(
+        "\\documentclass{article}\n\\citation{a}\n\\bibdata{refs}\n"
+        "\\bibstyle{plain}\n\\bibliography{refs}\n"
+    )
+    build_dir = build_dir_for(document)
+
+    assert compile_pdf(document, build_dir=build_dir)
+    assert _calls(tools, "bibtex") == 1
+    assert (build_dir / "doc.bbl").exists()
+
+    assert compile_pdf(document, build_dir=build_dir)
+    assert _calls(tools, "bibtex") == 1
+
+    bib.write_text("@book{a, title={B}}")
+    assert compile_pdf(document, build_dir=build_dir)
+    assert _calls(tools, "bibtex") == 2
+
+    document.write_text(document.read_text().replace("\\citation{a}", "\\citation{b}"))
+    assert compile_pdf(document, build_dir=build_dir)
+    assert _calls(tools, "bibtex") == 3
+
+
+def test_latexmk_uses_outdir_without_forced_rebuild(
+    tmp_path: Path, document: Path
+) -> None:
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    (build_dir / "doc.pdf").write_text("pdf")
+    done = subprocess.CompletedProcess[str]([], 0, "", "")
+    with (
+        patch("txt2tex.compile.shutil.which", return_value="/usr/bin/latexmk"),
+        patch("txt2tex.compile.subprocess.run", return_value=done) as run,
+    ):
+        assert compile_pdf(document, build_dir=build_dir)
+    (call,) = run.call_args_list  # no `latexmk -c` cleanup
+    assert f"-outdir={build_dir}" in call.args[0]
+    assert "-gg" not in call.args[0]
+    assert document.with_suffix(".pdf").read_text() == "pdf"
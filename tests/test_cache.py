@@ -0,0 +1,199 @@
+"""Tests for the content-addressed generation cache."""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.cache import (
+    _BLOCK_BYTES,
+    CachedGeneration,
+    GenerationCache,
+    default_cache_dir,
+)
+from txt2tex.cli import main
+from txt2tex.fuzz_cache import VerdictCache
+from txt2tex.pipeline import ConversionOptions, convert_text
+
+SOURCE = "schema S\n  n : N\nwhere\n  n > 0\nend\n"
+AXDEF = "axdef\n  f : N -> N\nwhere\n  forall x : N | f(x) = x + 1\nend\n"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> GenerationCache:
+    return GenerationCache(tmp_path / "cache")
+
+
+def test_default_cache_dir_honours_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TXT2TEX_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+
+
+def test_key_depends_on_source_and_options(cache: GenerationCache) -> None:
+    options = ConversionOptions()
+    key = cache.key(SOURCE, options)
+    assert key == cache.key(SOURCE, ConversionOptions())
+    assert key != cache.key(SOURCE + "\n", options)
+    assert key != cache.key(SOURCE, ConversionOptions(use_fuzz=False))
+    assert key != cache.key(SOURCE, ConversionOptions(toc_parts=True))
+    assert key != cache.key(SOURCE, ConversionOptions(warn_overflow=False))
+    assert key != cache.key(SOURCE, ConversionOptions(overflow_threshold=40))
+
+
+def test_hit_skips_parsing(cache: GenerationCache) -> None:
+    """A second conversion is served from the cache without parsing."""
+    options = ConversionOptions(overflow_threshold=10)
+    first = convert_text(SOURCE, options, cache)
+    assert first.ok
+    with patch("txt2tex.parser.Parser") as parser:
+        second = convert_text(SOURCE, options, cache)
+    parser.assert_not_called()
+    assert second == first
+
+
+def test_warnings_are_cached(cache: GenerationCache) -> None:
+    options = ConversionOptions(overflow_threshold=5)
+    first = convert_text(AXDEF, options, cache)
+    assert first.warnings
+    assert cache.get(AXDEF, options) == CachedGeneration(
+        latex=first.latex, warnings=first.warnings
+    )
+
+
+def test_errors_are_not_cached(cache: GenerationCache) -> None:
+    options = ConversionOptions()
+    result = convert_text("{x : N | x > 0", options, cache)
+    assert not result.ok
+    assert cache.get("{x : N | x > 0", options) is None
+
+
+def test_corrupt_entry_is_a_miss(cache: GenerationCache) -> None:
+    options = ConversionOptions()
+    convert_text(SOURCE, options, cache)
+    (entry,) = cache.root.glob("*/*.json")
+    entry.write_text("not json")
+    assert cache.get(SOURCE, options) is None
+    assert convert_text(SOURCE, options, cache).ok
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """Over budget, the least recently used entries are removed first."""
+    cache = GenerationCache(tmp_path / "cache")
+    options = ConversionOptions()
+    for i, name in enumerate(["a", "b", "c"]):
+        cache.put(name, options, CachedGeneration(latex=name * 100))
+        key = cache.key(name, options)
+        os.utime(cache.root / key[:2] / f"{key}.json", ns=(i, i))
+    # Reading "a" makes it the most recently used entry.
+    assert cache.get("a", options) is not None
+
+    # Each small entry occupies one block.
+    replace(cache, max_bytes=2 * _BLOCK_BYTES).evict()
+    assert cache.get("a", options) is not None
+    assert cache.get("b", options) is None
+    assert cache.get("c", options) is not None
+
+
+def test_put_does_not_evict(tmp_path: Path) -> None:
+    """Stores never scan the root."""
+    cache = GenerationCache(tmp_path / "cache", max_bytes=0)
+    options = ConversionOptions()
+    with patch.object(GenerationCache, "evict") as evict:
+        cache.put("a", options, CachedGeneration(latex="a"))
+        cache.put("b", options, CachedGeneration(latex="b"))
+    evict.assert_not_called()
+    assert cache.get("a", options) is not None
+
+
+def test_eviction_covers_builds_and_formats(tmp_path: Path) -> None:
+    """Build directories and formats share the root's budget."""
+    cache = GenerationCache(tmp_path / "cache")
+    options = ConversionOptions()
+    cache.put("a", options, CachedGeneration(latex="a"))
+    key = cache.key("a", options)
+    os.utime(cache.root / key[:2] / f"{key}.json", ns=(3, 3))
+    build_dir = cache.root / "build" / "doc-0123456789ab"
+    build_dir.mkdir(parents=True)
+    for name in ("doc.aux", "doc.pdf"):
+        (build_dir / name).write_bytes(b"x" * 100)
+        os.utime(build_dir / name, ns=(1, 1))
+    fmt = cache.root / "formats" / "txt2tex-fuzz-0.fmt"
+    fmt.parent.mkdir()
+    fmt.write_bytes(b"x" * (_BLOCK_BYTES + 1))
+    os.utime(fmt, ns=(2, 2))
+
+    # The build directory (two blocks) is the least recently used.
+    replace(cache, max_bytes=3 * _BLOCK_BYTES).evict()
+    assert not build_dir.exists()
+    assert fmt.exists()
+    replace(cache, max_bytes=_BLOCK_BYTES).evict()
+    assert not fmt.exists()
+    assert cache.get("a", options) is not None
+
+
+def test_evict_if_due_runs_once_per_interval(tmp_path: Path) -> None:
+    cache = GenerationCache(tmp_path / "cache")
+    with patch.object(GenerationCache, "evict") as evict:
+        # No root yet: nothing to evict.
+        assert not cache.evict_if_due()
+        cache.put("a", ConversionOptions(), CachedGeneration(latex="a"))
+        assert cache.evict_if_due()
+        assert not cache.evict_if_due()
+        assert cache.evict_if_due(interval=0)
+    assert evict.call_count == 2
+
+
+def test_cli_evicts_at_most_once_per_interval(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TXT2TEX_CACHE_DIR", str(tmp_path / "cache"))
+    sources = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for source in sources:
+        source.write_text(SOURCE)
+    (tmp_path / "cache").mkdir()
+    argv = ["txt2tex", *map(str, sources), "--tex-only", "--jobs", "1"]
+    with (
+        patch.object(sys, "argv", argv),
+        patch.object(GenerationCache, "evict") as evict,
+    ):
+        assert main() == 0
+        assert main() == 0
+    evict.assert_called_once_with()
+
+
+def test_cli_no_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TXT2TEX_CACHE_DIR", str(cache_dir))
+    source = tmp_path / "doc.txt"
+    source.write_text(SOURCE)
+
+    argv = ["txt2tex", str(source), "--tex-only", "--no-cache"]
+    with patch.object(sys, "argv", argv):
+        assert main() == 0
+    assert not list(cache_dir.glob("*/*.json"))
+
+    with patch.object(sys, "argv", argv[:-1]):
+        assert main() == 0
+    assert len(list(cache_dir.glob("*/*.json"))) == 1
+    first = source.with_suffix(".tex").read_text()
+
+    with patch.object(sys, "argv", argv[:-1]):
+        assert main() == 0
+    assert source.with_suffix(".tex").read_text() == first
+
+
+def test_eviction_covers_fuzz_verdicts(tmp_path: Path) -> None:
+    cache = GenerationCache(tmp_path / "cache")
+    verdicts = VerdictCache(cache.root / "fuzz")
+    verdicts.record(["ab12", "cd34"])
+    os.utime(cache.root / "fuzz" / "ab" / "ab12", ns=(1, 1))
+    replace(cache, max_bytes=_BLOCK_BYTES).evict()
+    assert not verdicts.passed("ab12")
+    assert verdicts.passed("cd34")
@@ -6,12 +6,15 @@ file I/O, error handling, land the --fuzz option.
 
 from __future__ import annotations
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from txt2tex import cli, compile as compile_module
 from txt2tex.cli import main
 
 
@@ -176,3 +179,34 @@ def test_cli_no_arguments() -> None:
         with pytest.raises(SystemExit) as exc_info:
             main()
         assert exc_info.value.code == 2
+
+
+def test_cli_version_does_not_import_pipeline() -> None:
+    """--version stays light: no lexer, parser, generator or REPL import."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['txt2tex', '--version']\n"
+        "from txt2tex.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('txt2tex.lexer', 'txt2tex.parser', 'txt2tex.latex_gen',\n"
+        "         'txt2tex.repl')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+    )
+    src_dir = Path(__file__).parent.parent / "src"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_cli_compile_reexports() -> None:
+    """The historical compile helpers are still importable from txt2tex.cli."""
+    assert cli.compile_pdf is compile_module.compile_pdf
+    assert cli.typecheck_fuzz is compile_module.typecheck_fuzz
@@ -0,0 +1,138 @@
+"""The annotation table answers the generator's per-subtree questions.
+
+``NodeAnnotations`` annotates a tree bottom-up once; has-line-breaks,
+contains-relational-construct, contains-connective and depth are then
+lookups keyed by the subtree's interned shape.
+"""
+
+from __future__ import annotations
+
+from txt2tex.ast_nodes import (
+    BinaryOp,
+    Document,
+    Expr,
+    FunctionApp,
+    Identifier,
+    Lambda,
+    Restrict,
+    UnaryOp,
+)
+from txt2tex.codegen.annotations import NodeAnnotations
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+
+def _x(name: str = "x", column: int = 1) -> Identifier:
+    return Identifier(line=1, column=column, name=name)
+
+
+def _op(operator: str, left: Expr, right: Expr, *, broken: bool = False) -> BinaryOp:
+    return BinaryOp(
+        line=1,
+        column=1,
+        operator=operator,
+        left=left,
+        right=right,
+        line_break_after=broken,
+    )
+
+
+def _table() -> NodeAnnotations:
+    generator = LaTeXGenerator()
+    return NodeAnnotations(
+        dat_types=generator._DAT_EXPRESSION_TYPES,
+        connective_ops=generator._CONNECTIVE_OPS,
+    )
+
+
+def test_flags_propagate_to_ancestors() -> None:
+    table = _table()
+    broken = _op("land", _x("p"), _x("q"), broken=True)
+    restrict = Restrict(line=1, column=1, predicate=_x("p"), relation=_x("R"))
+    root = UnaryOp(
+        line=1,
+        column=1,
+        operator="lnot",
+        operand=_op(
+            "+",
+            broken,
+            FunctionApp(line=1, column=1, function=_x("f"), args=[restrict]),
+        ),
+    )
+    table.annotate(root)
+    assert table.has_line_breaks(root)
+    assert table.contains_dat_construct(root)
+    assert table.contains_connective(root)
+    assert table.max_depth(root) == 5
+    assert not table.has_line_breaks(restrict)
+    assert not table.contains_connective(restrict)
+    assert table.max_depth(_x()) == 1
+
+
+def test_line_breaks_follow_layout_rules() -> None:
+    """Only the children the layout rules name carry a line break up."""
+    table = _table()
+    broken = _op("+", _x(), _x(), broken=True)
+    assert table.has_line_breaks(
+        FunctionApp(line=1, column=1, function=_x("f"), args=[broken])
+    )
+    hidden = Lambda(
+        line=1,
+        column=1,
+        variables=["x"],
+        domain=broken,
+        body=_x(),
+    )
+    assert not table.has_line_breaks(hidden)
+
+
+def test_equal_subtrees_are_annotated_once() -> None:
+    table = _table()
+    document = Parser(Lexer("x + y = z\n\ny = x + y\n").tokenize()).parse()
+    assert isinstance(document, Document)
+    table.annotate(document)
+    annotated = len(table)
+    # Two Identifiers x, y, z, one x + y, two equations, the document.
+    assert annotated == 7
+    for item in document.items:
+        assert not table.has_line_breaks(item)
+    assert len(table) == annotated
+
+
+def test_new_node_is_annotated_on_first_query() -> None:
+    table = _table()
+    table.annotate(_op("land", _x("p"), _x("q")))
+    annotated = len(table)
+    built = _op("lor", _x("p"), _op("land", _x("p"), _x("q")))
+    assert table.contains_connective(built)
+    assert len(table) == annotated + 1
+    assert table.max_depth(built) == 3
+
+
+def test_generate_document_annotates_whole_tree() -> None:
+    text = "X == { x : N | x > 0 }\n\nR == sigma[p](R2)\n"
+    document = Parser(Lexer(text).tokenize()).parse()
+    assert isinstance(document, Document)
+    generator = LaTeXGenerator()
+    generator.generate_document(document)
+    annotated = len(generator._annotations)
+    assert annotated > 0
+    for item in document.items:
+        generator._annotations.max_depth(item)
+    assert len(generator._annotations) == annotated
+
+
+def test_equal_siblings_are_expanded_once() -> None:
+    """Shapes form a DAG; annotating one must not re-walk shared parts."""
+
+    def doubled(levels: int) -> Expr:
+        if levels == 0:
+            return _x()
+        return _op("+", doubled(levels - 1), doubled(levels - 1))
+
+    table = _table()
+    root = doubled(12)
+    table.annotate(root)
+    assert len(table) == 13
+    assert table.max_depth(root) == 13
@@ -0,0 +1,222 @@
+"""Depth-10,000 expressions parse, generate and analyse without recursion.
+
+Operator chains are parsed, generated and walked from explicit stacks, so
+their depth is bounded by memory rather than ``sys.getrecursionlimit()``.
+Nested quantifiers, lambdas, conditionals, parentheses, literals,
+argument lists, set comprehensions and proof trees are parsed and
+generated the same way.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from txt2tex.ast_nodes import (
+    BagLiteral,
+    BinaryOp,
+    Binding,
+    CaseAnalysis,
+    Conditional,
+    Document,
+    Expr,
+    FunctionApp,
+    FunctionType,
+    Lambda,
+    ProofNode,
+    ProofTree,
+    Quantifier,
+    SequenceLiteral,
+    SetComprehension,
+    SetLiteral,
+    UnaryOp,
+)
+from txt2tex.ast_walk import walk
+from txt2tex.free_vars import expr_free_vars
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+
+DEPTH = 10_000
+
+CHAINS = {
+    "implies": " => ".join(f"p{i}" for i in range(DEPTH)),
+    "land": " land ".join(f"p{i}" for i in range(DEPTH)),
+    "lnot": "lnot " * DEPTH + "p",
+    "arrow": " -> ".join(f"A{i}" for i in range(DEPTH)),
+}
+
+# Each nests DEPTH quantifiers, lambdas or conditionals, or (for "parens")
+# DEPTH parenthesised land operators.
+NESTED = {
+    "forall": "".join(f"forall x{i} : N | " for i in range(DEPTH)) + "p",
+    "forall_land": "".join(f"forall x{i} : N | x{i} > 0 land " for i in range(DEPTH))
+    + "p",
+    "exists_implies": "".join(f"exists x{i} : N | x{i} > 0 => " for i in range(DEPTH))
+    + "p",
+    "lambda": "".join(f"lambda x{i} : N . " for i in range(DEPTH)) + "x0",
+    "if_else": "".join(f"if x = {i} then {i} else " for i in range(DEPTH)) + "0",
+    "if_then": "".join(f"if p{i} then " for i in range(DEPTH))
+    + "x"
+    + " else y" * DEPTH,
+    "parens": "(" * DEPTH + "p" + "".join(f" land q{i})" for i in range(DEPTH)),
+}
+
+# Each nests DEPTH literals, argument lists or set comprehensions, with the
+# node type they nest and the LaTeX that opens each one.
+LITERALS: dict[str, tuple[str, type[Expr], str]] = {
+    "set": ("{" * DEPTH + "x" + "}" * DEPTH, SetLiteral, r"\{"),
+    "sequence": ("<" * DEPTH + "x" + ">" * DEPTH, SequenceLiteral, r"\langle"),
+    "bag": ("[[" * DEPTH + "x" + "]]" * DEPTH, BagLiteral, r"\lbag"),
+    "binding": ("{| a == " * DEPTH + "x" + " |}" * DEPTH, Binding, r"\lblot"),
+    "application": ("f(a, " * DEPTH + "x" + ")" * DEPTH, FunctionApp, "f("),
+    "set_comprehension": (
+        "".join(f"{{x{i} : N | p . " for i in range(DEPTH)) + "s" + "}" * DEPTH,
+        SetComprehension,
+        r"\{~",
+    ),
+}
+
+
+def _parse(text: str) -> Document | Expr:
+    return Parser(Lexer(text).tokenize()).parse()
+
+
+def _depth(expr: Expr) -> int:
+    """Length of the operator spine, walked iteratively."""
+    depth = 0
+    node: Expr | None = expr
+    while node is not None:
+        depth += 1
+        if isinstance(node, BinaryOp):
+            # => nests to the right, land to the left.
+            node = node.right if node.operator == "=>" else node.left
+        elif isinstance(node, FunctionType):
+            node = node.range
+        elif isinstance(node, UnaryOp):
+            node = node.operand
+        else:
+            node = None
+    return depth
+
+
+@pytest.fixture(autouse=True)
+def _low_recursion_limit() -> object:
+    """Pin a limit well below DEPTH so a recursive walk fails loudly."""
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(1000)
+    yield
+    sys.setrecursionlimit(limit)
+
+
+@pytest.mark.parametrize("name", sorted(CHAINS))
+def test_deep_chain_parses(name: str) -> None:
+    ast = _parse(CHAINS[name])
+    assert isinstance(ast, (BinaryOp, FunctionType, UnaryOp))
+    # The lnot chain has DEPTH operators over one identifier.
+    expected = DEPTH + 1 if name == "lnot" else DEPTH
+    assert _depth(ast) == expected
+
+
+@pytest.mark.parametrize("name", sorted(CHAINS))
+def test_deep_chain_generates(name: str) -> None:
+    latex = LaTeXGenerator().generate_document(_parse(CHAINS[name]))
+    assert "p9999" in latex or "A9999" in latex or r"\lnot p" in latex
+
+
+@pytest.mark.parametrize("name", sorted(CHAINS))
+def test_deep_chain_free_vars(name: str) -> None:
+    ast = _parse(CHAINS[name])
+    assert not isinstance(ast, Document)
+    expected = {"lnot": 1}.get(name, DEPTH)
+    assert len(expr_free_vars(ast)) == expected
+
+
+@pytest.mark.parametrize("name", sorted(NESTED))
+def test_deep_nesting_parses(name: str) -> None:
+    ast = _parse(NESTED[name])
+    assert not isinstance(ast, Document)
+    nested = BinaryOp if name == "parens" else (Quantifier, Lambda, Conditional)
+    assert sum(isinstance(node, nested) for node in walk(ast)) == DEPTH
+
+
+@pytest.mark.parametrize("use_fuzz", [False, True])
+@pytest.mark.parametrize("name", sorted(NESTED))
+def test_deep_nesting_generates(name: str, *, use_fuzz: bool) -> None:
+    latex = LaTeXGenerator(use_fuzz=use_fuzz).generate_document(_parse(NESTED[name]))
+    assert str(DEPTH - 1) in latex
+
+
+@pytest.mark.parametrize("name", sorted(LITERALS))
+def test_deep_literal_parses(name: str) -> None:
+    text, nested, _ = LITERALS[name]
+    ast = _parse(text)
+    assert not isinstance(ast, Document)
+    assert sum(isinstance(node, nested) for node in walk(ast)) == DEPTH
+
+
+@pytest.mark.parametrize("name", sorted(LITERALS))
+def test_deep_literal_generates(name: str) -> None:
+    text, _, opener = LITERALS[name]
+    latex = LaTeXGenerator().generate_document(_parse(text))
+    assert latex.count(opener) == DEPTH
+
+
+def _proof_text(depth: int) -> str:
+    """A proof whose conclusion rests on ``depth`` nested premises.
+
+    Every premise is indented one column further than its conclusion, and
+    every other one opens a case analysis.
+    """
+    lines = ["PROOF:"]
+    for i in range(depth):
+        step = f"case c{i}:" if i % 2 else f"p{i} [rule]"
+        lines.append(" " * i + step)
+    return "\n".join(lines) + "\n"
+
+
+def test_deep_proof_parses_and_generates() -> None:
+    ast = _parse(_proof_text(DEPTH))
+    assert isinstance(ast, Document)
+    (proof,) = ast.items
+    assert isinstance(proof, ProofTree)
+    node: ProofNode | CaseAnalysis = proof.conclusion
+    levels = 1
+    while steps := node.steps if isinstance(node, CaseAnalysis) else node.children:
+        (node,) = steps
+        levels += 1
+    assert levels == DEPTH
+    latex = LaTeXGenerator().generate_document(ast)
+    assert latex.count(r"\infer[") == DEPTH // 2
+    assert f"p{DEPTH - 2}" in latex
+
+
+def test_deep_proof_from_assumption_generates() -> None:
+    """Derivations from a boxed assumption are generated iteratively too."""
+    lines = ["PROOF:", "p => q [=> intro from 1]", "  [1] p [assumption]"]
+    lines.extend(" " * (i + 4) + f"q{i} [rule]" for i in range(DEPTH))
+    latex = LaTeXGenerator().generate_document(_parse("\n".join(lines) + "\n"))
+    assert latex.count(r"\infer[") == DEPTH + 1
+    assert r"\ulcorner p \urcorner^{[1]}" in latex
+
+
+def test_deep_nesting_reports_errors() -> None:
+    """A syntax error deep inside nested rules still surfaces as ParserError."""
+    with pytest.raises(ParserError, match=r"Expected '\)'"):
+        _parse("(" * DEPTH + "forall x : N | p")
+
+
+def test_deep_chain_in_document_paragraphs() -> None:
+    """Line-break and relational-construct scans run over deep predicates."""
+    chain = CHAINS["land"]
+    text = f"=== Deep ===\n\naxdef\n  x : N\nwhere\n  {chain}\nend\n\nX == {chain}\n"
+    ast = _parse(text)
+    assert isinstance(ast, Document)
+    generator = LaTeXGenerator()
+    latex = generator.generate_document(ast)
+    assert "p9999" in latex
+    root = _parse(chain)
+    assert not isinstance(root, Document)
+    assert not generator._has_line_breaks(root)
+    assert not generator._expression_contains_dat_construct(root)
@@ -87,7 +87,7 @@ def test_set_comprehension_multiple_variables() -> None:
     result = parser.parse()
     assert isinstance(result, SetComprehension)
     assert len(result.variables) == 2
-    assert result.variables == ["x", "y"]
+    assert result.variables == ("x", "y")
 
 
 def test_quantifier_no_domain() -> None:
@@ -0,0 +1,123 @@
+"""Tests for the single-probe, cached --check-env."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from txt2tex.environment import (
+    REQUIRED_PACKAGES,
+    check_environment,
+    package_status,
+    probe_packages,
+)
+
+# Stand-in for pdflatex: answers the probe document from an allow-list of
+# "installed" packages and counts its invocations.  Like TeX, it takes the
+# branch of each top-level \IfFileExists and writes each \typeout message
+# as written: a robust command inside the message is not expanded.
+FAKE_PDFLATEX = """\
+#!{python}
+import re, sys
+from pathlib import Path
+
+here = Path(__file__).parent
+calls = here / "calls"
+calls.write_text(str(int(calls.read_text() or 0) + 1) if calls.exists() else "1")
+installed = (here / "installed").read_text().split()
+tex = Path(sys.argv[-1])
+branch = re.compile(
+    r"^\\\\IfFileExists\\{{(\\w+)\\.sty\\}}\\{{(.*?)\\}}\\{{(.*?)\\}}$", re.M
+)
+source = branch.sub(lambda m: m[2] if m[1] in installed else m[3], tex.read_text())
+lines = re.findall(r"\\\\typeout\\{{(.*)\\}}$", source, re.M)
+tex.with_suffix(".log").write_text("\\n".join(lines) + "\\n")
+"""
+
+
+@pytest.fixture
+def tex_bin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A PATH directory holding only the fake pdflatex, all packages present."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    pdflatex = bin_dir / "pdflatex"
+    pdflatex.write_text(FAKE_PDFLATEX.format(python=sys.executable))
+    pdflatex.chmod(pdflatex.stat().st_mode | stat.S_IXUSR)
+    (bin_dir / "installed").write_text(" ".join(REQUIRED_PACKAGES))
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return bin_dir
+
+
+def _calls(tex_bin: Path) -> int:
+    calls = tex_bin / "calls"
+    return int(calls.read_text()) if calls.exists() else 0
+
+
+def test_probe_reports_each_package_in_one_run(tex_bin: Path) -> None:
+    (tex_bin / "installed").write_text("adjustbox geometry")
+    result = probe_packages(str(tex_bin / "pdflatex"), REQUIRED_PACKAGES)
+    assert result == {
+        "adjustbox": True,
+        "natbib": False,
+        "geometry": True,
+        "amsfonts": False,
+        "hyperref": False,
+    }
+    assert _calls(tex_bin) == 1
+
+
+@pytest.mark.skipif(shutil.which("pdflatex") is None, reason="pdflatex not on PATH")
+def test_probe_with_real_pdflatex() -> None:
+    pdflatex = shutil.which("pdflatex")
+    assert pdflatex is not None
+    result = probe_packages(pdflatex, ("geometry", "txt2tex-no-such-package"))
+    assert result == {"geometry": True, "txt2tex-no-such-package": False}
+
+
+def test_complete_result_is_cached(tex_bin: Path) -> None:
+    pdflatex = str(tex_bin / "pdflatex")
+    assert all(package_status(pdflatex).values())
+    assert all(package_status(pdflatex).values())
+    assert _calls(tex_bin) == 1
+
+
+def test_missing_package_is_not_cached(tex_bin: Path) -> None:
+    (tex_bin / "installed").write_text("adjustbox")
+    pdflatex = str(tex_bin / "pdflatex")
+    assert not package_status(pdflatex)["natbib"]
+    (tex_bin / "installed").write_text(" ".join(REQUIRED_PACKAGES))
+    assert package_status(pdflatex)["natbib"]
+    assert _calls(tex_bin) == 2
+
+
+def test_cache_keyed_by_distribution_mtime(tex_bin: Path) -> None:
+    pdflatex = tex_bin / "pdflatex"
+    package_status(str(pdflatex))
+    st = pdflatex.stat()
+    os.utime(pdflatex, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    package_status(str(pdflatex))
+    assert _calls(tex_bin) == 2
+
+
+def test_no_cache_always_probes(tex_bin: Path) -> None:
+    pdflatex = str(tex_bin / "pdflatex")
+    package_status(pdflatex)
+    package_status(pdflatex, use_cache=False)
+    assert _calls(tex_bin) == 2
+
+
+def test_check_environment_report(
+    tex_bin: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tex_bin / "installed").write_text("adjustbox natbib geometry amsfonts")
+    assert check_environment() == 1
+    out = capsys.readouterr().out
+    assert "✓ natbib" in out
+    assert "✗ hyperref: NOT FOUND" in out
+    assert "○ latexmk: not found" in out
+    assert "○ tex-fmt: not found" in out
@@ -0,0 +1,134 @@
+"""Tests for the precompiled-preamble (.fmt) mode."""
+
+from __future__ import annotations
+
+import stat
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.compile import compile_pdf, get_latex_dir
+from txt2tex.formats import ensure_format, format_family, preamble_lines
+from txt2tex.pipeline import ConversionOptions, convert_text
+from txt2tex.repl import generate_preview_document
+
+SOURCE = "schema S\n  n : N\nwhere\n  n > 0\nend\n"
+
+# Stand-in for `pdflatex -ini`: writes <jobname>.fmt and counts its runs.
+FAKE_PDFLATEX = """\
+#!{python}
+import sys
+from pathlib import Path
+
+calls = Path(__file__).parent / "calls"
+calls.write_text(str(int(calls.read_text()) + 1) if calls.exists() else "1")
+job = next(a.split("=", 1)[1] for a in sys.argv if a.startswith("-jobname="))
+Path(job + ".fmt").write_text("dump")
+"""
+
+
+@pytest.mark.parametrize("family", ["fuzz", "zed"])
+def test_generated_preamble_matches_format(family: str) -> None:
+    """generate_document must keep emitting exactly the preamble we dump."""
+    options = ConversionOptions(use_fuzz=family == "fuzz")
+    latex = convert_text(SOURCE, options).latex
+    expected = preamble_lines(family)
+    assert latex.splitlines()[: len(expected)] == expected
+    assert format_family(latex) == family
+
+
+@pytest.mark.parametrize("family", ["fuzz", "zed"])
+def test_repl_preview_can_use_format(family: str) -> None:
+    preview = generate_preview_document("$x$", use_fuzz=family == "fuzz")
+    assert format_family(preview) == family
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "\\documentclass{article}\n\\usepackage{fuzz}\n",
+        (
+            "\\documentclass[a4paper,10pt,fleqn]{article}\n\\usepackage{tikz}\n"
+            "\\usepackage{fuzz}\n"
+        ),
+        "\\documentclass[a4paper,10pt,fleqn]{article}\n\\usepackage{amssymb}\n",
+    ],
+)
+def test_custom_preamble_has_no_format(document: str) -> None:
+    assert format_family(document) is None
+
+
+@pytest.fixture
+def fake_pdflatex(tmp_path: Path) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    pdflatex = bin_dir / "pdflatex"
+    pdflatex.write_text(FAKE_PDFLATEX.format(python=sys.executable))
+    pdflatex.chmod(pdflatex.stat().st_mode | stat.S_IXUSR)
+    return pdflatex
+
+
+def test_format_is_built_once_and_cached(fake_pdflatex: Path) -> None:
+    first = ensure_format("fuzz", str(fake_pdflatex), get_latex_dir())
+    second = ensure_format("fuzz", str(fake_pdflatex), get_latex_dir())
+    assert first is not None
+    assert first == second
+    assert first.read_text() == "dump"
+    assert (fake_pdflatex.parent / "calls").read_text() == "1"
+    zed = ensure_format("zed", str(fake_pdflatex), get_latex_dir())
+    assert zed is not None
+    assert zed != first
+
+
+@pytest.fixture
+def tex_document(tmp_path: Path) -> Path:
+    tex_path = tmp_path / "doc.tex"
+    tex_path.write_text(convert_text(SOURCE, ConversionOptions()).latex)
+    tex_path.with_suffix(".pdf").write_text("")
+    return tex_path
+
+
+def _which(available: dict[str, str]) -> object:
+    return lambda name: available.get(name)
+
+
+def test_precompiled_pdflatex_build_uses_fmt(tex_document: Path) -> None:
+    fmt = Path("/cache/txt2tex-fuzz-0123.fmt")
+    done = subprocess.CompletedProcess[str]([], 0, "", "")
+    with (
+        patch("txt2tex.compile.shutil.which", _which({"pdflatex": "/bin/pdflatex"})),
+        patch("txt2tex.compile.ensure_format", return_value=fmt),
+        patch("txt2tex.compile.subprocess.run", return_value=done) as run,
+    ):
+        assert compile_pdf(tex_document, precompiled=True)
+    for call in run.call_args_list:
+        assert f"-fmt={fmt}" in call.args[0]
+
+
+def test_precompiled_latexmk_build_uses_fmt(tex_document: Path) -> None:
+    fmt = Path("/cache/txt2tex-fuzz-0123.fmt")
+    done = subprocess.CompletedProcess[str]([], 0, "", "")
+    tools = {"pdflatex": "/bin/pdflatex", "latexmk": "/bin/latexmk"}
+    with (
+        patch("txt2tex.compile.shutil.which", _which(tools)),
+        patch("txt2tex.compile.ensure_format", return_value=fmt),
+        patch("txt2tex.compile.subprocess.run", return_value=done) as run,
+    ):
+        assert compile_pdf(tex_document, precompiled=True)
+    args = run.call_args_list[0].args[0]
+    assert f"-pdflatex=/bin/pdflatex -fmt={fmt} %O %S" in args
+
+
+def test_default_build_does_not_use_fmt(tex_document: Path) -> None:
+    done = subprocess.CompletedProcess[str]([], 0, "", "")
+    with (
+        patch("txt2tex.compile.shutil.which", _which({"pdflatex": "/bin/pdflatex"})),
+        patch("txt2tex.compile.ensure_format") as ensure,
+        patch("txt2tex.compile.subprocess.run", return_value=done) as run,
+    ):
+        assert compile_pdf(tex_document)
+    ensure.assert_not_called()
+    assert not any("-fmt" in " ".join(c.args[0]) for c in run.call_args_list)
@@ -0,0 +1,106 @@
+"""The memoized free-variable service agrees with expr_free_vars.
+
+``FreeVariables`` caches each set it computes by the expression's
+interned shape and reuses cached sets while computing new ones.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from txt2tex.ast_nodes import (
+    BinaryOp,
+    Binding,
+    Document,
+    Expr,
+    Identifier,
+    Quantifier,
+    SetLiteral,
+)
+from txt2tex.ast_walk import walk
+from txt2tex.free_vars import FreeVariables, expr_free_vars
+from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+
+def _x(name: str, column: int = 1) -> Identifier:
+    return Identifier(line=1, column=column, name=name)
+
+
+def _union(left: Expr, right: Expr) -> BinaryOp:
+    return BinaryOp(line=1, column=1, operator="union", left=left, right=right)
+
+
+def _forall(name: str, domain: Expr, body: Expr) -> Quantifier:
+    return Quantifier(
+        line=1,
+        column=1,
+        quantifier="forall",
+        variables=[name],
+        domain=domain,
+        body=body,
+    )
+
+
+def test_agrees_with_expr_free_vars() -> None:
+    text = (
+        "forall x : N | exists y : {x} | x = y land z > 0\n\n"
+        "{ a : A | a elem B . (a, c) }\n\n"
+        "(lambda f : X -> Y . f(w)) (g)\n"
+    )
+    document = Parser(Lexer(text).tokenize()).parse()
+    assert isinstance(document, Document)
+    free_vars = FreeVariables()
+    for item in document.items:
+        for node in walk(item):
+            if isinstance(node, Expr):
+                assert free_vars(node) == expr_free_vars(node)
+
+
+def test_repeated_and_equal_queries_share_one_set() -> None:
+    free_vars = FreeVariables()
+    first = free_vars(_union(_x("a"), _x("b")))
+    # Structurally equal, at another position: answered from the cache.
+    assert free_vars(_union(_x("a", 7), _x("b", 9))) is first
+    assert len(free_vars) == 1
+    # A different expression with the same free variables shares the set.
+    assert free_vars(_union(_x("b"), _x("a"))) is first
+    assert len(free_vars) == 2
+
+
+def test_cached_subtrees_are_reused() -> None:
+    free_vars = FreeVariables()
+    inner = _forall("x", _x("A"), _union(_x("x"), _x("y")))
+    assert free_vars(inner) == {"A", "y"}
+    outer = _union(inner, _x("z"))
+    assert free_vars(outer) == {"A", "y", "z"}
+    assert len(free_vars) == 2
+
+
+def test_deep_chain_does_not_recurse() -> None:
+    domain: Expr = _x("s0")
+    for i in range(1, sys.getrecursionlimit() + 100):
+        domain = _union(domain, SetLiteral(line=1, column=1, elements=[_x(f"s{i}")]))
+    assert len(FreeVariables()(domain)) == sys.getrecursionlimit() + 100
+
+
+def test_binding_still_raises() -> None:
+    with pytest.raises(NotImplementedError, match="Binding node not yet supported"):
+        FreeVariables()(Binding(line=1, column=1, pairs=[]))
+
+
+def test_generator_caches_inner_domains() -> None:
+    document = Parser(Lexer("forall a : A | forall b : B | a = b\n").tokenize()).parse()
+    assert isinstance(document, Document)
+    generator = LaTeXGenerator()
+    generator.generate_document(document)
+    assert len(generator._free_vars) == 1
+    (outer,) = document.items
+    assert isinstance(outer, Quantifier)
+    assert isinstance(outer.body, Quantifier)
+    assert outer.body.domain is not None
+    assert generator._free_vars(outer.body.domain) == {"B"}
+    assert len(generator._free_vars) == 1
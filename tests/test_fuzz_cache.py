@@ -0,0 +1,137 @@
+"""Tests for the per-paragraph fuzz verdict cache."""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.compile import typecheck_fuzz
+from txt2tex.fuzz_cache import dependency_closures, split_paragraphs
+from txt2tex.pipeline import ConversionOptions, convert_text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+SOURCE = """\
+given Person
+
+Gate ::= locked | unlocked
+
+schema State
+  gate : Gate
+end
+
+axdef
+  limit : N
+where
+  limit > 0
+end
+
+schema Visitors
+  seen : P Person
+end
+"""
+
+# Stand-in for fuzz: logs every document it checks and rejects any
+# containing "bad".
+FAKE_FUZZ = """\
+#!{python}
+import sys
+from pathlib import Path
+
+text = Path(sys.argv[1]).read_text()
+with (Path(__file__).parent / "checked").open("a") as log:
+    log.write(text + "\\f")
+sys.exit(1 if "bad" in text else 0)
+"""
+
+
+@pytest.fixture
+def fuzz(tmp_path: Path) -> Iterator[Path]:
+    """Install the fake fuzz; yields its log of checked documents."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "fuzz"
+    script.write_text(FAKE_FUZZ.replace("{python}", sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    with patch("txt2tex.compile.shutil.which", return_value=str(script)):
+        yield bin_dir / "checked"
+
+
+def _checked(log: Path) -> list[str]:
+    return log.read_text().split("\f")[:-1] if log.exists() else []
+
+
+@pytest.fixture
+def tex_path(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.tex"
+    path.write_text(convert_text(SOURCE, ConversionOptions()).latex)
+    return path
+
+
+def test_paragraph_definitions_and_dependencies(tex_path: Path) -> None:
+    paragraphs = split_paragraphs(tex_path.read_text())
+    assert [sorted(p.defines) for p in paragraphs] == [
+        ["Gate", "Person", "locked", "unlocked"],
+        ["State"],
+        ["limit"],
+        ["Visitors"],
+    ]
+    assert dependency_closures(paragraphs) == [[0], [0, 1], [2], [0, 3]]
+
+
+def test_unchanged_document_skips_fuzz(fuzz: Path, tex_path: Path) -> None:
+    assert typecheck_fuzz(tex_path)
+    assert len(_checked(fuzz)) == 1
+    assert typecheck_fuzz(tex_path)
+    assert len(_checked(fuzz)) == 1
+
+
+def test_edit_rechecks_paragraph_with_dependencies(fuzz: Path, tex_path: Path) -> None:
+    assert typecheck_fuzz(tex_path)
+    tex_path.write_text(tex_path.read_text().replace("seen", "visited"))
+    assert typecheck_fuzz(tex_path)
+
+    reduced = _checked(fuzz)[-1]
+    assert "visited" in reduced
+    assert "[Person]" in reduced
+    assert "State" not in reduced
+    assert "limit" not in reduced
+    assert not list(tex_path.parent.glob("*-fuzz-reduced.tex"))
+
+
+def test_failure_is_reported_from_full_document(fuzz: Path, tex_path: Path) -> None:
+    full = tex_path.read_text()
+    assert typecheck_fuzz(tex_path)
+    tex_path.write_text(full.replace("seen", "bad"))
+    assert not typecheck_fuzz(tex_path)
+    assert _checked(fuzz)[-1] == tex_path.read_text()
+
+    # The failing paragraph was not cached: it is checked again.
+    runs = len(_checked(fuzz))
+    assert not typecheck_fuzz(tex_path)
+    assert len(_checked(fuzz)) > runs
+
+
+def test_no_cache_checks_full_document(fuzz: Path, tex_path: Path) -> None:
+    assert typecheck_fuzz(tex_path, use_cache=False)
+    assert typecheck_fuzz(tex_path, use_cache=False)
+    assert _checked(fuzz) == [tex_path.read_text()] * 2
+
+
+def test_preamble_change_rechecks_every_paragraph(fuzz: Path, tex_path: Path) -> None:
+    """fuzz sees the preamble, so editing it invalidates every verdict."""
+    assert typecheck_fuzz(tex_path)
+    full = tex_path.read_text()
+    edited = full.replace(
+        "\\begin{document}", "\\newcommand{\\extra}{}\n\\begin{document}"
+    )
+    tex_path.write_text(edited)
+    assert typecheck_fuzz(tex_path)
+    assert len(_checked(fuzz)) == 2
+    assert _checked(fuzz)[-1] == edited
@@ -186,7 +186,7 @@ def test_parse_regroup_form_unchanged() -> None:
     """R group ({a, b} as alias) still parses to the regroup Group node."""
     node = _expr("R group ({a, b} as alias)")
     assert isinstance(node, Group)
-    assert node.attrs == ["a", "b"]
+    assert node.attrs == ("a", "b")
     assert node.alias == "alias"
 
 
@@ -0,0 +1,97 @@
+"""The master-pattern fast path must lex exactly like the per-character path.
+
+``_scan_token`` recognises common tokens with one match of ``_FAST_TOKEN``
+and defers everything else to ``_scan_special_token``, which on its own
+handles every token.  A lexer forced through the special path is the
+reference the fast path is compared against.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from txt2tex.lexer import Lexer, LexerError
+from txt2tex.tokens import Token
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+# Fragments chosen to exercise every context rule the fast path defers on.
+FRAGMENTS = [
+    *"()[]{}|<>=-+*/.:;,#~!^'\\ \t\n_0123456789axyzPF",
+    *"×⟨⟩⌢↾⊎²αé",  # noqa: RUF001
+    "===",
+    "**",
+    "{|",
+    "|}",
+    "77->",
+    "o9",
+    "/in",
+    "/inx",
+    "x > y",
+    "<x>",
+    "<<a>, <b>>",
+    " >> ",
+    "> ^ <",
+    ">^<",
+    "\\\n",
+    "// note\n",
+    "'str'",
+    "x'",
+    "y?",
+    "z!",
+    "479_c",
+    "(a) ",
+    "\n(aa)\n",
+    "----------",
+    "\n---",
+    "TEXT: a b",
+    "The end",
+    "A function",
+    "TRUTH TABLE:",
+    "forall",
+    "Let's",
+    "->",
+    ">->>",
+    "-->>",
+    "+->>",
+    "|->",
+    "<<|",
+    "|>>",
+    "::=",
+    "...",
+]
+
+
+class _ReferenceLexer(Lexer):
+    """Lexer with the fast path disabled."""
+
+    def _scan_token(self) -> Token | None:
+        return self._scan_special_token()
+
+
+def _lex(lexer_class: type[Lexer], text: str) -> list[Token] | str:
+    try:
+        return lexer_class(text).tokenize()
+    except LexerError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(EXAMPLES_DIR.rglob("*.txt")),
+    ids=lambda path: path.name,
+)
+def test_examples_lex_identically(path: Path) -> None:
+    text = path.read_text()
+    assert _lex(Lexer, text) == _lex(_ReferenceLexer, text)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_fragments_lex_identically(seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311 - reproducible test inputs
+    for _ in range(2000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 20)))
+        assert _lex(Lexer, text) == _lex(_ReferenceLexer, text), repr(text)
@@ -10,6 +10,7 @@ These tests pin the corrected behaviour.
 from __future__ import annotations
 
 from txt2tex.latex_gen import LaTeXGenerator
+from txt2tex.source import SourceFile
 
 
 def _make_gen(threshold: int = 5) -> LaTeXGenerator:
@@ -102,3 +103,13 @@ def test_overflow_warnings_disabled_emits_nothing() -> None:
         content_preview=None,
     )
     assert gen.get_warnings() == []
+
+
+def test_source_line_is_quoted_when_source_is_known() -> None:
+    """With the source at hand, the preview quotes the offending source line."""
+    source = SourceFile("x = 1\n  forall y : N | y > 0  \n")
+    gen = LaTeXGenerator(warn_overflow=True, overflow_threshold=3, source=source)
+    gen._check_overflow(latex="x" * 80, source_line=2, context="test")
+    warnings = gen.get_warnings()
+    assert len(warnings) == 1
+    assert "Content: forall y : N | y > 0\n" in warnings[0]
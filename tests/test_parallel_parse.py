@@ -0,0 +1,169 @@
+"""Parsing sections and solutions in a process pool must match ``parse``.
+
+``Parser.parse_parallel`` splits the tokens at line-initial section and
+solution heads, parses the blocks in worker processes and reattaches each
+solution to its section.  The result, and any ``ParserError``, must be
+exactly what the serial parser produces.
+"""
+
+from __future__ import annotations
+
+import itertools
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from txt2tex.ast_nodes import Document, Section, Solution
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+from txt2tex.parser_pkg.blocks import Block, split_blocks
+from txt2tex.parser_pkg.token_window import TokenWindow
+from txt2tex.tokens import Token, TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+DOCUMENT = """TITLE: Exercises
+
+x > 0
+
+** Solution 0 **
+
+y = 1
+
+=== First ===
+
+TEXT: Introduction.
+
+** Solution 1 **
+
+(a) p land q
+
+(b) forall x : N | x >= 0
+
+** Solution 2 **
+
+TEXT: Some prose with ** stars ** inside.
+
+=== Second ===
+
+** Solution 3 **
+
+axdef
+  f : N -> N
+where
+  f(0) = 1
+end
+"""
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def _tokens(text: str) -> list[Token]:
+    return Lexer(text).tokenize()
+
+
+def _serial(tokens: list[Token]) -> str:
+    try:
+        return repr(Parser(tokens).parse())
+    except ParserError as e:
+        return f"ParserError: {e}"
+
+
+def _parallel(tokens: list[Token], pool: ProcessPoolExecutor) -> str:
+    try:
+        return repr(Parser(tokens).parse_parallel(executor=pool))
+    except ParserError as e:
+        return f"ParserError: {e}"
+
+
+def test_split_blocks_finds_section_and_solution_heads() -> None:
+    tokens = _tokens(DOCUMENT)
+    blocks = split_blocks(tokens)
+    assert [(b.kind, b.section) for b in blocks] == [
+        ("solution", None),
+        ("section", None),
+        ("solution", 1),
+        ("solution", 1),
+        ("section", None),
+        ("solution", 4),
+    ]
+    heads = [tokens[b.start] for b in blocks]
+    assert [t.line for t in heads] == [5, 9, 13, 19, 23, 25]
+    assert blocks[-1].end == len(tokens) - 1
+    assert all(a.end == b.start for a, b in itertools.pairwise(blocks))
+
+
+def test_split_blocks_ignores_unclosed_and_mid_line_markers() -> None:
+    assert split_blocks(_tokens("x = 1\n\n=== Unclosed\n\ny\n")) == []
+    assert split_blocks(_tokens("x = 2 ** 3\n")) == []
+    assert split_blocks(_tokens("=== A ===\n")) == [Block("section", 0, 4)]
+
+
+def test_parallel_matches_serial(pool: ProcessPoolExecutor) -> None:
+    tokens = _tokens(DOCUMENT)
+    document = Parser(tokens).parse_parallel(executor=pool)
+    assert repr(document) == _serial(tokens)
+    assert isinstance(document, Document)
+    first = document.items[2]
+    assert isinstance(first, Section)
+    assert [type(item).__name__ for item in first.items] == [
+        "Paragraph",
+        "Solution",
+        "Solution",
+    ]
+    assert isinstance(first.items[1], Solution)
+    assert first.items[1].line == 13
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(EXAMPLES_DIR.rglob("*.txt"))[::5],
+    ids=lambda p: p.name,
+)
+def test_examples_match_serial(path: Path, pool: ProcessPoolExecutor) -> None:
+    tokens = _tokens(path.read_text())
+    assert _parallel(tokens, pool) == _serial(tokens)
+
+
+def test_error_in_later_block_reports_serial_location(
+    pool: ProcessPoolExecutor,
+) -> None:
+    text = DOCUMENT.replace("  f(0) = 1\n", "  f(0) = = 1\n")
+    tokens = _tokens(text)
+    with pytest.raises(ParserError) as serial:
+        Parser(tokens).parse()
+    with pytest.raises(ParserError) as parallel:
+        Parser(tokens).parse_parallel(executor=pool)
+    assert str(parallel.value) == str(serial.value)
+    assert parallel.value.token.line == 30
+
+
+def test_leading_item_running_into_first_block_falls_back(
+    pool: ProcessPoolExecutor,
+) -> None:
+    tokens = _tokens("schema S\n  x : N\n\n=== A ===\n\n** Solution 1 **\n\ny\n")
+    assert _parallel(tokens, pool) == _serial(tokens)
+
+
+def test_single_block_and_streams_parse_serially() -> None:
+    tokens = _tokens("=== Only ===\n\nx = 1\n")
+    assert repr(Parser(tokens).parse_parallel(jobs=1)) == _serial(tokens)
+    window = TokenWindow(iter(_tokens(DOCUMENT)))
+    assert repr(Parser(window).parse_parallel()) == _serial(_tokens(DOCUMENT))
+
+
+def test_parser_error_pickles() -> None:
+    error = ParserError("Unexpected token", Token(TokenType.IDENTIFIER, "x", 3, 7))
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301 - round trip
+    assert str(restored) == str(error)
+    assert restored.token == error.token
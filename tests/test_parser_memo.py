@@ -0,0 +1,66 @@
+"""Packrat memo for rules re-entered after backtracking.
+
+A zed block probes each line's leading name with
+``_parse_compound_identifier_name`` to decide between a free type, an
+abbreviation and a predicate, then rewinds and parses the line for real;
+the abbreviation parser takes the probed name from the memo.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from txt2tex.ast_nodes import Abbreviation, Document, Zed
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+
+if TYPE_CHECKING:
+    import pytest
+
+ZED = "zed\nR+ == {a, b : N | b > a}\nS == N\nend\n"
+
+
+def test_probed_name_is_parsed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    parse_name = Parser._parse_compound_identifier_name
+
+    def counting(parser: Parser) -> str:
+        nonlocal calls
+        calls += 1
+        return parse_name(parser)
+
+    monkeypatch.setattr(Parser, "_parse_compound_identifier_name", counting)
+    document = Parser(Lexer(ZED).tokenize()).parse()
+
+    assert isinstance(document, Document)
+    zed = document.items[0]
+    assert isinstance(zed, Zed)
+    assert isinstance(zed.content, Document)
+    names = [item.name for item in zed.content.items if isinstance(item, Abbreviation)]
+    assert names == ["R+", "S"]
+    assert calls == 2
+
+
+def test_memo_replays_position_and_result() -> None:
+    parser = Parser(Lexer("R~ == inv R").tokenize())
+    name = parser._memoized("compound_name", parser._parse_compound_identifier_name)
+    end = parser.pos
+    parser.pos = 0
+    assert parser._memoized("compound_name", lambda: "unused") == name == "R~"
+    assert parser.pos == end
+
+
+def test_memo_key_includes_context_flags() -> None:
+    parser = Parser(Lexer("x").tokenize())
+    assert parser._memoized("rule", lambda: "plain") == "plain"
+    parser.pos = 0
+    parser._parsing_schema_text = True
+    assert parser._memoized("rule", lambda: "schema text") == "schema text"
+
+
+def test_memo_is_dropped_between_items() -> None:
+    parser = Parser(Lexer("x").tokenize())
+    parser._memoized("rule", lambda: "first")
+    parser._release_tokens()
+    parser.pos = 0
+    assert parser._memoized("rule", lambda: "second") == "second"
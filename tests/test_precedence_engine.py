@@ -0,0 +1,89 @@
+"""Precedence-climbing expression engine.
+
+``_parse_binary`` replaces one method per binary level; these cases pin
+the associativity and single-operator levels the per-level loops encoded.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from txt2tex.ast_nodes import (
+    BinaryOp,
+    Document,
+    Expr,
+    FunctionType,
+    Identifier,
+    Range,
+    UnaryOp,
+)
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser, ParserError
+from txt2tex.parser_pkg.precedence import FUNCTION_TYPE, INFIX_LEVELS, RELATION
+from txt2tex.tokens import TokenType
+
+
+def _parse(text: str) -> Expr:
+    result = Parser(Lexer(text).tokenize()).parse()
+    assert not isinstance(result, Document)
+    return result
+
+
+def _shape(expr: Expr) -> object:
+    """Render operator structure as nested tuples."""
+    if isinstance(expr, BinaryOp):
+        return (expr.operator, _shape(expr.left), _shape(expr.right))
+    if isinstance(expr, FunctionType):
+        return (expr.arrow, _shape(expr.domain), _shape(expr.range))
+    if isinstance(expr, UnaryOp):
+        return (expr.operator, _shape(expr.operand))
+    if isinstance(expr, Range):
+        return ("..", _shape(expr.start), _shape(expr.end))
+    assert isinstance(expr, Identifier)
+    return expr.name
+
+
+def test_left_and_right_associative_levels() -> None:
+    assert _shape(_parse("a land b land c")) == (
+        "land",
+        ("land", "a", "b"),
+        "c",
+    )
+    assert _shape(_parse("a => b => c")) == ("=>", "a", ("=>", "b", "c"))
+    assert _shape(_parse("A -> B -> C")) == ("->", "A", ("->", "B", "C"))
+
+
+def test_looser_operator_takes_whole_tighter_operands() -> None:
+    assert _shape(_parse("a lor b land c <=> d")) == (
+        "<=>",
+        ("lor", "a", ("land", "b", "c")),
+        "d",
+    )
+    assert _shape(_parse("x elem S union T intersect U")) == (
+        "elem",
+        "x",
+        ("union", "S", ("intersect", "T", "U")),
+    )
+
+
+def test_prefix_operator_binds_looser_than_arithmetic() -> None:
+    assert _shape(_parse("lnot a + b")) == ("lnot", ("+", "a", "b"))
+    assert _shape(_parse("# S intersect T")) == ("intersect", ("#", "S"), "T")
+
+
+def test_range_takes_one_operator() -> None:
+    assert _shape(_parse("a + b .. c")) == ("..", ("+", "a", "b"), "c")
+
+
+def test_second_comparison_is_left_unparsed() -> None:
+    with pytest.raises(ParserError, match="Unexpected token after expression"):
+        _parse("a = b = c")
+
+
+def test_comparison_on_next_line() -> None:
+    assert _shape(_parse("a land b\n= c")) == ("land", "a", ("=", "b", "c"))
+
+
+def test_relation_arrow_is_a_relation_operator() -> None:
+    assert INFIX_LEVELS[TokenType.RELATION] == (RELATION, FUNCTION_TYPE)
+    assert _shape(_parse("A <-> B <-> C")) == ("<->", ("<->", "A", "B"), "C")
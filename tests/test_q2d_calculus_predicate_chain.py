@@ -74,7 +74,7 @@ class TestMultiDeclPredicateChain:
         src = "{ s : Ship | s.name = 'X' . {| name == s.name |} }"
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is None
         assert isinstance(node.predicate, BinaryOp)
         assert node.predicate.operator == "="
@@ -101,7 +101,7 @@ class TestMultiDeclPredicateChain:
         src = "{ s : Ship; c : Class | s.class = c.class . {| name == s.name |} }"
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 1
         extra_name, extra_domain = node.extra_declarations[0]
@@ -136,7 +136,7 @@ class TestMultiDeclPredicateChain:
         )
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 1
         assert node.extra_declarations[0][0] == "c"
@@ -178,7 +178,7 @@ class TestMultiDeclPredicateChain:
         )
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 2
         assert node.extra_declarations[0][0] == "c"
@@ -214,13 +214,13 @@ class TestMultiDeclPredicateChain:
         node = _parse(src)
         assert isinstance(node, Quantifier)
         assert node.quantifier == "forall"
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert isinstance(node.domain, Identifier)
         assert node.domain.name == "Ship"
         inner = node.body
         assert isinstance(inner, Quantifier)
         assert inner.quantifier == "forall"
-        assert inner.variables == ["c"]
+        assert inner.variables == ("c",)
         assert isinstance(inner.body, BinaryOp)
         assert inner.body.operator == "land"
 
@@ -244,13 +244,13 @@ class TestMultiDeclPredicateChain:
         node = _parse(src)
         assert isinstance(node, Quantifier)
         assert node.quantifier == "exists"
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert isinstance(node.domain, Identifier)
         assert node.domain.name == "Ship"
         inner = node.body
         assert isinstance(inner, Quantifier)
         assert inner.quantifier == "exists"
-        assert inner.variables == ["c"]
+        assert inner.variables == ("c",)
         # The innermost body must be the full conjunction, not truncated.
         assert isinstance(inner.body, BinaryOp)
         assert inner.body.operator == "land"
@@ -280,7 +280,7 @@ class TestMultiDeclPredicateChain:
         src = "{ s : N; c : N | s < 10 land c < 10 . s + c }"
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 1
         assert node.extra_declarations[0][0] == "c"
@@ -317,7 +317,7 @@ class TestMultiDeclPredicateChain:
         src = "{ s : Ship | s.name = 'X' land s.class = 'Y' . {| name == s.name |} }"
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is None
         assert isinstance(node.predicate, BinaryOp)
         assert node.predicate.operator == "land"
@@ -349,13 +349,13 @@ class TestMultiDeclPredicateChain:
         node = _parse(src)
         assert isinstance(node, Quantifier)
         assert node.quantifier == "mu"
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert isinstance(node.domain, Identifier)
         assert node.domain.name == "Ship"
         inner = node.body
         assert isinstance(inner, Quantifier)
         assert inner.quantifier == "mu"
-        assert inner.variables == ["c"]
+        assert inner.variables == ("c",)
         assert isinstance(inner.body, BinaryOp)
         assert inner.body.operator == "land"
         assert isinstance(inner.body.left, BinaryOp)
@@ -389,13 +389,13 @@ class TestMultiDeclPredicateChain:
         node = _parse(src)
         assert isinstance(node, Quantifier)
         assert node.quantifier == "lambda"
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert isinstance(node.domain, Identifier)
         assert node.domain.name == "Ship"
         inner = node.body
         assert isinstance(inner, Quantifier)
         assert inner.quantifier == "lambda"
-        assert inner.variables == ["c"]
+        assert inner.variables == ("c",)
         assert isinstance(inner.body, BinaryOp)
         assert inner.body.operator == "land"
 
@@ -422,7 +422,7 @@ class TestMultiDeclPredicateChain:
         src = "{ s : Ship; c : Class | s.class = c.class land s.name = c.name }"
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 1
         assert node.extra_declarations[0][0] == "c"
@@ -458,7 +458,7 @@ class TestMultiDeclPredicateChain:
         )
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 1
         assert node.extra_declarations[0][0] == "c"
@@ -495,7 +495,7 @@ class TestMultiDeclPredicateChain:
         )
         node = _parse(src)
         assert isinstance(node, SetComprehension)
-        assert node.variables == ["s"]
+        assert node.variables == ("s",)
         assert node.extra_declarations is not None
         assert len(node.extra_declarations) == 2
         assert node.extra_declarations[0][0] == "c"
@@ -4,7 +4,7 @@ The parser previously raised ``Expected variable name after ';' in quantifier``
 when a natural newline (or explicit ``\\`` continuation) appeared immediately
 after ``;`` in a semicolon-chained quantifier prefix.
 
-Fix: ``_parse_quantifier_continuation`` now skips newlines at its top, mirroring
+Fix: ``_quantifier_continuation_steps`` now skips newlines at its top, mirroring
 the post-``|`` line-break handling that was added in m-2026-05-20-001.
 """
 
@@ -1,6 +1,6 @@
 """Regression tests for WYSIWYG pipe-break in semicolon-chained quantifiers.
 
-Change: ``_parse_quantifier_continuation`` now honours a natural newline or
+Change: ``_quantifier_continuation_steps`` now honours a natural newline or
 explicit ``\\`` continuation after ``|``, mirroring the single-binding path
 in ``_parse_quantifier``.
 
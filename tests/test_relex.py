@@ -0,0 +1,112 @@
+"""Incremental re-lexing must give the same tokens as lexing from scratch.
+
+``Lexer.relex`` rescans from the last safe restart point before an edit
+and splices the result into the old token list; every case here compares
+``TokenDelta.apply`` with a fresh ``tokenize`` of the edited text.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from txt2tex.lexer import Lexer, LexerError, TokenDelta
+from txt2tex.tokens import Token, TokenType
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+PARAGRAPHS = "\n\n".join(f"x{i} = {i}\n\nTEXT: note {i}" for i in range(50))
+
+# Fragments that open or close multi-line lexer state
+PIECES = [
+    "\n",
+    "\n\n",
+    "x + 1",
+    "{| ",
+    "|} ",
+    "** ",
+    "=== Title ===\n",
+    "LATEX: \\alpha\n",
+    "TEXT: some prose\n",
+    "(a) ",
+    "forall x : N | x > 0\n",
+    "\\\n",
+    "// comment\n",
+]
+
+
+def _relexed(text: str, new_text: str) -> tuple[TokenDelta, list[Token]]:
+    lexer = Lexer(text)
+    tokens = lexer.tokenize()
+    delta = lexer.relex(tokens, new_text)
+    return delta, delta.apply(tokens)
+
+
+def test_edit_inside_one_line_rescans_only_that_line() -> None:
+    new_text = PARAGRAPHS.replace("x20 = 20", "x20 = 21 + y")
+    delta, tokens = _relexed(PARAGRAPHS, new_text)
+    assert tokens == Lexer(new_text).tokenize()
+    assert [token.value for token in delta.tokens] == ["x20", "=", "21", "+", "y", "\n"]
+    assert delta.line_shift == 0
+
+
+def test_inserted_lines_shift_later_tokens() -> None:
+    new_text = PARAGRAPHS.replace("x10 = 10\n", "x10 = 10\ny = 1\nz = 2\n")
+    delta, tokens = _relexed(PARAGRAPHS, new_text)
+    assert tokens == Lexer(new_text).tokenize()
+    assert delta.line_shift == 2
+    assert len(delta.tokens) < 20
+
+
+def test_opening_bind_list_rescans_until_it_closes() -> None:
+    text = "a = 1\n\nb = 2\n\nc = 3\n\nd = 4\n"
+    new_text = text.replace("b = 2", "{| b = 2").replace("c = 3", "c = 3 |}")
+    delta, tokens = _relexed(text, new_text)
+    assert tokens == Lexer(new_text).tokenize()
+    assert tokens[delta.start].line == 3
+    assert delta.end < len(tokens) - 1
+
+
+def test_edit_at_end_rescans_to_eof() -> None:
+    delta, tokens = _relexed(PARAGRAPHS, PARAGRAPHS + "\n\nw = 0")
+    assert tokens == Lexer(PARAGRAPHS + "\n\nw = 0").tokenize()
+    assert delta.tokens[-1].type == TokenType.EOF
+
+
+def test_successive_edits_reuse_restart_points() -> None:
+    lexer = Lexer(PARAGRAPHS)
+    tokens = lexer.tokenize()
+    text = PARAGRAPHS
+    for i in (45, 3, 27):
+        text = text.replace(f"TEXT: note {i}", f"TEXT: changed note {i}\n\nq = {i}")
+        tokens = lexer.relex(tokens, text).apply(tokens)
+        assert tokens == Lexer(text).tokenize()
+
+
+def test_relex_propagates_lexer_errors() -> None:
+    lexer = Lexer(PARAGRAPHS)
+    tokens = lexer.tokenize()
+    with pytest.raises(LexerError):
+        lexer.relex(tokens, PARAGRAPHS.replace("x5 = 5", "x5 = 5\r"))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_edits_match_full_lex(seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311 - reproducible test edits
+    text = (EXAMPLES_DIR / "user_guide" / "48_zed_blocks.txt").read_text()
+    lexer = Lexer(text)
+    tokens = lexer.tokenize()
+    for _ in range(40):
+        start = rng.randrange(len(text) + 1)
+        end = min(len(text), start + rng.randrange(20))
+        insert = "".join(rng.choice(PIECES) for _ in range(rng.randrange(3)))
+        new_text = text[:start] + insert + text[end:]
+        try:
+            expected = Lexer(new_text).tokenize()
+        except LexerError:
+            continue
+        tokens = lexer.relex(tokens, new_text).apply(tokens)
+        assert tokens == expected
+        text = new_text
@@ -105,7 +105,7 @@ class TestAST:
         assert node.schema_binding is not None
         assert node.schema_binding.decoration == "Delta"
         assert node.schema_binding.schema_name == "S"
-        assert node.variables == []
+        assert node.variables == ()
         assert node.domain is None
         assert node.quantifier == "exists"
 
@@ -235,7 +235,7 @@ class TestRegressionValueBinding:
         r"""exists x : T | P → value binding; schema_binding is None."""
         node = _parse_expr("exists x : N | x > 0")
         assert node.schema_binding is None
-        assert node.variables == ["x"]
+        assert node.variables == ("x",)
         assert node.domain is not None
 
     def test_exists_value_binding_latex(self) -> None:
@@ -247,13 +247,13 @@ class TestRegressionValueBinding:
         r"""forall x, y : N | x < y → value binding with two variables."""
         node = _parse_expr("forall x, y : N | x < y")
         assert node.schema_binding is None
-        assert node.variables == ["x", "y"]
+        assert node.variables == ("x", "y")
 
     def test_exists_no_domain_lowercase(self) -> None:
         r"""exists x | x > 0 — lowercase x without domain is a value binding."""
         node = _parse_expr("exists x | x > 0")
         assert node.schema_binding is None
-        assert node.variables == ["x"]
+        assert node.variables == ("x",)
         assert node.domain is None
 
     def test_nested_quantifier_schema_then_value(self) -> None:
@@ -0,0 +1,147 @@
+"""Tests for the conversion daemon (txt2tex serve) and --client mode."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.cli import main
+from txt2tex.pipeline import ConversionOptions, convert_text
+from txt2tex.server import (
+    ConversionServer,
+    ProtocolError,
+    _RequestHandler,
+    default_socket_path,
+    handle_request,
+    request_conversion,
+)
+
+SOURCE = "schema S\n  n : N\nwhere\n  n > 0\nend\n"
+
+
+def _request(payload: object) -> dict[str, Any]:
+    return handle_request(json.dumps(payload).encode())
+
+
+def test_handle_request_converts() -> None:
+    response = _request({"source": SOURCE, "options": {"use_fuzz": False}})
+    expected = convert_text(SOURCE, ConversionOptions(use_fuzz=False))
+    assert response["ok"] is True
+    assert response["latex"] == expected.latex
+    assert response["diagnostics"] == []
+    assert "convert_ms" in response["timings"]
+
+
+def test_handle_request_reports_parse_error() -> None:
+    response = _request({"source": "{x : N | x > 0"})
+    assert response["ok"] is False
+    assert response["latex"] == ""
+    (diagnostic,) = response["diagnostics"]
+    assert "Error" in diagnostic
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"not json",
+        b'{"options": {}}',
+        b'{"source": "x", "options": {"colour": true}}',
+        b'{"source": "x", "options": []}',
+    ],
+)
+def test_handle_request_rejects_malformed(line: bytes) -> None:
+    response = handle_request(line)
+    assert response["ok"] is False
+    (diagnostic,) = response["diagnostics"]
+    assert diagnostic.startswith("invalid request:")
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[Path]:
+    socket_path = tmp_path / "d.sock"
+    server = ConversionServer(str(socket_path), _RequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_round_trip(daemon: Path) -> None:
+    options = ConversionOptions(overflow_threshold=5)
+    result = request_conversion(SOURCE, options, daemon)
+    assert result == convert_text(SOURCE, options)
+
+
+def test_client_without_daemon_returns_none(tmp_path: Path) -> None:
+    assert request_conversion(SOURCE, ConversionOptions(), tmp_path / "x") is None
+
+
+def test_client_ignores_socket_of_another_user(daemon: Path) -> None:
+    with patch("txt2tex.server.os.getuid", return_value=os.getuid() + 1):
+        assert request_conversion(SOURCE, ConversionOptions(), daemon) is None
+
+
+def test_default_socket_is_in_private_directory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("TXT2TEX_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = default_socket_path()
+    assert path.parent.name == f"txt2tex-{os.getuid()}"
+
+
+def test_daemon_internal_error_is_reported(daemon: Path) -> None:
+    with (
+        patch("txt2tex.server.handle_request", side_effect=RecursionError),
+        pytest.raises(ProtocolError, match="daemon failed: internal error"),
+    ):
+        request_conversion(SOURCE, ConversionOptions(), daemon)
+
+
+def test_cli_client_falls_back_when_daemon_fails(tmp_path: Path, daemon: Path) -> None:
+    source = tmp_path / "doc.txt"
+    source.write_text(SOURCE)
+    argv = ["txt2tex", "--client", "--socket", str(daemon), str(source)]
+    with (
+        patch.object(sys, "argv", [*argv, "--tex-only"]),
+        patch("txt2tex.server.handle_request", side_effect=RecursionError),
+    ):
+        assert main() == 0
+    expected = convert_text(SOURCE, ConversionOptions()).latex
+    assert source.with_suffix(".tex").read_text() == expected
+
+
+def test_cli_client_uses_daemon(tmp_path: Path, daemon: Path) -> None:
+    source = tmp_path / "doc.txt"
+    source.write_text(SOURCE)
+    argv = ["txt2tex", "--client", "--socket", str(daemon), str(source)]
+    with (
+        patch.object(sys, "argv", [*argv, "--tex-only"]),
+        patch("txt2tex.pipeline.convert_text") as in_process,
+    ):
+        assert main() == 0
+    in_process.assert_not_called()
+    expected = convert_text(SOURCE, ConversionOptions()).latex
+    assert source.with_suffix(".tex").read_text() == expected
+
+
+def test_cli_client_falls_back_in_process(tmp_path: Path) -> None:
+    source = tmp_path / "doc.txt"
+    source.write_text(SOURCE)
+    missing = tmp_path / "none.sock"
+    argv = ["txt2tex", "--client", "--socket", str(missing), str(source)]
+    with patch.object(sys, "argv", [*argv, "--tex-only"]):
+        assert main() == 0
+    expected = convert_text(SOURCE, ConversionOptions()).latex
+    assert source.with_suffix(".tex").read_text() == expected
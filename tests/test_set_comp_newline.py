@@ -6,7 +6,7 @@ continuation) appeared immediately after ``|`` or ``;`` in a set-comprehension
 binding-prefix.
 
 Fix: the two sites in ``_parse_set_comprehension_from_brace`` now carry the
-same CONTINUATION/NEWLINE skip block used by ``_parse_quantifier_continuation``
+same CONTINUATION/NEWLINE skip block used by ``_quantifier_continuation_steps``
 since #131.
 """
 
@@ -0,0 +1,53 @@
+"""SourceFile positions must agree with the lexer's line and column."""
+
+from __future__ import annotations
+
+import pytest
+
+from txt2tex.errors import ErrorFormatter
+from txt2tex.lexer import Lexer
+from txt2tex.source import SourceFile
+
+TEXT = "first line\n\nthird x = 1\r\nlast"
+
+
+def test_position_and_offset_round_trip() -> None:
+    source = SourceFile(TEXT)
+    for offset in range(len(TEXT) + 1):
+        line, column = source.position(offset)
+        assert source.offset(line, column) == offset
+        before = TEXT[:offset]
+        assert line == before.count("\n") + 1
+        assert column == offset - (before.rfind("\n") + 1) + 1
+
+
+def test_lines() -> None:
+    source = SourceFile(TEXT)
+    assert source.line_count == 4
+    assert [source.line(n) for n in range(1, 5)] == [
+        "first line",
+        "",
+        "third x = 1",
+        "last",
+    ]
+    assert source.line(0) == ""
+    assert source.line(5) == ""
+    assert source.offset(9, 1) == -1
+
+
+@pytest.mark.parametrize(
+    ("text", "count"), [("", 0), ("a", 1), ("a\n", 1), ("\n", 1), ("a\n\nb", 3)]
+)
+def test_line_count_matches_splitlines(text: str, count: int) -> None:
+    assert SourceFile(text).line_count == count == len(text.splitlines())
+
+
+def test_lexer_and_formatter_share_one_source() -> None:
+    source = SourceFile(TEXT.replace("\r", ""))
+    tokens = Lexer(source).tokenize()
+    x = next(token for token in tokens if token.value == "x")
+    assert (x.line, x.column) == (3, 7)
+    assert SourceFile.of(source) is source
+    formatted = ErrorFormatter(source).format_error("oops", x.line, x.column)
+    assert "3 | third x = 1\n" in formatted
+    assert "  |       ^" in formatted
@@ -0,0 +1,119 @@
+"""Lookahead answers from ``TokenIndex`` must match the scanning helpers.
+
+A parser over a token list answers ``_bracket_contains_slash`` and the
+other lookahead helpers from a precomputed :class:`TokenIndex`; over a
+:class:`TokenWindow` it still scans.  Both are asked the same question at
+every position of random and real token streams.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+from txt2tex.parser_pkg.token_index import TokenIndex
+from txt2tex.parser_pkg.token_window import TokenWindow
+from txt2tex.tokens import Token, TokenType
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+ALPHABET = (
+    TokenType.LBRACKET,
+    TokenType.RBRACKET,
+    TokenType.SLASH,
+    TokenType.COLON,
+    TokenType.NEWLINE,
+    TokenType.SEMICOLON,
+    TokenType.WHERE,
+    TokenType.DEFS,
+    TokenType.CROSS,
+    TokenType.JOIN,
+    TokenType.IDENTIFIER,
+)
+
+
+def _answers(parser: Parser, count: int) -> list[tuple[bool, ...]]:
+    answers: list[tuple[bool, ...]] = []
+    for pos in range(count):
+        parser.pos = pos
+        answers.append(
+            (
+                parser._has_blank_line(),
+                parser._scan_for_colon_before_newline(),
+                parser._scan_for_defs_after_brackets(0),
+                parser._scan_for_defs_after_brackets(1),
+                parser._next_non_newline_is_cross_op(),
+                parser._current().type == TokenType.LBRACKET
+                and parser._bracket_contains_slash(),
+            )
+        )
+    return answers
+
+
+def _assert_index_matches_scan(tokens: list[Token]) -> None:
+    indexed = Parser(tokens)
+    assert indexed._token_index() is not None
+    scanning = Parser(TokenWindow(tokens, capacity=len(tokens)))
+    assert scanning._token_index() is None
+    assert _answers(indexed, len(tokens)) == _answers(scanning, len(tokens))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_streams(seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311 - reproducible test inputs
+    types = [rng.choice(ALPHABET) for _ in range(400)]
+    tokens = [Token(t, "x", 1, i + 1) for i, t in enumerate(types)]
+    _assert_index_matches_scan([*tokens, Token(TokenType.EOF, "", 1, 401)])
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(EXAMPLES_DIR.rglob("*.txt"))[::7],
+    ids=lambda p: p.name,
+)
+def test_example_streams(path: Path) -> None:
+    _assert_index_matches_scan(Lexer(path.read_text()).tokenize())
+
+
+def _index_answers(index: TokenIndex, count: int) -> list[tuple[object, ...]]:
+    return [
+        (
+            index.type_at(pos),
+            index.bracket_contains_slash(pos),
+            index.colon_before_newline(pos),
+            index.defs_after_brackets(pos),
+            index.newline_run_at(pos),
+        )
+        for pos in range(count)
+    ]
+
+
+def test_index_over_token_store_matches_list() -> None:
+    text = "S[x/y]\n\nA[X] defs B\n\nx, y : N\n"
+    tokens = Lexer(text).tokenize()
+    store = TokenIndex(Lexer(text).tokenize_compact())
+    listed = TokenIndex(tokens)
+    assert _index_answers(store, len(tokens)) == _index_answers(listed, len(tokens))
+
+
+def test_lines_are_indexed_on_demand() -> None:
+    tokens = Lexer("x : N\ny : N\n").tokenize()
+    index = TokenIndex(tokens)
+    assert index.colon_before_newline(0)
+    second_line = next(i for i, t in enumerate(tokens) if t.value == "y")
+    assert not any(index._indexed[second_line:])
+    assert index.colon_before_newline(second_line)
+
+
+def test_queries_past_end_read_eof() -> None:
+    tokens = Lexer("a\n\n").tokenize()
+    index = TokenIndex(tokens)
+    assert index.type_at(100) == TokenType.EOF
+    assert index.next_non_newline(100) == len(tokens) - 1
+    assert index.next_non_newline(1) == len(tokens) - 1
+    assert index.blank_line_at(1)
+    assert not index.blank_line_at(100)
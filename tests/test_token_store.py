@@ -0,0 +1,65 @@
+"""TokenStore must hold exactly the token stream the lexer produced."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+from txt2tex.token_store import TokenStore
+from txt2tex.tokens import Token, TokenType
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def _example_sources() -> list[Path]:
+    return [
+        path
+        for path in sorted(EXAMPLES_DIR.rglob("*.txt"))
+        if "infrastructure" not in path.parts
+    ]
+
+
+@pytest.mark.parametrize("path", _example_sources(), ids=lambda p: p.name)
+def test_store_round_trips_examples(path: Path) -> None:
+    text = path.read_text()
+    tokens = Lexer(text).tokenize()
+    store = Lexer(text).tokenize_compact()
+    assert list(store) == tokens
+    assert repr(Parser(store).parse()) == repr(Parser(tokens).parse())
+
+
+def test_values_that_are_not_source_slices() -> None:
+    text = "TITLE: A Title\n\nTEXT: some prose\n\nx = 1\n"
+    store = Lexer(text).tokenize_compact()
+    assert list(store) == Lexer(text).tokenize()
+    title = store[0]
+    assert title.type == TokenType.TITLE
+    assert title.value == Lexer(text).tokenize()[0].value
+
+
+def test_columns_and_type_lookup() -> None:
+    store = Lexer("x = 1\ny").tokenize_compact()
+    assert [store.type_at(i) for i in range(len(store))] == [
+        token.type for token in store
+    ]
+    assert store.lines.tolist() == [1, 1, 1, 1, 2, 2]
+    assert store.source.text[store.starts[4] : store.ends[4]] == "y"
+
+
+def test_indexing() -> None:
+    store = Lexer("a b c").tokenize_compact()
+    assert store[-1].type == TokenType.EOF
+    assert store[1:3] == [store[1], store[2]]
+    assert store[1] is store[1]  # recently built tokens are reused
+    with pytest.raises(IndexError):
+        _ = store[len(store)]
+
+
+def test_synthetic_tokens_keep_their_value() -> None:
+    store = TokenStore("ab", [Token(TokenType.IDENTIFIER, "zz", 1, 1)])
+    store.append(Token(TokenType.EOF, "", 7, 3))
+    assert store[0].value == "zz"
+    assert store[1] == Token(TokenType.EOF, "", 7, 3)
@@ -0,0 +1,126 @@
+"""Parsing a lazily lexed token stream must match parsing the token list.
+
+``Parser`` given ``Lexer.iter_tokens()`` reads through a ``TokenWindow``
+that pulls tokens on demand and drops those of finished document items.
+A tiny window forces drops and regrowth on every example, so any
+lookahead or backtracking that reaches a dropped token shows up here.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from txt2tex.lexer import Lexer
+from txt2tex.parser import Parser
+from txt2tex.parser_pkg.token_window import TokenWindow
+from txt2tex.tokens import Token, TokenType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+PREDICATES = "\n\n".join(
+    f"forall x{i} : N | (x{i} > {i}) land (y = {{1, 2, {i}}})" for i in range(300)
+)
+LARGE_DOCUMENT = f"=== Big ===\n\n{PREDICATES}"
+
+
+def _example_sources() -> list[Path]:
+    return [
+        path
+        for path in sorted(EXAMPLES_DIR.rglob("*.txt"))
+        if "infrastructure" not in path.parts
+    ]
+
+
+def _tokens(count: int) -> list[Token]:
+    tokens = [Token(TokenType.IDENTIFIER, f"t{i}", 1, i + 1) for i in range(count)]
+    return [*tokens, Token(TokenType.EOF, "", 1, count + 1)]
+
+
+class _CountingStream:
+    """Token iterator that records how many tokens were pulled."""
+
+    def __init__(self, tokens: Iterator[Token]) -> None:
+        self.tokens = tokens
+        self.pulled = 0
+
+    def __iter__(self) -> _CountingStream:
+        return self
+
+    def __next__(self) -> Token:
+        token = next(self.tokens)
+        self.pulled += 1
+        return token
+
+
+def test_iter_tokens_matches_tokenize() -> None:
+    text = (EXAMPLES_DIR / "user_guide" / "48_zed_blocks.txt").read_text()
+    assert list(Lexer(text).iter_tokens()) == Lexer(text).tokenize()
+
+
+@pytest.mark.parametrize("path", _example_sources(), ids=lambda p: p.name)
+def test_streamed_parse_matches_list_parse(path: Path) -> None:
+    text = path.read_text()
+    try:
+        expected = repr(Parser(Lexer(text).tokenize()).parse())
+    except Exception as e:  # noqa: BLE001 - compare failures too
+        expected = repr(e)
+    window = TokenWindow(Lexer(text).iter_tokens(), capacity=2)
+    try:
+        streamed = repr(Parser(window).parse())
+    except Exception as e:  # noqa: BLE001 - compare failures too
+        streamed = repr(e)
+    assert streamed == expected
+
+
+def test_items_arrive_before_input_is_lexed() -> None:
+    stream = _CountingStream(Lexer(PREDICATES).iter_tokens())
+    items = Parser(stream).iter_items()
+    next(items)
+    assert stream.pulled < 30
+    assert sum(1 for _ in items) == 299
+    assert stream.pulled == len(Lexer(PREDICATES).tokenize())
+
+
+def test_window_stays_bounded_on_large_document() -> None:
+    window = TokenWindow(Lexer(LARGE_DOCUMENT).iter_tokens(), capacity=32)
+    parser = Parser(window)
+    document = parser.parse()
+    assert window.capacity == 32
+    assert len(repr(document)) > 0
+
+
+def test_window_reads_eof_past_end() -> None:
+    window = TokenWindow(_tokens(3))
+    assert window[10].type == TokenType.EOF
+    assert window[3] is window[10]
+    assert window[0].value == "t0"
+
+
+def test_window_grows_while_tokens_are_held() -> None:
+    window = TokenWindow(_tokens(10), capacity=4)
+    assert [window[i].value for i in range(10)] == [f"t{i}" for i in range(10)]
+    assert window.capacity == 16
+    assert window.held == 10
+
+
+def test_window_drops_released_tokens() -> None:
+    window = TokenWindow(_tokens(10), capacity=4)
+    _ = window[3]
+    window.release(3)
+    assert window[6].value == "t6"
+    assert window.capacity == 4
+    assert window[3].value == "t3"
+    with pytest.raises(IndexError, match="released"):
+        _ = window[2]
+
+
+def test_window_requires_eof() -> None:
+    window = TokenWindow(_tokens(2)[:-1])
+    with pytest.raises(ValueError, match="EOF"):
+        _ = window[5]
@@ -0,0 +1,64 @@
+"""Tests for running the fuzz typecheck alongside the PDF build."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.compile import typecheck_and_compile_pdf
+
+
+@pytest.fixture
+def tex_path(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.tex"
+    path.write_text("\\documentclass{article}")
+    return path
+
+
+def _fake_compile(tex_path: Path, **_: object) -> bool:
+    tex_path.with_suffix(".pdf").write_text("pdf")
+    return True
+
+
+def test_typecheck_and_compile_overlap(tex_path: Path) -> None:
+    """Each side waits for the other: a sequential run would time out."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def typecheck(_: Path, **__: object) -> bool:
+        barrier.wait()
+        return True
+
+    def compile_pdf(tex_path: Path, **kwargs: object) -> bool:
+        barrier.wait()
+        return _fake_compile(tex_path, **kwargs)
+
+    with (
+        patch("txt2tex.compile.typecheck_fuzz", side_effect=typecheck),
+        patch("txt2tex.compile.compile_pdf", side_effect=compile_pdf),
+    ):
+        assert typecheck_and_compile_pdf(tex_path) == (True, True)
+    assert tex_path.with_suffix(".pdf").exists()
+
+
+@pytest.mark.parametrize("mode", ["discard", "keep"])
+def test_type_error_discards_pdf_unless_kept(tex_path: Path, mode: str) -> None:
+    with (
+        patch("txt2tex.compile.typecheck_fuzz", return_value=False),
+        patch("txt2tex.compile.compile_pdf", side_effect=_fake_compile),
+    ):
+        result = typecheck_and_compile_pdf(
+            tex_path, keep_pdf_on_type_error=mode == "keep"
+        )
+    assert result == (False, mode == "keep")
+    assert tex_path.with_suffix(".pdf").exists() == (mode == "keep")
+
+
+def test_compile_failure_is_reported(tex_path: Path) -> None:
+    with (
+        patch("txt2tex.compile.typecheck_fuzz", return_value=True),
+        patch("txt2tex.compile.compile_pdf", return_value=False),
+    ):
+        assert typecheck_and_compile_pdf(tex_path) == (True, False)
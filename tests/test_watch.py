@@ -0,0 +1,151 @@
+"""Tests for --watch mode."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from txt2tex.cli import main
+from txt2tex.compile import build_dir_for, compile_pdf
+from txt2tex.lexer import Lexer, TokenDelta
+from txt2tex.pipeline import ConversionOptions, convert_text
+from txt2tex.tokens import Token
+from txt2tex.watch import Watcher, WatchOptions
+
+
+@pytest.fixture
+def watcher(tmp_path: Path) -> Watcher:
+    source = tmp_path / "doc.txt"
+    source.write_text("x = 1")
+    options = WatchOptions(conversion=ConversionOptions(use_fuzz=False), tex_only=True)
+    return Watcher(source, source.with_suffix(".tex"), options)
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_first_poll_builds(watcher: Watcher) -> None:
+    report = watcher.poll()
+    assert report is not None
+    assert report.ok
+    assert report.stage == "done"
+    assert "x = 1" in watcher.output_path.read_text()
+    assert watcher.poll() is None
+
+
+def test_touch_without_content_change_is_skipped(watcher: Watcher) -> None:
+    watcher.poll()
+    _bump_mtime(watcher.input_path)
+    with patch("txt2tex.watch.convert_text") as convert:
+        assert watcher.poll() is None
+    convert.assert_not_called()
+
+
+def test_content_change_rebuilds(watcher: Watcher) -> None:
+    watcher.poll()
+    watcher.input_path.write_text("y = 2")
+    _bump_mtime(watcher.input_path)
+    report = watcher.poll()
+    assert report is not None
+    assert report.ok
+    assert "y = 2" in watcher.output_path.read_text()
+
+
+def test_rebuild_relexes_only_the_edit(watcher: Watcher) -> None:
+    lines = [f"x{i} = {i}" for i in range(50)]
+    watcher.input_path.write_text("\n".join(lines))
+    watcher.poll()
+    lines[25] = "x25 = y + 1"
+    edited = "\n".join(lines)
+    watcher.input_path.write_text(edited)
+    _bump_mtime(watcher.input_path)
+    deltas: list[TokenDelta] = []
+
+    def relex(lexer: Lexer, tokens: list[Token], text: str) -> TokenDelta:
+        deltas.append(real_relex(lexer, tokens, text))
+        return deltas[-1]
+
+    real_relex = Lexer.relex
+    with patch.object(Lexer, "relex", relex):
+        report = watcher.poll()
+    assert report is not None
+    assert report.ok
+    [delta] = deltas
+    assert delta.end - delta.start < 10
+    expected = convert_text(edited, watcher.options.conversion)
+    assert watcher.output_path.read_text() == expected.latex
+
+
+def test_rebuild_after_lexer_error_starts_over(watcher: Watcher) -> None:
+    watcher.poll()
+    for text in ("x = 'open", "y = 2"):
+        watcher.input_path.write_text(text)
+        _bump_mtime(watcher.input_path)
+        watcher.poll()
+    assert "y = 2" in watcher.output_path.read_text()
+
+
+def test_parse_error_reports_stage(watcher: Watcher) -> None:
+    watcher.input_path.write_text("{x : N | x > 0")
+    report = watcher.poll()
+    assert report is not None
+    assert not report.ok
+    assert report.stage == "generate"
+    assert not watcher.output_path.exists()
+
+
+def test_pdf_rebuild_is_incremental(tmp_path: Path) -> None:
+    source = tmp_path / "doc.txt"
+    source.write_text("x = 1")
+    options = WatchOptions(conversion=ConversionOptions(use_fuzz=False))
+    watcher = Watcher(source, source.with_suffix(".tex"), options)
+    with patch("txt2tex.watch.compile_pdf", return_value=True) as compile_mock:
+        report = watcher.poll()
+    assert report is not None
+    assert report.ok
+    compile_mock.assert_called_once_with(
+        source.with_suffix(".tex"), incremental=True, precompiled=False, build_dir=None
+    )
+
+
+def test_persistent_build_uses_document_build_dir(tmp_path: Path) -> None:
+    source = tmp_path / "doc.txt"
+    source.write_text("x = 1")
+    options = WatchOptions(
+        conversion=ConversionOptions(use_fuzz=False), persistent_build=True
+    )
+    tex_path = source.with_suffix(".tex")
+    watcher = Watcher(source, tex_path, options)
+    with patch("txt2tex.watch.compile_pdf", return_value=True) as compile_mock:
+        watcher.poll()
+    assert compile_mock.call_args.kwargs["build_dir"] == build_dir_for(tex_path)
+
+
+def test_incremental_compile_drops_forced_rebuild(tmp_path: Path) -> None:
+    """latexmk runs without -gg and keeps its state for the next cycle."""
+    tex_path = tmp_path / "doc.tex"
+    tex_path.write_text("\\documentclass{article}")
+    tex_path.with_suffix(".pdf").write_text("")
+    done = subprocess.CompletedProcess[str]([], 0, "", "")
+    with (
+        patch("txt2tex.compile.shutil.which", return_value="/usr/bin/latexmk"),
+        patch("txt2tex.compile.subprocess.run", return_value=done) as run,
+    ):
+        assert compile_pdf(tex_path, incremental=True)
+    (call,) = run.call_args_list
+    assert "-gg" not in call.args[0]
+
+
+def test_cli_watch_rejects_multiple_inputs(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    argv = ["txt2tex", "--watch", str(a), str(b)]
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2